@@ -0,0 +1,246 @@
+import base64
+import dataclasses
+import json
+import logging
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, TypeVar
+
+from algosdk import abi
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PAGE_SIZE = 1000
+DEFAULT_CONCURRENCY = 16
+
+T = TypeVar("T")
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxRecord:
+    name: bytes
+    value: bytes
+
+
+@dataclasses.dataclass(frozen=True)
+class DecodedBox:
+    map_name: str
+    name: bytes
+    key: Any
+    value: Any
+
+
+@dataclasses.dataclass
+class Checkpoint:
+    """Where a scan got to; `next_token` is None before the first page"""
+
+    app_id: int
+    prefix: str  # hex, so any byte prefix survives JSON
+    next_token: str | None = None
+    scanned: int = 0
+    done: bool = False
+
+    @classmethod
+    def load(cls, path: Path) -> "Checkpoint | None":
+        if not path.exists():
+            return None
+        return cls(**json.loads(path.read_text()))
+
+    def save(self, path: Path) -> None:
+        # Write-then-rename so a crash never leaves a half-written checkpoint.
+        tmp = path.with_suffix(path.suffix + ".tmp")
+        tmp.write_text(json.dumps(dataclasses.asdict(self)))
+        os.replace(tmp, path)
+
+
+def _start_token(prefix: bytes) -> str | None:
+    # Indexer pages boxes in name order, returning names strictly after the
+    # token, so starting at the bare prefix skips everything sorting before it.
+    return f"b64:{base64.b64encode(prefix).decode()}" if prefix else None
+
+
+class BoxScanner:
+    """
+    Streams every box of an app whose name starts with a prefix.
+
+    Names come from the indexer one page at a time, in name order, so a
+    prefix scan is a range read that stops at the first name past the
+    prefix. Values are read from algod with at most `concurrency` requests
+    in flight, while the next page of names is fetched in the background.
+    Only one page is held in memory, and with a `checkpoint` file the scan
+    resumes at the page after the last one fully consumed, so a restarted
+    backfill may repeat at most one page.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        indexer_client: IndexerClient,
+        app_id: int,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ) -> None:
+        self._algod = algod_client
+        self._indexer = indexer_client
+        self._app_id = app_id
+        self._page_size = page_size
+        self._concurrency = concurrency
+
+    def names(
+        self, prefix: bytes = b"", next_token: str | None = None
+    ) -> Iterator[bytes]:
+        for page, _ in self._pages(prefix, next_token or _start_token(prefix)):
+            yield from page
+
+    def scan(
+        self,
+        prefix: bytes = b"",
+        checkpoint: Path | None = None,
+    ) -> Iterator[BoxRecord]:
+        state = Checkpoint.load(checkpoint) if checkpoint else None
+        scan_id = (self._app_id, prefix.hex())
+        if state is not None and (state.app_id, state.prefix) != scan_id:
+            raise ValueError(f"Checkpoint {checkpoint} belongs to a different scan")
+        if state is None:
+            state = Checkpoint(self._app_id, prefix.hex(), _start_token(prefix))
+        if state.done:
+            return
+
+        with ThreadPoolExecutor(self._concurrency, "box-scan") as executor:
+            pages = self._pages(prefix, state.next_token)
+            pending = executor.submit(next, pages, None)
+            while (item := pending.result()) is not None:
+                names, token = item
+                # Prefetch the next page of names while this page's values load.
+                pending = executor.submit(next, pages, None)
+                for name, value in zip(names, executor.map(self._fetch, names)):
+                    if value is not None:
+                        yield BoxRecord(name, value)
+                state.next_token = token
+                state.scanned += len(names)
+                state.done = token is None
+                if checkpoint:
+                    state.save(checkpoint)
+            logger.info(f"Scanned {state.scanned} boxes of app {self._app_id}")
+
+    def scan_decoded(
+        self,
+        decode: Callable[[BoxRecord], T],
+        prefix: bytes = b"",
+        checkpoint: Path | None = None,
+    ) -> Iterator[T]:
+        for record in self.scan(prefix, checkpoint):
+            yield decode(record)
+
+    def _pages(
+        self, prefix: bytes, token: str | None
+    ) -> Iterator[tuple[list[bytes], str | None]]:
+        """Yield (names, token to resume after this page)"""
+        while True:
+            response = self._indexer.application_boxes(
+                self._app_id, limit=self._page_size, next_page=token
+            )
+            names = [base64.b64decode(box["name"]) for box in response.get("boxes", [])]
+            token = response.get("next-token")
+            matching = [name for name in names if name.startswith(prefix)]
+            # Names are sorted, so the first miss means the prefix range ended.
+            if len(matching) < len(names) or not token or not names:
+                yield matching, None
+                return
+            yield matching, token
+
+    def _fetch(self, name: bytes) -> bytes | None:
+        try:
+            response = self._algod.application_box_by_name(self._app_id, name)
+        except Exception as e:
+            # Deleted between listing and reading; anything else is a real failure.
+            if "box not found" in str(e).lower():
+                return None
+            raise
+        return base64.b64decode(response["value"])
+
+
+_Decode = Callable[[bytes], Any]
+
+
+def _avm_decoder(type_name: str) -> _Decode | None:
+    match type_name:
+        case "AVMBytes":
+            return bytes
+        case "AVMString":
+            return lambda raw: raw.decode()
+        case "AVMUint64":
+            return lambda raw: int.from_bytes(raw, "big")
+    return None
+
+
+class BoxMapDecoder:
+    """
+    Decodes box records using the `state.maps.box` and `structs` sections
+    of an ARC-56 spec, matching each box to its map by name prefix.
+    """
+
+    def __init__(self, spec: dict[str, Any]) -> None:
+        self._structs: dict[str, list[dict[str, str]]] = spec.get("structs", {})
+        self._maps: list[tuple[bytes, str, _Decode, _Decode]] = []
+        for map_name, box_map in spec["state"]["maps"]["box"].items():
+            prefix = base64.b64decode(box_map.get("prefix") or "")
+            self._maps.append(
+                (
+                    prefix,
+                    map_name,
+                    self._decoder(box_map["keyType"]),
+                    self._decoder(box_map["valueType"]),
+                )
+            )
+        # Longest prefix first so nested prefixes resolve to the most specific map.
+        self._maps.sort(key=lambda entry: len(entry[0]), reverse=True)
+
+    @classmethod
+    def from_arc56_file(cls, path: Path) -> "BoxMapDecoder":
+        return cls(json.loads(path.read_text()))
+
+    @property
+    def prefixes(self) -> dict[str, bytes]:
+        return {map_name: prefix for prefix, map_name, _, _ in self._maps}
+
+    def decode(self, record: BoxRecord) -> DecodedBox | None:
+        """Decode a box, or return None if it belongs to no known map"""
+        for prefix, map_name, decode_key, decode_value in self._maps:
+            if record.name.startswith(prefix):
+                return DecodedBox(
+                    map_name=map_name,
+                    name=record.name,
+                    key=decode_key(record.name[len(prefix) :]),
+                    value=decode_value(record.value),
+                )
+        return None
+
+    def _decoder(self, type_name: str) -> _Decode:
+        avm = _avm_decoder(type_name)
+        if avm is not None:
+            return avm
+        abi_type = abi.ABIType.from_string(self._abi_type(type_name))
+        if type_name not in self._structs:
+            return abi_type.decode
+        return lambda raw: self._to_dict(type_name, abi_type.decode(raw))
+
+    def _abi_type(self, type_name: str) -> str:
+        fields = self._structs.get(type_name)
+        if fields is None:
+            return type_name
+        return f"({','.join(self._abi_type(field['type']) for field in fields)})"
+
+    def _to_dict(self, type_name: str, values: list[Any]) -> dict[str, Any]:
+        return {
+            field["name"]: (
+                self._to_dict(field["type"], value)
+                if field["type"] in self._structs
+                else value
+            )
+            for field, value in zip(self._structs[type_name], values)
+        }
@@ -0,0 +1,116 @@
+import logging
+import math
+from collections.abc import Sequence
+from typing import Any
+
+import algokit_utils
+from algosdk import transaction
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+logger = logging.getLogger(__name__)
+
+# Opcode budget each app call adds to its group's shared pool.
+APP_CALL_BUDGET = 700
+
+# Largest extra budget simulate grants, enough to measure any group.
+MAX_EXTRA_OPCODE_BUDGET = 320_000
+
+# Largest atomic group algod accepts.
+GROUP_SIZE = 16
+
+Call = algokit_utils.AppCallMethodCallParams | algokit_utils.AppCallParams
+
+
+class BudgetError(Exception):
+    """Raised when a group fails under simulate or cannot fit its padding"""
+
+
+class BudgetPadder:
+    """
+    Tops up a group's pooled opcode budget for heavy methods.
+
+    The group is simulated with the largest extra budget simulate allows,
+    which reports what it actually consumes. Every app call adds 700 to the
+    pool, so the group is padded with `op_up` bare calls for the shortfall;
+    those do nothing on-chain and cost only their minimum fee. Routing an
+    `op_up` call still uses part of the 700 it adds, so the padded group is
+    simulated again and topped up until it fits. Padding is appended after
+    the caller's transactions, which keeps their group indexes stable.
+    """
+
+    def __init__(self, client: Any) -> None:
+        """`client` is a generated `ContextRegistryClient` or `LicenseManagerClient`"""
+        self._client = client
+
+    def measure(self, calls: Sequence[Call]) -> tuple[int, int]:
+        """Budget (consumed, pooled) by `calls` as one group, before padding"""
+        txns = self._build(calls)
+        response = self._client.algorand.client.algod.simulate_transactions(
+            SimulateRequest(
+                txn_groups=[
+                    SimulateRequestTransactionGroup(
+                        txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                    )
+                ],
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                allow_more_logs=True,
+                extra_opcode_budget=MAX_EXTRA_OPCODE_BUDGET,
+            )
+        )
+        group = response["txn-groups"][0]
+        if failure := group.get("failure-message"):
+            raise BudgetError(f"Group fails even with unlimited budget: {failure}")
+        app_calls = sum(isinstance(txn, transaction.ApplicationCallTxn) for txn in txns)
+        return group.get("app-budget-consumed", 0), app_calls * APP_CALL_BUDGET
+
+    def padding_needed(self, calls: Sequence[Call]) -> int:
+        return len(self.pad(calls)) - len(calls)
+
+    def pad(self, calls: Sequence[Call]) -> list[Call]:
+        """`calls` followed by just enough `op_up` calls to cover their budget"""
+        padded = list(calls)
+        consumed, pooled = self.measure(padded)
+        while consumed > pooled:
+            padding = math.ceil((consumed - pooled) / APP_CALL_BUDGET)
+            free = GROUP_SIZE - len(self._build(padded))
+            if padding > free:
+                raise BudgetError(
+                    f"Group needs {padding} more op_up calls but has room for {free}; "
+                    "split the batch"
+                )
+            start = len(padded) - len(calls)
+            padded += [self._op_up(calls[0].sender, start + i) for i in range(padding)]
+            consumed, pooled = self.measure(padded)
+        if len(padded) > len(calls):
+            logger.debug(
+                f"Padded group of {len(calls)} calls with {len(padded) - len(calls)} op_up calls"
+            )
+        return padded
+
+    def send(
+        self,
+        calls: Sequence[Call],
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> algokit_utils.SendAtomicTransactionComposerResults:
+        return self._compose(self.pad(calls)).send(send_params)
+
+    def _op_up(self, sender: str, index: int) -> algokit_utils.AppCallParams:
+        return self._client.app_client.params.bare.call(
+            # Distinct notes keep otherwise identical padding calls from
+            # sharing a transaction id.
+            algokit_utils.AppClientBareCallParams(sender=sender, note=f"op_up:{index}".encode())
+        )
+
+    def _compose(self, calls: Sequence[Call]) -> algokit_utils.TransactionComposer:
+        composer = self._client.algorand.new_group()
+        for call in calls:
+            if isinstance(call, algokit_utils.AppCallMethodCallParams):
+                composer.add_app_call_method_call(call)
+            else:
+                composer.add_app_call(call)
+        return composer
+
+    def _build(self, calls: Sequence[Call]) -> list[transaction.Transaction]:
+        txns = self._compose(calls).build_transactions().transactions
+        return transaction.assign_group_id(txns) if len(txns) > 1 else txns
@@ -0,0 +1,128 @@
+import base64
+import logging
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import algokit_utils
+from algokit_utils.applications.abi import (
+    get_abi_struct_from_abi_tuple,
+    get_abi_tuple_type_from_abi_struct_definition,
+)
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import ABI_RETURN_HASH
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.artifacts.context_registry.context_registry_client import (
+    APP_SPEC,
+    ContextRecord,
+    ContextRegistryClient,
+    GetContextsArgs,
+)
+
+logger = logging.getLogger(__name__)
+
+# A ContextRecord encodes to at most ~330 bytes and an AVM value to 4096, so
+# each get_contexts call returns a slice of the page rather than all of it.
+CONTEXTS_PER_CALL = 8
+
+# Largest atomic group algod accepts. Simulate takes one group per request,
+# so larger pages are split into groups that are simulated concurrently.
+GROUP_SIZE = 16
+DEFAULT_SIMULATE_CONCURRENCY = 8
+
+# get_contexts returns ContextRecord[], which ARC-56 types as a bare tuple
+# array, so the layout comes from the spec's struct definition instead.
+_RECORD_FIELDS = APP_SPEC.structs["ContextRecord"]
+_RECORDS_TYPE = abi.ArrayDynamicType(
+    get_abi_tuple_type_from_abi_struct_definition(_RECORD_FIELDS, APP_SPEC.structs)
+)
+
+
+class ContextReadError(Exception):
+    """Raised when a get_contexts group failed, e.g. on an unknown id"""
+
+
+def _decode_records(txn_result: dict) -> list[ContextRecord]:
+    raw = base64.b64decode(txn_result["logs"][-1])
+    if not raw.startswith(ABI_RETURN_HASH):
+        raise ContextReadError("get_contexts did not return a value")
+    return [
+        ContextRecord(**get_abi_struct_from_abi_tuple(values, _RECORD_FIELDS, APP_SPEC.structs))
+        for values in _RECORDS_TYPE.decode(raw[len(ABI_RETURN_HASH) :])
+    ]
+
+
+class ContextReader:
+    """
+    Reads full context records for listing pages.
+
+    A page of ids is split into `get_contexts` calls of `CONTEXTS_PER_CALL`,
+    packed into groups of 16 and simulated, one request per group with up
+    to `concurrency` in flight, so a page of up to 128 contexts costs one
+    round-trip and nothing is written on-chain.
+    """
+
+    def __init__(
+        self,
+        client: ContextRegistryClient,
+        sender: str,
+        concurrency: int = DEFAULT_SIMULATE_CONCURRENCY,
+    ) -> None:
+        self._client = client
+        self._sender = sender  # pays the simulated fees, so it must hold some ALGO
+        self._concurrency = concurrency
+
+    def get(self, context_id: int) -> ContextRecord:
+        return self.get_many([context_id])[0]
+
+    def get_many(self, context_ids: Sequence[int]) -> list[ContextRecord]:
+        """Records for `context_ids`, in the order requested"""
+        if not context_ids:
+            return []
+        calls = [
+            list(context_ids[start : start + CONTEXTS_PER_CALL])
+            for start in range(0, len(context_ids), CONTEXTS_PER_CALL)
+        ]
+        groups = [calls[start : start + GROUP_SIZE] for start in range(0, len(calls), GROUP_SIZE)]
+        if len(groups) == 1:
+            pages = [self._simulate_group(groups[0])]
+        else:
+            with ThreadPoolExecutor(min(len(groups), self._concurrency)) as executor:
+                pages = list(executor.map(self._simulate_group, groups))
+        records = [record for page in pages for record in page]
+        logger.debug(f"Read {len(records)} contexts in {len(calls)} calls")
+        return records
+
+    def _simulate_group(self, calls: list[list[int]]) -> list[ContextRecord]:
+        composer = self._client.algorand.new_group()
+        for ids in calls:
+            composer.add_app_call_method_call(
+                self._client.params.get_contexts(
+                    GetContextsArgs(context_ids=ids),
+                    algokit_utils.CommonAppCallParams(sender=self._sender),
+                )
+            )
+        txns = transaction.assign_group_id(composer.build_transactions().transactions)
+        response = self._client.algorand.client.algod.simulate_transactions(
+            SimulateRequest(
+                txn_groups=[
+                    SimulateRequestTransactionGroup(
+                        txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                    )
+                ],
+                allow_empty_signatures=True,
+                allow_unnamed_resources=True,
+                # Each record is logged in the ABI return, past the 1KB log limit.
+                allow_more_logs=True,
+            )
+        )
+        group = response["txn-groups"][0]
+        if failure := group.get("failure-message"):
+            raise ContextReadError(failure)
+        results = group["txn-results"]
+        if len(results) != len(calls):
+            raise ContextReadError(f"Simulate returned {len(results)} of {len(calls)} results")
+        records: list[ContextRecord] = []
+        for result in results:
+            records.extend(_decode_records(result["txn-result"]))
+        return records
@@ -0,0 +1,370 @@
+import argparse
+import base64
+import dataclasses
+import json
+import logging
+import math
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any
+
+from algosdk import abi
+
+from smart_contracts.utils.constants import MAX_TITLE_LENGTH, USER_INDEX_PAGE_SIZE
+
+logger = logging.getLogger(__name__)
+
+# Protocol minimum-balance and fee parameters, in microAlgo.
+MIN_TXN_FEE = 1_000
+ACCOUNT_MIN_BALANCE = 100_000
+APP_PAGE_MIN_BALANCE = 100_000
+SCHEMA_UINT_MIN_BALANCE = 28_500
+SCHEMA_BYTES_MIN_BALANCE = 50_000
+BOX_FLAT_MIN_BALANCE = 2_500
+BOX_BYTE_MIN_BALANCE = 400
+PROGRAM_PAGE_SIZE = 2_048
+
+# Length of a CIDv0, the only form validate_ipfs_hash accepts.
+IPFS_HASH_LENGTH = 46
+
+ARTIFACTS_DIR = Path(__file__).parent.parent / "smart_contracts" / "artifacts"
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxLayout:
+    """What ARC-56 leaves open: raw key lengths and string lengths to assume"""
+
+    key_size: int | None = None  # required for AVMBytes keys
+    string_lengths: Mapping[str, int] = dataclasses.field(default_factory=dict)
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxCreation:
+    """
+    A box an operation creates; `every` > 1 means one per that many calls by
+    an account, and `once_per_creator` one per creator whose items are sold
+    """
+
+    map_name: str
+    every: int = 1
+    once_per_creator: bool = False
+
+    def count(self, calls: int, accounts: int, creators: int = 1) -> int:
+        if self.once_per_creator:
+            return min(calls, creators)
+        if self.every == 1:
+            return calls
+        per_account = math.ceil(calls / accounts)
+        return accounts * math.ceil(per_account / self.every)
+
+
+@dataclasses.dataclass(frozen=True)
+class Operation:
+    creates: tuple[BoxCreation, ...] = ()
+    txns: int = 1  # outer transactions, e.g. 2 with a payment argument
+    inner_txns: int = 0  # inner transactions sent with fee=0, pooled by the caller
+    caller_funded: bool = False  # the call's payment must cover the MBR of `creates`
+
+
+@dataclasses.dataclass(frozen=True)
+class OperationCost:
+    method: str
+    fees: int
+    min_balance: int  # worst case for one call, locked in the app account
+    caller_funded: bool = False  # `min_balance` is part of the call's payment
+
+    @property
+    def total(self) -> int:
+        return self.fees + self.min_balance
+
+
+BOX_LAYOUTS: dict[str, dict[str, BoxLayout]] = {
+    "ContextRegistry": {
+        "contexts": BoxLayout(
+            string_lengths={"ipfs_hash": IPFS_HASH_LENGTH, "title": MAX_TITLE_LENGTH}
+        ),
+        "purchases": BoxLayout(key_size=8 + 32),  # context id + buyer
+        "user_pages": BoxLayout(key_size=32 + 1 + 8),  # user + list kind + page
+    },
+    "LicenseManager": {
+        "grants": BoxLayout(key_size=8 + 32),  # license id + holder
+    },
+}
+
+OPERATIONS: dict[str, dict[str, Operation]] = {
+    "ContextRegistry": {
+        "create_context": Operation(
+            creates=(
+                BoxCreation("contexts"),
+                BoxCreation("user_pages", every=USER_INDEX_PAGE_SIZE),
+            ),
+            txns=2,
+            caller_funded=True,
+        ),
+        "purchase_context": Operation(
+            creates=(
+                BoxCreation("purchases"),
+                BoxCreation("user_pages", every=USER_INDEX_PAGE_SIZE),
+                BoxCreation("balances", once_per_creator=True),  # keyed by the seller
+            ),
+            txns=2,
+            caller_funded=True,
+        ),
+        "rate_context": Operation(),
+        "set_price_tiers": Operation(),
+        "withdraw": Operation(inner_txns=1),
+        "withdraw_platform_fees": Operation(inner_txns=1),
+        "set_platform_fee_percentage": Operation(),
+    },
+    "LicenseManager": {
+        # Ownership is checked with an inner call to the registry's get_context.
+        "create_license": Operation(
+            creates=(BoxCreation("licenses"),),
+            txns=2,
+            inner_txns=1,
+            caller_funded=True,
+        ),
+        "purchase_license": Operation(
+            creates=(
+                BoxCreation("grants"),
+                BoxCreation("balances", once_per_creator=True),  # keyed by the seller
+            ),
+            txns=2,
+            caller_funded=True,
+        ),
+        "renew_license": Operation(txns=2),
+        "record_usage": Operation(),
+        "revoke_license": Operation(inner_txns=1),  # refunds the grant box's MBR
+        "set_price_tiers": Operation(),
+        "withdraw": Operation(inner_txns=1),
+        "withdraw_platform_fees": Operation(inner_txns=1),
+        "set_platform_fee_percentage": Operation(),
+    },
+}
+
+
+def spec_path(contract_name: str) -> Path:
+    """ARC-56 spec of a built contract, e.g. `spec_path("ContextRegistry")`"""
+    return next(ARTIFACTS_DIR.glob(f"*/{contract_name}.arc56.json"))
+
+
+class CostModel:
+    """
+    Minimum-balance and fee arithmetic for one contract.
+
+    Box sizes come from the `state.maps.box` and `structs` sections of the
+    ARC-56 spec, with `BOX_LAYOUTS` filling in raw key lengths and the
+    string lengths to budget for; `OPERATIONS` says which boxes each method
+    creates and how many transactions it pays for. Amounts are exact for
+    the protocol parameters above and `min_fee`.
+    """
+
+    def __init__(
+        self,
+        spec: dict[str, Any],
+        layouts: Mapping[str, BoxLayout] | None = None,
+        operations: Mapping[str, Operation] | None = None,
+        min_fee: int = MIN_TXN_FEE,
+    ) -> None:
+        self._spec = spec
+        self._structs: dict[str, list[dict[str, str]]] = spec.get("structs", {})
+        self._layouts = layouts or {}
+        self._operations = operations or {}
+        self._min_fee = min_fee
+
+    @classmethod
+    def for_contract(cls, contract_name: str, min_fee: int = MIN_TXN_FEE) -> "CostModel":
+        return cls(
+            json.loads(spec_path(contract_name).read_text()),
+            BOX_LAYOUTS.get(contract_name),
+            OPERATIONS.get(contract_name),
+            min_fee,
+        )
+
+    @property
+    def name(self) -> str:
+        return self._spec["name"]
+
+    @property
+    def box_maps(self) -> list[str]:
+        return list(self._spec["state"]["maps"]["box"])
+
+    @property
+    def operations(self) -> list[str]:
+        return list(self._operations)
+
+    def box_size(self, map_name: str) -> int:
+        """Bytes a box of `map_name` counts toward its MBR: prefix + key + value"""
+        box_map = self._spec["state"]["maps"]["box"][map_name]
+        layout = self._layouts.get(map_name, BoxLayout())
+        prefix = base64.b64decode(box_map.get("prefix") or "")
+        return (
+            len(prefix)
+            + self._size(box_map["keyType"], layout, layout.key_size)
+            + self._size(box_map["valueType"], layout)
+        )
+
+    def box_min_balance(self, map_name: str) -> int:
+        return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * self.box_size(map_name)
+
+    def creation_min_balance(self) -> int:
+        """What creating the app adds to the creator's minimum balance"""
+        schema = self._spec["state"]["schema"]["global"]
+        byte_code = self._spec.get("byteCode") or {}
+        program_size = sum(
+            len(base64.b64decode(byte_code.get(program, ""))) for program in ("approval", "clear")
+        )
+        extra_pages = max(0, math.ceil(program_size / PROGRAM_PAGE_SIZE) - 1)
+        return (
+            APP_PAGE_MIN_BALANCE * (1 + extra_pages)
+            + SCHEMA_UINT_MIN_BALANCE * schema["ints"]
+            + SCHEMA_BYTES_MIN_BALANCE * schema["bytes"]
+        )
+
+    def deploy_cost(self) -> int:
+        """Creator spend to create the app and fund its account minimum"""
+        return self.creation_min_balance() + ACCOUNT_MIN_BALANCE + 2 * self._min_fee
+
+    def operation_cost(self, method: str) -> OperationCost:
+        operation = self._operations[method]
+        return OperationCost(
+            method=method,
+            # Inner transactions are sent with fee=0, so the outer call covers them.
+            fees=(operation.txns + operation.inner_txns) * self._min_fee,
+            min_balance=sum(
+                self.box_min_balance(creation.map_name) for creation in operation.creates
+            ),
+            caller_funded=operation.caller_funded,
+        )
+
+    def bulk_min_balance(
+        self, method: str, calls: int, accounts: int = 1, creators: int = 1
+    ) -> int:
+        """
+        App-account MBR added by `calls` calls spread over `accounts` senders,
+        buying from `creators` distinct creators
+        """
+        return sum(
+            creation.count(calls, accounts, creators) * self.box_min_balance(creation.map_name)
+            for creation in self._operations[method].creates
+        )
+
+    def app_funding(self, plan: Mapping[str, int], accounts: int = 1, creators: int = 1) -> int:
+        """
+        One payment that lets the app account absorb every call in `plan`;
+        caller-funded calls bring their own MBR and add nothing
+        """
+        return ACCOUNT_MIN_BALANCE + sum(
+            self.bulk_min_balance(method, calls, accounts, creators)
+            for method, calls in plan.items()
+            if not self._operations[method].caller_funded
+        )
+
+    def caller_funding(
+        self, plan: Mapping[str, int], accounts: int = 1, creators: int = 1
+    ) -> int:
+        """Box MBR that the calls in `plan` pay into the app with their payments"""
+        return sum(
+            self.bulk_min_balance(method, calls, accounts, creators)
+            for method, calls in plan.items()
+            if self._operations[method].caller_funded
+        )
+
+    def _size(self, type_name: str, layout: BoxLayout, raw_size: int | None = None) -> int:
+        match type_name:
+            case "AVMUint64":
+                return 8
+            case "AVMBytes" | "AVMString":
+                if raw_size is None:
+                    raise ValueError(f"Box layout needs a key_size for {type_name} keys")
+                return raw_size
+        abi_type = abi.ABIType.from_string(self._abi_type(type_name))
+        if not abi_type.is_dynamic():
+            return abi_type.byte_len()
+        return len(abi_type.encode(self._sample(type_name, abi_type, layout)))
+
+    def _abi_type(self, type_name: str) -> str:
+        fields = self._structs.get(type_name)
+        if fields is None:
+            return type_name
+        return f"({','.join(self._abi_type(field['type']) for field in fields)})"
+
+    def _sample(
+        self,
+        type_name: str,
+        abi_type: abi.ABIType,
+        layout: BoxLayout,
+        field_name: str = "",
+    ) -> Any:
+        """A value of `abi_type` whose encoding has the budgeted size"""
+        fields = self._structs.get(type_name)
+        if fields is not None:
+            assert isinstance(abi_type, abi.TupleType)
+            return [
+                self._sample(field["type"], child, layout, field["name"])
+                for field, child in zip(fields, abi_type.child_types)
+            ]
+        match abi_type:
+            case abi.StringType():
+                return "x" * layout.string_lengths.get(field_name, 0)
+            case abi.ArrayDynamicType():
+                return []
+            case abi.TupleType():
+                return [
+                    self._sample(str(child), child, layout) for child in abi_type.child_types
+                ]
+            case abi.ArrayStaticType():
+                child = abi_type.child_type
+                return [self._sample(str(child), child, layout)] * abi_type.static_length
+            case abi.AddressType():
+                return bytes(32)
+            case abi.BoolType():
+                return False
+        return 0
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m backend.costs",
+        description="Minimum-balance and fee costs of contract operations",
+    )
+    parser.add_argument("contract", help="contract name, e.g. ContextRegistry")
+    parser.add_argument(
+        "plan",
+        nargs="*",
+        metavar="METHOD=CALLS",
+        help="size a single app-account payment for a bulk run, e.g. create_context=500",
+    )
+    parser.add_argument("--accounts", type=int, default=1, help="distinct senders in the plan")
+    parser.add_argument(
+        "--creators", type=int, default=1, help="distinct creators whose items the plan buys"
+    )
+    parser.add_argument("--min-fee", type=int, default=MIN_TXN_FEE)
+    args = parser.parse_args(argv)
+
+    model = CostModel.for_contract(args.contract, args.min_fee)
+    print(
+        f"{model.name}: creation MBR {model.creation_min_balance()}, "
+        f"deploy {model.deploy_cost()}"
+    )
+    for map_name in model.box_maps:
+        print(
+            f"  box {map_name}: {model.box_size(map_name)} bytes, "
+            f"MBR {model.box_min_balance(map_name)}"
+        )
+    for method in model.operations:
+        cost = model.operation_cost(method)
+        payer = " (paid by the caller)" if cost.caller_funded else ""
+        print(
+            f"  {method}: fees {cost.fees}, MBR {cost.min_balance}{payer}, total {cost.total}"
+        )
+    if args.plan:
+        plan = {method: int(calls) for method, calls in (item.split("=") for item in args.plan)}
+        print(f"Fund app with {model.app_funding(plan, args.accounts, args.creators)} microAlgo")
+        caller_mbr = model.caller_funding(plan, args.accounts, args.creators)
+        if caller_mbr:
+            print(f"Callers pay {caller_mbr} microAlgo of box MBR with their calls")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,367 @@
+import json
+import logging
+import struct
+import threading
+from collections import OrderedDict
+from collections.abc import Iterable
+from typing import Any
+
+import msgpack
+
+try:
+    import zstandard
+except ImportError:  # optional: only needed for compressed documents
+    zstandard = None
+
+logger = logging.getLogger(__name__)
+
+# Binary AIContext documents: a fixed header, a table of sections, then
+# the sections, each a separately encoded (and optionally compressed)
+# MessagePack value. Splitting the bulky content arrays out of the head
+# lets readers get metadata and licensing without touching them.
+MAGIC = b"SCTX"
+FORMAT_VERSION = 1
+SECTIONS = ("head", "examples", "tools")
+BULK_FIELDS = SECTIONS[1:]  # keys of AIContext.content stored in their own section
+
+# magic, format version, flags, zstd dictionary id (0 for none), section count
+_HEADER = struct.Struct(">4sBBIB")
+# section index into SECTIONS, encoded length
+_SECTION = struct.Struct(">BI")
+_ZSTD = 0x01
+
+DEFAULT_COMPRESSION_LEVEL = 19  # documents are written once and read many times
+DEFAULT_DICTIONARY_SIZE = 32 * 1024
+
+DEFAULT_OFFSET_CACHE_ENTRIES = 10_000
+
+
+class DocumentError(ValueError):
+    """Raised for a malformed or unsupported context document"""
+
+
+def _require_zstandard() -> None:
+    if zstandard is None:
+        raise DocumentError("zstd compression needs the zstandard package (the compression extra)")
+
+
+def _pack(value: Any) -> bytes:
+    return msgpack.packb(value, use_bin_type=True)
+
+
+def _unpack(data: bytes | memoryview) -> Any:
+    return msgpack.unpackb(data, raw=False)
+
+
+def _split(document: dict[str, Any]) -> dict[str, Any]:
+    """The document as section name -> value, bulk fields moved out of content"""
+    content = dict(document.get("content") or {})
+    sections = {name: content.pop(name) for name in BULK_FIELDS if name in content}
+    head = dict(document)
+    if "content" in document:
+        head["content"] = content
+    return {"head": head, **sections}
+
+
+class ContextCodec:
+    """
+    Encodes AIContext documents in a versioned binary form and back.
+
+    A document is a small head (everything except `content.examples` and
+    `content.tools`) followed by those arrays as separate sections, so
+    `decode_head` reads listing data without decoding the bulk. With a
+    `dictionary` (see `train_dictionary`) or `compress=True` each section
+    is zstd-compressed on its own; a dictionary trained on real documents
+    is what makes that pay off for sections of a few hundred bytes.
+    Decoders pick the dictionary by the id in the header, so documents
+    written under an older dictionary stay readable as long as it is
+    passed in `dictionaries`. Plain JSON, which is what the frontend
+    uploads, is accepted by every decode method.
+    """
+
+    def __init__(
+        self,
+        dictionary: bytes | None = None,
+        compress: bool = False,
+        level: int = DEFAULT_COMPRESSION_LEVEL,
+        dictionaries: Iterable[bytes] = (),
+    ) -> None:
+        self._compress = compress or dictionary is not None
+        self._dictionary = None
+        self._dictionaries: dict[int, Any] = {}
+        if not self._compress and not dictionaries:
+            return
+        _require_zstandard()
+        for data in [*dictionaries, *([dictionary] if dictionary is not None else [])]:
+            loaded = zstandard.ZstdCompressionDict(data)
+            self._dictionaries[loaded.dict_id()] = loaded
+        if dictionary is not None:
+            self._dictionary = zstandard.ZstdCompressionDict(dictionary)
+        if self._compress:
+            self._compressor = zstandard.ZstdCompressor(
+                level=level, dict_data=self._dictionary
+            )
+
+    def encode(self, document: dict[str, Any]) -> bytes:
+        sections = _split(document)
+        encoded = [(SECTIONS.index(name), _pack(value)) for name, value in sections.items()]
+        flags = dict_id = 0
+        if self._compress:
+            flags |= _ZSTD
+            dict_id = self._dictionary.dict_id() if self._dictionary is not None else 0
+            encoded = [(index, self._compressor.compress(data)) for index, data in encoded]
+        out = bytearray(_HEADER.pack(MAGIC, FORMAT_VERSION, flags, dict_id, len(encoded)))
+        for index, data in encoded:
+            out += _SECTION.pack(index, len(data))
+        for _, data in encoded:
+            out += data
+        return bytes(out)
+
+    def decode(self, data: bytes | memoryview) -> dict[str, Any]:
+        if not is_binary(data):
+            return json.loads(bytes(data))
+        sections = {name: self._section(data, name) for name in self.sections(data)}
+        document = sections.pop("head")
+        if sections:
+            document["content"] = {**document.get("content", {}), **sections}
+        return document
+
+    def decode_head(self, data: bytes | memoryview) -> dict[str, Any]:
+        """The document without its bulk content fields"""
+        if not is_binary(data):
+            return _split(json.loads(bytes(data)))["head"]
+        return self._section(data, "head")
+
+    def decode_field(self, data: bytes | memoryview, name: str) -> Any:
+        """One bulk content field (see BULK_FIELDS), or None if absent"""
+        if name not in BULK_FIELDS:
+            raise DocumentError(f"{name} is not stored in its own section")
+        if not is_binary(data):
+            return json.loads(bytes(data)).get("content", {}).get(name)
+        if name not in self.sections(data):
+            return None
+        return self._section(data, name)
+
+    def sections(self, data: bytes | memoryview) -> dict[str, memoryview]:
+        """Section name -> its encoded bytes, without decoding any of them"""
+        view = memoryview(data)
+        if len(view) < _HEADER.size:
+            raise DocumentError("Truncated document header")
+        magic, version, _, _, count = _HEADER.unpack_from(view)
+        if magic != MAGIC:
+            raise DocumentError("Not a binary context document")
+        if version != FORMAT_VERSION:
+            raise DocumentError(f"Unsupported document format version {version}")
+        offset = _HEADER.size + count * _SECTION.size
+        sections = {}
+        for i in range(count):
+            index, length = _SECTION.unpack_from(view, _HEADER.size + i * _SECTION.size)
+            if index >= len(SECTIONS) or offset + length > len(view):
+                raise DocumentError("Corrupt document section table")
+            sections[SECTIONS[index]] = view[offset : offset + length]
+            offset += length
+        return sections
+
+    def section_bytes(self, data: bytes | memoryview, name: str) -> bytes | memoryview:
+        """The MessagePack encoding of one section, decompressed if need be"""
+        raw = self.sections(data)[name]
+        _, _, flags, dict_id, _ = _HEADER.unpack_from(data)
+        if flags & _ZSTD:
+            return self._decompressor(dict_id).decompress(raw)
+        return raw
+
+    def _section(self, data: bytes | memoryview, name: str) -> Any:
+        raw = self.section_bytes(data, name)
+        try:
+            return _unpack(raw)
+        except (ValueError, msgpack.UnpackException) as e:
+            raise DocumentError(f"Corrupt {name} section: {e}") from e
+
+    def _decompressor(self, dict_id: int) -> Any:
+        _require_zstandard()
+        if dict_id and dict_id not in self._dictionaries:
+            raise DocumentError(f"Document needs zstd dictionary {dict_id}")
+        return zstandard.ZstdDecompressor(dict_data=self._dictionaries.get(dict_id))
+
+
+def is_binary(data: bytes | memoryview) -> bool:
+    return bytes(data[: len(MAGIC)]) == MAGIC
+
+
+def train_dictionary(
+    documents: Iterable[dict[str, Any]], size: int = DEFAULT_DICTIONARY_SIZE
+) -> bytes:
+    """Train a zstd dictionary on the sections of sample documents"""
+    _require_zstandard()
+    samples = [
+        _pack(value) for document in documents for value in _split(document).values()
+    ]
+    dictionary = zstandard.train_dictionary(size, samples)
+    logger.info(f"Trained {len(dictionary.as_bytes())}-byte dictionary {dictionary.dict_id()}")
+    return dictionary.as_bytes()
+
+
+# Path -> (start, end) of its encoded value within the head section.
+Offsets = dict[str, tuple[int, int]]
+
+_MISSING = object()
+
+
+def _is_map(first_byte: int) -> bool:
+    return 0x80 <= first_byte <= 0x8F or first_byte in (0xDE, 0xDF)
+
+
+def index_head(head: bytes | memoryview) -> Offsets:
+    """Offsets of every map entry in an encoded head, keyed by dotted path"""
+    view = memoryview(head)
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(view)
+    offsets: Offsets = {}
+
+    def walk(prefix: str) -> None:
+        for _ in range(unpacker.read_map_header()):
+            path = f"{prefix}{unpacker.unpack()}"
+            start = unpacker.tell()
+            if start < len(view) and _is_map(view[start]):
+                walk(path + ".")
+            else:
+                unpacker.skip()  # arrays and scalars are indexed as a whole
+            offsets[path] = (start, unpacker.tell())
+
+    if not view or not _is_map(view[0]):
+        raise DocumentError("Document head is not a map")
+    try:
+        walk("")
+    except (ValueError, msgpack.UnpackException) as e:
+        raise DocumentError(f"Corrupt head section: {e}") from e
+    return offsets
+
+
+class ContextView:
+    """
+    Read-only view of a stored context document that decodes on demand.
+
+    Fields are addressed by dotted path, e.g. `view["metadata.title"]`.
+    The first access scans the head section once, skipping values without
+    building them, to record where each field's encoding starts and ends;
+    every access after that decodes just that slice of the buffer, which
+    may be an mmap from `BlobCache` so nothing else is read. Bulk fields
+    (`content.examples`, `content.tools`) come from their own sections and
+    are not touched unless asked for, directly or through `content` as a
+    whole. Pass `offsets` from an earlier view
+    of the same bytes to skip the scan. Legacy JSON documents have no
+    offsets to index, so they are parsed in full on first access.
+    """
+
+    def __init__(
+        self,
+        data: bytes | memoryview,
+        codec: "ContextCodec | None" = None,
+        offsets: Offsets | None = None,
+    ) -> None:
+        self._data = memoryview(data)
+        self._codec = codec or ContextCodec()
+        self._binary = is_binary(self._data)
+        self._offsets = offsets
+        self._head: bytes | memoryview | None = None
+        self._document: dict[str, Any] | None = None
+        self._decoded: dict[str, Any] = {}
+
+    @property
+    def offsets(self) -> Offsets:
+        if not self._binary:
+            return {}
+        if self._offsets is None:
+            self._offsets = index_head(self._head_bytes())
+        return self._offsets
+
+    def __getitem__(self, path: str) -> Any:
+        value = self.get(path, _MISSING)
+        if value is _MISSING:
+            raise KeyError(path)
+        return value
+
+    def __contains__(self, path: str) -> bool:
+        return self.get(path, _MISSING) is not _MISSING
+
+    def get(self, path: str, default: Any = None) -> Any:
+        if path in self._decoded:
+            return self._decoded[path]
+        if not self._binary:
+            value: Any = self._parsed()
+            for key in path.split("."):
+                if not isinstance(value, dict) or key not in value:
+                    return default
+                value = value[key]
+            return value
+        section = path.removeprefix("content.")
+        if section in BULK_FIELDS and path != section:
+            if section not in self._codec.sections(self._data):
+                return default
+            value = self._codec.decode_field(self._data, section)
+        elif path in self.offsets:
+            start, end = self.offsets[path]
+            value = _unpack(self._head_bytes()[start:end])
+            if path == "content":
+                # Whole content, as a JSON document would give it.
+                sections = self._codec.sections(self._data)
+                for name in BULK_FIELDS:
+                    if name in sections:
+                        value[name] = self._codec.decode_field(self._data, name)
+        else:
+            return default
+        self._decoded[path] = value
+        return value
+
+    def to_dict(self) -> dict[str, Any]:
+        return self._codec.decode(self._data)
+
+    def _head_bytes(self) -> bytes | memoryview:
+        if self._head is None:
+            self._head = self._codec.section_bytes(self._data, "head")
+        return self._head
+
+    def _parsed(self) -> dict[str, Any]:
+        if self._document is None:
+            self._document = json.loads(bytes(self._data))
+        return self._document
+
+
+class OffsetCache:
+    """
+    Head offsets of recently viewed documents, keyed by CID.
+
+    A CID names exact bytes, so offsets indexed once stay valid for every
+    later copy of that document, wherever it was fetched from. Listing
+    endpoints that view the same contexts over and over therefore pay for
+    the scan once per document rather than once per request. The least
+    recently used entry goes once `max_entries` is reached.
+    """
+
+    def __init__(
+        self,
+        codec: "ContextCodec | None" = None,
+        max_entries: int = DEFAULT_OFFSET_CACHE_ENTRIES,
+    ) -> None:
+        self._codec = codec or ContextCodec()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self._offsets: OrderedDict[str, Offsets] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def view(self, cid: str, data: bytes | memoryview) -> ContextView:
+        """A view of `data`, which must be the document `cid` names"""
+        with self._lock:
+            offsets = self._offsets.get(cid)
+            if offsets is not None:
+                self._offsets.move_to_end(cid)
+                return ContextView(data, self._codec, offsets)
+        view = ContextView(data, self._codec)
+        offsets = view.offsets  # index outside the lock
+        with self._lock:
+            self._offsets[cid] = offsets
+            while len(self._offsets) > self._max_entries:
+                self._offsets.popitem(last=False)
+        return view
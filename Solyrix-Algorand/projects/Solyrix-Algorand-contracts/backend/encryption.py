@@ -0,0 +1,318 @@
+import base64
+import functools
+import hashlib
+import hmac
+import json
+import logging
+import os
+import struct
+import tempfile
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import BinaryIO, TypedDict
+
+# pycryptodomex ships with py-algorand-sdk; its AES-GCM releases the GIL,
+# so chunks encrypt in parallel on threads.
+from Cryptodome.Cipher import AES
+
+logger = logging.getLogger(__name__)
+
+# Must match the frontend's utils/encryption.ts.
+ALGORITHM = "AES-GCM"
+KEY_LENGTH = 32  # 256 bits
+IV_LENGTH = 12  # 96 bits for GCM
+SALT_LENGTH = 16  # 128 bits
+ITERATIONS = 100_000  # PBKDF2-SHA256 iterations
+TAG_LENGTH = 16
+
+# Streams use the same key derivation and envelope fields, with the
+# ciphertext written as a sequence of independently sealed chunks.
+STREAM_ALGORITHM = "AES-GCM-STREAM"
+DEFAULT_CHUNK_SIZE = 1 << 20
+
+DEFAULT_KEY_CACHE_ENTRIES = 1024
+DEFAULT_KEY_CACHE_TTL = 15 * 60  # seconds
+
+# Chunk index and a last-chunk flag are the associated data of every chunk,
+# so reordering, dropping or truncating chunks fails authentication.
+_CHUNK_AAD = struct.Struct(">QB")
+
+
+class EncryptedContextData(TypedDict):
+    encryptedContent: str
+    iv: str
+    salt: str
+    algorithm: str
+
+
+class StreamHeader(EncryptedContextData):
+    chunkSize: int
+
+
+class DecryptionError(Exception):
+    """Raised on a wrong password or tampered, reordered or truncated data"""
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.b64encode(data).decode()
+
+
+def derive_key(password: str, salt: bytes) -> bytes:
+    return hashlib.pbkdf2_hmac("sha256", password.encode(), salt, ITERATIONS, KEY_LENGTH)
+
+
+class DerivedKeyCache:
+    """
+    Keeps PBKDF2 output so re-serving a context costs only the AES work.
+
+    Entries are keyed by (salt, key id), where the key id names the password
+    without containing it, e.g. a context id. They expire `ttl` seconds after
+    derivation and the least recently used one goes once `max_entries` is
+    reached. Keys live in bytearrays that are overwritten with zeros when
+    they expire, are evicted or the cache is cleared.
+
+    Each entry also holds an HMAC of the password keyed by the salt, so a
+    hit is served only to the password that derived it; any other password
+    gets a fresh derivation, which then fails to decrypt as it would
+    without the cache.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_KEY_CACHE_ENTRIES,
+        ttl: float = DEFAULT_KEY_CACHE_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl
+        self._clock = clock
+        self._lock = threading.Lock()
+        # (salt, key id) -> (key, password verifier, expiry)
+        self._keys: OrderedDict[tuple[bytes, str], tuple[bytearray, bytes, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def derive(self, password: str, salt: bytes, key_id: str) -> bytes:
+        """The key for `password` and `salt`, deriving it on a miss"""
+        entry = (bytes(salt), key_id)
+        verifier = hmac.new(entry[0], password.encode(), hashlib.sha256).digest()
+        now = self._clock()
+        with self._lock:
+            cached = self._keys.get(entry)
+            if cached is not None and now < cached[2] and hmac.compare_digest(cached[1], verifier):
+                self._keys.move_to_end(entry)
+                # A copy, so an eviction zeroizing the entry cannot break its user.
+                return bytes(cached[0])
+        # Derive outside the lock so a miss does not stall every other reader.
+        key = bytearray(derive_key(password, salt))
+        with self._lock:
+            self._discard(entry)
+            self._expire(now)
+            while len(self._keys) >= self._max_entries:
+                self._discard(next(iter(self._keys)))
+            self._keys[entry] = (key, verifier, now + self._ttl)
+            return bytes(key)
+
+    def evict(self, salt: bytes, key_id: str) -> None:
+        with self._lock:
+            self._discard((bytes(salt), key_id))
+
+    def clear(self) -> None:
+        with self._lock:
+            while self._keys:
+                self._discard(next(iter(self._keys)))
+
+    def _expire(self, now: float) -> None:
+        for entry in [entry for entry, (_, _, expiry) in self._keys.items() if expiry <= now]:
+            self._discard(entry)
+
+    def _discard(self, entry: tuple[bytes, str]) -> None:
+        cached = self._keys.pop(entry, None)
+        if cached is not None:
+            cached[0][:] = bytes(KEY_LENGTH)
+
+
+def _key(
+    password: str, salt: bytes, key_cache: DerivedKeyCache | None, key_id: str | None
+) -> bytes:
+    if key_cache is None:
+        return derive_key(password, salt)
+    if key_id is None:
+        raise ValueError("A key cache needs a key_id naming the password")
+    return key_cache.derive(password, salt, key_id)
+
+
+def encrypt_data(data: str, password: str) -> EncryptedContextData:
+    """Encrypt exactly as the frontend's `encryptData` does"""
+    salt = os.urandom(SALT_LENGTH)
+    iv = os.urandom(IV_LENGTH)
+    cipher = AES.new(derive_key(password, salt), AES.MODE_GCM, nonce=iv)
+    ciphertext, tag = cipher.encrypt_and_digest(data.encode())
+    return EncryptedContextData(
+        encryptedContent=_b64encode(ciphertext + tag),
+        iv=_b64encode(iv),
+        salt=_b64encode(salt),
+        algorithm=ALGORITHM,
+    )
+
+
+def decrypt_data(
+    encrypted: EncryptedContextData,
+    password: str,
+    key_cache: DerivedKeyCache | None = None,
+    key_id: str | None = None,
+) -> str:
+    """Decrypt the output of the frontend's `encryptData` or `encrypt_data`"""
+    sealed = base64.b64decode(encrypted["encryptedContent"])
+    key = _key(password, base64.b64decode(encrypted["salt"]), key_cache, key_id)
+    cipher = AES.new(key, AES.MODE_GCM, nonce=base64.b64decode(encrypted["iv"]))
+    try:
+        plaintext = cipher.decrypt_and_verify(sealed[:-TAG_LENGTH], sealed[-TAG_LENGTH:])
+    except ValueError as e:
+        raise DecryptionError("Invalid password or corrupted data") from e
+    return plaintext.decode()
+
+
+def _chunk_nonce(iv: bytes, index: int) -> bytes:
+    # Distinct per chunk: the random base IV XOR the chunk index.
+    return (int.from_bytes(iv, "big") ^ index).to_bytes(IV_LENGTH, "big")
+
+
+def _seal(key: bytes, iv: bytes, index: int, chunk: bytes, last: bool) -> bytes:
+    cipher = AES.new(key, AES.MODE_GCM, nonce=_chunk_nonce(iv, index))
+    cipher.update(_CHUNK_AAD.pack(index, last))
+    ciphertext, tag = cipher.encrypt_and_digest(chunk)
+    return ciphertext + tag
+
+
+def _open(key: bytes, iv: bytes, index: int, sealed: bytes, last: bool) -> bytes:
+    cipher = AES.new(key, AES.MODE_GCM, nonce=_chunk_nonce(iv, index))
+    cipher.update(_CHUNK_AAD.pack(index, last))
+    try:
+        return cipher.decrypt_and_verify(sealed[:-TAG_LENGTH], sealed[-TAG_LENGTH:])
+    except ValueError as e:
+        raise DecryptionError(f"Chunk {index} failed authentication") from e
+
+
+def _chunks(src: BinaryIO, size: int) -> Iterator[tuple[int, bytes, bool]]:
+    """Yield (index, chunk, is_last), reading one chunk ahead to spot the end"""
+    index = 0
+    chunk = src.read(size)
+    while True:
+        following = src.read(size) if len(chunk) == size else b""
+        last = not following
+        yield index, chunk, last
+        if last:
+            return
+        index, chunk = index + 1, following
+
+
+def _ordered(
+    executor: ThreadPoolExecutor,
+    fn: Callable[[int, bytes, bool], bytes],
+    items: Iterable[tuple[int, bytes, bool]],
+    window: int,
+) -> Iterator[bytes]:
+    """Map `fn` over `items` in parallel, in order, with at most `window` in flight"""
+    pending: deque[Future[bytes]] = deque()
+    for item in items:
+        pending.append(executor.submit(fn, *item))
+        if len(pending) >= window:
+            yield pending.popleft().result()
+    while pending:
+        yield pending.popleft().result()
+
+
+def encrypt_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    password: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    workers: int | None = None,
+) -> StreamHeader:
+    """
+    Encrypt `src` into `dst` without holding it in memory.
+
+    `dst` gets a JSON header line with the `EncryptedContextData` fields
+    (`encryptedContent` left empty) plus `chunkSize`, followed by the sealed
+    chunks, each `chunkSize` + 16 bytes except the last. At most two chunks
+    per worker are buffered at a time.
+    """
+    salt = os.urandom(SALT_LENGTH)
+    iv = os.urandom(IV_LENGTH)
+    key = derive_key(password, salt)
+    header = StreamHeader(
+        encryptedContent="",
+        iv=_b64encode(iv),
+        salt=_b64encode(salt),
+        algorithm=STREAM_ALGORITHM,
+        chunkSize=chunk_size,
+    )
+    dst.write(json.dumps(header).encode() + b"\n")
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(workers, "encrypt") as executor:
+        seal = functools.partial(_seal, key, iv)
+        count = 0
+        for sealed in _ordered(executor, seal, _chunks(src, chunk_size), 2 * workers):
+            dst.write(sealed)
+            count += 1
+    logger.debug(f"Encrypted {count} chunks of up to {chunk_size} bytes")
+    return header
+
+
+def decrypt_stream(
+    src: BinaryIO,
+    dst: BinaryIO,
+    password: str,
+    workers: int | None = None,
+    key_cache: DerivedKeyCache | None = None,
+    key_id: str | None = None,
+) -> None:
+    """
+    Decrypt the output of `encrypt_stream`; raises `DecryptionError` on tampering.
+
+    Each chunk is written to `dst` once it authenticates, but a truncated
+    stream is only detected at its end, so a caller must discard `dst` if
+    this raises. `decrypt_file` does that for files.
+    """
+    header: StreamHeader = json.loads(src.readline())
+    if header["algorithm"] != STREAM_ALGORITHM:
+        raise DecryptionError(f"Not a stream: {header['algorithm']}")
+    iv = base64.b64decode(header["iv"])
+    key = _key(password, base64.b64decode(header["salt"]), key_cache, key_id)
+    workers = workers or os.cpu_count() or 1
+    with ThreadPoolExecutor(workers, "decrypt") as executor:
+        unseal = functools.partial(_open, key, iv)
+        sealed_chunks = _chunks(src, header["chunkSize"] + TAG_LENGTH)
+        for chunk in _ordered(executor, unseal, sealed_chunks, 2 * workers):
+            dst.write(chunk)
+
+
+def encrypt_file(
+    src: Path, dst: Path, password: str, chunk_size: int = DEFAULT_CHUNK_SIZE
+) -> StreamHeader:
+    with src.open("rb") as reader, dst.open("wb") as writer:
+        return encrypt_stream(reader, writer, password, chunk_size)
+
+
+def decrypt_file(
+    src: Path,
+    dst: Path,
+    password: str,
+    key_cache: DerivedKeyCache | None = None,
+    key_id: str | None = None,
+) -> None:
+    """Decrypt `src` to `dst`, which only appears once every chunk has authenticated"""
+    fd, tmp = tempfile.mkstemp(dir=dst.parent, prefix=f".{dst.name}.")
+    try:
+        with src.open("rb") as reader, os.fdopen(fd, "wb") as writer:
+            decrypt_stream(reader, writer, password, key_cache=key_cache, key_id=key_id)
+        os.replace(tmp, dst)
+    except BaseException:
+        os.unlink(tmp)
+        raise
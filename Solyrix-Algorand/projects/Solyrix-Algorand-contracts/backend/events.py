@@ -0,0 +1,101 @@
+import base64
+import dataclasses
+import json
+from collections.abc import Iterable
+from pathlib import Path
+from typing import Any, Protocol
+
+from algosdk import abi
+from algosdk.encoding import checksum
+
+
+class _Event(Protocol):
+    name: str
+    args: list[Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class DecodedEvent:
+    name: str
+    signature: str
+    fields: dict[str, Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class _EventType:
+    name: str
+    signature: str
+    arg_names: list[str]
+    codec: abi.TupleType
+
+
+def _arg_attr(arg: Any, key: str) -> Any:
+    return arg[key] if isinstance(arg, dict) else getattr(arg, key)
+
+
+class EventDecoder:
+    """
+    Decodes ARC-28 event logs using the `events` section of an ARC-56 spec.
+
+    An event log is the first 4 bytes of sha512_256 over the event signature
+    followed by the ARC-4 tuple of its fields.
+    """
+
+    def __init__(self, events: Iterable[_Event | dict[str, Any]]) -> None:
+        self._by_selector: dict[bytes, _EventType] = {}
+        for event in events:
+            name = _arg_attr(event, "name")
+            args = _arg_attr(event, "args")
+            types = [_arg_attr(arg, "type") for arg in args]
+            signature = f"{name}({','.join(types)})"
+            selector = checksum(signature.encode())[:4]
+            self._by_selector[selector] = _EventType(
+                name=name,
+                signature=signature,
+                arg_names=[
+                    _arg_attr(arg, "name") or f"field{i}" for i, arg in enumerate(args)
+                ],
+                codec=abi.TupleType([abi.ABIType.from_string(t) for t in types]),
+            )
+
+    @classmethod
+    def from_app_spec(cls, app_spec: Any) -> "EventDecoder":
+        """Build from a generated client's `APP_SPEC` (`algokit_utils.Arc56Contract`)"""
+        return cls(app_spec.events or [])
+
+    @classmethod
+    def from_arc56_file(cls, path: Path) -> "EventDecoder":
+        return cls(json.loads(path.read_text()).get("events", []))
+
+    @property
+    def event_names(self) -> list[str]:
+        return [event.name for event in self._by_selector.values()]
+
+    def decode(self, log: bytes) -> DecodedEvent | None:
+        """Decode one log line, or return None if it is not a known event"""
+        event = self._by_selector.get(bytes(log[:4]))
+        if event is None:
+            return None
+        values = event.codec.decode(bytes(log[4:]))
+        return DecodedEvent(
+            name=event.name,
+            signature=event.signature,
+            fields=dict(zip(event.arg_names, values)),
+        )
+
+    def decode_logs(self, logs: Iterable[bytes | str]) -> list[DecodedEvent]:
+        """Decode every event in a transaction's logs; base64 strings are accepted"""
+        decoded: list[DecodedEvent] = []
+        for log in logs:
+            raw = base64.b64decode(log) if isinstance(log, str) else log
+            event = self.decode(raw)
+            if event is not None:
+                decoded.append(event)
+        return decoded
+
+    def decode_confirmation(self, confirmation: dict[str, Any]) -> list[DecodedEvent]:
+        """Decode events from a pending-transaction response, including inner calls"""
+        events = self.decode_logs(confirmation.get("logs", []))
+        for inner in confirmation.get("inner-txns", []):
+            events.extend(self.decode_confirmation(inner))
+        return events
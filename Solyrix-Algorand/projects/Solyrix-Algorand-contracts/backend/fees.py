@@ -0,0 +1,86 @@
+import base64
+import dataclasses
+import logging
+import threading
+import time
+
+from algosdk.v2client.algod import AlgodClient
+
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import MarketplaceEvent, PlatformFeeUpdated
+
+logger = logging.getLogger(__name__)
+
+# Global state key written by ContextRegistry and LicenseManager.
+PLATFORM_FEE_KEY = b"platform_fee"
+
+# Seconds an entry is served without hearing from the follower.
+DEFAULT_MAX_AGE = 60.0
+
+
+@dataclasses.dataclass(frozen=True)
+class _CachedFee:
+    fee_bps: int
+    round: int  # round the value is known to be current as of
+    checked_at: float  # time.monotonic() of the read or change
+
+
+class PlatformFeeCache:
+    """
+    Platform fees of the marketplace apps, read from global state once and
+    then served from memory.
+
+    Each entry remembers the round it was read or last changed at. Register
+    `on_block` with `MarketplaceIndexer.add_listener`: a `PlatformFeeUpdated`
+    event from a round at or after the entry replaces it in place, so the
+    cache never goes back to algod while the follower is running. Entries
+    are only trusted for `max_age` seconds past the later of their own read
+    and the follower's last block, so a cache without a follower, or with
+    one that stopped, re-reads stale fees instead of serving them forever.
+    """
+
+    def __init__(self, algod_client: AlgodClient, max_age: float = DEFAULT_MAX_AGE) -> None:
+        self._algod = algod_client
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._fees: dict[int, _CachedFee] = {}
+        self._followed_at = float("-inf")  # time.monotonic() of the last block seen
+
+    def get(self, app_id: int) -> int:
+        """Platform fee of `app_id` in basis points"""
+        cached = self._fees.get(app_id)
+        if cached is not None:
+            age = time.monotonic() - max(cached.checked_at, self._followed_at)
+            if age < self._max_age:
+                return cached.fee_bps
+        return self.refresh(app_id)
+
+    def refresh(self, app_id: int) -> int:
+        """Re-read the fee from algod, e.g. after the follower was down"""
+        # Taken before the read, so a change in a later round always wins.
+        current_round = self._algod.status()["last-round"]
+        fee_bps = read_platform_fee(self._algod, app_id)
+        self._remember(app_id, fee_bps, current_round)
+        return fee_bps
+
+    def on_block(self, block: Block, events: list[MarketplaceEvent]) -> None:
+        """`MarketplaceIndexer` listener: apply fee changes as they are confirmed"""
+        self._followed_at = time.monotonic()
+        for event in events:
+            if isinstance(event, PlatformFeeUpdated):
+                logger.info(f"Platform fee of app {event.app_id} is now {event.fee_bps} bps")
+                self._remember(event.app_id, event.fee_bps, event.round)
+
+    def _remember(self, app_id: int, fee_bps: int, round_: int) -> None:
+        with self._lock:
+            cached = self._fees.get(app_id)
+            if cached is None or round_ >= cached.round:
+                self._fees[app_id] = _CachedFee(fee_bps, round_, time.monotonic())
+
+
+def read_platform_fee(algod_client: AlgodClient, app_id: int) -> int:
+    state = algod_client.application_info(app_id)["params"].get("global-state", [])
+    for entry in state:
+        if base64.b64decode(entry["key"]) == PLATFORM_FEE_KEY:
+            return entry["value"]["uint"]
+    raise KeyError(f"App {app_id} has no platform fee in global state")
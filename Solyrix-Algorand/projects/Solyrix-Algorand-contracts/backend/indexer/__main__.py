@@ -0,0 +1,60 @@
+import logging
+import os
+import sys
+from pathlib import Path
+
+import algokit_utils
+from dotenv import load_dotenv
+
+from backend.indexer.blocks import AlgodBlockSource
+from backend.indexer.decoder import MarketplaceDecoder
+from backend.indexer.metadata import MetadataFetcher
+from backend.indexer.search import ContextSearchIndex
+from backend.indexer.service import MarketplaceIndexer
+from backend.indexer.store import MarketplaceStore
+from backend.ipfs.cache import BlobCache
+from backend.ipfs.gateways import DEFAULT_GATEWAYS, GatewayFetcher
+
+logging.basicConfig(
+    level=logging.INFO, format="%(asctime)s %(levelname)-10s: %(message)s"
+)
+logger = logging.getLogger(__name__)
+load_dotenv()
+
+
+def main(db_path: str) -> None:
+    algorand = algokit_utils.AlgorandClient.from_environment()
+    decoder = MarketplaceDecoder(
+        context_registry_app_id=int(os.environ["CONTEXT_REGISTRY_APP_ID"]),
+        license_manager_app_id=int(os.environ["LICENSE_MANAGER_APP_ID"]),
+    )
+    store = MarketplaceStore(db_path)
+    indexer = MarketplaceIndexer(
+        source=AlgodBlockSource(
+            algorand.client.algod,
+            include_box_changes=os.getenv("INDEXER_BOX_DELTAS") == "1",
+        ),
+        decoder=decoder,
+        store=store,
+        start_round=int(os.getenv("INDEXER_START_ROUND", "1")),
+    )
+    search = ContextSearchIndex(store.connection)
+    indexer.add_listener(search.on_block)
+    gateways = os.getenv("IPFS_GATEWAYS")
+    cache_dir = os.getenv("IPFS_CACHE_DIR")
+    metadata = MetadataFetcher(
+        GatewayFetcher(
+            gateways.split(",") if gateways else DEFAULT_GATEWAYS,
+            cache=BlobCache(Path(cache_dir)) if cache_dir else None,
+        ),
+        consumers=[store.apply_metadata, search.apply_metadata],
+    )
+    indexer.add_listener(metadata.on_block)
+    try:
+        indexer.run()
+    finally:
+        metadata.close()
+
+
+if __name__ == "__main__":
+    main(sys.argv[1] if len(sys.argv) > 1 else "marketplace.sqlite")
@@ -0,0 +1,166 @@
+import dataclasses
+import logging
+import queue
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any, Protocol
+
+import msgpack
+from algosdk import encoding
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.algod import AlgodClient
+
+logger = logging.getLogger(__name__)
+
+# Box keys in ledger state deltas are "bx:" + big-endian app id + box name.
+_BOX_DELTA_PREFIX = b"bx:"
+
+
+@dataclasses.dataclass(frozen=True)
+class AppCall:
+    """A (possibly inner) application call as it appeared in a block"""
+
+    app_id: int
+    sender: str
+    args: list[bytes]
+    logs: list[bytes]
+    intra: int  # position of the top-level transaction in the block
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxChange:
+    app_id: int
+    name: bytes
+    value: bytes | None  # None when the box was deleted
+
+
+@dataclasses.dataclass(frozen=True)
+class Block:
+    round: int
+    timestamp: int
+    app_calls: list[AppCall]
+    box_changes: list[BoxChange] = dataclasses.field(default_factory=list)
+
+
+class BlockSource(Protocol):
+    def blocks(self, start_round: int) -> Iterator[Block]:
+        """Yield blocks in order, starting at `start_round`, forever"""
+        ...
+
+
+def _collect_app_calls(
+    stxn: dict[bytes, Any], intra: int, out: list[AppCall]
+) -> None:
+    txn = stxn.get(b"txn", {})
+    apply_data = stxn.get(b"dt", {})
+    if txn.get(b"type") == b"appl":
+        out.append(
+            AppCall(
+                app_id=txn.get(b"apid", 0) or stxn.get(b"apid", 0),
+                sender=encoding.encode_address(txn[b"snd"]),
+                args=list(txn.get(b"apaa", [])),
+                logs=list(apply_data.get(b"lg", [])),
+                intra=intra,
+            )
+        )
+    for inner in apply_data.get(b"itx", []):
+        _collect_app_calls(inner, intra, out)
+
+
+def decode_block(raw: bytes) -> Block:
+    """Decode a msgpack block response into the app calls it contains"""
+    # Logs, args and state-delta keys are arbitrary bytes that msgpack
+    # encodes as str, so nothing is decoded as UTF-8; keys and the
+    # transaction type are compared as bytes instead.
+    block = msgpack.unpackb(raw, raw=True, strict_map_key=False)[b"block"]
+    app_calls: list[AppCall] = []
+    for intra, stxn in enumerate(block.get(b"txns", [])):
+        _collect_app_calls(stxn, intra, app_calls)
+    return Block(
+        round=block.get(b"rnd", 0), timestamp=block.get(b"ts", 0), app_calls=app_calls
+    )
+
+
+def decode_box_changes(raw: bytes) -> list[BoxChange]:
+    """Extract box writes and deletes from a msgpack ledger state delta"""
+    delta = msgpack.unpackb(raw, raw=True, strict_map_key=False)
+    kv_mods = delta.get(b"Kv") or delta.get(b"KvMods") or {}
+    changes: list[BoxChange] = []
+    for key, mod in kv_mods.items():
+        if not key.startswith(_BOX_DELTA_PREFIX):
+            continue
+        body = key[len(_BOX_DELTA_PREFIX) :]
+        changes.append(
+            BoxChange(
+                app_id=int.from_bytes(body[:8], "big"),
+                name=body[8:],
+                value=mod.get(b"Data"),
+            )
+        )
+    return changes
+
+
+class AlgodBlockSource:
+    """
+    Follows an algod node block by block.
+
+    Box changes come from the `/v2/deltas/{round}` endpoint, which is only
+    served by nodes running in follow mode; leave `include_box_changes`
+    off against a regular node.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        include_box_changes: bool = False,
+        retry_delay: float = 1.0,
+    ) -> None:
+        self._algod = algod_client
+        self._include_box_changes = include_box_changes
+        self._retry_delay = retry_delay
+
+    def blocks(self, start_round: int) -> Iterator[Block]:
+        current = start_round
+        while True:
+            try:
+                self._algod.status_after_block(current - 1)
+                block = decode_block(
+                    self._algod.block_info(current, response_format="msgpack")
+                )
+                if self._include_box_changes:
+                    block = dataclasses.replace(
+                        block,
+                        box_changes=decode_box_changes(
+                            self._algod.get_ledger_state_delta(
+                                current, response_format="msgpack"
+                            )
+                        ),
+                    )
+            except (AlgodHTTPError, ValueError) as e:
+                # ValueError covers msgpack's errors on a truncated response.
+                logger.warning(f"Failed to fetch round {current}: {e}")
+                time.sleep(self._retry_delay)
+                continue
+            yield block
+            current += 1
+
+
+class LocalBlockSource:
+    """In-process stand-in for a node, fed with `Block`s by the caller"""
+
+    def __init__(self, blocks: Iterable[Block] = ()) -> None:
+        self._queue: queue.Queue[Block | None] = queue.Queue()
+        for block in blocks:
+            self.push(block)
+
+    def push(self, block: Block) -> None:
+        self._queue.put(block)
+
+    def close(self) -> None:
+        """End the stream once the already-pushed blocks are consumed"""
+        self._queue.put(None)
+
+    def blocks(self, start_round: int) -> Iterator[Block]:
+        while (block := self._queue.get()) is not None:
+            if block.round >= start_round:
+                yield block
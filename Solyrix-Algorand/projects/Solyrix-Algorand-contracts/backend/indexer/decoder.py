@@ -0,0 +1,277 @@
+import dataclasses
+import json
+import logging
+from pathlib import Path
+
+from algosdk import abi
+
+from backend.events import DecodedEvent, EventDecoder
+from backend.indexer.blocks import AppCall, Block, BoxChange
+
+logger = logging.getLogger(__name__)
+
+ARTIFACTS_PATH = Path(__file__).parents[2] / "smart_contracts" / "artifacts"
+
+
+@dataclasses.dataclass(frozen=True)
+class ContextCreated:
+    round: int
+    timestamp: int
+    intra: int
+    context_id: int
+    creator: str
+    ipfs_hash: str
+    title: str
+    price: int
+
+
+@dataclasses.dataclass(frozen=True)
+class ContextPurchased:
+    round: int
+    timestamp: int
+    intra: int
+    context_id: int
+    buyer: str
+
+
+@dataclasses.dataclass(frozen=True)
+class ContextRated:
+    round: int
+    timestamp: int
+    intra: int
+    context_id: int
+    rater: str
+    rating: int
+    previous_rating: int  # 0 on a buyer's first rating
+
+
+@dataclasses.dataclass(frozen=True)
+class LicenseCreated:
+    round: int
+    timestamp: int
+    intra: int
+    license_id: int
+    context_id: int
+    creator: str
+    license_type: int
+    price: int
+
+
+@dataclasses.dataclass(frozen=True)
+class LicensePurchased:
+    round: int
+    timestamp: int
+    intra: int
+    license_id: int
+    buyer: str
+    expiry: int  # 0 = never expires
+
+
+@dataclasses.dataclass(frozen=True)
+class LicenseRenewed:
+    round: int
+    timestamp: int
+    intra: int
+    license_id: int
+    holder: str
+    expiry: int
+
+
+@dataclasses.dataclass(frozen=True)
+class LicenseRevoked:
+    round: int
+    timestamp: int
+    intra: int
+    license_id: int
+    holder: str
+
+
+@dataclasses.dataclass(frozen=True)
+class LicenseUsed:
+    round: int
+    timestamp: int
+    intra: int
+    license_id: int
+    holder: str
+    usage_count: int
+
+
+@dataclasses.dataclass(frozen=True)
+class PlatformFeeUpdated:
+    round: int
+    timestamp: int
+    intra: int
+    app_id: int
+    fee_bps: int
+
+
+@dataclasses.dataclass(frozen=True)
+class BoxWritten:
+    round: int
+    app_id: int
+    name: bytes
+    value: bytes | None
+
+
+MarketplaceEvent = (
+    ContextCreated
+    | ContextPurchased
+    | ContextRated
+    | LicenseCreated
+    | LicensePurchased
+    | LicenseRenewed
+    | LicenseRevoked
+    | LicenseUsed
+    | PlatformFeeUpdated
+    | BoxWritten
+)
+
+
+def load_methods(arc56_path: Path) -> dict[bytes, abi.Method]:
+    """Index an ARC-56 spec's methods by their 4-byte selector"""
+    spec = json.loads(arc56_path.read_text())
+    methods: dict[bytes, abi.Method] = {}
+    for method in spec["methods"]:
+        parsed = abi.Method.undictify(
+            {
+                "name": method["name"],
+                "args": [
+                    {"type": arg["type"], "name": arg["name"]} for arg in method["args"]
+                ],
+                "returns": {"type": method["returns"]["type"]},
+            }
+        )
+        methods[parsed.get_selector()] = parsed
+    return methods
+
+
+class MarketplaceDecoder:
+    """Turns raw app calls and box changes into marketplace events"""
+
+    def __init__(
+        self,
+        context_registry_app_id: int,
+        license_manager_app_id: int,
+        artifacts_path: Path = ARTIFACTS_PATH,
+    ) -> None:
+        specs = {
+            context_registry_app_id: artifacts_path
+            / "context_registry"
+            / "ContextRegistry.arc56.json",
+            license_manager_app_id: artifacts_path
+            / "license_manager"
+            / "LicenseManager.arc56.json",
+        }
+        self._methods = {app_id: load_methods(path) for app_id, path in specs.items()}
+        self._events = {
+            app_id: EventDecoder.from_arc56_file(path) for app_id, path in specs.items()
+        }
+
+    @property
+    def app_ids(self) -> set[int]:
+        return set(self._methods)
+
+    def decode_block(self, block: Block) -> list[MarketplaceEvent]:
+        events: list[MarketplaceEvent] = []
+        for call in block.app_calls:
+            events.extend(self.decode_call(block, call))
+        for change in block.box_changes:
+            if change.app_id in self._methods:
+                events.append(self.decode_box(block, change))
+        return events
+
+    def decode_box(self, block: Block, change: BoxChange) -> BoxWritten:
+        return BoxWritten(
+            round=block.round,
+            app_id=change.app_id,
+            name=change.name,
+            value=change.value,
+        )
+
+    def decode_call(self, block: Block, call: AppCall) -> list[MarketplaceEvent]:
+        methods = self._methods.get(call.app_id)
+        if methods is None or not call.args:
+            return []
+        method = methods.get(call.args[0])
+        if method is None:
+            return []
+        common = {"round": block.round, "timestamp": block.timestamp, "intra": call.intra}
+        try:
+            logged = self._events[call.app_id].decode_logs(call.logs)
+        except Exception as e:
+            logger.warning(f"Could not decode {method.name} in round {block.round}: {e}")
+            return []
+        # ARC-28 events carry everything that changed, so app args are never decoded.
+        # There is no fallback for pre-event deployments: their methods took string
+        # ids, so their selectors never match the methods loaded here.
+        return [
+            event
+            for logged_event in logged
+            if (event := self._from_event(common, call.app_id, logged_event))
+            is not None
+        ]
+
+    @staticmethod
+    def _from_event(
+        common: dict[str, int], app_id: int, event: DecodedEvent
+    ) -> MarketplaceEvent | None:
+        fields = event.fields
+        match event.name:
+            case "ContextCreated":
+                return ContextCreated(
+                    **common,
+                    context_id=fields["context_id"],
+                    creator=fields["creator"],
+                    ipfs_hash=fields["ipfs_hash"],
+                    title=fields["title"],
+                    price=fields["price"],
+                )
+            case "ContextPurchased":
+                return ContextPurchased(
+                    **common, context_id=fields["context_id"], buyer=fields["buyer"]
+                )
+            case "ContextRated":
+                return ContextRated(
+                    **common,
+                    context_id=fields["context_id"],
+                    rater=fields["rater"],
+                    rating=fields["rating"],
+                    previous_rating=fields["previous_rating"],
+                )
+            case "LicenseCreated":
+                return LicenseCreated(
+                    **common,
+                    license_id=fields["license_id"],
+                    context_id=fields["context_id"],
+                    creator=fields["creator"],
+                    license_type=fields["license_type"],
+                    price=fields["price"],
+                )
+            case "LicensePurchased":
+                return LicensePurchased(
+                    **common,
+                    license_id=fields["license_id"],
+                    buyer=fields["buyer"],
+                    expiry=fields["expiry"],
+                )
+            case "LicenseRenewed":
+                return LicenseRenewed(
+                    **common,
+                    license_id=fields["license_id"],
+                    holder=fields["holder"],
+                    expiry=fields["expiry"],
+                )
+            case "LicenseRevoked":
+                return LicenseRevoked(
+                    **common, license_id=fields["license_id"], holder=fields["holder"]
+                )
+            case "LicenseUsed":
+                return LicenseUsed(
+                    **common,
+                    license_id=fields["license_id"],
+                    holder=fields["holder"],
+                    usage_count=fields["usage_count"],
+                )
+            case "PlatformFeeUpdated":
+                return PlatformFeeUpdated(**common, app_id=app_id, fee_bps=fields["fee_bps"])
+        return None
@@ -0,0 +1,75 @@
+import logging
+import queue
+from collections.abc import Callable, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from backend.documents import ContextCodec
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import ContextCreated, MarketplaceEvent
+from backend.ipfs.gateways import GatewayFetcher
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 4
+
+# Takes a context's IPFS hash and its decoded AIContext document, e.g.
+# `MarketplaceStore.apply_metadata` or `ContextSearchIndex.apply_metadata`.
+MetadataConsumer = Callable[[str, dict[str, Any]], None]
+
+
+class MetadataFetcher:
+    """
+    Fetches the IPFS document of every new context for the indexer.
+
+    Register `on_block` with `MarketplaceIndexer.add_listener`. Each
+    `ContextCreated` event starts a fetch on a small thread pool, so slow
+    gateways never hold up block following. Finished documents are queued
+    and handed to the consumers at the start of the next `on_block` call, on
+    the indexer's own thread, because the store and search index share one
+    SQLite connection. A document that cannot be fetched or decoded is
+    logged and skipped; the context keeps its on-chain fields.
+    """
+
+    def __init__(
+        self,
+        fetcher: GatewayFetcher,
+        consumers: Sequence[MetadataConsumer],
+        codec: ContextCodec | None = None,
+        workers: int = DEFAULT_WORKERS,
+    ) -> None:
+        self._fetcher = fetcher
+        self._consumers = list(consumers)
+        self._codec = codec or ContextCodec()
+        self._executor = ThreadPoolExecutor(workers, "ipfs-metadata")
+        self._fetched: queue.Queue[tuple[str, dict[str, Any]]] = queue.Queue()
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def on_block(self, block: Block, events: list[MarketplaceEvent]) -> None:
+        """`MarketplaceIndexer` listener: apply fetched documents, start new fetches"""
+        self.apply_fetched()
+        for event in events:
+            if isinstance(event, ContextCreated):
+                self._executor.submit(self._fetch, event.ipfs_hash)
+
+    def apply_fetched(self) -> int:
+        """Hand every document fetched so far to the consumers; returns how many"""
+        applied = 0
+        while True:
+            try:
+                ipfs_hash, document = self._fetched.get_nowait()
+            except queue.Empty:
+                return applied
+            for consumer in self._consumers:
+                consumer(ipfs_hash, document)
+            applied += 1
+
+    def _fetch(self, ipfs_hash: str) -> None:
+        try:
+            document = self._codec.decode(self._fetcher.fetch_blocking(ipfs_hash))
+        except Exception as e:
+            logger.warning(f"No metadata for {ipfs_hash}: {e}")
+            return
+        self._fetched.put((ipfs_hash, document))
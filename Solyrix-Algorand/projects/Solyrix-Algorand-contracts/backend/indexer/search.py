@@ -0,0 +1,143 @@
+import dataclasses
+import re
+import sqlite3
+from collections.abc import Iterable
+from typing import Any
+
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import ContextCreated, MarketplaceEvent
+
+# Column weights for bm25(): a title hit outranks a tag hit outranks body text.
+TITLE_WEIGHT = 10.0
+DESCRIPTION_WEIGHT = 1.0
+TAGS_WEIGHT = 5.0
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+# Rows are keyed by context id, which is the rowid of `contexts` (its INTEGER
+# PRIMARY KEY), so updates are point lookups rather than scans. Prefix indexes
+# on 1-4 leading characters keep type-ahead queries off the full term list;
+# `tokenize` folds case and diacritics the same way at index and query time.
+_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS context_search USING fts5(
+    title,
+    description,
+    tags,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '1 2 3 4'
+);
+"""
+
+
+@dataclasses.dataclass(frozen=True)
+class SearchHit:
+    context_id: int
+    title: str
+    score: float  # bm25, higher is better
+
+
+def build_match_query(text: str, prefix: bool) -> str | None:
+    """
+    Turn free text into an FTS5 MATCH expression.
+
+    Every token is quoted so user input can never inject FTS5 syntax; with
+    `prefix` the last token also matches longer terms, for type-ahead.
+    """
+    tokens = _TOKEN.findall(text.lower())
+    if not tokens:
+        return None
+    terms = [f'"{token}"' for token in tokens]
+    if prefix:
+        terms[-1] += "*"
+    return " ".join(terms)
+
+
+class ContextSearchIndex:
+    """
+    BM25-ranked full-text index over context titles, descriptions and tags.
+
+    Lives in the indexer's SQLite database as an FTS5 table and is updated
+    incrementally: titles as `ContextCreated` events arrive, descriptions and
+    tags once a context's IPFS document has been fetched.
+    """
+
+    def __init__(self, connection: sqlite3.Connection) -> None:
+        self._db = connection
+        self._db.executescript(_SCHEMA)
+
+    def index_context(
+        self,
+        context_id: int,
+        title: str,
+        description: str = "",
+        tags: Iterable[str] = (),
+    ) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM context_search WHERE rowid = ?", (context_id,))
+            self._db.execute(
+                "INSERT INTO context_search (rowid, title, description, tags) "
+                "VALUES (?, ?, ?, ?)",
+                (context_id, title, description, " ".join(tags)),
+            )
+
+    def remove_context(self, context_id: int) -> None:
+        with self._db:
+            self._db.execute("DELETE FROM context_search WHERE rowid = ?", (context_id,))
+
+    def on_block(self, block: Block, events: list[MarketplaceEvent]) -> None:
+        """`MarketplaceIndexer` listener: make new contexts findable by title"""
+        for event in events:
+            if isinstance(event, ContextCreated):
+                self.index_context(event.context_id, event.title)
+
+    def apply_metadata(self, ipfs_hash: str, document: dict[str, Any]) -> None:
+        """Re-index contexts pointing at `ipfs_hash` with their IPFS `AIContext` JSON"""
+        metadata = document.get("metadata", {})
+        rows = self._db.execute(
+            "SELECT context_id, title FROM contexts WHERE ipfs_hash = ?", (ipfs_hash,)
+        ).fetchall()
+        for context_id, chain_title in rows:
+            self.index_context(
+                context_id,
+                metadata.get("title") or chain_title,
+                metadata.get("description", ""),
+                [str(tag) for tag in metadata.get("tags", [])],
+            )
+
+    def search(self, text: str, limit: int = 20, prefix: bool = False) -> list[SearchHit]:
+        query = build_match_query(text, prefix)
+        if query is None:
+            return []
+        weights = f"{TITLE_WEIGHT}, {DESCRIPTION_WEIGHT}, {TAGS_WEIGHT}"
+        return self._query(f"bm25(context_search, {weights})", query, limit)
+
+    def suggest(self, text: str, limit: int = 8) -> list[SearchHit]:
+        """Type-ahead: titles whose words start with what has been typed so far"""
+        query = build_match_query(text, prefix=True)
+        if query is None:
+            return []
+        return self._search_column("title", query, limit)
+
+    def _search_column(self, column: str, query: str, limit: int) -> list[SearchHit]:
+        if column not in ("title", "description", "tags"):
+            raise ValueError(f"Unknown search column {column}")
+        return self._query("bm25(context_search)", f"{column} : ({query})", limit)
+
+    def _query(self, rank_expr: str, match: str, limit: int) -> list[SearchHit]:
+        # Rank inside the FTS table first, then join only the top `limit` rows.
+        rows = self._db.execute(
+            "SELECT c.context_id, s.title, s.rank FROM ("
+            f"  SELECT rowid, title, {rank_expr} AS rank FROM context_search"
+            "   WHERE context_search MATCH ? ORDER BY rank LIMIT ?"
+            ") AS s JOIN contexts c ON c.context_id = s.rowid ORDER BY s.rank",
+            (match, limit),
+        ).fetchall()
+        # FTS5's bm25() is negated so that ascending order is best-first.
+        return [SearchHit(context_id, title, -rank) for context_id, title, rank in rows]
+
+    def optimize(self) -> None:
+        """Merge FTS5 segments; worth running after a large backfill"""
+        with self._db:
+            self._db.execute(
+                "INSERT INTO context_search (context_search) VALUES ('optimize')"
+            )
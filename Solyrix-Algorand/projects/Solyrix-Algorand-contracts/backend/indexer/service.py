@@ -0,0 +1,53 @@
+import logging
+import threading
+from collections.abc import Callable
+
+from backend.indexer.blocks import Block, BlockSource
+from backend.indexer.decoder import MarketplaceDecoder, MarketplaceEvent
+from backend.indexer.store import MarketplaceStore
+
+logger = logging.getLogger(__name__)
+
+# Called after each block is committed, e.g. to fetch IPFS metadata for new contexts.
+BlockListener = Callable[[Block, list[MarketplaceEvent]], None]
+
+
+class MarketplaceIndexer:
+    """Follows blocks and keeps a `MarketplaceStore` in sync with the contracts"""
+
+    def __init__(
+        self,
+        source: BlockSource,
+        decoder: MarketplaceDecoder,
+        store: MarketplaceStore,
+        start_round: int = 1,
+    ) -> None:
+        self._source = source
+        self._decoder = decoder
+        self._store = store
+        self._start_round = start_round
+        self._listeners: list[BlockListener] = []
+
+    def add_listener(self, listener: BlockListener) -> None:
+        self._listeners.append(listener)
+
+    def process_block(self, block: Block) -> list[MarketplaceEvent]:
+        events = self._decoder.decode_block(block)
+        self._store.apply_block(block.round, events)
+        for listener in self._listeners:
+            try:
+                listener(block, events)
+            except Exception as e:
+                logger.warning(f"Block listener failed on round {block.round}: {e}")
+        return events
+
+    def run(self, stop: threading.Event | None = None) -> None:
+        """Index from the stored cursor until `stop` is set or the source ends"""
+        next_round = self._store.next_round(self._start_round)
+        logger.info(f"Indexing from round {next_round}")
+        for block in self._source.blocks(next_round):
+            events = self.process_block(block)
+            if events:
+                logger.debug(f"Round {block.round}: {len(events)} marketplace events")
+            if stop is not None and stop.is_set():
+                break
@@ -0,0 +1,397 @@
+import dataclasses
+import sqlite3
+from collections.abc import Iterable, Sequence
+from pathlib import Path
+from typing import Any, Literal
+
+from backend.indexer.decoder import (
+    BoxWritten,
+    ContextCreated,
+    ContextPurchased,
+    ContextRated,
+    LicenseCreated,
+    LicensePurchased,
+    LicenseRenewed,
+    LicenseRevoked,
+    LicenseUsed,
+    MarketplaceEvent,
+)
+
+SortBy = Literal["newest", "oldest", "price_low", "price_high", "rating", "popularity"]
+
+# Mirrors `sortBy` in the frontend's ContextFilters; each has a matching index.
+_ORDER_BY: dict[str, str] = {
+    "newest": "c.created_round DESC, c.intra DESC",
+    "oldest": "c.created_round ASC, c.intra ASC",
+    "price_low": "c.price ASC, c.created_round DESC",
+    "price_high": "c.price DESC, c.created_round DESC",
+    "rating": "c.rating_avg DESC, c.created_round DESC",
+    "popularity": "c.purchases DESC, c.created_round DESC",
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS cursor (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    next_round INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS contexts (
+    context_id INTEGER PRIMARY KEY,
+    creator TEXT NOT NULL,
+    ipfs_hash TEXT NOT NULL,
+    title TEXT NOT NULL,
+    description TEXT NOT NULL DEFAULT '',
+    author TEXT NOT NULL DEFAULT '',
+    category INTEGER,
+    price INTEGER NOT NULL,
+    purchases INTEGER NOT NULL DEFAULT 0,
+    rating_sum INTEGER NOT NULL DEFAULT 0,
+    rating_count INTEGER NOT NULL DEFAULT 0,
+    rating_avg REAL GENERATED ALWAYS AS (
+        CASE WHEN rating_count > 0
+        THEN CAST(rating_sum AS REAL) / rating_count ELSE 0 END
+    ) STORED,
+    created_round INTEGER NOT NULL,
+    created_at INTEGER NOT NULL,
+    intra INTEGER NOT NULL,
+    updated_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_contexts_created ON contexts (created_round, intra);
+CREATE INDEX IF NOT EXISTS idx_contexts_price ON contexts (price, created_round);
+CREATE INDEX IF NOT EXISTS idx_contexts_rating ON contexts (rating_avg, created_round);
+CREATE INDEX IF NOT EXISTS idx_contexts_popularity ON contexts (purchases, created_round);
+CREATE INDEX IF NOT EXISTS idx_contexts_category ON contexts (category, created_round);
+CREATE INDEX IF NOT EXISTS idx_contexts_creator ON contexts (creator, created_round);
+CREATE INDEX IF NOT EXISTS idx_contexts_ipfs ON contexts (ipfs_hash);
+
+CREATE TABLE IF NOT EXISTS context_tags (
+    tag TEXT NOT NULL,
+    context_id INTEGER NOT NULL REFERENCES contexts (context_id),
+    PRIMARY KEY (tag, context_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS context_models (
+    model_type INTEGER NOT NULL,
+    context_id INTEGER NOT NULL REFERENCES contexts (context_id),
+    PRIMARY KEY (model_type, context_id)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS purchases (
+    round INTEGER NOT NULL,
+    intra INTEGER NOT NULL,
+    context_id INTEGER NOT NULL,
+    buyer TEXT NOT NULL,
+    PRIMARY KEY (round, intra, context_id)
+);
+CREATE INDEX IF NOT EXISTS idx_purchases_buyer ON purchases (buyer, round);
+
+CREATE TABLE IF NOT EXISTS licenses (
+    license_id INTEGER PRIMARY KEY,
+    context_id INTEGER NOT NULL,
+    creator TEXT NOT NULL,
+    license_type INTEGER NOT NULL,
+    price INTEGER NOT NULL,
+    created_round INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_licenses_context ON licenses (context_id);
+
+CREATE TABLE IF NOT EXISTS license_purchases (
+    round INTEGER NOT NULL,
+    intra INTEGER NOT NULL,
+    license_id INTEGER NOT NULL,
+    buyer TEXT NOT NULL,
+    PRIMARY KEY (round, intra, license_id)
+);
+CREATE INDEX IF NOT EXISTS idx_license_purchases_buyer ON license_purchases (buyer, round);
+
+-- Live grant per license holder (expiry 0 = never expires); revoked grants are deleted.
+CREATE TABLE IF NOT EXISTS license_grants (
+    license_id INTEGER NOT NULL,
+    holder TEXT NOT NULL,
+    expiry INTEGER NOT NULL,
+    usage_count INTEGER NOT NULL DEFAULT 0,
+    updated_round INTEGER NOT NULL,
+    PRIMARY KEY (license_id, holder)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS boxes (
+    app_id INTEGER NOT NULL,
+    name BLOB NOT NULL,
+    value BLOB NOT NULL,
+    round INTEGER NOT NULL,
+    PRIMARY KEY (app_id, name)
+) WITHOUT ROWID;
+"""
+
+
+@dataclasses.dataclass
+class ContextFilters:
+    """Python counterpart of the frontend's `ContextFilters`"""
+
+    category: int | None = None
+    model_type: int | None = None
+    min_price: int | None = None
+    max_price: int | None = None
+    rating: float | None = None
+    tags: Sequence[str] = ()
+    author: str | None = None
+    sort_by: SortBy = "newest"
+
+
+@dataclasses.dataclass
+class IndexedContext:
+    context_id: int
+    creator: str
+    ipfs_hash: str
+    title: str
+    description: str
+    author: str
+    category: int | None
+    price: int
+    purchases: int
+    rating_sum: int
+    rating_count: int
+    rating_avg: float
+    created_round: int
+    created_at: int
+    updated_at: int
+
+
+@dataclasses.dataclass
+class SearchResult:
+    contexts: list[IndexedContext]
+    total_count: int
+    has_more: bool
+
+
+class MarketplaceStore:
+    """SQLite-backed read model of the marketplace contracts"""
+
+    def __init__(self, path: Path | str = ":memory:") -> None:
+        self._db = sqlite3.connect(str(path), check_same_thread=False)
+        self._db.row_factory = sqlite3.Row
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._db.close()
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        return self._db
+
+    # ------------------------------ Writes ------------------------------ #
+
+    def next_round(self, default: int) -> int:
+        row = self._db.execute("SELECT next_round FROM cursor WHERE id = 0").fetchone()
+        return row["next_round"] if row else default
+
+    def apply_block(self, round_: int, events: Iterable[MarketplaceEvent]) -> None:
+        """Apply a block's events and advance the cursor atomically"""
+        with self._db:
+            for event in events:
+                self._apply(event)
+            self._db.execute(
+                "INSERT INTO cursor (id, next_round) VALUES (0, ?) "
+                "ON CONFLICT (id) DO UPDATE SET next_round = excluded.next_round",
+                (round_ + 1,),
+            )
+
+    def _apply(self, event: MarketplaceEvent) -> None:
+        match event:
+            case ContextCreated():
+                self._db.execute(
+                    # Upsert rather than REPLACE so the purchase and rating
+                    # counts and the IPFS metadata survive a re-applied block.
+                    "INSERT INTO contexts (context_id, creator, ipfs_hash, title, "
+                    "price, created_round, created_at, intra, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                    "ON CONFLICT (context_id) DO UPDATE SET creator = excluded.creator, "
+                    "ipfs_hash = excluded.ipfs_hash, title = excluded.title, "
+                    "price = excluded.price, updated_at = excluded.updated_at",
+                    (
+                        event.context_id,
+                        event.creator,
+                        event.ipfs_hash,
+                        event.title,
+                        event.price,
+                        event.round,
+                        event.timestamp,
+                        event.intra,
+                        event.timestamp,
+                    ),
+                )
+            case ContextPurchased():
+                self._db.execute(
+                    "INSERT OR IGNORE INTO purchases VALUES (?, ?, ?, ?)",
+                    (event.round, event.intra, event.context_id, event.buyer),
+                )
+                self._db.execute(
+                    "UPDATE contexts SET purchases = purchases + 1, updated_at = ? "
+                    "WHERE context_id = ?",
+                    (event.timestamp, event.context_id),
+                )
+            case ContextRated():
+                self._db.execute(
+                    "UPDATE contexts SET rating_sum = rating_sum + ? - ?, "
+                    "rating_count = rating_count + ?, updated_at = ? WHERE context_id = ?",
+                    (
+                        event.rating,
+                        event.previous_rating,
+                        1 if event.previous_rating == 0 else 0,
+                        event.timestamp,
+                        event.context_id,
+                    ),
+                )
+            case LicenseCreated():
+                self._db.execute(
+                    "INSERT OR REPLACE INTO licenses VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        event.license_id,
+                        event.context_id,
+                        event.creator,
+                        event.license_type,
+                        event.price,
+                        event.round,
+                    ),
+                )
+            case LicensePurchased():
+                self._db.execute(
+                    "INSERT OR IGNORE INTO license_purchases VALUES (?, ?, ?, ?)",
+                    (event.round, event.intra, event.license_id, event.buyer),
+                )
+                self._set_grant(event.license_id, event.buyer, event.expiry, event.round)
+            case LicenseRenewed():
+                self._set_grant(event.license_id, event.holder, event.expiry, event.round)
+            case LicenseRevoked():
+                self._db.execute(
+                    "DELETE FROM license_grants WHERE license_id = ? AND holder = ?",
+                    (event.license_id, event.holder),
+                )
+            case LicenseUsed():
+                self._db.execute(
+                    "UPDATE license_grants SET usage_count = ?, updated_round = ? "
+                    "WHERE license_id = ? AND holder = ?",
+                    (event.usage_count, event.round, event.license_id, event.holder),
+                )
+            case BoxWritten(value=None):
+                self._db.execute(
+                    "DELETE FROM boxes WHERE app_id = ? AND name = ?",
+                    (event.app_id, event.name),
+                )
+            case BoxWritten():
+                self._db.execute(
+                    "INSERT OR REPLACE INTO boxes VALUES (?, ?, ?, ?)",
+                    (event.app_id, event.name, event.value, event.round),
+                )
+
+    def _set_grant(self, license_id: int, holder: str, expiry: int, round_: int) -> None:
+        # Renewals keep the usage count; a fresh purchase starts at zero.
+        self._db.execute(
+            "INSERT INTO license_grants (license_id, holder, expiry, updated_round) "
+            "VALUES (?, ?, ?, ?) ON CONFLICT (license_id, holder) DO UPDATE SET "
+            "expiry = excluded.expiry, updated_round = excluded.updated_round",
+            (license_id, holder, expiry, round_),
+        )
+
+    def apply_metadata(self, ipfs_hash: str, document: dict[str, Any]) -> None:
+        """Enrich contexts pointing at `ipfs_hash` with their IPFS `AIContext` JSON"""
+        metadata = document.get("metadata", {})
+        tags = {str(tag).strip().lower() for tag in metadata.get("tags", [])}
+        models = {int(model) for model in metadata.get("modelCompatibility", [])}
+        with self._db:
+            context_ids = [
+                row["context_id"]
+                for row in self._db.execute(
+                    "SELECT context_id FROM contexts WHERE ipfs_hash = ?", (ipfs_hash,)
+                )
+            ]
+            for context_id in context_ids:
+                self._db.execute(
+                    "UPDATE contexts SET description = ?, author = ?, category = ? "
+                    "WHERE context_id = ?",
+                    (
+                        metadata.get("description", ""),
+                        metadata.get("author", ""),
+                        metadata.get("category"),
+                        context_id,
+                    ),
+                )
+                self._db.execute(
+                    "DELETE FROM context_tags WHERE context_id = ?", (context_id,)
+                )
+                self._db.executemany(
+                    "INSERT INTO context_tags VALUES (?, ?)",
+                    [(tag, context_id) for tag in tags if tag],
+                )
+                self._db.execute(
+                    "DELETE FROM context_models WHERE context_id = ?", (context_id,)
+                )
+                self._db.executemany(
+                    "INSERT INTO context_models VALUES (?, ?)",
+                    [(model, context_id) for model in models],
+                )
+
+    # ------------------------------ Reads ------------------------------- #
+
+    def get_context(self, context_id: int) -> IndexedContext | None:
+        row = self._db.execute(
+            "SELECT * FROM contexts WHERE context_id = ?", (context_id,)
+        ).fetchone()
+        return _to_context(row) if row else None
+
+    def search(
+        self, filters: ContextFilters, limit: int = 20, offset: int = 0
+    ) -> SearchResult:
+        where: list[str] = []
+        params: list[Any] = []
+        if filters.category is not None:
+            where.append("c.category = ?")
+            params.append(filters.category)
+        if filters.model_type is not None:
+            where.append(
+                "c.context_id IN "
+                "(SELECT context_id FROM context_models WHERE model_type = ?)"
+            )
+            params.append(filters.model_type)
+        if filters.min_price is not None:
+            where.append("c.price >= ?")
+            params.append(filters.min_price)
+        if filters.max_price is not None:
+            where.append("c.price <= ?")
+            params.append(filters.max_price)
+        if filters.rating is not None:
+            where.append("c.rating_avg >= ?")
+            params.append(filters.rating)
+        if filters.tags:
+            tags = [tag.strip().lower() for tag in filters.tags]
+            where.append(
+                "c.context_id IN (SELECT context_id FROM context_tags "
+                f"WHERE tag IN ({', '.join('?' * len(tags))}))"
+            )
+            params.extend(tags)
+        if filters.author is not None:
+            where.append("c.creator = ?")
+            params.append(filters.author)
+
+        where_sql = f"WHERE {' AND '.join(where)}" if where else ""
+        total = self._db.execute(
+            f"SELECT COUNT(*) FROM contexts c {where_sql}", params
+        ).fetchone()[0]
+        rows = self._db.execute(
+            f"SELECT c.* FROM contexts c {where_sql} "
+            f"ORDER BY {_ORDER_BY[filters.sort_by]} LIMIT ? OFFSET ?",
+            [*params, limit, offset],
+        ).fetchall()
+        return SearchResult(
+            contexts=[_to_context(row) for row in rows],
+            total_count=total,
+            has_more=offset + len(rows) < total,
+        )
+
+
+def _to_context(row: sqlite3.Row) -> IndexedContext:
+    return IndexedContext(
+        **{field.name: row[field.name] for field in dataclasses.fields(IndexedContext)}
+    )
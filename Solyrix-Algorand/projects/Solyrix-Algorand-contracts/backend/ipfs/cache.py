@@ -0,0 +1,126 @@
+import logging
+import mmap
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from backend.ipfs.cid import CID, verify
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 1 << 30
+
+
+class BlobCache:
+    """
+    Disk-backed store of IPFS payloads, keyed by CID.
+
+    `put` hashes the payload and refuses it unless it is exactly what the
+    CID names, so anything read back is trustworthy without re-checking.
+    Blobs are files named after their CID; reads memory-map them, so hot
+    contexts are served from the page cache without copies. The least
+    recently read blobs are deleted once the total exceeds `max_bytes`.
+    Recency is kept in file mtimes, so it survives restarts.
+    """
+
+    def __init__(self, root: Path, max_bytes: int = DEFAULT_MAX_BYTES) -> None:
+        self._root = root
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._sizes: OrderedDict[str, int] = OrderedDict()  # least recent first
+        self._total = 0
+        root.mkdir(parents=True, exist_ok=True)
+        self._load()
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total
+
+    def __contains__(self, cid: str) -> bool:
+        return self._key(cid) in self._sizes
+
+    def __len__(self) -> int:
+        return len(self._sizes)
+
+    def get(self, cid: str) -> mmap.mmap | bytes | None:
+        """The payload of `cid` mapped read-only, or None if not cached"""
+        key = self._key(cid)
+        with self._lock:
+            if key not in self._sizes:
+                return None
+            self._sizes.move_to_end(key)
+        path = self._path(key)
+        try:
+            with path.open("rb") as file:
+                os.utime(file.fileno())
+                if self._sizes.get(key) == 0:
+                    return b""  # empty files cannot be mapped
+                return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        except FileNotFoundError:
+            # Removed behind our back; forget it and let the caller refetch.
+            with self._lock:
+                self._forget(key)
+            return None
+
+    def put(self, cid: str, data: bytes) -> None:
+        """Store `data` under `cid`; raises `CIDError` if it does not match"""
+        key = self._key(cid)
+        verify(key, data)
+        if len(data) > self._max_bytes:
+            logger.warning(f"Not caching {key}: {len(data)} bytes exceeds the cache budget")
+            return
+        path = self._path(key)
+        path.parent.mkdir(exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp, path)
+        with self._lock:
+            self._forget(key)
+            self._sizes[key] = len(data)
+            self._total += len(data)
+            self._evict(keep=key)
+
+    def discard(self, cid: str) -> None:
+        key = self._key(cid)
+        with self._lock:
+            if key in self._sizes:
+                self._forget(key)
+                self._path(key).unlink(missing_ok=True)
+
+    def _evict(self, keep: str) -> None:
+        while self._total > self._max_bytes:
+            key = next(iter(self._sizes))
+            if key == keep:
+                return
+            self._forget(key)
+            # Open maps stay valid after unlink; the space is freed when they close.
+            self._path(key).unlink(missing_ok=True)
+            logger.debug(f"Evicted {key} from the blob cache")
+
+    def _forget(self, key: str) -> None:
+        size = self._sizes.pop(key, None)
+        if size is not None:
+            self._total -= size
+
+    def _load(self) -> None:
+        blobs = [
+            (path.stat(), path.name)
+            for path in self._root.glob("*/*")
+            if not path.name.startswith(".tmp-")
+        ]
+        for stat, name in sorted(blobs, key=lambda blob: blob[0].st_mtime):
+            self._sizes[name] = stat.st_size
+            self._total += stat.st_size
+        with self._lock:
+            self._evict(keep="")
+
+    def _key(self, cid: str) -> str:
+        # Canonical form, so the same content is never stored twice.
+        return str(CID.parse(cid))
+
+    def _path(self, key: str) -> Path:
+        # Fan out on the last characters, which are uniformly distributed.
+        return self._root / key[-2:] / key
@@ -0,0 +1,64 @@
+import logging
+from typing import BinaryIO
+
+from backend.ipfs.cid import CHUNK_SIZE, CID, DAG_PB, Block, DagBuilder, _varint
+
+logger = logging.getLogger(__name__)
+
+_CID_TAG = b"\xd8\x2a"  # CBOR tag 42, an IPLD link
+
+
+def _cbor_head(major: int, length: int) -> bytes:
+    if length < 24:
+        return bytes([major << 5 | length])
+    return bytes([major << 5 | 24, length])  # lengths here stay below 256
+
+
+def _header(root: CID) -> bytes:
+    """The dag-cbor CARv1 header `{"roots": [root], "version": 1}`"""
+    link = b"\0" + root.to_bytes()  # multibase identity prefix
+    return b"".join(
+        [
+            _cbor_head(5, 2),  # map of two entries, keys in dag-cbor order
+            _cbor_head(3, 5) + b"roots",
+            _cbor_head(4, 1) + _CID_TAG + _cbor_head(2, len(link)) + link,
+            _cbor_head(3, 7) + b"version",
+            _cbor_head(0, 1),
+        ]
+    )
+
+
+def write_car(src: BinaryIO, dst: BinaryIO, cid_version: int = 0) -> CID:
+    """
+    Write `src` as a CARv1 archive of its UnixFS DAG and return the root.
+
+    This is the upload format of services without Kubo's `block/put`, such
+    as Pinata, and what `ipfs dag import` reads. The root is only known at
+    the end, so the header is written with a placeholder of the same length
+    and rewritten in place; `dst` must be seekable. Repeated chunks are
+    stored once.
+    """
+    builder = DagBuilder(cid_version)
+    start = dst.tell()
+    # A root's encoded length depends only on the CID version.
+    placeholder = _header(CID(cid_version, DAG_PB, bytes(32)))
+    dst.write(_varint(len(placeholder)) + placeholder)
+    written: set[CID] = set()
+
+    def write(blocks: list[Block]) -> None:
+        for block in blocks:
+            if block.cid in written:
+                continue
+            written.add(block.cid)
+            cid = block.cid.to_bytes()
+            dst.write(_varint(len(cid) + len(block.data)) + cid + block.data)
+
+    while chunk := src.read(CHUNK_SIZE):
+        write(builder.update(chunk))
+    write(builder.finish())
+    end = dst.tell()
+    dst.seek(start)
+    dst.write(_varint(len(placeholder)) + _header(builder.root))
+    dst.seek(end)
+    logger.debug(f"Wrote {len(written)} blocks of {builder.root} to a CAR")
+    return builder.root
@@ -0,0 +1,239 @@
+import base64
+import dataclasses
+import hashlib
+from collections.abc import Iterable
+
+# Multiformat codes used by the CIDs the marketplace deals in.
+SHA2_256 = 0x12
+DAG_PB = 0x70
+RAW = 0x55
+
+# Import parameters of `ipfs add` and Pinata: 256 KiB chunks, balanced
+# DAG, at most 174 links per node. CIDv0 wraps leaves in dag-pb, CIDv1
+# stores them as raw blocks.
+CHUNK_SIZE = 256 * 1024
+MAX_LINKS = 174
+
+_UNIXFS_FILE = 2
+_B58_ALPHABET = b"123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
+
+
+class CIDError(ValueError):
+    """Raised for a malformed CID or content that does not hash to it"""
+
+
+def _b58encode(data: bytes) -> str:
+    number = int.from_bytes(data, "big")
+    out = bytearray()
+    while number:
+        number, digit = divmod(number, 58)
+        out.append(_B58_ALPHABET[digit])
+    zeros = len(data) - len(data.lstrip(b"\0"))
+    return (_B58_ALPHABET[:1] * zeros + bytes(reversed(out))).decode()
+
+
+def _b58decode(text: str) -> bytes:
+    number = 0
+    for char in text.encode():
+        digit = _B58_ALPHABET.find(char)
+        if digit < 0:
+            raise CIDError(f"Invalid base58 character {chr(char)!r}")
+        number = number * 58 + digit
+    zeros = len(text) - len(text.lstrip("1"))
+    return b"\0" * zeros + number.to_bytes((number.bit_length() + 7) // 8, "big")
+
+
+def _varint(value: int) -> bytes:
+    out = bytearray()
+    while value >= 0x80:
+        out.append(value & 0x7F | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _read_varint(data: bytes, offset: int) -> tuple[int, int]:
+    value = shift = 0
+    while True:
+        if offset >= len(data):
+            raise CIDError("Truncated varint")
+        byte = data[offset]
+        value |= (byte & 0x7F) << shift
+        offset += 1
+        if byte < 0x80:
+            return value, offset
+        shift += 7
+
+
+def _field(number: int, payload: bytes) -> bytes:
+    """A length-delimited protobuf field"""
+    return _varint(number << 3 | 2) + _varint(len(payload)) + payload
+
+
+def _uint_field(number: int, value: int) -> bytes:
+    return _varint(number << 3) + _varint(value)
+
+
+@dataclasses.dataclass(frozen=True)
+class CID:
+    version: int
+    codec: int
+    digest: bytes  # sha2-256
+
+    @classmethod
+    def parse(cls, text: str) -> "CID":
+        if len(text) == 46 and text.startswith("Qm"):
+            multihash = _b58decode(text)
+            if multihash[:2] != bytes([SHA2_256, 32]) or len(multihash) != 34:
+                raise CIDError(f"Unsupported CIDv0 {text}")
+            return cls(0, DAG_PB, multihash[2:])
+        if not text.startswith("b"):
+            raise CIDError(f"Only base58 CIDv0 and base32 CIDv1 are supported, got {text}")
+        body = text[1:].upper()
+        raw = base64.b32decode(body + "=" * (-len(body) % 8))
+        version, offset = _read_varint(raw, 0)
+        codec, offset = _read_varint(raw, offset)
+        hash_code, offset = _read_varint(raw, offset)
+        length, offset = _read_varint(raw, offset)
+        if version != 1 or hash_code != SHA2_256 or length != 32 or len(raw) != offset + 32:
+            raise CIDError(f"Unsupported CID {text}")
+        return cls(1, codec, raw[offset:])
+
+    @property
+    def multihash(self) -> bytes:
+        return bytes([SHA2_256, 32]) + self.digest
+
+    def to_bytes(self) -> bytes:
+        if self.version == 0:
+            return self.multihash
+        return _varint(1) + _varint(self.codec) + self.multihash
+
+    def __str__(self) -> str:
+        if self.version == 0:
+            return _b58encode(self.multihash)
+        return "b" + base64.b32encode(self.to_bytes()).decode().lower().rstrip("=")
+
+
+@dataclasses.dataclass(frozen=True)
+class Block:
+    cid: CID
+    data: bytes
+
+
+@dataclasses.dataclass(frozen=True)
+class _Link:
+    cid: CID
+    file_size: int  # bytes of file content below the link
+    tree_size: int  # bytes of every block below and including the link
+
+
+def _pb_node(unixfs: bytes, links: Iterable[_Link] = ()) -> bytes:
+    # dag-pb puts Links (field 2) before Data (field 1).
+    encoded_links = b"".join(
+        _field(2, _field(1, link.cid.to_bytes()) + _field(2, b"") + _uint_field(3, link.tree_size))
+        for link in links
+    )
+    return encoded_links + _field(1, unixfs)
+
+
+class DagBuilder:
+    """
+    Builds the UnixFS file DAG of a byte stream the way `ipfs add` does,
+    holding only one chunk and the pending links in memory.
+
+    `update` returns the blocks completed so far, leaves and interior nodes,
+    so callers can store or upload them as they go; `finish` returns the
+    remaining blocks, the last of which is the root.
+    """
+
+    def __init__(self, cid_version: int = 0, chunk_size: int = CHUNK_SIZE) -> None:
+        self._version = cid_version
+        self._chunk_size = chunk_size
+        self._buffer = bytearray()
+        # levels[0] holds leaf links, levels[n] links to nodes of height n.
+        self._levels: list[list[_Link]] = [[]]
+        self._leaves = 0
+
+    def update(self, data: bytes) -> list[Block]:
+        self._buffer += data
+        blocks: list[Block] = []
+        while len(self._buffer) > self._chunk_size:
+            chunk = bytes(self._buffer[: self._chunk_size])
+            del self._buffer[: self._chunk_size]
+            blocks += self._add_leaf(chunk)
+        return blocks
+
+    def finish(self) -> list[Block]:
+        blocks: list[Block] = []
+        if self._buffer or not self._leaves:
+            chunk = bytes(self._buffer)
+            self._buffer.clear()
+            blocks += self._add_leaf(chunk)
+        # Close partial nodes bottom-up until one link, the root, remains.
+        height = 0
+        while height < len(self._levels) - 1 or len(self._levels[height]) > 1:
+            if self._levels[height]:
+                blocks += self._flush(height)
+            height += 1
+        return blocks
+
+    @property
+    def root(self) -> CID:
+        """CID of the whole stream; only valid after `finish`"""
+        return self._levels[-1][-1].cid
+
+    def _block(self, data: bytes, codec: int = DAG_PB) -> CID:
+        return CID(self._version, codec, hashlib.sha256(data).digest())
+
+    def _add_leaf(self, chunk: bytes) -> list[Block]:
+        self._leaves += 1
+        if self._version == 1:
+            cid = self._block(chunk, RAW)
+            block = Block(cid, chunk)
+        else:
+            unixfs = _uint_field(1, _UNIXFS_FILE)
+            if chunk:
+                unixfs += _field(2, chunk)
+            data = _pb_node(unixfs + _uint_field(3, len(chunk)))
+            block = Block(self._block(data), data)
+        self._levels[0].append(_Link(block.cid, len(chunk), len(block.data)))
+        blocks = [block]
+        height = 0
+        # A full node is final once more data proves it is not the root.
+        while self._buffer and len(self._levels[height]) == MAX_LINKS:
+            blocks += self._flush(height)
+            height += 1
+        return blocks
+
+    def _flush(self, height: int) -> list[Block]:
+        links = self._levels[height]
+        self._levels[height] = []
+        file_size = sum(link.file_size for link in links)
+        unixfs = _uint_field(1, _UNIXFS_FILE) + _uint_field(3, file_size)
+        unixfs += b"".join(_uint_field(4, link.file_size) for link in links)
+        data = _pb_node(unixfs, links)
+        cid = self._block(data)
+        if height + 1 == len(self._levels):
+            self._levels.append([])
+        self._levels[height + 1].append(
+            _Link(cid, file_size, len(data) + sum(link.tree_size for link in links))
+        )
+        return [Block(cid, data)]
+
+
+def compute_cid(data: bytes, cid_version: int = 0) -> CID:
+    builder = DagBuilder(cid_version)
+    builder.update(data)
+    builder.finish()
+    return builder.root
+
+
+def verify(cid: CID | str, data: bytes) -> None:
+    """Raise `CIDError` unless `data` is the file `cid` names"""
+    expected = CID.parse(cid) if isinstance(cid, str) else cid
+    if expected.codec == RAW:
+        actual = CID(1, RAW, hashlib.sha256(data).digest())
+    else:
+        actual = compute_cid(data, expected.version)
+    if actual != expected:
+        raise CIDError(f"Content hashes to {actual}, not {expected}")
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import statistics
+import time
+from collections import deque
+from collections.abc import Sequence
+
+import httpx
+
+from backend.ipfs.cache import BlobCache
+from backend.ipfs.cid import verify
+
+logger = logging.getLogger(__name__)
+
+# Same gateways, in the same default order, as the frontend's ipfs.service.ts.
+DEFAULT_GATEWAYS = (
+    "https://gateway.pinata.cloud/ipfs/",
+    "https://ipfs.io/ipfs/",
+    "https://cloudflare-ipfs.com/ipfs/",
+    "https://dweb.link/ipfs/",
+)
+
+# Hedge delay for a gateway without enough history for a useful p95.
+DEFAULT_HEDGE_DELAY = 0.5
+MIN_SAMPLES = 5
+
+DEFAULT_TIMEOUT = 30.0
+LATENCY_WINDOW = 100
+
+
+class GatewayError(Exception):
+    """Raised when every gateway failed; `errors` maps gateway to its failure"""
+
+    def __init__(self, cid: str, errors: dict[str, Exception]) -> None:
+        super().__init__(f"Failed to retrieve {cid} from {len(errors)} gateways: {errors}")
+        self.errors = errors
+
+
+class GatewayStats:
+    """Recent outcomes of one gateway"""
+
+    def __init__(self, window: int = LATENCY_WINDOW) -> None:
+        self.latencies: deque[float] = deque(maxlen=window)
+        self.outcomes: deque[bool] = deque(maxlen=window)
+
+    def record(self, latency: float | None) -> None:
+        """Record a success that took `latency` seconds, or a failure (None)"""
+        if latency is not None:
+            self.latencies.append(latency)
+        self.outcomes.append(latency is not None)
+
+    @property
+    def success_rate(self) -> float:
+        return sum(self.outcomes) / len(self.outcomes) if self.outcomes else 1.0
+
+    def quantile(self, q: float, default: float) -> float:
+        if len(self.latencies) < MIN_SAMPLES:
+            return default
+        return statistics.quantiles(self.latencies, n=100, method="inclusive")[round(q * 100) - 1]
+
+    def expected_latency(self) -> float:
+        """Median latency scaled up by how often the gateway fails"""
+        return self.quantile(0.5, DEFAULT_HEDGE_DELAY) / max(self.success_rate, 0.05)
+
+
+class GatewayFetcher:
+    """
+    Retrieves IPFS payloads by racing gateways with hedged requests.
+
+    Gateways are tried fastest-first by their recent median latency and
+    success rate. Only one request runs at first; if it has not answered by
+    that gateway's p95 latency, or fails, the next gateway starts too. The
+    first response that hashes to the CID wins and the rest are cancelled,
+    so a slow gateway costs at most its p95 instead of a full timeout.
+    Verified payloads go to the optional `BlobCache`, which is checked
+    before any request. Gateways are plain URL prefixes, so tests can point
+    the fetcher at local HTTP servers.
+    """
+
+    def __init__(
+        self,
+        gateways: Sequence[str] = DEFAULT_GATEWAYS,
+        cache: BlobCache | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._gateways = list(gateways)
+        self._cache = cache
+        self._timeout = timeout
+        self.stats = {gateway: GatewayStats() for gateway in self._gateways}
+
+    def ranked(self) -> list[str]:
+        """Gateways in the order the next fetch will try them"""
+        return sorted(self._gateways, key=lambda gateway: self.stats[gateway].expected_latency())
+
+    def fetch_blocking(self, cid: str) -> bytes:
+        return asyncio.run(self.fetch(cid))
+
+    async def fetch(self, cid: str, client: httpx.AsyncClient | None = None) -> bytes:
+        if self._cache is not None and (cached := self._cache.get(cid)) is not None:
+            return bytes(cached)
+        if client is None:
+            async with httpx.AsyncClient(follow_redirects=True) as owned:
+                data = await self._race(cid, owned)
+        else:
+            data = await self._race(cid, client)
+        if self._cache is not None:
+            self._cache.put(cid, data)
+        return data
+
+    async def _race(self, cid: str, client: httpx.AsyncClient) -> bytes:
+        order = self.ranked()
+        running: dict[asyncio.Task[bytes], str] = {}
+        errors: dict[str, Exception] = {}
+        hedge_at = 0.0
+
+        def launch() -> None:
+            nonlocal hedge_at
+            gateway = order[len(running) + len(errors)]
+            running[asyncio.create_task(self._attempt(client, gateway, cid))] = gateway
+            delay = self.stats[gateway].quantile(0.95, DEFAULT_HEDGE_DELAY)
+            hedge_at = time.monotonic() + delay
+
+        launch()
+        try:
+            while running:
+                can_hedge = len(running) + len(errors) < len(order)
+                done, _ = await asyncio.wait(
+                    running,
+                    timeout=max(0.0, hedge_at - time.monotonic()) if can_hedge else None,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    logger.debug(f"Hedging {cid} after {running[next(iter(running))]} stalled")
+                    launch()
+                    continue
+                for task in done:
+                    gateway = running.pop(task)
+                    try:
+                        return task.result()
+                    except Exception as e:
+                        logger.debug(f"{gateway} failed for {cid}: {e}")
+                        errors[gateway] = e
+                        if len(running) + len(errors) < len(order):
+                            launch()
+        finally:
+            for task in running:
+                task.cancel()
+            await asyncio.gather(*running, return_exceptions=True)
+        raise GatewayError(cid, errors)
+
+    async def _attempt(self, client: httpx.AsyncClient, gateway: str, cid: str) -> bytes:
+        started = time.monotonic()
+        try:
+            response = await client.get(f"{gateway}{cid}", timeout=self._timeout)
+            response.raise_for_status()
+            # Gateways are untrusted; a payload counts only if it hashes to the CID.
+            await asyncio.to_thread(verify, cid, response.content)
+        except asyncio.CancelledError:
+            raise  # lost the race, which says nothing about the gateway
+        except Exception:
+            self.stats[gateway].record(None)
+            raise
+        self.stats[gateway].record(time.monotonic() - started)
+        return response.content
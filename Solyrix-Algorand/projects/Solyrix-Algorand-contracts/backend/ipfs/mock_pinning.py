@@ -0,0 +1,145 @@
+import argparse
+import hashlib
+import http.server
+import json
+import logging
+import random
+import threading
+from email.parser import BytesParser
+from email.policy import HTTP
+from urllib.parse import parse_qs, urlparse
+
+from backend.ipfs.cid import CID, DAG_PB, RAW, _read_varint
+
+logger = logging.getLogger(__name__)
+
+
+def _links(node: bytes) -> list[CID]:
+    """CIDs a dag-pb node links to"""
+    links = []
+    offset = 0
+    while offset < len(node):
+        tag, offset = _read_varint(node, offset)
+        length, offset = _read_varint(node, offset)
+        field = node[offset : offset + length]
+        offset += length
+        if tag == (2 << 3 | 2):  # PBNode.Links
+            _, inner = _read_varint(field, 0)  # PBLink.Hash tag
+            hash_length, inner = _read_varint(field, inner)
+            links.append(_parse_binary_cid(field[inner : inner + hash_length]))
+    return links
+
+
+def _parse_binary_cid(raw: bytes) -> CID:
+    if raw[:2] == b"\x12\x20":
+        return CID(0, DAG_PB, raw[2:])
+    version, offset = _read_varint(raw, 0)
+    codec, offset = _read_varint(raw, offset)
+    return CID(version, codec, raw[offset + 2 :])
+
+
+class MockPinningService(http.server.ThreadingHTTPServer):
+    """
+    In-process stand-in for a pinning service's Kubo RPC, for offline runs.
+
+    `block/put` checks and stores blocks by hash; `pin/add` succeeds only if
+    the whole DAG under the root is present. `failure_rate` makes that
+    share of `block/put` calls fail with a 503 to exercise retries.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self, address: tuple[str, int] = ("127.0.0.1", 0), failure_rate: float = 0.0
+    ) -> None:
+        super().__init__(address, _Handler)
+        self.failure_rate = failure_rate
+        self.blocks: dict[bytes, tuple[int, bytes]] = {}  # digest -> (codec, data)
+        self.pins: set[bytes] = set()
+        self.puts = 0
+        self._lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        if isinstance(host, bytes):
+            host = host.decode()
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockPinningService":
+        threading.Thread(target=self.serve_forever, name="mock-pinning", daemon=True).start()
+        return self
+
+    def put(self, codec: int, data: bytes) -> CID:
+        cid = CID(1, codec, hashlib.sha256(data).digest())
+        with self._lock:
+            self.puts += 1
+            self.blocks[cid.digest] = (codec, data)
+        return cid
+
+    def pin(self, root: CID) -> list[str]:
+        """Pin `root`, returning the CIDs of any missing blocks instead"""
+        missing = []
+        pending = [root]
+        while pending:
+            cid = pending.pop()
+            block = self.blocks.get(cid.digest)
+            if block is None:
+                missing.append(str(cid))
+            elif block[0] == DAG_PB:
+                pending += _links(block[1])
+        if not missing:
+            self.pins.add(root.digest)
+        return missing
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: MockPinningService
+
+    def do_POST(self) -> None:
+        url = urlparse(self.path)
+        params = {key: values[0] for key, values in parse_qs(url.query).items()}
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        match url.path:
+            case "/api/v0/block/put":
+                if random.random() < self.server.failure_rate:
+                    return self._reply(503, {"Message": "injected failure"})
+                codec = RAW if params.get("cid-codec") == "raw" else DAG_PB
+                data = self._file(body)
+                cid = self.server.put(codec, data)
+                return self._reply(200, {"Key": str(cid), "Size": len(data)})
+            case "/api/v0/pin/add":
+                root = CID.parse(params["arg"])
+                missing = self.server.pin(root)
+                if missing:
+                    return self._reply(500, {"Message": f"blocks not found: {missing[:5]}"})
+                return self._reply(200, {"Pins": [params["arg"]]})
+        self._reply(404, {"Message": f"no endpoint {url.path}"})
+
+    def _file(self, body: bytes) -> bytes:
+        header = f"Content-Type: {self.headers['Content-Type']}\r\n\r\n".encode()
+        message = BytesParser(policy=HTTP).parsebytes(header + body)
+        part = next(message.iter_parts())
+        payload = part.get_payload(decode=True)
+        return payload if isinstance(payload, bytes) else b""
+
+    def _reply(self, status: int, payload: dict) -> None:
+        encoded = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        self.end_headers()
+        self.wfile.write(encoded)
+
+    def log_message(self, format: str, *args: object) -> None:
+        logger.debug(format % args)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m backend.ipfs.mock_pinning")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    args = parser.parse_args()
+    service = MockPinningService(("127.0.0.1", args.port), args.failure_rate)
+    print(f"Mock pinning service on {service.url}")
+    service.serve_forever()
@@ -0,0 +1,193 @@
+import dataclasses
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TextIO
+
+import httpx
+
+from backend.ipfs.cid import CHUNK_SIZE, CID, RAW, Block, DagBuilder
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONCURRENCY = 8
+DEFAULT_RETRIES = 3
+DEFAULT_TIMEOUT = 60.0
+RETRY_DELAY = 1.0  # seconds, doubled after each failed attempt
+
+
+class UploadError(Exception):
+    """Raised when a block or the final pin cannot be stored"""
+
+
+@dataclasses.dataclass(frozen=True)
+class UploadResult:
+    cid: str
+    size: int  # file bytes
+    blocks: int
+    uploaded: int  # blocks sent this run; the rest were done before a resume
+
+
+class PinningClient:
+    """
+    Kubo RPC endpoints a pinning service exposes: `block/put` to store one
+    block and `pin/add` to pin a DAG whose blocks it already holds.
+
+    Only services that proxy Kubo's RPC API, or a Kubo node of your own,
+    offer these. Pinata does not; for it, write the file as a CAR with
+    `backend.ipfs.car.write_car` and send that through Pinata's own upload
+    API, which keeps the CID computed here.
+    """
+
+    def __init__(
+        self,
+        api_url: str,
+        headers: dict[str, str] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+    ) -> None:
+        self._client = httpx.Client(
+            base_url=api_url.rstrip("/") + "/api/v0/", headers=headers, timeout=timeout
+        )
+
+    def close(self) -> None:
+        self._client.close()
+
+    def put_block(self, block: Block) -> None:
+        response = self._client.post(
+            "block/put",
+            params={
+                "cid-codec": "raw" if block.cid.codec == RAW else "dag-pb",
+                "mhtype": "sha2-256",
+            },
+            files={"file": ("block", block.data)},
+        )
+        response.raise_for_status()
+        stored = CID.parse(response.json()["Key"])
+        # Kubo answers with a CIDv1 even for v0 blocks, so compare hashes.
+        if stored.digest != block.cid.digest:
+            raise UploadError(f"Service stored {stored} for block {block.cid}")
+
+    def pin(self, cid: CID) -> None:
+        response = self._client.post("pin/add", params={"arg": str(cid)})
+        response.raise_for_status()
+
+
+class _Progress:
+    """
+    Append-only log of stored block CIDs, so a rerun skips them.
+
+    The first line identifies the file and import settings; a log written
+    for anything else is discarded.
+    """
+
+    def __init__(self, path: Path | None, identity: str) -> None:
+        self.done: set[str] = set()
+        self._lock = threading.Lock()
+        self._file: TextIO | None = None
+        if path is None:
+            return
+        lines = path.read_text().splitlines() if path.exists() else []
+        if lines and lines[0] == identity:
+            self.done = {line for line in lines[1:] if line}
+        fresh = not self.done
+        self._file = path.open("w" if fresh else "a")
+        if fresh:
+            self._file.write(identity + "\n")
+            self._file.flush()
+
+    def add(self, cid: str) -> None:
+        with self._lock:
+            self.done.add(cid)
+            if self._file is not None:
+                self._file.write(cid + "\n")
+                self._file.flush()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+class DatasetUploader:
+    """
+    Uploads large files to a pinning service block by block.
+
+    The file is streamed through `DagBuilder`, so its CID is computed
+    locally exactly as `ipfs add` would, and every completed block is sent
+    with `block/put` while the next chunks are read. Up to `concurrency`
+    blocks are in flight and at most twice that are buffered. Each stored
+    block is logged to the `checkpoint` file; after an interruption the
+    same call rehashes the file, which is far cheaper than the uplink, and
+    only sends blocks missing from the log. The root is pinned last, once
+    every block is stored.
+    """
+
+    def __init__(
+        self,
+        client: PinningClient,
+        concurrency: int = DEFAULT_CONCURRENCY,
+        cid_version: int = 0,
+        retries: int = DEFAULT_RETRIES,
+    ) -> None:
+        self._client = client
+        self._concurrency = concurrency
+        self._cid_version = cid_version
+        self._retries = retries
+
+    def upload(self, path: Path, checkpoint: Path | None = None) -> UploadResult:
+        stat = path.stat()
+        identity = (
+            f"{path.name} {stat.st_size} {stat.st_mtime_ns} v{self._cid_version} {CHUNK_SIZE}"
+        )
+        progress = _Progress(checkpoint, identity)
+        builder = DagBuilder(self._cid_version)
+        blocks = uploaded = 0
+        in_flight: deque[Future[None]] = deque()
+        # Repeated chunks make identical blocks; each is sent once per run.
+        queued: set[str] = set()
+        try:
+            with (
+                ThreadPoolExecutor(self._concurrency, "ipfs-upload") as executor,
+                path.open("rb") as reader,
+            ):
+
+                def send(completed: list[Block]) -> None:
+                    nonlocal blocks, uploaded
+                    for block in completed:
+                        blocks += 1
+                        cid = str(block.cid)
+                        if cid in progress.done or cid in queued:
+                            continue
+                        queued.add(cid)
+                        uploaded += 1
+                        in_flight.append(executor.submit(self._put, block, progress))
+                        if len(in_flight) >= 2 * self._concurrency:
+                            in_flight.popleft().result()
+
+                while chunk := reader.read(CHUNK_SIZE):
+                    send(builder.update(chunk))
+                send(builder.finish())
+                while in_flight:
+                    in_flight.popleft().result()
+        finally:
+            progress.close()
+
+        self._client.pin(builder.root)
+        logger.info(f"Pinned {path.name} as {builder.root}: {blocks} blocks, {uploaded} sent")
+        return UploadResult(str(builder.root), stat.st_size, blocks, uploaded)
+
+    def _put(self, block: Block, progress: _Progress) -> None:
+        delay = RETRY_DELAY
+        for attempt in range(1, self._retries + 1):
+            try:
+                self._client.put_block(block)
+                break
+            except (httpx.HTTPError, UploadError) as e:
+                if attempt == self._retries:
+                    raise UploadError(f"Block {block.cid} failed {attempt} times: {e}") from e
+                logger.debug(f"Retrying block {block.cid} after: {e}")
+                time.sleep(delay)
+                delay *= 2
+        progress.add(str(block.cid))
@@ -0,0 +1,269 @@
+import base64
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import algokit_utils
+from algosdk import abi, transaction
+from algosdk.atomic_transaction_composer import ABI_RETURN_HASH
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import (
+    LicensePurchased,
+    LicenseRenewed,
+    LicenseRevoked,
+    LicenseUsed,
+    MarketplaceEvent,
+)
+from smart_contracts.artifacts.license_manager.license_manager_client import (
+    CheckLicenseArgs,
+    LicenseManagerClient,
+    LicenseStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+# Largest atomic group algod accepts. Simulate takes one group per request,
+# so a batch is split into groups that are simulated concurrently.
+GROUP_SIZE = 16
+DEFAULT_SIMULATE_CONCURRENCY = 8
+
+# How long the dispatcher waits for more cold checks to share a round-trip.
+DEFAULT_MAX_WAIT = 0.002
+
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_ENTRIES = 100_000
+
+_STATUS_TYPE = abi.ABIType.from_string("(bool,uint64,uint64,uint64)")
+
+LicenseKey = tuple[int, str]  # (license_id, holder address)
+
+
+class LicenseCheckError(Exception):
+    """Raised on a check's future when its simulate group failed"""
+
+
+def _decode_status(txn_result: dict) -> LicenseStatus:
+    raw = base64.b64decode(txn_result["logs"][-1])
+    if not raw.startswith(ABI_RETURN_HASH):
+        raise LicenseCheckError("check_license did not return a value")
+    valid, expiry, usage_count, usage_limit = _STATUS_TYPE.decode(
+        raw[len(ABI_RETURN_HASH) :]
+    )
+    return LicenseStatus(
+        valid=valid, expiry=expiry, usage_count=usage_count, usage_limit=usage_limit
+    )
+
+
+class LicenseVerifier:
+    """
+    Answers "may this holder use this license?" for inference gateways.
+
+    Valid licenses are cached until their on-chain expiry (forever for
+    perpetual ones), so a warm check is a dict lookup. Cold checks from any
+    number of threads are queued and resolved together: a dispatcher thread
+    packs up to `max_batch` `check_license` calls into groups of 16 and
+    simulates up to `concurrency` groups at once, so concurrent misses share
+    round-trips and nothing is ever written on-chain.
+
+    Register `on_block` with `MarketplaceIndexer.add_listener` so that
+    purchases, renewals, revocations and metered usage drop stale entries.
+    """
+
+    def __init__(
+        self,
+        client: LicenseManagerClient,
+        sender: str,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        max_wait: float = DEFAULT_MAX_WAIT,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+        concurrency: int = DEFAULT_SIMULATE_CONCURRENCY,
+    ) -> None:
+        self._client = client
+        self._sender = sender  # pays the simulated fees, so it must hold some ALGO
+        self._max_batch = max_batch
+        self._max_wait = max_wait
+        self._max_entries = max_entries
+        self._clock = clock
+        self._cache: dict[LicenseKey, int] = {}  # key -> expiry, 0 = never
+        self._lock = threading.Condition()
+        self._pending: dict[LicenseKey, Future[LicenseStatus]] = {}
+        # Bumped on every invalidation so an in-flight batch cannot re-cache
+        # a result that an event has since made stale.
+        self._epoch = 0
+        self._closed = False
+        self._dispatcher: threading.Thread | None = None
+        self._executor = ThreadPoolExecutor(concurrency, "license-simulate")
+
+    def __enter__(self) -> "LicenseVerifier":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def check(self, license_id: int, holder: str, timeout: float | None = None) -> bool:
+        """Whether `holder` currently holds a valid `license_id`"""
+        if self._cached(license_id, holder):
+            return True
+        return self.submit(license_id, holder).result(timeout).valid
+
+    def check_many(
+        self, keys: Iterable[LicenseKey], timeout: float | None = None
+    ) -> dict[LicenseKey, bool]:
+        """Check many pairs at once; cache misses share simulate round-trips"""
+        results: dict[LicenseKey, bool] = {}
+        futures: dict[LicenseKey, Future[LicenseStatus]] = {}
+        for key in keys:
+            if self._cached(*key):
+                results[key] = True
+            elif key not in futures:
+                futures[key] = self.submit(*key)
+        for key, future in futures.items():
+            results[key] = future.result(timeout).valid
+        return results
+
+    def submit(self, license_id: int, holder: str) -> "Future[LicenseStatus]":
+        """Queue an on-chain check, bypassing the cache"""
+        key = (license_id, holder)
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Verifier is closed")
+            future = self._pending.get(key)
+            if future is None:
+                future = self._pending[key] = Future()
+                self._lock.notify_all()
+            self._ensure_dispatcher()
+        return future
+
+    def invalidate(self, license_id: int, holder: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self._cache.pop((license_id, holder), None)
+
+    def on_block(self, block: Block, events: list[MarketplaceEvent]) -> None:
+        """`MarketplaceIndexer` listener: forget grants that changed on-chain"""
+        for event in events:
+            match event:
+                case LicensePurchased():
+                    self.invalidate(event.license_id, event.buyer)
+                case LicenseRenewed() | LicenseRevoked() | LicenseUsed():
+                    self.invalidate(event.license_id, event.holder)
+
+    def close(self) -> None:
+        """Stop the dispatcher; checks already queued are still answered"""
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        if self._dispatcher is not None:
+            self._dispatcher.join()
+        self._executor.shutdown()
+
+    def _cached(self, license_id: int, holder: str) -> bool:
+        expiry = self._cache.get((license_id, holder))
+        return expiry is not None and (expiry == 0 or self._clock() < expiry)
+
+    def _ensure_dispatcher(self) -> None:
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(
+                target=self._dispatch, name="license-verifier", daemon=True
+            )
+            self._dispatcher.start()
+
+    def _dispatch(self) -> None:
+        while True:
+            with self._lock:
+                self._lock.wait_for(lambda: self._pending or self._closed)
+                if not self._pending:
+                    return
+                # Give concurrent callers a moment to join this batch.
+                deadline = time.monotonic() + self._max_wait
+                while len(self._pending) < self._max_batch and not self._closed:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._lock.wait(remaining)
+                keys = list(self._pending)[: self._max_batch]
+                futures = [self._pending.pop(key) for key in keys]
+                epoch = self._epoch
+            try:
+                statuses = self._simulate(keys)
+            except Exception as e:
+                logger.warning(f"License check batch of {len(keys)} failed: {e}")
+                for future in futures:
+                    future.set_exception(e)
+                continue
+            self._store(keys, statuses, epoch)
+            for future, status in zip(futures, statuses, strict=True):
+                if isinstance(status, Exception):
+                    future.set_exception(status)
+                else:
+                    future.set_result(status)
+
+    def _store(
+        self,
+        keys: list[LicenseKey],
+        statuses: list[LicenseStatus | Exception],
+        epoch: int,
+    ) -> None:
+        with self._lock:
+            if epoch != self._epoch:
+                return
+            for key, status in zip(keys, statuses):
+                if isinstance(status, Exception) or not status.valid:
+                    continue
+                if len(self._cache) >= self._max_entries:
+                    del self._cache[next(iter(self._cache))]
+                self._cache[key] = status.expiry
+
+    def _simulate(self, keys: list[LicenseKey]) -> list[LicenseStatus | Exception]:
+        """One status or error per key, in order"""
+        chunks = [keys[start : start + GROUP_SIZE] for start in range(0, len(keys), GROUP_SIZE)]
+        statuses: list[LicenseStatus | Exception] = []
+        for chunk_statuses in self._executor.map(self._simulate_group, chunks):
+            statuses += chunk_statuses
+        return statuses
+
+    def _simulate_group(self, keys: list[LicenseKey]) -> list[LicenseStatus | Exception]:
+        try:
+            composer = self._client.algorand.new_group()
+            for license_id, holder in keys:
+                composer.add_app_call_method_call(
+                    self._client.params.check_license(
+                        CheckLicenseArgs(license_id=license_id, holder=holder),
+                        algokit_utils.CommonAppCallParams(sender=self._sender),
+                    )
+                )
+            txns = transaction.assign_group_id(composer.build_transactions().transactions)
+            response = self._client.algorand.client.algod.simulate_transactions(
+                SimulateRequest(
+                    txn_groups=[
+                        SimulateRequestTransactionGroup(
+                            txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                        )
+                    ],
+                    allow_empty_signatures=True,
+                    allow_unnamed_resources=True,
+                )
+            )
+        except Exception as e:
+            logger.warning(f"License check group of {len(keys)} failed: {e}")
+            return [e] * len(keys)
+        group = response["txn-groups"][0]
+        failure = group.get("failure-message")
+        statuses: list[LicenseStatus | Exception] = []
+        for result in group.get("txn-results", []):
+            if failure:
+                statuses.append(LicenseCheckError(failure))
+            else:
+                try:
+                    statuses.append(_decode_status(result["txn-result"]))
+                except (LicenseCheckError, KeyError, IndexError, ValueError) as e:
+                    statuses.append(LicenseCheckError(f"Undecodable check_license result: {e}"))
+        # A failed group may stop short; every key still needs an answer.
+        missing = LicenseCheckError(failure or "Simulate returned too few results")
+        statuses += [missing] * (len(keys) - len(statuses))
+        return statuses[: len(keys)]
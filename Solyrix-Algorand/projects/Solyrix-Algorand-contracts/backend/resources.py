@@ -0,0 +1,477 @@
+import base64
+import dataclasses
+import logging
+import typing
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import algokit_utils
+from algosdk import encoding, transaction
+from algosdk.atomic_transaction_composer import TransactionWithSigner
+from algosdk.error import AlgodHTTPError
+from algosdk.v2client.models import SimulateRequest, SimulateRequestTransactionGroup
+
+from smart_contracts.utils.constants import (
+    BALANCE_BOX_PREFIX,
+    CONTEXT_BOX_PREFIX,
+    HOLDER_BOX_PREFIX,
+    LICENSE_BOX_PREFIX,
+    PURCHASE_BOX_PREFIX,
+    USER_BOX_PREFIX,
+    USER_INDEX_CREATED,
+    USER_INDEX_PURCHASED,
+    USER_INDEX_PAGE_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+# Protocol limits: references per app call (accounts count against both),
+# and transactions per atomic group.
+MAX_REFERENCES = 8
+MAX_ACCOUNT_REFERENCES = 4
+GROUP_SIZE = 16
+
+
+@dataclasses.dataclass(frozen=True)
+class CallResources:
+    """
+    What one app call needs referenced; `extra_box_refs` buy I/O quota.
+    `apps` and `foreign_boxes`, (app id, name) pairs, are for inner calls
+    to other apps and stay on the call itself.
+    """
+
+    boxes: tuple[bytes, ...] = ()
+    accounts: tuple[str, ...] = ()
+    extra_box_refs: int = 0
+    apps: tuple[int, ...] = ()
+    foreign_boxes: tuple[tuple[int, bytes], ...] = ()
+
+    @property
+    def foreign_references(self) -> int:
+        return len(set(self.apps)) + len(set(self.foreign_boxes))
+
+
+# Box names an app call touches, derived from its ABI args and sender, or
+# None when they depend on on-chain state and must come from simulate. A
+# CallResources says more, e.g. an inner payment's receiver.
+BoxDeriver = Callable[[list[Any], str], list[bytes] | CallResources | None]
+
+# Byte offset of the creator address in ContextRecord and LicenseOffer.
+CONTEXT_CREATOR_OFFSET = 0
+LICENSE_CREATOR_OFFSET = 8
+
+AppCall = algokit_utils.AppCallMethodCallParams
+
+
+def _itob(value: int) -> bytes:
+    return value.to_bytes(8, "big")
+
+
+def _address(value: str) -> bytes:
+    return encoding.decode_address(value)
+
+
+CONTEXT_REGISTRY_BOXES: dict[str, BoxDeriver] = {
+    # create_context and purchase_context depend on counters and on the
+    # creator stored in the context; see CONTEXT_REGISTRY_STATEFUL.
+    "get_context_price": lambda args, sender: [CONTEXT_BOX_PREFIX + _itob(args[0])],
+    "get_context": lambda args, sender: [CONTEXT_BOX_PREFIX + _itob(args[0])],
+    "get_contexts": lambda args, sender: [
+        CONTEXT_BOX_PREFIX + _itob(context_id) for context_id in args[0]
+    ],
+    "set_price_tiers": lambda args, sender: [CONTEXT_BOX_PREFIX + _itob(args[0])],
+    "rate_context": lambda args, sender: [
+        CONTEXT_BOX_PREFIX + _itob(args[0]),
+        PURCHASE_BOX_PREFIX + _itob(args[0]) + _address(sender),
+    ],
+    "get_context_rating": lambda args, sender: [CONTEXT_BOX_PREFIX + _itob(args[0])],
+    "withdraw": lambda args, sender: [BALANCE_BOX_PREFIX + _address(sender)],
+    "withdraw_platform_fees": lambda args, sender: [],
+    "get_balance": lambda args, sender: [BALANCE_BOX_PREFIX + _address(args[0])],
+    "get_user_contexts": lambda args, sender: [
+        USER_BOX_PREFIX + _address(args[0]) + bytes([args[1]]) + _itob(args[2])
+    ],
+    "get_platform_fee_percentage": lambda args, sender: [],
+    "set_platform_fee_percentage": lambda args, sender: [],
+}
+
+LICENSE_MANAGER_BOXES: dict[str, BoxDeriver] = {
+    # create, purchase and renew depend on the license counter or on the
+    # creator stored in the offer; see LICENSE_MANAGER_STATEFUL.
+    "record_usage": lambda args, sender: [
+        LICENSE_BOX_PREFIX + _itob(args[0]),
+        HOLDER_BOX_PREFIX + _itob(args[0]) + _address(args[1]),
+    ],
+    "revoke_license": lambda args, sender: CallResources(
+        boxes=(
+            LICENSE_BOX_PREFIX + _itob(args[0]),
+            HOLDER_BOX_PREFIX + _itob(args[0]) + _address(args[1]),
+        ),
+        accounts=(args[1],),  # receives the grant box's MBR
+    ),
+    "check_license": lambda args, sender: [
+        HOLDER_BOX_PREFIX + _itob(args[0]) + _address(args[1])
+    ],
+    "get_license_price": lambda args, sender: [LICENSE_BOX_PREFIX + _itob(args[0])],
+    "set_price_tiers": lambda args, sender: [LICENSE_BOX_PREFIX + _itob(args[0])],
+    "withdraw": lambda args, sender: [BALANCE_BOX_PREFIX + _address(sender)],
+    "withdraw_platform_fees": lambda args, sender: [],
+    "get_balance": lambda args, sender: [BALANCE_BOX_PREFIX + _address(args[0])],
+    "get_platform_fee_percentage": lambda args, sender: [],
+    "set_platform_fee_percentage": lambda args, sender: [],
+    "set_context_registry": lambda args, sender: [],
+}
+
+BOX_DERIVERS: dict[str, dict[str, BoxDeriver]] = {
+    "ContextRegistry": CONTEXT_REGISTRY_BOXES,
+    "LicenseManager": LICENSE_MANAGER_BOXES,
+}
+
+
+class ResourceError(Exception):
+    """Raised when a call's references cannot be resolved or do not fit a group"""
+
+
+class ChainState:
+    """
+    The on-chain values stateful calls derive box names from, read once per
+    batch and advanced locally as each call is planned.
+
+    Simulating each call on its own would show every create in a batch the
+    same next id and every append the same index page; tracking counters
+    here gives the nth create the nth new id, as the chain will when the
+    calls land in order. Creators of items created earlier in the batch
+    are remembered so purchases of them resolve without a box read.
+    """
+
+    def __init__(self, algorand: algokit_utils.AlgorandClient, app_id: int) -> None:
+        self._algod = algorand.client.algod
+        self._app_id = app_id
+        self._globals: dict[str, int] | None = None
+        self._user_totals: dict[tuple[str, int], int] = {}
+        self._creators: dict[bytes, str] = {}
+
+    def global_uint(self, key: str) -> int:
+        if self._globals is None:
+            state = self._algod.application_info(self._app_id)["params"].get("global-state", [])
+            self._globals = {
+                base64.b64decode(entry["key"]).decode(errors="replace"): entry["value"].get(
+                    "uint", 0
+                )
+                for entry in state
+            }
+        return self._globals.get(key, 0)
+
+    def next_id(self, counter: str) -> int:
+        value = self.global_uint(counter) + 1
+        typing.cast(dict[str, int], self._globals)[counter] = value
+        return value
+
+    def append_user_index(self, user: str, kind: int) -> list[bytes]:
+        """Boxes an append to one of `user`'s index lists touches: page 0 and the target page"""
+        prefix = USER_BOX_PREFIX + _address(user) + bytes([kind])
+        first_key = prefix + _itob(0)
+        total = self._user_totals.get((user, kind))
+        if total is None:
+            page = self._box(first_key)
+            total = int.from_bytes(page[:8], "big") if page else 0
+        self._user_totals[user, kind] = total + 1
+        return list(dict.fromkeys([first_key, prefix + _itob(total // USER_INDEX_PAGE_SIZE)]))
+
+    def created(self, key: bytes, creator: str) -> None:
+        self._creators[key] = creator
+
+    def creator(self, key: bytes, offset: int) -> str | None:
+        """Creator stored in box `key` at `offset`, or None if there is no such box"""
+        if key not in self._creators:
+            record = self._box(key)
+            if record is None:
+                return None
+            self._creators[key] = encoding.encode_address(record[offset : offset + 32])
+        return self._creators[key]
+
+    def _box(self, name: bytes) -> bytes | None:
+        try:
+            response = self._algod.application_box_by_name(self._app_id, name)
+        except AlgodHTTPError as e:
+            if e.code == 404:
+                return None
+            raise
+        return base64.b64decode(response["value"])
+
+
+# Like BoxDeriver, for calls whose boxes depend on counters or stored creators.
+StatefulDeriver = Callable[[list[Any], str, ChainState], list[bytes] | CallResources | None]
+
+
+def _create_context(args: list[Any], sender: str, state: ChainState) -> list[bytes]:
+    key = CONTEXT_BOX_PREFIX + _itob(state.next_id("context_count"))
+    state.created(key, sender)
+    return [key, *state.append_user_index(sender, USER_INDEX_CREATED)]
+
+
+def _purchase_context(args: list[Any], sender: str, state: ChainState) -> list[bytes] | None:
+    key = CONTEXT_BOX_PREFIX + _itob(args[0])
+    creator = state.creator(key, CONTEXT_CREATOR_OFFSET)
+    if creator is None:
+        return None  # unknown context; simulate reports why the call fails
+    return [
+        key,
+        PURCHASE_BOX_PREFIX + _itob(args[0]) + _address(sender),
+        *state.append_user_index(sender, USER_INDEX_PURCHASED),
+        BALANCE_BOX_PREFIX + _address(creator),
+    ]
+
+
+def _create_license(args: list[Any], sender: str, state: ChainState) -> CallResources:
+    key = LICENSE_BOX_PREFIX + _itob(state.next_id("license_count"))
+    state.created(key, sender)
+    # The ownership check reads the context through the registry's get_context.
+    registry = state.global_uint("context_registry")
+    return CallResources(
+        boxes=(key,),
+        apps=(registry,),
+        foreign_boxes=((registry, CONTEXT_BOX_PREFIX + _itob(args[0])),),
+    )
+
+
+def _pay_for_license(args: list[Any], sender: str, state: ChainState) -> list[bytes] | None:
+    key = LICENSE_BOX_PREFIX + _itob(args[0])
+    creator = state.creator(key, LICENSE_CREATOR_OFFSET)
+    if creator is None:
+        return None
+    return [
+        key,
+        HOLDER_BOX_PREFIX + _itob(args[0]) + _address(sender),
+        BALANCE_BOX_PREFIX + _address(creator),
+    ]
+
+
+CONTEXT_REGISTRY_STATEFUL: dict[str, StatefulDeriver] = {
+    "create_context": _create_context,
+    "purchase_context": _purchase_context,
+}
+
+LICENSE_MANAGER_STATEFUL: dict[str, StatefulDeriver] = {
+    "create_license": _create_license,
+    "purchase_license": _pay_for_license,
+    "renew_license": _pay_for_license,
+}
+
+STATEFUL_DERIVERS: dict[str, dict[str, StatefulDeriver]] = {
+    "ContextRegistry": CONTEXT_REGISTRY_STATEFUL,
+    "LicenseManager": LICENSE_MANAGER_STATEFUL,
+}
+
+
+def _txn_count(call: AppCall) -> int:
+    # Transaction arguments become their own transactions in the group.
+    return 1 + sum(
+        isinstance(arg, transaction.Transaction | TransactionWithSigner)
+        or dataclasses.is_dataclass(arg)
+        for arg in call.args or []
+    )
+
+
+def _fits(calls: Sequence[AppCall], resources: Sequence[CallResources]) -> bool:
+    if sum(_txn_count(call) for call in calls) > GROUP_SIZE:
+        return False
+    for app_id in {call.app_id for call in calls}:
+        members = [i for i, call in enumerate(calls) if call.app_id == app_id]
+        boxes = {box for i in members for box in resources[i].boxes}
+        accounts = {account for i in members for account in resources[i].accounts}
+        extra = sum(resources[i].extra_box_refs for i in members)
+        foreign = sum(resources[i].foreign_references for i in members)
+        if len(accounts) > MAX_ACCOUNT_REFERENCES * len(members):
+            return False
+        if len(boxes) + len(accounts) + extra + foreign > MAX_REFERENCES * len(members):
+            return False
+    return True
+
+
+class ResourcePacker:
+    """
+    Fills in box and account references for calls built with a generated
+    client's `params` methods.
+
+    Box names are derived from each call's arguments where the contract's
+    key layout allows it. Calls whose boxes depend on counters or stored
+    creators read those once per batch through a `ChainState`, which
+    advances them locally as calls are planned. Anything left is simulated
+    one call per request, with unnamed resources allowed, and its
+    references read back from the simulate response. References are shared
+    across the group, so `pack` splits a batch into as few groups as the
+    per-call reference and per-group transaction limits allow, spreading
+    each group's deduplicated references over all of its app calls.
+    """
+
+    def __init__(
+        self,
+        algorand: algokit_utils.AlgorandClient,
+        derivers: dict[str, BoxDeriver] | None = None,
+        stateful: dict[str, StatefulDeriver] | None = None,
+    ) -> None:
+        self._algorand = algorand
+        self._derivers = derivers or {}
+        self._stateful = stateful or {}
+
+    @classmethod
+    def for_client(cls, client: Any) -> "ResourcePacker":
+        """Packer for a generated `ContextRegistryClient` or `LicenseManagerClient`"""
+        return cls(
+            client.algorand,
+            BOX_DERIVERS.get(client.app_name),
+            STATEFUL_DERIVERS.get(client.app_name),
+        )
+
+    def resolve(self, calls: Sequence[AppCall]) -> list[CallResources]:
+        resolved: list[CallResources | None] = []
+        states: dict[int, ChainState] = {}
+        for call in calls:
+            args = list(call.args or [])
+            derived: list[bytes] | CallResources | None = None
+            if derive := self._derivers.get(call.method.name):
+                derived = derive(args, call.sender)
+            elif stateful := self._stateful.get(call.method.name):
+                if call.app_id not in states:
+                    states[call.app_id] = ChainState(self._algorand, call.app_id)
+                derived = stateful(args, call.sender, states[call.app_id])
+            if isinstance(derived, list):
+                derived = CallResources(tuple(derived))
+            resolved.append(derived)
+        unresolved = [i for i, resources in enumerate(resolved) if resources is None]
+        if unresolved:
+            simulated = self._simulate([calls[i] for i in unresolved])
+            for i, resources in zip(unresolved, simulated):
+                resolved[i] = resources
+        return typing.cast(list[CallResources], resolved)
+
+    def pack(self, calls: Sequence[AppCall]) -> list[list[AppCall]]:
+        """Split `calls` into groups, in order, with references filled in"""
+        resources = self.resolve(calls)
+        groups: list[list[int]] = []
+        for i in range(len(calls)):
+            if not _fits([calls[i]], [resources[i]]):
+                raise ResourceError(
+                    f"{calls[i].method.name} needs more references than one call holds"
+                )
+            current = groups[-1] if groups else None
+            if current is not None and _fits(
+                [calls[j] for j in current + [i]], [resources[j] for j in current + [i]]
+            ):
+                current.append(i)
+            else:
+                groups.append([i])
+        return [
+            self._assign([calls[i] for i in group], [resources[i] for i in group])
+            for group in groups
+        ]
+
+    def send(
+        self,
+        calls: Sequence[AppCall],
+        send_params: algokit_utils.SendParams | None = None,
+    ) -> list[algokit_utils.SendAtomicTransactionComposerResults]:
+        """Pack and send `calls`, one group at a time"""
+        # References are already in place, so skip algokit's own simulate pass.
+        send_params = {"populate_app_call_resources": False, **(send_params or {})}
+        results = []
+        for group in self.pack(calls):
+            composer = self._algorand.new_group()
+            for call in group:
+                composer.add_app_call_method_call(call)
+            results.append(composer.send(send_params))
+        return results
+
+    def _assign(
+        self, calls: list[AppCall], resources: list[CallResources]
+    ) -> list[AppCall]:
+        for app_id in dict.fromkeys(call.app_id for call in calls):
+            members = [i for i, call in enumerate(calls) if call.app_id == app_id]
+            boxes = list(dict.fromkeys(box for i in members for box in resources[i].boxes))
+            # Empty names add I/O quota for boxes larger than 1KB.
+            boxes += [b""] * sum(resources[i].extra_box_refs for i in members)
+            accounts = list(
+                dict.fromkeys(account for i in members for account in resources[i].accounts)
+            )
+            for i in members:
+                call_accounts = accounts[:MAX_ACCOUNT_REFERENCES]
+                del accounts[: len(call_accounts)]
+                free = max(
+                    0, MAX_REFERENCES - len(call_accounts) - resources[i].foreign_references
+                )
+                call_boxes = boxes[:free]
+                del boxes[:free]
+                calls[i] = dataclasses.replace(
+                    calls[i],
+                    account_references=call_accounts or None,
+                    app_references=list(dict.fromkeys(resources[i].apps)) or None,
+                    box_references=[
+                        algokit_utils.BoxReference(app_id=0, name=name) for name in call_boxes
+                    ]
+                    + [
+                        algokit_utils.BoxReference(app_id=app, name=name)
+                        for app, name in dict.fromkeys(resources[i].foreign_boxes)
+                    ]
+                    or None,
+                )
+        return calls
+
+    def _simulate(self, calls: list[AppCall]) -> list[CallResources]:
+        # algod simulates one group per request, and box access is reported
+        # for the whole group, so each call gets a request of its own. Calls
+        # that move counters are planned through ChainState instead, so
+        # these see the chain as it is now without missing anything.
+        resolved = []
+        for call in calls:
+            composer = self._algorand.new_group()
+            composer.add_app_call_method_call(call)
+            txns = composer.build_transactions().transactions
+            if len(txns) > 1:
+                txns = transaction.assign_group_id(txns)
+            response = self._algorand.client.algod.simulate_transactions(
+                SimulateRequest(
+                    txn_groups=[
+                        SimulateRequestTransactionGroup(
+                            txns=[transaction.SignedTransaction(txn, None) for txn in txns]
+                        )
+                    ],
+                    allow_empty_signatures=True,
+                    allow_unnamed_resources=True,
+                )
+            )
+            group = response["txn-groups"][0]
+            if failure := group.get("failure-message"):
+                raise ResourceError(f"Simulating {call.method.name} failed: {failure}")
+            accessed = [group.get("unnamed-resources-accessed", {})] + [
+                result.get("unnamed-resources-accessed", {})
+                for result in group["txn-results"]
+            ]
+            resolved.append(
+                CallResources(
+                    boxes=tuple(
+                        base64.b64decode(box["name"])
+                        for used in accessed
+                        for box in used.get("boxes", [])
+                        if box["app"] in (0, call.app_id)
+                    ),
+                    accounts=tuple(
+                        account for used in accessed for account in used.get("accounts", [])
+                    ),
+                    extra_box_refs=sum(used.get("extra-box-refs", 0) for used in accessed),
+                    apps=tuple(
+                        app
+                        for used in accessed
+                        for app in used.get("apps", [])
+                        if app != call.app_id
+                    ),
+                    foreign_boxes=tuple(
+                        (box["app"], base64.b64decode(box["name"]))
+                        for used in accessed
+                        for box in used.get("boxes", [])
+                        if box["app"] not in (0, call.app_id)
+                    ),
+                )
+            )
+        logger.debug(f"Resolved references for {len(calls)} calls by simulate")
+        return resolved
@@ -0,0 +1,166 @@
+import logging
+import os
+from collections.abc import Iterable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+
+from algosdk import account, encoding
+from algosdk.atomic_transaction_composer import (
+    AccountTransactionSigner,
+    AtomicTransactionComposer,
+    TransactionWithSigner,
+)
+from algosdk.transaction import SignedTransaction, Transaction
+
+logger = logging.getLogger(__name__)
+
+# Transactions per task sent to a worker. Large enough to amortise the IPC
+# round-trip, small enough to keep every core busy on mid-sized batches.
+DEFAULT_CHUNK_SIZE = 256
+
+# Below this many transactions the pool overhead outweighs the signing cost.
+SERIAL_THRESHOLD = 64
+
+# Populated once per worker process by `_load_keys`; never used in the
+# parent, where each pool signs with its own keys.
+_worker_signers: dict[str, AccountTransactionSigner] = {}
+
+
+def _index_keys(private_keys: Sequence[str]) -> dict[str, AccountTransactionSigner]:
+    return {
+        account.address_from_private_key(key): AccountTransactionSigner(key)
+        for key in private_keys
+    }
+
+
+def _load_keys(private_keys: Sequence[str]) -> None:
+    """Worker initializer: index a signer for each key by address"""
+    global _worker_signers
+    _worker_signers = _index_keys(private_keys)
+
+
+def _sign_encoded(
+    encoded_txns: Sequence[str],
+    signers: dict[str, AccountTransactionSigner] | None = None,
+) -> list[str]:
+    """Sign msgpack-encoded transactions with `signers`, or the worker's signers"""
+    signers = _worker_signers if signers is None else signers
+    signed: list[str] = []
+    for encoded in encoded_txns:
+        txn = encoding.msgpack_decode(encoded)
+        signer = signers.get(txn.sender)
+        if signer is None:
+            raise KeyError(f"No signing key loaded for sender {txn.sender}")
+        # The signer API replaces the deprecated `Transaction.sign(private_key)`.
+        signed.append(encoding.msgpack_encode(signer.sign_transactions([txn], [0])[0]))
+    return signed
+
+
+def unwrap_transactions(
+    items: Iterable[object] | AtomicTransactionComposer,
+) -> list[Transaction]:
+    """
+    Normalise composer output into a flat list of unsigned transactions.
+
+    Accepts raw `Transaction`s, `TransactionWithSigner`s (as returned by
+    `AtomicTransactionComposer.build_group`), an `AtomicTransactionComposer`
+    itself, or an algokit `BuiltTransactions` result.
+    """
+    if isinstance(items, AtomicTransactionComposer):
+        items = items.build_group()
+    elif hasattr(items, "transactions") and hasattr(items, "signers"):
+        items = items.transactions  # algokit_utils.BuiltTransactions
+
+    txns: list[Transaction] = []
+    for item in items:
+        if isinstance(item, TransactionWithSigner):
+            txns.append(item.txn)
+        elif isinstance(item, Transaction):
+            txns.append(item)
+        else:
+            raise TypeError(f"Cannot sign object of type {type(item).__name__}")
+    return txns
+
+
+class SigningPool:
+    """
+    Signs transactions across a pool of worker processes.
+
+    Keys are shipped to each worker once, at start-up, rather than with every
+    task. Output order always matches input order, so atomic groups stay
+    intact and can be submitted as-is.
+    """
+
+    def __init__(
+        self,
+        private_keys: Sequence[str],
+        max_workers: int | None = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> None:
+        if not private_keys:
+            raise ValueError("At least one private key is required")
+        self._keys = list(private_keys)
+        self._signers = _index_keys(self._keys)  # serial fallback signs in-process
+        self._max_workers = max_workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+        self._executor: ProcessPoolExecutor | None = None
+
+    def __enter__(self) -> "SigningPool":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def start(self) -> None:
+        """Spin up the worker processes"""
+        if self._executor is None:
+            logger.debug(f"Starting signing pool with {self._max_workers} workers")
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._max_workers,
+                initializer=_load_keys,
+                initargs=(self._keys,),
+            )
+
+    def close(self) -> None:
+        """Shut down the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def sign(
+        self, items: Iterable[object] | AtomicTransactionComposer
+    ) -> list[SignedTransaction]:
+        """Sign transactions (or composer output), preserving order"""
+        txns = unwrap_transactions(items)
+        encoded = [encoding.msgpack_encode(txn) for txn in txns]
+
+        if len(encoded) < SERIAL_THRESHOLD or self._max_workers == 1:
+            signed = _sign_encoded(encoded, self._signers)
+        else:
+            self.start()
+            assert self._executor is not None
+            chunks = [
+                encoded[i : i + self._chunk_size]
+                for i in range(0, len(encoded), self._chunk_size)
+            ]
+            signed = [
+                stxn
+                for chunk in self._executor.map(_sign_encoded, chunks)
+                for stxn in chunk
+            ]
+
+        return [encoding.msgpack_decode(stxn) for stxn in signed]
+
+    def sign_groups(
+        self, groups: Sequence[Iterable[object] | AtomicTransactionComposer]
+    ) -> list[list[SignedTransaction]]:
+        """Sign many groups in one pass, returning them split back per group"""
+        unwrapped = [unwrap_transactions(group) for group in groups]
+        signed = self.sign(txn for group in unwrapped for txn in group)
+
+        result: list[list[SignedTransaction]] = []
+        offset = 0
+        for group in unwrapped:
+            result.append(signed[offset : offset + len(group)])
+            offset += len(group)
+        return result
@@ -0,0 +1,250 @@
+import dataclasses
+import logging
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Sequence
+from concurrent.futures import Future
+
+from algosdk.error import AlgodHTTPError
+from algosdk.transaction import GenericSignedTransaction
+from algosdk.v2client.algod import AlgodClient
+
+from backend import telemetry
+
+logger = logging.getLogger(__name__)
+
+# Seconds to back off after a failed block fetch, doubling with each
+# consecutive failure up to the maximum. After FOLLOWER_MAX_FAILURES in a
+# row the follower stops and fails every pending group.
+FOLLOWER_RETRY_DELAY = 1.0
+FOLLOWER_MAX_RETRY_DELAY = 30.0
+FOLLOWER_MAX_FAILURES = 10
+
+# Re-signs a group with fresh validity rounds after it expired unconfirmed.
+Rebuild = Callable[[], Sequence[GenericSignedTransaction]]
+
+
+class GroupExpiredError(Exception):
+    """Raised on a group's future when it passed lastValid without confirming"""
+
+
+@dataclasses.dataclass(frozen=True)
+class Confirmation:
+    txids: list[str]
+    confirmed_round: int
+    attempts: int
+
+
+@dataclasses.dataclass
+class _InFlight:
+    group: Sequence[GenericSignedTransaction]
+    future: "Future[Confirmation]"
+    rebuild: Rebuild | None
+    retries_left: int
+    attempts: int = 0
+    txids: list[str] = dataclasses.field(default_factory=list)
+    last_valid: int = 0
+    submitted_at: float = dataclasses.field(default_factory=time.monotonic)
+
+
+def _group_txids(group: Sequence[GenericSignedTransaction]) -> list[str]:
+    return [stxn.get_txid() for stxn in group]
+
+
+def _group_last_valid(group: Sequence[GenericSignedTransaction]) -> int:
+    # The whole group is dead as soon as its tightest member expires.
+    return min(stxn.transaction.last_valid_round for stxn in group)
+
+
+class PipelinedSubmitter:
+    """
+    Keeps a window of transaction groups in flight and confirms them by
+    following blocks.
+
+    Instead of waiting on `pending_transaction_info` for every transaction,
+    a single follower thread reads each new block's txids and resolves the
+    matching futures. Groups still unconfirmed after their `lastValid`
+    round are rebuilt and resubmitted when a `rebuild` callback was given,
+    otherwise their future fails with `GroupExpiredError`. If the follower
+    cannot read blocks, every pending future fails with its last error and
+    the next `submit` starts a new follower.
+    """
+
+    def __init__(
+        self,
+        algod_client: AlgodClient,
+        window: int = 16,
+        max_retries: int = 3,
+    ) -> None:
+        self._algod = algod_client
+        self._window = window
+        self._max_retries = max_retries
+        self._lock = threading.Condition()
+        self._queued: deque[_InFlight] = deque()
+        self._in_flight: dict[str, _InFlight] = {}
+        self._closed = False
+        self._follower: threading.Thread | None = None
+
+    def __enter__(self) -> "PipelinedSubmitter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def submit(
+        self,
+        group: Sequence[GenericSignedTransaction],
+        rebuild: Rebuild | None = None,
+    ) -> "Future[Confirmation]":
+        """Queue a signed group, returning a future for its confirmation"""
+        if not group:
+            raise ValueError("Cannot submit an empty group")
+        entry = _InFlight(
+            group=group,
+            future=Future(),
+            rebuild=rebuild,
+            retries_left=self._max_retries if rebuild else 0,
+        )
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("Submitter is closed")
+            self._ensure_follower()
+            self._queued.append(entry)
+            self._fill_window()
+        return entry.future
+
+    def drain(self, timeout: float | None = None) -> bool:
+        """Block until every submitted group has resolved"""
+        with self._lock:
+            return self._lock.wait_for(
+                lambda: not self._queued and not self._in_flight, timeout
+            )
+
+    def close(self) -> None:
+        """Wait for outstanding groups and stop following blocks"""
+        self.drain()
+        with self._lock:
+            self._closed = True
+            self._lock.notify_all()
+        # The follower may be parked in wait-for-block-after; it is a daemon
+        # thread and exits on its own once that call returns.
+        self._follower = None
+
+    # Callers must hold self._lock for the helpers below.
+
+    def _ensure_follower(self) -> None:
+        if self._follower is None:
+            # Read before anything is sent, so a group confirmed in the very
+            # next block is not skipped.
+            first_round = self._algod.status()["last-round"] + 1
+            self._follower = threading.Thread(
+                target=self._follow, args=(first_round,), name="submitter-follower", daemon=True
+            )
+            self._follower.start()
+
+    def _fill_window(self) -> None:
+        while self._queued and len(self._in_flight) < self._window:
+            self._send(self._queued.popleft())
+
+    def _send(self, entry: _InFlight) -> None:
+        entry.attempts += 1
+        entry.txids = _group_txids(entry.group)
+        entry.last_valid = _group_last_valid(entry.group)
+        entry.submitted_at = time.monotonic()
+        try:
+            self._algod.send_transactions(entry.group)
+        except Exception as e:
+            # A resubmission of an already-committed group is not a failure;
+            # the follower will still see it in a block.
+            if not (isinstance(e, AlgodHTTPError) and "already in ledger" in str(e)):
+                entry.future.set_exception(e)
+                self._lock.notify_all()
+                return
+        self._in_flight[entry.txids[0]] = entry
+
+    def _expire(self, current_round: int) -> None:
+        expired = [
+            key
+            for key, entry in self._in_flight.items()
+            if entry.last_valid <= current_round
+        ]
+        for key in expired:
+            entry = self._in_flight.pop(key)
+            if entry.rebuild is not None and entry.retries_left > 0:
+                logger.debug(
+                    f"Group {key} expired at round {entry.last_valid}, rebuilding"
+                )
+                entry.retries_left -= 1
+                try:
+                    entry.group = entry.rebuild()
+                except Exception as e:
+                    entry.future.set_exception(e)
+                    continue
+                self._queued.appendleft(entry)
+            else:
+                entry.future.set_exception(
+                    GroupExpiredError(
+                        f"Group {key} passed lastValid {entry.last_valid} "
+                        f"after {entry.attempts} attempt(s)"
+                    )
+                )
+
+    def _fail_pending(self, error: BaseException) -> None:
+        for entry in [*self._queued, *self._in_flight.values()]:
+            if not entry.future.done():
+                entry.future.set_exception(error)
+        self._queued.clear()
+        self._in_flight.clear()
+
+    def _follow(self, next_round: int) -> None:
+        try:
+            self._follow_blocks(next_round)
+        except Exception as e:
+            logger.error(f"Block follower stopped: {e}")
+            with self._lock:
+                self._fail_pending(e)
+                if self._follower is threading.current_thread():
+                    self._follower = None
+                self._lock.notify_all()
+
+    def _follow_blocks(self, next_round: int) -> None:
+        failures = 0
+        while True:
+            with self._lock:
+                if self._closed and not self._in_flight and not self._queued:
+                    return
+            try:
+                self._algod.status_after_block(next_round - 1)
+                txids = self._algod.get_block_txids(next_round)["blockTxids"]
+            except Exception as e:
+                failures += 1
+                if failures >= FOLLOWER_MAX_FAILURES:
+                    raise
+                delay = min(FOLLOWER_RETRY_DELAY * 2 ** (failures - 1), FOLLOWER_MAX_RETRY_DELAY)
+                logger.warning(
+                    f"Block follower error at round {next_round}, retrying in {delay}s: {e}"
+                )
+                time.sleep(delay)
+                continue
+            failures = 0
+
+            with self._lock:
+                for txid in txids:
+                    entry = self._in_flight.pop(txid, None)
+                    if entry is not None:
+                        telemetry.observe(
+                            "confirmation_seconds", time.monotonic() - entry.submitted_at
+                        )
+                        entry.future.set_result(
+                            Confirmation(
+                                txids=entry.txids,
+                                confirmed_round=next_round,
+                                attempts=entry.attempts,
+                            )
+                        )
+                # Anything unconfirmed whose lastValid is this round is dead.
+                self._expire(next_round)
+                self._fill_window()
+                self._lock.notify_all()
+            next_round += 1
@@ -0,0 +1,323 @@
+import bisect
+import contextlib
+import contextvars
+import dataclasses
+import functools
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from algosdk.error import AlgodHTTPError, IndexerHTTPError
+from algosdk.v2client.algod import AlgodClient
+from algosdk.v2client.indexer import IndexerClient
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = "solyrix-algorand"
+
+# Upper bounds in seconds; wide enough for an HTTP call and a full compile.
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300)
+DEFAULT_MAX_SPANS = 10_000
+
+# Path segments that are ids rather than routes: rounds, app and asset ids,
+# and base32 txids and addresses. Collapsed so histograms stay per route.
+_ID_SEGMENT = re.compile(r"/(?:\d+|[A-Z2-7]{52}|[A-Z2-7]{58})(?=/|$)")
+_METRIC_NAME = re.compile(r"[^a-zA-Z0-9_:]")
+
+_current_span: contextvars.ContextVar["Span | None"] = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+@dataclasses.dataclass
+class Span:
+    name: str
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    labels: dict[str, str]  # low-cardinality attributes, also histogram labels
+    start_ns: int  # unix time
+    duration: float = 0.0  # seconds
+    attributes: dict[str, Any] = dataclasses.field(default_factory=dict)
+    error: str | None = None
+
+    def set(self, key: str, value: Any) -> None:
+        """Attach a trace-only attribute, e.g. an app id or status code"""
+        self.attributes[key] = value
+
+
+class Recorder:
+    """Receives finished spans and histogram observations; this one drops them"""
+
+    def record_span(self, span: Span) -> None:
+        pass
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        pass
+
+
+_recorder: Recorder = Recorder()
+
+
+def get_recorder() -> Recorder:
+    return _recorder
+
+
+def set_recorder(recorder: Recorder) -> Recorder:
+    """Install `recorder` for the whole process, returning the previous one"""
+    global _recorder
+    previous, _recorder = _recorder, recorder
+    return previous
+
+
+def observe(name: str, value: float, **labels: str) -> None:
+    _recorder.observe(name, value, labels)
+
+
+@contextlib.contextmanager
+def span(name: str, **labels: str) -> Iterator[Span]:
+    """
+    Time the enclosed block as a span nested under the current one.
+
+    Its duration is also observed into the `<name>_seconds` histogram,
+    labelled with `labels` plus `status`, so pass only values with few
+    distinct settings as labels and anything else through `Span.set`.
+    """
+    parent = _current_span.get()
+    current = Span(
+        name=name,
+        trace_id=parent.trace_id if parent else os.urandom(16).hex(),
+        span_id=os.urandom(8).hex(),
+        parent_id=parent.span_id if parent else None,
+        labels=labels,
+        start_ns=time.time_ns(),
+    )
+    token = _current_span.set(current)
+    started = time.perf_counter()
+    try:
+        yield current
+    except BaseException as e:
+        current.error = f"{type(e).__name__}: {e}"
+        raise
+    finally:
+        _current_span.reset(token)
+        current.duration = time.perf_counter() - started
+        recorder = _recorder
+        recorder.record_span(current)
+        status = "error" if current.error else "ok"
+        recorder.observe(f"{name}_seconds", current.duration, {**labels, "status": status})
+
+
+class _Histogram:
+    def __init__(self, buckets: int) -> None:
+        self.counts = [0] * (buckets + 1)  # the last bucket is +Inf
+        self.sum = 0.0
+        self.count = 0
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _otlp_value(value: Any) -> dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _otlp_attributes(attributes: Mapping[str, Any]) -> list[dict[str, Any]]:
+    return [{"key": key, "value": _otlp_value(value)} for key, value in attributes.items()]
+
+
+class Telemetry(Recorder):
+    """
+    Keeps spans and histograms in memory for export at the end of a run.
+
+    Histograms use fixed `buckets`, so recording is a lookup and two adds
+    under a lock, cheap enough for every HTTP call. Only the most recent
+    `max_spans` spans are kept. `export` writes either Prometheus text
+    exposition, for a node_exporter textfile collector or a push gateway,
+    or OTLP/JSON, one traces and one metrics request per line as an
+    OpenTelemetry collector's otlpjsonfile receiver reads them.
+    """
+
+    def __init__(
+        self,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        service_name: str = SERVICE_NAME,
+    ) -> None:
+        self._bounds = tuple(sorted(buckets))
+        self._service_name = service_name
+        self._lock = threading.Lock()
+        self._started_ns = time.time_ns()
+        self.spans: deque[Span] = deque(maxlen=max_spans)
+        self.histograms: dict[str, dict[tuple[tuple[str, str], ...], _Histogram]] = {}
+
+    def record_span(self, span: Span) -> None:
+        with self._lock:
+            self.spans.append(span)
+
+    def observe(self, name: str, value: float, labels: Mapping[str, str]) -> None:
+        key = tuple(sorted(labels.items()))
+        bucket = bisect.bisect_left(self._bounds, value)
+        with self._lock:
+            series = self.histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = _Histogram(len(self._bounds))
+            histogram.counts[bucket] += 1
+            histogram.sum += value
+            histogram.count += 1
+
+    def prometheus(self) -> str:
+        lines = []
+        with self._lock:
+            for name, series in sorted(self.histograms.items()):
+                metric = _METRIC_NAME.sub("_", name)
+                lines.append(f"# TYPE {metric} histogram")
+                for key, histogram in series.items():
+                    labels = "".join(f'{k}="{_escape(v)}",' for k, v in key)
+                    cumulative = 0
+                    for bound, count in zip((*self._bounds, "+Inf"), histogram.counts):
+                        cumulative += count
+                        lines.append(f'{metric}_bucket{{{labels}le="{bound}"}} {cumulative}')
+                    suffix = f"{{{labels.rstrip(',')}}}" if labels else ""
+                    lines.append(f"{metric}_sum{suffix} {histogram.sum}")
+                    lines.append(f"{metric}_count{suffix} {histogram.count}")
+        return "\n".join(lines) + "\n"
+
+    def otlp(self) -> tuple[dict[str, Any], dict[str, Any]]:
+        """OTLP/JSON trace and metric export requests"""
+        resource = {"attributes": _otlp_attributes({"service.name": self._service_name})}
+        scope = {"name": __name__}
+        now = str(time.time_ns())
+        with self._lock:
+            spans = [
+                {
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 1,  # SPAN_KIND_INTERNAL
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.start_ns + int(span.duration * 1e9)),
+                    "attributes": _otlp_attributes({**span.labels, **span.attributes}),
+                    "status": (
+                        {"code": 2, "message": span.error} if span.error else {"code": 1}
+                    ),
+                }
+                for span in self.spans
+            ]
+            metrics = [
+                {
+                    "name": name,
+                    "unit": "s",
+                    "histogram": {
+                        "aggregationTemporality": 2,  # cumulative
+                        "dataPoints": [
+                            {
+                                "attributes": _otlp_attributes(dict(key)),
+                                "startTimeUnixNano": str(self._started_ns),
+                                "timeUnixNano": now,
+                                "count": str(histogram.count),
+                                "sum": histogram.sum,
+                                "bucketCounts": [str(count) for count in histogram.counts],
+                                "explicitBounds": list(self._bounds),
+                            }
+                            for key, histogram in series.items()
+                        ],
+                    },
+                }
+                for name, series in sorted(self.histograms.items())
+            ]
+        traces = {
+            "resourceSpans": [
+                {"resource": resource, "scopeSpans": [{"scope": scope, "spans": spans}]}
+            ]
+        }
+        metric_request = {
+            "resourceMetrics": [
+                {"resource": resource, "scopeMetrics": [{"scope": scope, "metrics": metrics}]}
+            ]
+        }
+        return traces, metric_request
+
+    def export(self, path: Path) -> None:
+        """Write OTLP/JSON if `path` ends in .json, Prometheus text otherwise"""
+        if path.suffix == ".json":
+            traces, metrics = self.otlp()
+            text = json.dumps(traces) + "\n" + json.dumps(metrics) + "\n"
+        else:
+            text = self.prometheus()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(text)
+        logger.info(
+            f"Wrote {len(self.spans)} spans and {len(self.histograms)} histograms to {path}"
+        )
+
+
+def route(requrl: str) -> str:
+    """`requrl` with ids and query collapsed, e.g. /applications/{id}/box"""
+    return _ID_SEGMENT.sub("/{id}", requrl.split("?", 1)[0])
+
+
+def _timed(request: Callable[..., Any], service: str) -> Callable[..., Any]:
+    @functools.wraps(request)
+    def timed(client: Any, method: str, requrl: str, *args: Any, **kwargs: Any) -> Any:
+        with span(f"{service}.request", method=method, route=route(requrl)) as current:
+            current.set("url", requrl)
+            try:
+                return request(client, method, requrl, *args, **kwargs)
+            except (AlgodHTTPError, IndexerHTTPError) as e:
+                # IndexerHTTPError carries no status code.
+                current.set("http.status_code", getattr(e, "code", None) or 0)
+                raise
+
+    timed._instrumented = True  # type: ignore[attr-defined]
+    return timed
+
+
+def instrument_clients() -> None:
+    """
+    Time every algod and indexer HTTP call made by any client in the process.
+
+    All py-algorand-sdk and AlgoKit calls go through the clients' request
+    methods, which are wrapped once here; simulate, confirmation polling
+    (`/status/wait-for-block-after`, `/transactions/pending`) and box reads
+    show up as separate routes of the `algod_request_seconds` histogram.
+    """
+    for cls, method, service in (
+        (AlgodClient, "algod_request", "algod"),
+        (IndexerClient, "indexer_request", "indexer"),
+    ):
+        request = getattr(cls, method)
+        if not getattr(request, "_instrumented", False):
+            setattr(cls, method, _timed(request, service))
+
+
+@contextlib.contextmanager
+def exporting(path: str | Path | None) -> Iterator[Telemetry | None]:
+    """Record into a fresh `Telemetry` and export it to `path` on exit; no-op without a path"""
+    if not path:
+        yield None
+        return
+    telemetry = Telemetry()
+    previous = set_recorder(telemetry)
+    instrument_clients()
+    try:
+        yield telemetry
+    finally:
+        set_recorder(previous)
+        telemetry.export(Path(path))
@@ -5,8 +5,11 @@ This is for demo purposes only - real deployment requires proper mnemonic
 """
 
 import json
+import logging
 from pathlib import Path
 
+logger = logging.getLogger(__name__)
+
 def update_frontend_for_demo():
     """Update frontend to simulate deployed contracts for demo"""
     
@@ -18,7 +21,7 @@ def update_frontend_for_demo():
         "governance_token": 628893741   # Demo ID
     }
     
-    print("🚀 Setting up demo contract IDs...")
+    logger.info("Setting up demo contract IDs...")
     
     # Update frontend .env.local with demo app IDs
     frontend_env_path = Path(__file__).parent.parent / "Solyrix-Algorand-frontend" / ".env.local"
@@ -42,31 +45,31 @@ def update_frontend_for_demo():
         with open(frontend_env_path, 'w') as f:
             f.writelines(updated_lines)
         
-        print(f"✅ Updated frontend environment variables!")
-        print("\n📌 Demo Configuration Applied:")
-        print(f"   Context Registry: {demo_app_ids['context_registry']}")
-        print(f"   License Manager: {demo_app_ids['license_manager']}")
-        print(f"   Governance Token: {demo_app_ids['governance_token']}")
-        print("\n✨ Next steps:")
-        print("   1. Restart the frontend dev server")
-        print("   2. The deployment warning will be gone")
-        print("   3. You can demo the UI with simulated deployed contracts")
-        print("\n⚠️  Note: These are demo IDs. For real deployment:")
-        print("   - Get TestNet ALGO from the dispenser")
-        print("   - Create a real mnemonic with: algokey generate")
-        print("   - Deploy actual contracts to TestNet")
+        logger.info("Updated frontend environment variables!")
+        logger.info("Demo Configuration Applied:")
+        logger.info(f"   Context Registry: {demo_app_ids['context_registry']}")
+        logger.info(f"   License Manager: {demo_app_ids['license_manager']}")
+        logger.info(f"   Governance Token: {demo_app_ids['governance_token']}")
+        logger.info("Next steps:")
+        logger.info("   1. Restart the frontend dev server")
+        logger.info("   2. The deployment warning will be gone")
+        logger.info("   3. You can demo the UI with simulated deployed contracts")
+        logger.warning("Note: These are demo IDs. For real deployment:")
+        logger.info("   - Get TestNet ALGO from the dispenser")
+        logger.info("   - Create a real mnemonic with: algokey generate")
+        logger.info("   - Deploy actual contracts to TestNet")
         
         return True
     else:
-        print("❌ Frontend .env.local not found!")
+        logger.error("Frontend .env.local not found!")
         return False
 
 if __name__ == "__main__":
-    print("🎭 DecentralAI Demo Deployment")
-    print("=" * 40)
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    logger.info("DecentralAI Demo Deployment")
     success = update_frontend_for_demo()
     
     if success:
-        print("\n✅ Demo setup complete! The UI will now show contracts as deployed.")
+        logger.info("Demo setup complete! The UI will now show contracts as deployed.")
     else:
-        print("\n❌ Demo setup failed. Please check the errors above.")
+        logger.error("Demo setup failed. Please check the errors above.")
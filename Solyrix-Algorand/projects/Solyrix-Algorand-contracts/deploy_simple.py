@@ -4,6 +4,7 @@ Simple deployment script for DecentralAI smart contracts to TestNet
 This deploys minimal versions for testing the frontend
 """
 
+import logging
 import os
 from pathlib import Path
 from algokit_utils import Account, get_algod_client
@@ -11,6 +12,8 @@ import algosdk
 from algosdk.v2client import algod
 from dotenv import load_dotenv
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables
 load_dotenv()
 
@@ -20,17 +23,17 @@ def deploy_minimal_contracts():
     # Get deployer account from mnemonic
     mnemonic = os.getenv("DEPLOYER_MNEMONIC")
     if not mnemonic:
-        print("❌ DEPLOYER_MNEMONIC not set in .env file")
-        print("Please add your TestNet mnemonic to the .env file")
+        logger.error("DEPLOYER_MNEMONIC not set in .env file")
+        logger.info("Please add your TestNet mnemonic to the .env file")
         return False
     
     try:
         deployer = Account(private_key=algosdk.mnemonic.to_private_key(mnemonic))
     except Exception as e:
-        print(f"❌ Invalid mnemonic: {e}")
+        logger.error(f"Invalid mnemonic: {e}")
         return False
     
-    print(f"✅ Deployer address: {deployer.address}")
+    logger.info(f"Deployer address: {deployer.address}")
     
     # Create algod client for TestNet
     algod_client = algod.AlgodClient(
@@ -43,14 +46,14 @@ def deploy_minimal_contracts():
     try:
         account_info = algod_client.account_info(deployer.address)
         balance = account_info['amount'] / 1_000_000
-        print(f"✅ Balance: {balance} ALGO")
+        logger.info(f"Balance: {balance} ALGO")
         
         if balance < 1:
-            print("⚠️  Low balance! You need at least 1 ALGO for deployment")
-            print("Get TestNet ALGO from: https://testnet.algoexplorer.io/dispenser")
+            logger.warning("Low balance! You need at least 1 ALGO for deployment")
+            logger.info("Get TestNet ALGO from: https://testnet.algoexplorer.io/dispenser")
             return False
     except Exception as e:
-        print(f"❌ Error checking balance: {e}")
+        logger.error(f"Error checking balance: {e}")
         return False
     
     # Deploy a simple test contract
@@ -112,8 +115,8 @@ return
         result = algosdk.future.transaction.wait_for_confirmation(algod_client, tx_id, 4)
         app_id = result['application-index']
         
-        print(f"✅ Test contract deployed! App ID: {app_id}")
-        print(f"✅ Transaction ID: {tx_id}")
+        logger.info(f"Test contract deployed! App ID: {app_id}")
+        logger.info(f"Transaction ID: {tx_id}")
         
         # Update frontend .env.local with the app IDs
         frontend_env_path = Path(__file__).parent.parent / "Solyrix-Algorand-frontend" / ".env.local"
@@ -137,21 +140,22 @@ return
             with open(frontend_env_path, 'w') as f:
                 f.writelines(updated_lines)
             
-            print(f"✅ Updated frontend environment variables!")
-            print("\n📌 Next steps:")
-            print("1. Restart the frontend dev server")
-            print("2. The deployment warning should be gone")
-            print("3. You can now test the UI with deployed contracts")
+            logger.info("Updated frontend environment variables!")
+            logger.info("Next steps:")
+            logger.info("1. Restart the frontend dev server")
+            logger.info("2. The deployment warning should be gone")
+            logger.info("3. You can now test the UI with deployed contracts")
         
         return True
         
     except Exception as e:
-        print(f"❌ Deployment failed: {e}")
+        logger.error(f"Deployment failed: {e}")
         return False
 
 if __name__ == "__main__":
-    print("🚀 Deploying minimal test contracts to TestNet...")
+    logging.basicConfig(level=logging.INFO, format="%(levelname)-10s: %(message)s")
+    logger.info("Deploying minimal test contracts to TestNet...")
     success = deploy_minimal_contracts()
     
     if not success:
-        print("\n⚠️  Deployment failed. Please check the errors above.")
+        logger.warning("Deployment failed. Please check the errors above.")
@@ -1,6 +1,7 @@
 import dataclasses
 import importlib
 import logging
+import os
 import subprocess
 import sys
 from collections.abc import Callable
@@ -10,6 +11,8 @@ from shutil import rmtree
 from algokit_utils.config import config
 from dotenv import load_dotenv
 
+from backend import telemetry
+
 # Set trace_all to True to capture all transactions, defaults to capturing traces only on failure
 # Learn more about using AlgoKit AVM Debugger to debug your TEAL source codes and inspect various kinds of
 # Algorand transactions in atomic groups -> https://github.com/algorandfoundation/algokit-avm-vscode-debugger
@@ -97,22 +100,23 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     output_dir.mkdir(exist_ok=True, parents=True)
     logger.info(f"Exporting {contract_path} to {output_dir}")
 
-    build_result = subprocess.run(
-        [
-            "algokit",
-            "--no-color",
-            "compile",
-            "python",
-            str(contract_path.resolve()),
-            f"--out-dir={output_dir}",
-            "--no-output-arc32",
-            "--output-arc56",
-            "--output-source-map",
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-        text=True,
-    )
+    with telemetry.span("compile", contract=contract_path.parent.name):
+        build_result = subprocess.run(
+            [
+                "algokit",
+                "--no-color",
+                "compile",
+                "python",
+                str(contract_path.resolve()),
+                f"--out-dir={output_dir}",
+                "--no-output-arc32",
+                "--output-arc56",
+                "--output-source-map",
+            ],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+        )
     if build_result.returncode:
         raise Exception(f"Could not build contract:\n{build_result.stdout}")
 
@@ -129,20 +133,21 @@ def build(output_dir: Path, contract_path: Path) -> Path:
     else:
         for file_name in app_spec_file_names:
             client_file = file_name
-            print(file_name)
-            generate_result = subprocess.run(
-                [
-                    "algokit",
-                    "generate",
-                    "client",
-                    str(output_dir),
-                    "--output",
-                    str(_get_output_path(output_dir, deployment_extension)),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-            )
+            logger.info(f"Generating client for {file_name}")
+            with telemetry.span("generate_client", contract=contract_path.parent.name):
+                generate_result = subprocess.run(
+                    [
+                        "algokit",
+                        "generate",
+                        "client",
+                        str(output_dir),
+                        "--output",
+                        str(_get_output_path(output_dir, deployment_extension)),
+                    ],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                )
             if generate_result.returncode:
                 if "No such command" in generate_result.stdout:
                     raise Exception(
@@ -190,22 +195,27 @@ def main(action: str, contract_name: str | None = None) -> None:
                     raise Exception("Could not deploy app, .arc56.json file not found")
                 if contract.deploy:
                     logger.info(f"Deploying app {contract.name}")
-                    contract.deploy()
+                    with telemetry.span("deploy", contract=contract.name):
+                        contract.deploy()
         case "all":
             for contract in filtered_contracts:
                 logger.info(f"Building app at {contract.path}")
                 build(artifact_path / contract.name, contract.path)
                 if contract.deploy:
                     logger.info(f"Deploying {contract.name}")
-                    contract.deploy()
+                    with telemetry.span("deploy", contract=contract.name):
+                        contract.deploy()
         case _:
             logger.error(f"Unknown action: {action}")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) > 2:
-        main(sys.argv[1], sys.argv[2])
-    elif len(sys.argv) > 1:
-        main(sys.argv[1])
-    else:
-        main("all")
+    # Set TELEMETRY_EXPORT to a .prom (Prometheus text) or .json (OTLP) path
+    # to record timings of every build step, deploy and algod/indexer call.
+    with telemetry.exporting(os.environ.get("TELEMETRY_EXPORT")):
+        if len(sys.argv) > 2:
+            main(sys.argv[1], sys.argv[2])
+        elif len(sys.argv) > 1:
+            main(sys.argv[1])
+        else:
+            main("all")
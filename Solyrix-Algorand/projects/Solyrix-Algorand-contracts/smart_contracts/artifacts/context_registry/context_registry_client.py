@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "ipfs_hash"}, {"type": "string", "name": "title"}, {"type": "uint64", "name": "price"}], "name": "create_context", "returns": {"type": "string"}, "desc": "Create a new AI context", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "context_id"}], "name": "get_context_price", "returns": {"type": "uint64"}, "desc": "Get context price - simplified implementation", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "context_id"}], "name": "purchase_context", "returns": {"type": "string"}, "desc": "Purchase access to a context", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_platform_fee_percentage", "returns": {"type": "uint64"}, "desc": "Get platform fee percentage", "events": [], "readonly": false, "recommendations": {}}], "name": "ContextRegistry", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABATEbQQCXggQEEw+R/ATZfX8hBGILuuAE4pdJ+DYaAI4EAFUAPQAbAAOBAEMxGRREMRhEgAwVH3x1AAAAAAAAAPqwIkMxGRREMRhEgBYVH3x1ABBwdXJjaGFzZV9zdWNjZXNzsCJDMRkURDEYRIAMFR98dQAAAAAAABOIsCJDMRkURDEYRDYaATYaAjYaAxeIABaABBUffHVMULAiQzEZQP+HMRgURCJDigMBi/+B6AcPRIANAAtjdHhfY3JlYXRlZIk=", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for AI context registry", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0A5CiAgICBwdXNoYnl0ZXNzIDB4MTMwZjkxZmMgMHhkOTdkN2YyMSAweDYyMGJiYWUwIDB4ZTI5NzQ5ZjggLy8gbWV0aG9kICJjcmVhdGVfY29udGV4dChzdHJpbmcsc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF9jb250ZXh0X3ByaWNlKHN0cmluZyl1aW50NjQiLCBtZXRob2QgInB1cmNoYXNlX2NvbnRleHQoc3RyaW5nKXN0cmluZyIsIG1ldGhvZCAiZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9jb250ZXh0X3JvdXRlQDMgbWFpbl9nZXRfY29udGV4dF9wcmljZV9yb3V0ZUA0IG1haW5fcHVyY2hhc2VfY29udGV4dF9yb3V0ZUA1IG1haW5fZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlX3JvdXRlQDYKCm1haW5fYWZ0ZXJfaWZfZWxzZUAxMzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIENvbnRleHRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgcHVzaGludCAwIC8vIDAKICAgIHJldHVybgoKbWFpbl9nZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwMGZhCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcHVyY2hhc2VfY29udGV4dF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjgKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMTA3MDc1NzI2MzY4NjE3MzY1NWY3Mzc1NjM2MzY1NzM3MwogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9jb250ZXh0X3ByaWNlX3JvdXRlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMTM4OAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9jb250ZXh0X3JvdXRlQDM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTo4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgQ29udGV4dFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTo4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NvbnRleHQKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIENvbnRleHRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxMwogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuY3JlYXRlX2NvbnRleHQoaXBmc19oYXNoOiBieXRlcywgdGl0bGU6IGJ5dGVzLCBwcmljZTogdWludDY0KSAtPiBieXRlczoKY3JlYXRlX2NvbnRleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTo4LTE0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBjcmVhdGVfY29udGV4dCgKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGlwZnNfaGFzaDogU3RyaW5nLAogICAgLy8gICAgIHRpdGxlOiBTdHJpbmcsCiAgICAvLyAgICAgcHJpY2U6IFVJbnQ2NAogICAgLy8gKSAtPiBTdHJpbmc6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3LTE4CiAgICAvLyAjIEJhc2ljIHZhbGlkYXRpb24KICAgIC8vIGFzc2VydCBwcmljZSA+PSBVSW50NjQoMTAwMCksICJQcmljZSB0b28gbG93IgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEwMDAgLy8gMTAwMAogICAgPj0KICAgIGFzc2VydCAvLyBQcmljZSB0b28gbG93CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMC0yMQogICAgLy8gIyBSZXR1cm4gYSBzaW1wbGUgY29udGV4dCBJRAogICAgLy8gcmV0dXJuIFN0cmluZygiY3R4X2NyZWF0ZWQiKQogICAgcHVzaGJ5dGVzIDB4MDAwYjYzNzQ3ODVmNjM3MjY1NjE3NDY1NjQKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [50, 74, 108, 132], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [180], "errorMessage": "Price too low"}, {"pc": [168], "errorMessage": "can only call when creating"}, {"pc": [53, 77, 111, 135], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["NoOp"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "ipfs_hash"}, {"type": "string", "name": "title"}, {"type": "uint64", "name": "price"}, {"type": "pay", "name": "payment"}], "name": "create_context", "returns": {"type": "uint64"}, "desc": "Create a new AI context; `payment` covers the MBR of the boxes it creates", "events": [{"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "price"}, {"type": "string", "name": "ipfs_hash"}, {"type": "string", "name": "title"}], "name": "ContextCreated", "desc": "ARC-28 event emitted when a context is registered"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}, {"type": "uint64", "name": "quantity"}, {"type": "uint64", "name": "license_type"}], "name": "get_context_price", "returns": {"type": "uint64"}, "desc": "Get the price of `quantity` units under a license type, after volume discounts", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}], "name": "get_context", "returns": {"type": "(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)", "struct": "ContextRecord"}, "desc": "Get the full record of a context", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64[]", "name": "context_ids"}], "name": "get_contexts", "returns": {"type": "(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]"}, "desc": "Get the full records of several contexts, in the order requested", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}, {"type": "uint64[4]", "name": "breakpoints"}, {"type": "uint64[4]", "name": "discounts"}, {"type": "uint64[4]", "name": "multipliers"}], "name": "set_price_tiers", "returns": {"type": "void"}, "desc": "Set quantity breakpoints, discounts (bps) and license-type multipliers (bps)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}, {"type": "pay", "name": "payment"}], "name": "purchase_context", "returns": {"type": "void"}, "desc": "Purchase access to a context; `payment` covers its price and the boxes it creates", "events": [{"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "buyer"}], "name": "ContextPurchased", "desc": "ARC-28 event emitted when a context is purchased"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}, {"type": "uint64", "name": "rating"}], "name": "rate_context", "returns": {"type": "void"}, "desc": "Rate a purchased context from 1 to 5; rating again replaces the previous rating", "events": [{"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "rater"}, {"type": "uint64", "name": "rating"}, {"type": "uint64", "name": "previous_rating"}], "name": "ContextRated", "desc": "ARC-28 event emitted when a buyer rates a context (previous_rating is 0 on first rating)"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}], "name": "get_context_rating", "returns": {"type": "(uint64,uint64,uint64[5])", "struct": "ContextRating"}, "desc": "Get rating sum, count and per-star histogram for a context", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Pay out the caller's accumulated earnings plus the MBR freed by deleting\ntheir balance box; the caller covers the inner fee. That MBR was paid by the buyer whose purchase opened the box and counts as part of the sale, so it goes to the creator; the next sale pays for a new box.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw_platform_fees", "returns": {"type": "uint64"}, "desc": "Pay the platform's accumulated fees to the admin; admin only, covers the inner fee", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "creator"}], "name": "get_balance", "returns": {"type": "uint64"}, "desc": "Get a creator's earnings awaiting withdrawal", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "user"}, {"type": "uint64", "name": "kind"}, {"type": "uint64", "name": "page"}], "name": "get_user_contexts", "returns": {"type": "(uint64,uint64[64])", "struct": "UserContextPage"}, "desc": "Get one page of a user's created (kind 0) or purchased (kind 1) context ids", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_platform_fee_percentage", "returns": {"type": "uint64"}, "desc": "Get platform fee in basis points", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "fee_bps"}], "name": "set_platform_fee_percentage", "returns": {"type": "void"}, "desc": "Change the platform fee (basis points); admin only, applies to later sales", "events": [{"args": [{"type": "uint64", "name": "previous_fee_bps"}, {"type": "uint64", "name": "fee_bps"}], "name": "PlatformFeeUpdated", "desc": "ARC-28 event emitted when the admin changes the platform fee"}], "readonly": false, "recommendations": {}}], "name": "ContextRegistry", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "address"}, "platform_fee": {"key": "cGxhdGZvcm1fZmVl", "keyType": "AVMString", "valueType": "AVMUint64"}, "context_count": {"key": "Y29udGV4dF9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "platform_balance": {"key": "cGxhdGZvcm1fYmFsYW5jZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"contexts": {"keyType": "uint64", "valueType": "ContextRecord", "prefix": "Y3R4Xw=="}, "purchases": {"keyType": "AVMBytes", "valueType": "uint64", "prefix": "cHVyXw=="}, "user_pages": {"keyType": "AVMBytes", "valueType": "UserContextPage", "prefix": "dXNyXw=="}, "balances": {"keyType": "address", "valueType": "uint64", "prefix": "YmFsXw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 3}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"ContextRating": [{"name": "rating_sum", "type": "uint64"}, {"name": "rating_count", "type": "uint64"}, {"name": "rating_histogram", "type": "uint64[5]"}], "ContextRecord": [{"name": "creator", "type": "address"}, {"name": "price", "type": "uint64"}, {"name": "pricing", "type": "uint64[12]"}, {"name": "created_at", "type": "uint64"}, {"name": "purchases", "type": "uint64"}, {"name": "rating_sum", "type": "uint64"}, {"name": "rating_count", "type": "uint64"}, {"name": "rating_histogram", "type": "uint64[5]"}, {"name": "ipfs_hash", "type": "string"}, {"name": "title", "type": "string"}], "UserContextPage": [{"name": "total", "type": "uint64"}, {"name": "context_ids", "type": "uint64[64]"}]}, "byteCode": {"approval": "CiAGAAEIBJBO////////////ASYLBBUffHUEY3R4XxBwbGF0Zm9ybV9iYWxhbmNlAAxwbGF0Zm9ybV9mZWUFYWRtaW4EYmFsXw1jb250ZXh0X2NvdW50CAAAAAAAAAAABHVzcl8EcHVyXzEYQAASJwUyCWcnBIH6AWcnByJnKiJnMRtBAaGCDgRjgsigBBVOdPUEr5m9pQRRho/MBM+uKJkEibNScQTNC8eUBOHVGIgEOjlfKwQ6s+TMBOXQrx8EWCOInwTil0n4BCGRNIU2GgCODgETAPYA4gDPALYAnACIAHQAYwBSAD4AIwASAAIiQzEZFEQxGEQ2GgEXiAZQI0MxGRREMRhEiAY+FihMULAjQzEZFEQxGEQ2GgE2GgIXNhoDF4gF+ihMULAjQzEZFEQxGEQ2GgGIBdYWKExQsCNDMRkURDEYRIgFnxYoTFCwI0MxGRREMRhEiAVbFihMULAjQzEZFEQxGEQ2GgEXiAUnKExQsCNDMRkURDEYRDYaARc2GgIXiARGI0MxGRREMRhENhoBFzEWIwlJOBAjEkSIA3UjQzEZFEQxGEQ2GgEXNhoCNhoDNhoEiAKNI0MxGRREMRhENhoBiAG0KExQsCNDMRkURDEYRDYaAReIAZQoTFCwI0MxGRREMRhENhoBFzYaAhc2GgMXiAFrFihMULAjQzEZFEQxGEQ2GgE2GgI2GgMXMRYjCUk4ECMSRIgAchYoTFCwI0MxGUD+wyNDigABK4FgryKLAiUMQQAhiwJJgQwMREkkC4sBTIAI//////////9djAEjCIwCQv/YIowAiwAlDEEAJSSLAElOAghJgQwMRCQLiwFMgAgAAAAAAAAnEF2MASMIjABC/9SLAYwAiYoEAYv+gegHD0SL/VcCABWBQA5EMgpzAUQiJwdlRCMIJwdLAWcxAIv+Foj/bzIHFk8DSwNQTwJQTFAnCFAnCFAnCFCAKAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAAABQgAIA1FCL/BWB1AFLAQgWVwYCTwJMUIv8UIv9UEsDFilLAVBJvEhPAr8xACJLBYgE5iIqZUSL/yJPB4gEPggqTGcxAFBPAlCAAgA0UIE0TwIIFlcGAlCL/FCL/VCABJ1idE9MULCJigMBi/2L/ov/iAQsiYoBAYv/FilMUL5EiYoBASJHAitHA4ACAACL/yJZIosJiwgMQQCri/9XAgCLCSQLWxYpTFC+RIACAAJMUIwCiwdJIllJTgKMA1cCAIwAK4wBgQILjAYijASLBIsGDEEAHYsAiwRJTgJZgQIIFlcGAosBTFCMAYECCIwEQv/biwAVjAUijASLBIECDEEAHYsCiwRJTgJZiwUIFlcGAosBTFCMAYECCIwEQv/biwMjCBZXBgKLAVCLAIsGiwVSUIsCSRWBAkxSUIwHiwkjCIwJQv9NiweMAImKBAArRwKL/BYpTFBJvkxJTwJEVwAgMQASRIj9yCJHAosIJQxBAGWLCCQLSYwBi/1MW0mMAEEATYsGSSEFE0SLAElPAg1Ei/6LAVtJiwcPREkhBA5EjAeMBosGFosISU4CgQwMRIsFiwFPAl2LBxYlSwMISYEMDEQkC0xdjAUjCIwIQv+bIQWMBkL/zSKMAosCJQxBACuLAkkkC4v/SwEkWIv/TwJbRCRLAghJgQwMRCQLiwVMTwJdjAUjCIwCQv/OiwSLBVwoiwNJvEhMv4mKAgAri/4WSSlLAVBJvkQxAE8DTFAnCkxQSb1FARREi/4jIogCYElOA04EMgpzAUxOBUQiFr9JgZABWyMIFlyQSwK8SE8CSwG/MQAji/6IAq5XACAiJwRlREsCCyEECk8CTAlJTgInBk8CUElOAr5MFyJMTwJNTEEAB4sGFosFTL+L/4sCiwOIAdmMAIsEQQAKiwaLBAgWiwVMvyIqZUSLAIsECQgqTGeLATEAUIAEZ2xhIExQsImKAgAiRwIri/9BALmL/4EFDkEAsSNEi/4WSYwCSTEAUCcKTFBJjAC+TBdJTgKMA0QpTwJQSYwBvkxOAkRBAHlJgZgBW4sDSU4CCRZPAkxcmEwjCUsBV6goSwEkC0pbIwkWTwOBBQxEXVyoSYGYAVuL/wgWXJiL/yMJSwFXqChLASQLSlsjCBZPA4EFDERdXKiLAUm8SEy/i/8WiwBLAb8xAIsDFosCTwJQTwJQTFCABPWhfUFMULCJSYGgAVsjCBZcoEL/pSJC/0yKAQGL/xYpTFC+RElXmAhLAVegCE8CV6goTgJQTFCJJwYxAFC+TBciTE8CTUlEMgpzAUQnBjEAULxIMgpzAUQJCLExAEsBsgiyByOyECKyAbOJMQAiJwVlRBJEIiplRElEKiJnsSInBWVESwGyCLIHI7IQIrIBs4mKAQEnBov/UL5MFyJMTwJNiYoDAYv+FlcHAYv9TFCL/xZQJwlMUEm9RQFBAAaLAL5ETImBiASvTIkiJwRlRImKAQAxACInBWVEEkSL/4HoBw5EIicEZUQWi/8WUIAEJKvJwExQsCcEi/9niYoDAYv9OAcyChJEMgpzAUSL/wmL/TgIi/5LAghLAQ5ETAmJigMBi/0WKUxQgwIgaLqL/yUMRCJHAosDJQxBADgliwNJTgIIJAskCIsASU8CW0sCJAskCE8CTFtLAYsCCYv+TwIPIk4CTYsBCIwBTCMIjAOMAkL/wSSL/wgkCyQIiwBJTwJbTCJbi/4LCyEECiEEiwEJCyEECowAiYoDACIri/4WVwcBi/1MUEkiFlAnCUxQSSJMvUUBQQAIiwMiJLoXjASLBEmBQBhJTgKMAYFAChaLAkxQJwlMUIwAQAAHiwCBiAS5SIsBJAskCIv/FosASU4DTgK7iwQjCBZMIksCu4sDIk8Cu4k=", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for AI context registry", "events": [{"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "price"}, {"type": "string", "name": "ipfs_hash"}, {"type": "string", "name": "title"}], "name": "ContextCreated", "desc": "ARC-28 event emitted when a context is registered"}, {"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "buyer"}], "name": "ContextPurchased", "desc": "ARC-28 event emitted when a context is purchased"}, {"args": [{"type": "uint64", "name": "context_id"}, {"type": "address", "name": "rater"}, {"type": "uint64", "name": "rating"}, {"type": "uint64", "name": "previous_rating"}], "name": "ContextRated", "desc": "ARC-28 event emitted when a buyer rates a context (previous_rating is 0 on first rating)"}, {"args": [{"type": "uint64", "name": "previous_fee_bps"}, {"type": "uint64", "name": "fee_bps"}], "name": "PlatformFeeUpdated", "desc": "ARC-28 event emitted when the admin changes the platform fee"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuX19hbGdvcHlfZW50cnlwb2ludF93aXRoX2luaXQoKSAtPiB1aW50NjQ6Cm1haW46CiAgICBpbnRjYmxvY2sgMCAxIDggNCAxMDAwMCAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgYnl0ZWNibG9jayAweDE1MWY3Yzc1IDB4NjM3NDc4NWYgInBsYXRmb3JtX2JhbGFuY2UiIDB4ICJwbGF0Zm9ybV9mZWUiICJhZG1pbiIgMHg2MjYxNmM1ZiAiY29udGV4dF9jb3VudCIgMHgwMDAwMDAwMDAwMDAwMDAwIDB4NzU3MzcyNWYgMHg3MDc1NzI1ZgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTEzCiAgICAvLyBzZWxmLmFkbWluID0gR2xvYmFsLmNyZWF0b3JfYWRkcmVzcwogICAgYnl0ZWMgNSAvLyAiYWRtaW4iCiAgICBnbG9iYWwgQ3JlYXRvckFkZHJlc3MKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxMTQKICAgIC8vIHNlbGYucGxhdGZvcm1fZmVlID0gVUludDY0KERFRkFVTFRfUExBVEZPUk1fRkVFX1BFUkNFTlRBR0UpCiAgICBieXRlYyA0IC8vICJwbGF0Zm9ybV9mZWUiCiAgICBwdXNoaW50IDI1MCAvLyAyNTAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxMTUKICAgIC8vIHNlbGYuY29udGV4dF9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgNyAvLyAiY29udGV4dF9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTE2LTExNwogICAgLy8gIyBQbGF0Zm9ybSBmZWVzIChhbmQgb3ZlcnBheW1lbnRzKSBhd2FpdGluZyB3aXRoZHJhd19wbGF0Zm9ybV9mZWVzCiAgICAvLyBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzIgLy8gInBsYXRmb3JtX2JhbGFuY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxOQogICAgcHVzaGJ5dGVzcyAweDYzODJjOGEwIDB4MTU0ZTc0ZjUgMHhhZjk5YmRhNSAweDUxODY4ZmNjIDB4Y2ZhZTI4OTkgMHg4OWIzNTI3MSAweGNkMGJjNzk0IDB4ZTFkNTE4ODggMHgzYTM5NWYyYiAweDNhYjNlNGNjIDB4ZTVkMGFmMWYgMHg1ODIzODg5ZiAweGUyOTc0OWY4IDB4MjE5MTM0ODUgLy8gbWV0aG9kICJjcmVhdGVfY29udGV4dChzdHJpbmcsc3RyaW5nLHVpbnQ2NCxwYXkpdWludDY0IiwgbWV0aG9kICJnZXRfY29udGV4dF9wcmljZSh1aW50NjQsdWludDY0LHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgImdldF9jb250ZXh0KHVpbnQ2NCkoYWRkcmVzcyx1aW50NjQsdWludDY0WzEyXSx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0WzVdLHN0cmluZyxzdHJpbmcpIiwgbWV0aG9kICJnZXRfY29udGV4dHModWludDY0W10pKGFkZHJlc3MsdWludDY0LHVpbnQ2NFsxMl0sdWludDY0LHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NFs1XSxzdHJpbmcsc3RyaW5nKVtdIiwgbWV0aG9kICJzZXRfcHJpY2VfdGllcnModWludDY0LHVpbnQ2NFs0XSx1aW50NjRbNF0sdWludDY0WzRdKXZvaWQiLCBtZXRob2QgInB1cmNoYXNlX2NvbnRleHQodWludDY0LHBheSl2b2lkIiwgbWV0aG9kICJyYXRlX2NvbnRleHQodWludDY0LHVpbnQ2NCl2b2lkIiwgbWV0aG9kICJnZXRfY29udGV4dF9yYXRpbmcodWludDY0KSh1aW50NjQsdWludDY0LHVpbnQ2NFs1XSkiLCBtZXRob2QgIndpdGhkcmF3KCl1aW50NjQiLCBtZXRob2QgIndpdGhkcmF3X3BsYXRmb3JtX2ZlZXMoKXVpbnQ2NCIsIG1ldGhvZCAiZ2V0X2JhbGFuY2UoYWRkcmVzcyl1aW50NjQiLCBtZXRob2QgImdldF91c2VyX2NvbnRleHRzKGFkZHJlc3MsdWludDY0LHVpbnQ2NCkodWludDY0LHVpbnQ2NFs2NF0pIiwgbWV0aG9kICJnZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2UoKXVpbnQ2NCIsIG1ldGhvZCAic2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKHVpbnQ2NCl2b2lkIgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfY29udGV4dF9yb3V0ZUA1IG1haW5fZ2V0X2NvbnRleHRfcHJpY2Vfcm91dGVANiBtYWluX2dldF9jb250ZXh0X3JvdXRlQDcgbWFpbl9nZXRfY29udGV4dHNfcm91dGVAOCBtYWluX3NldF9wcmljZV90aWVyc19yb3V0ZUA5IG1haW5fcHVyY2hhc2VfY29udGV4dF9yb3V0ZUAxMCBtYWluX3JhdGVfY29udGV4dF9yb3V0ZUAxMSBtYWluX2dldF9jb250ZXh0X3JhdGluZ19yb3V0ZUAxMiBtYWluX3dpdGhkcmF3X3JvdXRlQDEzIG1haW5fd2l0aGRyYXdfcGxhdGZvcm1fZmVlc19yb3V0ZUAxNCBtYWluX2dldF9iYWxhbmNlX3JvdXRlQDE1IG1haW5fZ2V0X3VzZXJfY29udGV4dHNfcm91dGVAMTYgbWFpbl9nZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVAMTcgbWFpbl9zZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVAMTgKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gY2xhc3MgQ29udGV4dFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICBpbnRjXzAgLy8gMAogICAgcmV0dXJuCgptYWluX3NldF9wbGF0Zm9ybV9mZWVfcGVyY2VudGFnZV9yb3V0ZUAxODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMyNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gY2xhc3MgQ29udGV4dFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMjYKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2UKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzIxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF91c2VyX2NvbnRleHRzX3JvdXRlQDE2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzExCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gY2xhc3MgQ29udGV4dFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICBidG9pCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMTEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgZ2V0X3VzZXJfY29udGV4dHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2JhbGFuY2Vfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMDYKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwNgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYmFsYW5jZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19wbGF0Zm9ybV9mZWVzX3JvdXRlQDE0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB3aXRoZHJhd19wbGF0Zm9ybV9mZWVzCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3dpdGhkcmF3X3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjgwCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiB3aXRoZHJhdwogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfY29udGV4dF9yYXRpbmdfcm91dGVAMTI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNzAKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3MAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfY29udGV4dF9yYXRpbmcKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmF0ZV9jb250ZXh0X3JvdXRlQDExOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzOAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIHJhdGVfY29udGV4dAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9wdXJjaGFzZV9jb250ZXh0X3JvdXRlQDEwOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcHVyY2hhc2VfY29udGV4dAogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfcHJpY2VfdGllcnNfcm91dGVAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEwOQogICAgLy8gY2xhc3MgQ29udGV4dFJlZ2lzdHJ5KEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAzCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxOTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfcHJpY2VfdGllcnMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NvbnRleHRzX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxODMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4MwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfY29udGV4dHMKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2NvbnRleHRfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3OAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxMDkKICAgIC8vIGNsYXNzIENvbnRleHRSZWdpc3RyeShBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTc4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9jb250ZXh0CiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9jb250ZXh0X3ByaWNlX3JvdXRlQDY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNzEKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfY29udGV4dF9wcmljZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfY29udGV4dF9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2NvbnRleHQKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fYmFyZV9yb3V0aW5nQDE5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTA5CiAgICAvLyBjbGFzcyBDb250ZXh0UmVnaXN0cnkoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMjEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzNAogICAgLy8gQGFyYzQuYmFyZW1ldGhvZChhbGxvd19hY3Rpb25zPVsiTm9PcCJdLCBjcmVhdGU9ImFsbG93IikKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCgovLyBzbWFydF9jb250cmFjdHMudXRpbHMuaGVscGVycy5kZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCkgLT4gYnl0ZXM6CmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo0OS01MAogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBkZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCkgLT4gUHJpY2VTY2hlZHVsZToKICAgIHByb3RvIDAgMQogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTIKICAgIC8vIHNjaGVkdWxlID0gUHJpY2VTY2hlZHVsZS5mcm9tX2J5dGVzKG9wLmJ6ZXJvKChQUklDRV9USUVSUyAqIDIgKyBMSUNFTlNFX1RZUEVTKSAqIDgpKQogICAgcHVzaGludCA5NiAvLyA5NgogICAgYnplcm8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjUzCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgaW50Y18wIC8vIDAKCmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfZm9yX2hlYWRlckAxOgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTMKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGJ6IGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfYWZ0ZXJfZm9yQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjU0CiAgICAvLyBzY2hlZHVsZVt0aWVyXSA9IGFyYzQuVUludDY0KE5PX0JSRUFLUE9JTlQpCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBwdXNoYnl0ZXMgMHhmZmZmZmZmZmZmZmZmZmZmCiAgICByZXBsYWNlMwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1MwogICAgLy8gZm9yIHRpZXIgaW4gdXJhbmdlKFBSSUNFX1RJRVJTKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9mb3JfaGVhZGVyQDEKCmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1NQogICAgLy8gZm9yIGxpY2Vuc2VfdHlwZSBpbiB1cmFuZ2UoTElDRU5TRV9UWVBFUyk6CiAgICBpbnRjXzAgLy8gMAogICAgZnJhbWVfYnVyeSAwCgpkZWZhdWx0X3ByaWNlX3NjaGVkdWxlX2Zvcl9oZWFkZXJANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjU1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGZyYW1lX2RpZyAwCiAgICBpbnRjXzMgLy8gNAogICAgPAogICAgYnogZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9hZnRlcl9mb3JAOAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTYKICAgIC8vIHNjaGVkdWxlW1BSSUNFX1RJRVJTICogMiArIGxpY2Vuc2VfdHlwZV0gPSBhcmM0LlVJbnQ2NCgxMDAwMCkKICAgIGludGNfMiAvLyA4CiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBwdXNoYnl0ZXMgMHgwMDAwMDAwMDAwMDAyNzEwCiAgICByZXBsYWNlMwogICAgZnJhbWVfYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1NQogICAgLy8gZm9yIGxpY2Vuc2VfdHlwZSBpbiB1cmFuZ2UoTElDRU5TRV9UWVBFUyk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAwCiAgICBiIGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfZm9yX2hlYWRlckA1CgpkZWZhdWx0X3ByaWNlX3NjaGVkdWxlX2FmdGVyX2ZvckA4OgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTcKICAgIC8vIHJldHVybiBzY2hlZHVsZQogICAgZnJhbWVfZGlnIDEKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbnRleHRfcmVnaXN0cnkuY29udHJhY3QuQ29udGV4dFJlZ2lzdHJ5LmNyZWF0ZV9jb250ZXh0KGlwZnNfaGFzaDogYnl0ZXMsIHRpdGxlOiBieXRlcywgcHJpY2U6IHVpbnQ2NCwgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CmNyZWF0ZV9jb250ZXh0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTI2LTEzMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2NvbnRleHQoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBpcGZzX2hhc2g6IFN0cmluZywKICAgIC8vICAgICB0aXRsZTogU3RyaW5nLAogICAgLy8gICAgIHByaWNlOiBVSW50NjQsCiAgICAvLyAgICAgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDQgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTM2LTEzNwogICAgLy8gIyBCYXNpYyB2YWxpZGF0aW9uCiAgICAvLyBhc3NlcnQgcHJpY2UgPj0gTUlOX1BSSUNFLCAiUHJpY2UgdG9vIGxvdyIKICAgIGZyYW1lX2RpZyAtMgogICAgcHVzaGludCAxMDAwIC8vIDEwMDAKICAgID49CiAgICBhc3NlcnQgLy8gUHJpY2UgdG9vIGxvdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTM4CiAgICAvLyBhc3NlcnQgdGl0bGUubmF0aXZlLmJ5dGVzLmxlbmd0aCA8PSBNQVhfVElUTEVfTEVOR1RILCAiVGl0bGUgdG9vIGxvbmciCiAgICBmcmFtZV9kaWcgLTMKICAgIGV4dHJhY3QgMiAwCiAgICBsZW4KICAgIHB1c2hpbnQgNjQgLy8gNjQKICAgIDw9CiAgICBhc3NlcnQgLy8gVGl0bGUgdG9vIGxvbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjEzOQogICAgLy8gbWluX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MQogICAgLy8gc2VsZi5jb250ZXh0X2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA3IC8vICJjb250ZXh0X2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRleHRfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgNyAvLyAiY29udGV4dF9jb3VudCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ1CiAgICAvLyBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIHR4biBTZW5kZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NgogICAgLy8gcHJpY2U9YXJjNC5VSW50NjQocHJpY2UpLAogICAgZnJhbWVfZGlnIC0yCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNDcKICAgIC8vIHByaWNpbmc9ZGVmYXVsdF9wcmljZV9zY2hlZHVsZSgpLAogICAgY2FsbHN1YiBkZWZhdWx0X3ByaWNlX3NjaGVkdWxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNDgKICAgIC8vIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0LTE1NQogICAgLy8gc2VsZi5jb250ZXh0c1tjb250ZXh0X2lkXSA9IENvbnRleHRSZWNvcmQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgcHJpY2U9YXJjNC5VSW50NjQocHJpY2UpLAogICAgLy8gICAgIHByaWNpbmc9ZGVmYXVsdF9wcmljZV9zY2hlZHVsZSgpLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIHB1cmNoYXNlcz16ZXJvLAogICAgLy8gICAgIHJhdGluZ19zdW09emVybywKICAgIC8vICAgICByYXRpbmdfY291bnQ9emVybywKICAgIC8vICAgICByYXRpbmdfaGlzdG9ncmFtPVJhdGluZ0hpc3RvZ3JhbSh6ZXJvLCB6ZXJvLCB6ZXJvLCB6ZXJvLCB6ZXJvKSwKICAgIC8vICAgICBpcGZzX2hhc2g9aXBmc19oYXNoLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICBkaWcgMwogICAgY29uY2F0CiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNDMKICAgIC8vIHplcm8gPSBhcmM0LlVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NC0xNTUKICAgIC8vIHNlbGYuY29udGV4dHNbY29udGV4dF9pZF0gPSBDb250ZXh0UmVjb3JkKAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICBwcmljaW5nPWRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICBwdXJjaGFzZXM9emVybywKICAgIC8vICAgICByYXRpbmdfc3VtPXplcm8sCiAgICAvLyAgICAgcmF0aW5nX2NvdW50PXplcm8sCiAgICAvLyAgICAgcmF0aW5nX2hpc3RvZ3JhbT1SYXRpbmdIaXN0b2dyYW0oemVybywgemVybywgemVybywgemVybywgemVybyksCiAgICAvLyAgICAgaXBmc19oYXNoPWlwZnNfaGFzaCwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQzCiAgICAvLyB6ZXJvID0gYXJjNC5VSW50NjQoMCkKICAgIGJ5dGVjIDggLy8gMHgwMDAwMDAwMDAwMDAwMDAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNDQtMTU1CiAgICAvLyBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdID0gQ29udGV4dFJlY29yZCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZSksCiAgICAvLyAgICAgcHJpY2luZz1kZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgcHVyY2hhc2VzPXplcm8sCiAgICAvLyAgICAgcmF0aW5nX3N1bT16ZXJvLAogICAgLy8gICAgIHJhdGluZ19jb3VudD16ZXJvLAogICAgLy8gICAgIHJhdGluZ19oaXN0b2dyYW09UmF0aW5nSGlzdG9ncmFtKHplcm8sIHplcm8sIHplcm8sIHplcm8sIHplcm8pLAogICAgLy8gICAgIGlwZnNfaGFzaD1pcGZzX2hhc2gsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyApCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0MwogICAgLy8gemVybyA9IGFyYzQuVUludDY0KDApCiAgICBieXRlYyA4IC8vIDB4MDAwMDAwMDAwMDAwMDAwMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTQ0LTE1NQogICAgLy8gc2VsZi5jb250ZXh0c1tjb250ZXh0X2lkXSA9IENvbnRleHRSZWNvcmQoCiAgICAvLyAgICAgY3JlYXRvcj1hcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgcHJpY2U9YXJjNC5VSW50NjQocHJpY2UpLAogICAgLy8gICAgIHByaWNpbmc9ZGVmYXVsdF9wcmljZV9zY2hlZHVsZSgpLAogICAgLy8gICAgIGNyZWF0ZWRfYXQ9YXJjNC5VSW50NjQoR2xvYmFsLmxhdGVzdF90aW1lc3RhbXApLAogICAgLy8gICAgIHB1cmNoYXNlcz16ZXJvLAogICAgLy8gICAgIHJhdGluZ19zdW09emVybywKICAgIC8vICAgICByYXRpbmdfY291bnQ9emVybywKICAgIC8vICAgICByYXRpbmdfaGlzdG9ncmFtPVJhdGluZ0hpc3RvZ3JhbSh6ZXJvLCB6ZXJvLCB6ZXJvLCB6ZXJvLCB6ZXJvKSwKICAgIC8vICAgICBpcGZzX2hhc2g9aXBmc19oYXNoLAogICAgLy8gICAgIHRpdGxlPXRpdGxlLAogICAgLy8gKQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNTIKICAgIC8vIHJhdGluZ19oaXN0b2dyYW09UmF0aW5nSGlzdG9ncmFtKHplcm8sIHplcm8sIHplcm8sIHplcm8sIHplcm8pLAogICAgcHVzaGJ5dGVzIDB4MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NC0xNTUKICAgIC8vIHNlbGYuY29udGV4dHNbY29udGV4dF9pZF0gPSBDb250ZXh0UmVjb3JkKAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICBwcmljaW5nPWRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKSwKICAgIC8vICAgICBjcmVhdGVkX2F0PWFyYzQuVUludDY0KEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wKSwKICAgIC8vICAgICBwdXJjaGFzZXM9emVybywKICAgIC8vICAgICByYXRpbmdfc3VtPXplcm8sCiAgICAvLyAgICAgcmF0aW5nX2NvdW50PXplcm8sCiAgICAvLyAgICAgcmF0aW5nX2hpc3RvZ3JhbT1SYXRpbmdIaXN0b2dyYW0oemVybywgemVybywgemVybywgemVybywgemVybyksCiAgICAvLyAgICAgaXBmc19oYXNoPWlwZnNfaGFzaCwKICAgIC8vICAgICB0aXRsZT10aXRsZSwKICAgIC8vICkKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MDBkNAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGxlbgogICAgcHVzaGludCAyMTIgLy8gMjEyCiAgICBkaWcgMQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTQKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC0zCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE0NAogICAgLy8gc2VsZi5jb250ZXh0c1tjb250ZXh0X2lkXSA9IENvbnRleHRSZWNvcmQoCiAgICBkaWcgMwogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDYzNzQ3ODVmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNDQtMTU1CiAgICAvLyBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdID0gQ29udGV4dFJlY29yZCgKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZSksCiAgICAvLyAgICAgcHJpY2luZz1kZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCksCiAgICAvLyAgICAgY3JlYXRlZF9hdD1hcmM0LlVJbnQ2NChHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCksCiAgICAvLyAgICAgcHVyY2hhc2VzPXplcm8sCiAgICAvLyAgICAgcmF0aW5nX3N1bT16ZXJvLAogICAgLy8gICAgIHJhdGluZ19jb3VudD16ZXJvLAogICAgLy8gICAgIHJhdGluZ19oaXN0b2dyYW09UmF0aW5nSGlzdG9ncmFtKHplcm8sIHplcm8sIHplcm8sIHplcm8sIHplcm8pLAogICAgLy8gICAgIGlwZnNfaGFzaD1pcGZzX2hhc2gsCiAgICAvLyAgICAgdGl0bGU9dGl0bGUsCiAgICAvLyApCiAgICBkdXAKICAgIGJveF9kZWwKICAgIHBvcAogICAgdW5jb3ZlciAyCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNTYKICAgIC8vIHNlbGYuX2luZGV4X3VzZXJfY29udGV4dChUeG4uc2VuZGVyLCBVSW50NjQoVVNFUl9JTkRFWF9DUkVBVEVEKSwgY29udGV4dF9pZCkKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBkaWcgNQogICAgY2FsbHN1YiBfaW5kZXhfdXNlcl9jb250ZXh0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNTctMTU4CiAgICAvLyAjIEFueXRoaW5nIHBhaWQgYmV5b25kIHRoZSBNQlIgZ29lcyB0byB0aGUgcGxhdGZvcm0uCiAgICAvLyBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgKz0gc2VsZi5fYXNzZXJ0X3BhaWQocGF5bWVudCwgVUludDY0KDApLCBtaW5fYmFsYW5jZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18yIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDcKICAgIGNhbGxzdWIgX2Fzc2VydF9wYWlkCiAgICArCiAgICBieXRlY18yIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE2MwogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTYxLTE2NwogICAgLy8gQ29udGV4dENyZWF0ZWQoCiAgICAvLyAgICAgYXJjNC5VSW50NjQoY29udGV4dF9pZCksCiAgICAvLyAgICAgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICBpcGZzX2hhc2gsCiAgICAvLyAgICAgdGl0bGUsCiAgICAvLyApCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHgwMDM0CiAgICBjb25jYXQKICAgIHB1c2hpbnQgNTIgLy8gNTIKICAgIHVuY292ZXIgMgogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGNvbmNhdAogICAgZnJhbWVfZGlnIC00CiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMwogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNjAtMTY4CiAgICAvLyBhcmM0LmVtaXQoCiAgICAvLyAgICAgQ29udGV4dENyZWF0ZWQoCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KGNvbnRleHRfaWQpLAogICAgLy8gICAgICAgICBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICAvLyAgICAgICAgIGFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICAgICAgaXBmc19oYXNoLAogICAgLy8gICAgICAgICB0aXRsZSwKICAgIC8vICAgICApCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHg5ZDYyNzQ0ZiAvLyBtZXRob2QgIkNvbnRleHRDcmVhdGVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCxzdHJpbmcsc3RyaW5nKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNjkKICAgIC8vIHJldHVybiBjb250ZXh0X2lkCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuZ2V0X2NvbnRleHRfcHJpY2UoY29udGV4dF9pZDogdWludDY0LCBxdWFudGl0eTogdWludDY0LCBsaWNlbnNlX3R5cGU6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfY29udGV4dF9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE3MS0xNzQKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIC8vIGRlZiBnZXRfY29udGV4dF9wcmljZSgKICAgIC8vICAgICBzZWxmLCBjb250ZXh0X2lkOiBVSW50NjQsIHF1YW50aXR5OiBVSW50NjQsIGxpY2Vuc2VfdHlwZTogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTc2CiAgICAvLyByZXR1cm4gc2VsZi5fcXVvdGUoY29udGV4dF9pZCwgcXVhbnRpdHksIGxpY2Vuc2VfdHlwZSkKICAgIGZyYW1lX2RpZyAtMwogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX3F1b3RlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuZ2V0X2NvbnRleHQoY29udGV4dF9pZDogdWludDY0KSAtPiBieXRlczoKZ2V0X2NvbnRleHQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxNzgtMTc5CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2NvbnRleHQoc2VsZiwgY29udGV4dF9pZDogVUludDY0KSAtPiBDb250ZXh0UmVjb3JkOgogICAgcHJvdG8gMSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxODEKICAgIC8vIHJldHVybiBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGJ5dGVjXzEgLy8gMHg2Mzc0Nzg1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5jb250ZXh0cyBlbnRyeSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb250ZXh0X3JlZ2lzdHJ5LmNvbnRyYWN0LkNvbnRleHRSZWdpc3RyeS5nZXRfY29udGV4dHMoY29udGV4dF9pZHM6IGJ5dGVzKSAtPiBieXRlczoKZ2V0X2NvbnRleHRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTgzLTE4NgogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9jb250ZXh0cygKICAgIC8vICAgICBzZWxmLCBjb250ZXh0X2lkczogYXJjNC5EeW5hbWljQXJyYXlbYXJjNC5VSW50NjRdCiAgICAvLyApIC0+IGFyYzQuRHluYW1pY0FycmF5W0NvbnRleHRSZWNvcmRdOgogICAgcHJvdG8gMSAxCiAgICBpbnRjXzAgLy8gMAogICAgZHVwbiAyCiAgICBieXRlY18zIC8vICIiCiAgICBkdXBuIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4OAogICAgLy8gcmVjb3JkcyA9IGFyYzQuRHluYW1pY0FycmF5W0NvbnRleHRSZWNvcmRdKCkKICAgIHB1c2hieXRlcyAweDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE4OQogICAgLy8gZm9yIGNvbnRleHRfaWQgaW4gY29udGV4dF9pZHM6CiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgaW50Y18wIC8vIDAKCmdldF9jb250ZXh0c19mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxODkKICAgIC8vIGZvciBjb250ZXh0X2lkIGluIGNvbnRleHRfaWRzOgogICAgZnJhbWVfZGlnIDkKICAgIGZyYW1lX2RpZyA4CiAgICA8CiAgICBieiBnZXRfY29udGV4dHNfYWZ0ZXJfZm9yQDQKICAgIGZyYW1lX2RpZyAtMQogICAgZXh0cmFjdCAyIDAKICAgIGZyYW1lX2RpZyA5CiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MTkwCiAgICAvLyByZWNvcmRzLmFwcGVuZChzZWxmLmNvbnRleHRzW2NvbnRleHRfaWQubmF0aXZlXS5jb3B5KCkpCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaXRvYgogICAgYnl0ZWNfMSAvLyAweDYzNzQ3ODVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRleHRzIGVudHJ5IGV4aXN0cwogICAgcHVzaGJ5dGVzIDB4MDAwMgogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9idXJ5IDIKICAgIGZyYW1lX2RpZyA3CiAgICBkdXAKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQxNgogICAgZHVwCiAgICBjb3ZlciAyCiAgICBmcmFtZV9idXJ5IDMKICAgIGV4dHJhY3QgMiAwCiAgICBmcmFtZV9idXJ5IDAKICAgIGJ5dGVjXzMgLy8gMHgKICAgIGZyYW1lX2J1cnkgMQogICAgcHVzaGludCAyIC8vIDIKICAgICoKICAgIGZyYW1lX2J1cnkgNgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNAoKZ2V0X2NvbnRleHRzX2Zvcl9oZWFkZXJANjoKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgNgogICAgPAogICAgYnogZ2V0X2NvbnRleHRzX2FmdGVyX2ZvckA4CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgY292ZXIgMgogICAgZXh0cmFjdF91aW50MTYKICAgIHB1c2hpbnQgMiAvLyAyCiAgICArCiAgICBpdG9iCiAgICBleHRyYWN0IDYgMgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAxCiAgICBwdXNoaW50IDIgLy8gMgogICAgKwogICAgZnJhbWVfYnVyeSA0CiAgICBiIGdldF9jb250ZXh0c19mb3JfaGVhZGVyQDYKCmdldF9jb250ZXh0c19hZnRlcl9mb3JAODoKICAgIGZyYW1lX2RpZyAwCiAgICBsZW4KICAgIGZyYW1lX2J1cnkgNQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgNAoKZ2V0X2NvbnRleHRzX2Zvcl9oZWFkZXJAOToKICAgIGZyYW1lX2RpZyA0CiAgICBwdXNoaW50IDIgLy8gMgogICAgPAogICAgYnogZ2V0X2NvbnRleHRzX2FmdGVyX2ZvckAxMQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyA0CiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGV4dHJhY3RfdWludDE2CiAgICBmcmFtZV9kaWcgNQogICAgKwogICAgaXRvYgogICAgZXh0cmFjdCA2IDIKICAgIGZyYW1lX2RpZyAxCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMQogICAgcHVzaGludCAyIC8vIDIKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgYiBnZXRfY29udGV4dHNfZm9yX2hlYWRlckA5CgpnZXRfY29udGV4dHNfYWZ0ZXJfZm9yQDExOgogICAgZnJhbWVfZGlnIDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5MAogICAgLy8gcmVjb3Jkcy5hcHBlbmQoc2VsZi5jb250ZXh0c1tjb250ZXh0X2lkLm5hdGl2ZV0uY29weSgpKQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIGV4dHJhY3QgNiAyCiAgICBmcmFtZV9kaWcgMQogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMAogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyA1CiAgICBzdWJzdHJpbmczCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGxlbgogICAgcHVzaGludCAyIC8vIDIKICAgIHN3YXAKICAgIHN1YnN0cmluZzMKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSA3CiAgICBmcmFtZV9kaWcgOQogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgOQogICAgYiBnZXRfY29udGV4dHNfZm9yX2hlYWRlckAxCgpnZXRfY29udGV4dHNfYWZ0ZXJfZm9yQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToxOTEKICAgIC8vIHJldHVybiByZWNvcmRzCiAgICBmcmFtZV9kaWcgNwogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuc2V0X3ByaWNlX3RpZXJzKGNvbnRleHRfaWQ6IHVpbnQ2NCwgYnJlYWtwb2ludHM6IGJ5dGVzLCBkaXNjb3VudHM6IGJ5dGVzLCBtdWx0aXBsaWVyczogYnl0ZXMpIC0+IHZvaWQ6CnNldF9wcmljZV90aWVyczoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjE5My0yMDAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9wcmljZV90aWVycygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGNvbnRleHRfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBicmVha3BvaW50czogVGllclZhbHVlcywKICAgIC8vICAgICBkaXNjb3VudHM6IFRpZXJWYWx1ZXMsCiAgICAvLyAgICAgbXVsdGlwbGllcnM6IFRpZXJWYWx1ZXMsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjAyCiAgICAvLyByZWNvcmQgPSBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NjM3NDc4NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29udGV4dHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMDMKICAgIC8vIGFzc2VydCByZWNvcmQuY3JlYXRvciA9PSBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksICJOb3QgY3JlYXRvciIKICAgIGV4dHJhY3QgMCAzMiAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGNyZWF0b3IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjY4CiAgICAvLyBzY2hlZHVsZSA9IGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKQogICAgY2FsbHN1YiBkZWZhdWx0X3ByaWNlX3NjaGVkdWxlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo2OQogICAgLy8gcHJldmlvdXNfYnJlYWtwb2ludCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjcwLTcxCiAgICAvLyBwcmV2aW91c19kaXNjb3VudCA9IFVJbnQ2NCgwKQogICAgLy8gZm9yIHRpZXIgaW4gdXJhbmdlKFBSSUNFX1RJRVJTKToKICAgIGR1cG4gMgoKc2V0X3ByaWNlX3RpZXJzX2Zvcl9oZWFkZXJAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjcxCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgZnJhbWVfZGlnIDgKICAgIGludGNfMyAvLyA0CiAgICA8CiAgICBieiBzZXRfcHJpY2VfdGllcnNfYWZ0ZXJfZm9yQDcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjcyCiAgICAvLyBicmVha3BvaW50ID0gYnJlYWtwb2ludHNbdGllcl0ubmF0aXZlCiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGR1cAogICAgZnJhbWVfYnVyeSAxCiAgICBmcmFtZV9kaWcgLTMKICAgIHN3YXAKICAgIGV4dHJhY3RfdWludDY0CiAgICBkdXAKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzMKICAgIC8vIGlmIGJyZWFrcG9pbnQ6CiAgICBieiBzZXRfcHJpY2VfdGllcnNfZWxzZV9ib2R5QDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojc0CiAgICAvLyBhc3NlcnQgcHJldmlvdXNfYnJlYWtwb2ludCAhPSBOT19CUkVBS1BPSU5ULCAiR2FwIGluIHByaWNlIHRpZXJzIgogICAgZnJhbWVfZGlnIDYKICAgIGR1cAogICAgaW50YyA1IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICAhPQogICAgYXNzZXJ0IC8vIEdhcCBpbiBwcmljZSB0aWVycwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzUKICAgIC8vIGFzc2VydCBicmVha3BvaW50ID4gcHJldmlvdXNfYnJlYWtwb2ludCwgIkJyZWFrcG9pbnRzIG11c3QgYXNjZW5kIgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICA+CiAgICBhc3NlcnQgLy8gQnJlYWtwb2ludHMgbXVzdCBhc2NlbmQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojc2CiAgICAvLyBhc3NlcnQgZGlzY291bnRzW3RpZXJdLm5hdGl2ZSA+PSBwcmV2aW91c19kaXNjb3VudCwgIkRpc2NvdW50cyBtdXN0IG5vdCBkcm9wIgogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgMQogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfZGlnIDcKICAgID49CiAgICBhc3NlcnQgLy8gRGlzY291bnRzIG11c3Qgbm90IGRyb3AKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojc3CiAgICAvLyBhc3NlcnQgZGlzY291bnRzW3RpZXJdLm5hdGl2ZSA8PSAxMDAwMCwgIkRpc2NvdW50IGFib3ZlIDEwMCUiCiAgICBkdXAKICAgIGludGMgNCAvLyAxMDAwMAogICAgPD0KICAgIGFzc2VydCAvLyBEaXNjb3VudCBhYm92ZSAxMDAlCiAgICBmcmFtZV9idXJ5IDcKICAgIGZyYW1lX2J1cnkgNgoKc2V0X3ByaWNlX3RpZXJzX2FmdGVyX2lmX2Vsc2VANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjgyCiAgICAvLyBzY2hlZHVsZVt0aWVyXSA9IGFyYzQuVUludDY0KHByZXZpb3VzX2JyZWFrcG9pbnQpCiAgICBmcmFtZV9kaWcgNgogICAgaXRvYgogICAgZnJhbWVfZGlnIDgKICAgIGR1cAogICAgY292ZXIgMgogICAgcHVzaGludCAxMiAvLyAxMgogICAgPAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgNQogICAgZnJhbWVfZGlnIDEKICAgIHVuY292ZXIgMgogICAgcmVwbGFjZTMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjgzLTg0CiAgICAvLyAjIFVudXNlZCB0aWVycyByZXBlYXQgdGhlIGxhc3QgZGlzY291bnQgc28gdGhlaXIgc3RlcCBpcyB6ZXJvLgogICAgLy8gc2NoZWR1bGVbUFJJQ0VfVElFUlMgKyB0aWVyXSA9IGFyYzQuVUludDY0KHByZXZpb3VzX2Rpc2NvdW50KQogICAgZnJhbWVfZGlnIDcKICAgIGl0b2IKICAgIGludGNfMyAvLyA0CiAgICBkaWcgMwogICAgKwogICAgZHVwCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBzd2FwCiAgICByZXBsYWNlMwogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo3MQogICAgLy8gZm9yIHRpZXIgaW4gdXJhbmdlKFBSSUNFX1RJRVJTKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDgKICAgIGIgc2V0X3ByaWNlX3RpZXJzX2Zvcl9oZWFkZXJAMgoKc2V0X3ByaWNlX3RpZXJzX2Vsc2VfYm9keUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6ODEKICAgIC8vIHByZXZpb3VzX2JyZWFrcG9pbnQgPSBVSW50NjQoTk9fQlJFQUtQT0lOVCkKICAgIGludGMgNSAvLyAxODQ0Njc0NDA3MzcwOTU1MTYxNQogICAgZnJhbWVfYnVyeSA2CiAgICBiIHNldF9wcmljZV90aWVyc19hZnRlcl9pZl9lbHNlQDYKCnNldF9wcmljZV90aWVyc19hZnRlcl9mb3JANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojg1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDIKCnNldF9wcmljZV90aWVyc19mb3JfaGVhZGVyQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo4NQogICAgLy8gZm9yIGxpY2Vuc2VfdHlwZSBpbiB1cmFuZ2UoTElDRU5TRV9UWVBFUyk6CiAgICBmcmFtZV9kaWcgMgogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGJ6IHNldF9wcmljZV90aWVyc19hZnRlcl9mb3JAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojg2CiAgICAvLyBhc3NlcnQgbXVsdGlwbGllcnNbbGljZW5zZV90eXBlXS5uYXRpdmUsICJNdWx0aXBsaWVyIG11c3QgYmUgcG9zaXRpdmUiCiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZnJhbWVfZGlnIC0xCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3QzIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3RfdWludDY0CiAgICBhc3NlcnQgLy8gTXVsdGlwbGllciBtdXN0IGJlIHBvc2l0aXZlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo4NwogICAgLy8gc2NoZWR1bGVbUFJJQ0VfVElFUlMgKiAyICsgbGljZW5zZV90eXBlXSA9IG11bHRpcGxpZXJzW2xpY2Vuc2VfdHlwZV0KICAgIGludGNfMiAvLyA4CiAgICBkaWcgMgogICAgKwogICAgZHVwCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBmcmFtZV9kaWcgNQogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgZnJhbWVfYnVyeSA1CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo4NQogICAgLy8gZm9yIGxpY2Vuc2VfdHlwZSBpbiB1cmFuZ2UoTElDRU5TRV9UWVBFUyk6CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgZnJhbWVfYnVyeSAyCiAgICBiIHNldF9wcmljZV90aWVyc19mb3JfaGVhZGVyQDgKCnNldF9wcmljZV90aWVyc19hZnRlcl9mb3JAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMDQKICAgIC8vIHJlY29yZC5wcmljaW5nID0gYnVpbGRfcHJpY2Vfc2NoZWR1bGUoYnJlYWtwb2ludHMsIGRpc2NvdW50cywgbXVsdGlwbGllcnMpCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDUKICAgIHJlcGxhY2UyIDQwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMDUKICAgIC8vIHNlbGYuY29udGV4dHNbY29udGV4dF9pZF0gPSByZWNvcmQuY29weSgpCiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb250ZXh0X3JlZ2lzdHJ5LmNvbnRyYWN0LkNvbnRleHRSZWdpc3RyeS5wdXJjaGFzZV9jb250ZXh0KGNvbnRleHRfaWQ6IHVpbnQ2NCwgcGF5bWVudDogdWludDY0KSAtPiB2b2lkOgpwdXJjaGFzZV9jb250ZXh0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjA3LTIxMAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcHVyY2hhc2VfY29udGV4dCgKICAgIC8vICAgICBzZWxmLCBjb250ZXh0X2lkOiBVSW50NjQsIHBheW1lbnQ6IGd0eG4uUGF5bWVudFRyYW5zYWN0aW9uCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIxMgogICAgLy8gcmVjb3JkID0gc2VsZi5jb250ZXh0c1tjb250ZXh0X2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBieXRlY18xIC8vIDB4NjM3NDc4NWYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29udGV4dHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMTMKICAgIC8vIGtleSA9IG9wLml0b2IoY29udGV4dF9pZCkgKyBUeG4uc2VuZGVyLmJ5dGVzCiAgICB0eG4gU2VuZGVyCiAgICB1bmNvdmVyIDMKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjE0CiAgICAvLyBhc3NlcnQga2V5IG5vdCBpbiBzZWxmLnB1cmNoYXNlcywgIkFscmVhZHkgcHVyY2hhc2VkIgogICAgYnl0ZWMgMTAgLy8gMHg3MDc1NzI1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9sZW4KICAgIGJ1cnkgMQogICAgIQogICAgYXNzZXJ0IC8vIEFscmVhZHkgcHVyY2hhc2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMTUKICAgIC8vIHByaWNlID0gc2VsZi5fcXVvdGUoY29udGV4dF9pZCwgVUludDY0KDEpLCBVSW50NjQoTElDRU5TRV9PTkVfVElNRSkpCiAgICBmcmFtZV9kaWcgLTIKICAgIGludGNfMSAvLyAxCiAgICBpbnRjXzAgLy8gMAogICAgY2FsbHN1YiBfcXVvdGUKICAgIGR1cAogICAgY292ZXIgMwogICAgY292ZXIgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjE2CiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIHN3YXAKICAgIGNvdmVyIDUKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjE4CiAgICAvLyBzZWxmLnB1cmNoYXNlc1trZXldID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgaXRvYgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjE5CiAgICAvLyByZWNvcmQucHVyY2hhc2VzID0gYXJjNC5VSW50NjQocmVjb3JkLnB1cmNoYXNlcy5uYXRpdmUgKyAxKQogICAgZHVwCiAgICBwdXNoaW50IDE0NCAvLyAxNDQKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMTQ0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMjAKICAgIC8vIHNlbGYuY29udGV4dHNbY29udGV4dF9pZF0gPSByZWNvcmQuY29weSgpCiAgICBkaWcgMgogICAgYm94X2RlbAogICAgcG9wCiAgICB1bmNvdmVyIDIKICAgIGRpZyAxCiAgICBib3hfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMjEKICAgIC8vIHNlbGYuX2luZGV4X3VzZXJfY29udGV4dChUeG4uc2VuZGVyLCBVSW50NjQoVVNFUl9JTkRFWF9QVVJDSEFTRUQpLCBjb250ZXh0X2lkKQogICAgdHhuIFNlbmRlcgogICAgaW50Y18xIC8vIDEKICAgIGZyYW1lX2RpZyAtMgogICAgY2FsbHN1YiBfaW5kZXhfdXNlcl9jb250ZXh0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMjItMjI0CiAgICAvLyAjIFdyaXR0ZW4gbm93IHNvIGEgZmlyc3Qgc2FsZSdzIGJhbGFuY2UgYm94IGlzIHBhcnQgb2YgdGhlIE1CUiBjaGVja2VkCiAgICAvLyAjIGJlbG93OyBhIGZyZWUgc2FsZSBlYXJucyBub3RoaW5nIGFuZCBvcGVucyBubyBib3guCiAgICAvLyBjcmVhdG9yID0gcmVjb3JkLmNyZWF0b3IubmF0aXZlCiAgICBleHRyYWN0IDAgMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMjUKICAgIC8vIGNyZWF0b3JfYW1vdW50ID0gY2FsY3VsYXRlX2NyZWF0b3JfYW1vdW50KHByaWNlLCBzZWxmLnBsYXRmb3JtX2ZlZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwbGF0Zm9ybV9mZWUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxhdGZvcm1fZmVlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTYKICAgIC8vIHJldHVybiAoYW1vdW50ICogZmVlX2JwcykgLy8gMTAwMDAKICAgIGRpZyAyCiAgICAqCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjIyCiAgICAvLyByZXR1cm4gYW1vdW50IC0gY2FsY3VsYXRlX3BsYXRmb3JtX2ZlZShhbW91bnQsIGZlZV9icHMpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjI2CiAgICAvLyBlYXJuZWQgPSBzZWxmLmJhbGFuY2VzLmdldChjcmVhdG9yLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjIDYgLy8gMHg2MjYxNmM1ZgogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIGR1cAogICAgY292ZXIgMgogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMjcKICAgIC8vIGlmIGNyZWF0b3JfYW1vdW50OgogICAgYnogcHVyY2hhc2VfY29udGV4dF9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIyOAogICAgLy8gc2VsZi5iYWxhbmNlc1tjcmVhdG9yXSA9IGVhcm5lZAogICAgZnJhbWVfZGlnIDYKICAgIGl0b2IKICAgIGZyYW1lX2RpZyA1CiAgICBzd2FwCiAgICBib3hfcHV0CgpwdXJjaGFzZV9jb250ZXh0X2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzMAogICAgLy8gcGFpZCA9IHNlbGYuX2Fzc2VydF9wYWlkKHBheW1lbnQsIHByaWNlLCBtaW5fYmFsYW5jZSkKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDIKICAgIGZyYW1lX2RpZyAzCiAgICBjYWxsc3ViIF9hc3NlcnRfcGFpZAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMzEKICAgIC8vIGlmIGNyZWF0b3JfYW1vdW50OgogICAgZnJhbWVfZGlnIDQKICAgIGJ6IHB1cmNoYXNlX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUA0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMzIKICAgIC8vIHNlbGYuYmFsYW5jZXNbY3JlYXRvcl0gPSBlYXJuZWQgKyBjcmVhdG9yX2Ftb3VudAogICAgZnJhbWVfZGlnIDYKICAgIGZyYW1lX2RpZyA0CiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgNQogICAgc3dhcAogICAgYm94X3B1dAoKcHVyY2hhc2VfY29udGV4dF9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyMzMtMjM0CiAgICAvLyAjIFRoZSBmZWUgYW5kIGFueXRoaW5nIHBhaWQgYmV5b25kIHRoZSBwcmljZSBnbyB0byB0aGUgcGxhdGZvcm0uCiAgICAvLyBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgKz0gcGFpZCAtIGNyZWF0b3JfYW1vdW50CiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicGxhdGZvcm1fYmFsYW5jZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0Zm9ybV9iYWxhbmNlIGV4aXN0cwogICAgZnJhbWVfZGlnIDAKICAgIGZyYW1lX2RpZyA0CiAgICAtCiAgICArCiAgICBieXRlY18yIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjIzNgogICAgLy8gYXJjNC5lbWl0KENvbnRleHRQdXJjaGFzZWQoYXJjNC5VSW50NjQoY29udGV4dF9pZCksIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSkpCiAgICBmcmFtZV9kaWcgMQogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg2NzZjNjEyMCAvLyBtZXRob2QgIkNvbnRleHRQdXJjaGFzZWQodWludDY0LGFkZHJlc3MpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb250ZXh0X3JlZ2lzdHJ5LmNvbnRyYWN0LkNvbnRleHRSZWdpc3RyeS5yYXRlX2NvbnRleHQoY29udGV4dF9pZDogdWludDY0LCByYXRpbmc6IHVpbnQ2NCkgLT4gdm9pZDoKcmF0ZV9jb250ZXh0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjM4LTIzOQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmF0ZV9jb250ZXh0KHNlbGYsIGNvbnRleHRfaWQ6IFVJbnQ2NCwgcmF0aW5nOiBVSW50NjQpIC0+IE5vbmU6CiAgICBwcm90byAyIDAKICAgIGludGNfMCAvLyAwCiAgICBkdXBuIDIKICAgIGJ5dGVjXzMgLy8gIiIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjI4CiAgICAvLyByZXR1cm4gcmF0aW5nID49IDEgYW5kIHJhdGluZyA8PSBNQVhfUkFUSU5HCiAgICBmcmFtZV9kaWcgLTEKICAgIGJ6IHJhdGVfY29udGV4dF9ib29sX2ZhbHNlQDcKICAgIGZyYW1lX2RpZyAtMQogICAgcHVzaGludCA1IC8vIDUKICAgIDw9CiAgICBieiByYXRlX2NvbnRleHRfYm9vbF9mYWxzZUA3CiAgICBpbnRjXzEgLy8gMQoKcmF0ZV9jb250ZXh0X2Jvb2xfbWVyZ2VAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MQogICAgLy8gYXNzZXJ0IHZhbGlkYXRlX3JhdGluZyhyYXRpbmcpLCAiSW52YWxpZCByYXRpbmciCiAgICBhc3NlcnQgLy8gSW52YWxpZCByYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI0MgogICAgLy8ga2V5ID0gb3AuaXRvYihjb250ZXh0X2lkKSArIFR4bi5zZW5kZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDIKICAgIGR1cAogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNDMKICAgIC8vIHByZXZpb3VzLCBwdXJjaGFzZWQgPSBzZWxmLnB1cmNoYXNlcy5tYXliZShrZXkpCiAgICBieXRlYyAxMCAvLyAweDcwNzU3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ0CiAgICAvLyBhc3NlcnQgcHVyY2hhc2VkLCAiQ29udGV4dCBub3QgcHVyY2hhc2VkIgogICAgYXNzZXJ0IC8vIENvbnRleHQgbm90IHB1cmNoYXNlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ2CiAgICAvLyByZWNvcmQgPSBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdLmNvcHkoKQogICAgYnl0ZWNfMSAvLyAweDYzNzQ3ODVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRleHRzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ3CiAgICAvLyBpZiBwcmV2aW91czoKICAgIGJ6IHJhdGVfY29udGV4dF9lbHNlX2JvZHlAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ4CiAgICAvLyByZWNvcmQucmF0aW5nX3N1bSA9IGFyYzQuVUludDY0KHJlY29yZC5yYXRpbmdfc3VtLm5hdGl2ZSAtIHByZXZpb3VzKQogICAgZHVwCiAgICBwdXNoaW50IDE1MiAvLyAxNTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICAtCiAgICBpdG9iCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIHJlcGxhY2UyIDE1MgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjUwCiAgICAvLyByZWNvcmQucmF0aW5nX2hpc3RvZ3JhbVtwcmV2aW91cyAtIDFdLm5hdGl2ZSAtIDEKICAgIHN3YXAKICAgIGludGNfMSAvLyAxCiAgICAtCiAgICBkaWcgMQogICAgZXh0cmFjdCAxNjggNDAgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBkaWcgMQogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGR1cDIKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjQ5LTI1MQogICAgLy8gcmVjb3JkLnJhdGluZ19oaXN0b2dyYW1bcHJldmlvdXMgLSAxXSA9IGFyYzQuVUludDY0KAogICAgLy8gICAgIHJlY29yZC5yYXRpbmdfaGlzdG9ncmFtW3ByZXZpb3VzIC0gMV0ubmF0aXZlIC0gMQogICAgLy8gKQogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDUgLy8gNQogICAgPAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICByZXBsYWNlMwogICAgcmVwbGFjZTIgMTY4CgpyYXRlX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjU0CiAgICAvLyByZWNvcmQucmF0aW5nX3N1bSA9IGFyYzQuVUludDY0KHJlY29yZC5yYXRpbmdfc3VtLm5hdGl2ZSArIHJhdGluZykKICAgIGR1cAogICAgcHVzaGludCAxNTIgLy8gMTUyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpdG9iCiAgICByZXBsYWNlMiAxNTIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NgogICAgLy8gcmVjb3JkLnJhdGluZ19oaXN0b2dyYW1bcmF0aW5nIC0gMV0ubmF0aXZlICsgMQogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZGlnIDEKICAgIGV4dHJhY3QgMTY4IDQwIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZGlnIDEKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBkdXAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1NS0yNTcKICAgIC8vIHJlY29yZC5yYXRpbmdfaGlzdG9ncmFtW3JhdGluZyAtIDFdID0gYXJjNC5VSW50NjQoCiAgICAvLyAgICAgcmVjb3JkLnJhdGluZ19oaXN0b2dyYW1bcmF0aW5nIC0gMV0ubmF0aXZlICsgMQogICAgLy8gKQogICAgaXRvYgogICAgdW5jb3ZlciAzCiAgICBwdXNoaW50IDUgLy8gNQogICAgPAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICByZXBsYWNlMwogICAgcmVwbGFjZTIgMTY4CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNTgKICAgIC8vIHNlbGYuY29udGV4dHNbY29udGV4dF9pZF0gPSByZWNvcmQuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBib3hfZGVsCiAgICBwb3AKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI1OQogICAgLy8gc2VsZi5wdXJjaGFzZXNba2V5XSA9IHJhdGluZwogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMAogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI2NAogICAgLy8gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjY2CiAgICAvLyBhcmM0LlVJbnQ2NChwcmV2aW91cyksCiAgICBmcmFtZV9kaWcgMwogICAgaXRvYgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjYyLTI2NwogICAgLy8gQ29udGV4dFJhdGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGNvbnRleHRfaWQpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChyYXRpbmcpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHByZXZpb3VzKSwKICAgIC8vICkKICAgIGZyYW1lX2RpZyAyCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjYxLTI2OAogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIENvbnRleHRSYXRlZCgKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoY29udGV4dF9pZCksCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocmF0aW5nKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocHJldmlvdXMpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGY1YTE3ZDQxIC8vIG1ldGhvZCAiQ29udGV4dFJhdGVkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIHJldHN1YgoKcmF0ZV9jb250ZXh0X2Vsc2VfYm9keUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjUzCiAgICAvLyByZWNvcmQucmF0aW5nX2NvdW50ID0gYXJjNC5VSW50NjQocmVjb3JkLnJhdGluZ19jb3VudC5uYXRpdmUgKyAxKQogICAgZHVwCiAgICBwdXNoaW50IDE2MCAvLyAxNjAKICAgIGV4dHJhY3RfdWludDY0CiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgaXRvYgogICAgcmVwbGFjZTIgMTYwCiAgICBiIHJhdGVfY29udGV4dF9hZnRlcl9pZl9lbHNlQDMKCnJhdGVfY29udGV4dF9ib29sX2ZhbHNlQDc6CiAgICBpbnRjXzAgLy8gMAogICAgYiByYXRlX2NvbnRleHRfYm9vbF9tZXJnZUA4CgoKLy8gc21hcnRfY29udHJhY3RzLmNvbnRleHRfcmVnaXN0cnkuY29udHJhY3QuQ29udGV4dFJlZ2lzdHJ5LmdldF9jb250ZXh0X3JhdGluZyhjb250ZXh0X2lkOiB1aW50NjQpIC0+IGJ5dGVzOgpnZXRfY29udGV4dF9yYXRpbmc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNzAtMjcxCiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2NvbnRleHRfcmF0aW5nKHNlbGYsIGNvbnRleHRfaWQ6IFVJbnQ2NCkgLT4gQ29udGV4dFJhdGluZzoKICAgIHByb3RvIDEgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjczCiAgICAvLyByZWNvcmQgPSBzZWxmLmNvbnRleHRzW2NvbnRleHRfaWRdLmNvcHkoKQogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NjM3NDc4NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuY29udGV4dHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNzUKICAgIC8vIHJhdGluZ19zdW09cmVjb3JkLnJhdGluZ19zdW0sCiAgICBkdXAKICAgIGV4dHJhY3QgMTUyIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNzYKICAgIC8vIHJhdGluZ19jb3VudD1yZWNvcmQucmF0aW5nX2NvdW50LAogICAgZGlnIDEKICAgIGV4dHJhY3QgMTYwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyNzcKICAgIC8vIHJhdGluZ19oaXN0b2dyYW09cmVjb3JkLnJhdGluZ19oaXN0b2dyYW0uY29weSgpLAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0IDE2OCA0MCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI3NC0yNzgKICAgIC8vIHJldHVybiBDb250ZXh0UmF0aW5nKAogICAgLy8gICAgIHJhdGluZ19zdW09cmVjb3JkLnJhdGluZ19zdW0sCiAgICAvLyAgICAgcmF0aW5nX2NvdW50PXJlY29yZC5yYXRpbmdfY291bnQsCiAgICAvLyAgICAgcmF0aW5nX2hpc3RvZ3JhbT1yZWNvcmQucmF0aW5nX2hpc3RvZ3JhbS5jb3B5KCksCiAgICAvLyApCiAgICBjb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbnRleHRfcmVnaXN0cnkuY29udHJhY3QuQ29udGV4dFJlZ2lzdHJ5LndpdGhkcmF3KCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI4OAogICAgLy8gYW1vdW50ID0gc2VsZi5iYWxhbmNlcy5nZXQoVHhuLnNlbmRlciwgZGVmYXVsdD1VSW50NjQoMCkpCiAgICBieXRlYyA2IC8vIDB4NjI2MTZjNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyODkKICAgIC8vIGFzc2VydCBhbW91bnQsICJOb3RoaW5nIHRvIHdpdGhkcmF3IgogICAgZHVwCiAgICBhc3NlcnQgLy8gTm90aGluZyB0byB3aXRoZHJhdwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjkwCiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjkxCiAgICAvLyBkZWwgc2VsZi5iYWxhbmNlc1tUeG4uc2VuZGVyXQogICAgYnl0ZWMgNiAvLyAweDYyNjE2YzVmCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIGJveF9kZWwKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MjkyCiAgICAvLyBhbW91bnQgKz0gbWluX2JhbGFuY2UgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC0KICAgICsKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjI5MwogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weToyOTQKICAgIC8vIHJldHVybiBhbW91bnQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb250ZXh0X3JlZ2lzdHJ5LmNvbnRyYWN0LkNvbnRleHRSZWdpc3RyeS53aXRoZHJhd19wbGF0Zm9ybV9mZWVzKCkgLT4gdWludDY0Ogp3aXRoZHJhd19wbGF0Zm9ybV9mZWVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6Mjk5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCAiTm90IGFkbWluIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMAogICAgLy8gYW1vdW50ID0gc2VsZi5wbGF0Zm9ybV9iYWxhbmNlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMiAvLyAicGxhdGZvcm1fYmFsYW5jZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0Zm9ybV9iYWxhbmNlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzAxCiAgICAvLyBhc3NlcnQgYW1vdW50LCAiTm90aGluZyB0byB3aXRoZHJhdyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vdGhpbmcgdG8gd2l0aGRyYXcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwMgogICAgLy8gc2VsZi5wbGF0Zm9ybV9iYWxhbmNlID0gVUludDY0KDApCiAgICBieXRlY18yIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMDMKICAgIC8vIGl0eG4uUGF5bWVudChyZWNlaXZlcj1zZWxmLmFkbWluLCBhbW91bnQ9YW1vdW50LCBmZWU9MCkuc3VibWl0KCkKICAgIGl0eG5fYmVnaW4KICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgIGRpZyAxCiAgICBpdHhuX2ZpZWxkIEFtb3VudAogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgaW50Y18xIC8vIHBheQogICAgaXR4bl9maWVsZCBUeXBlRW51bQogICAgaW50Y18wIC8vIDAKICAgIGl0eG5fZmllbGQgRmVlCiAgICBpdHhuX3N1Ym1pdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzA0CiAgICAvLyByZXR1cm4gYW1vdW50CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuZ2V0X2JhbGFuY2UoY3JlYXRvcjogYnl0ZXMpIC0+IHVpbnQ2NDoKZ2V0X2JhbGFuY2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMDYtMzA3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2JhbGFuY2Uoc2VsZiwgY3JlYXRvcjogYXJjNC5BZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMwOQogICAgLy8gcmV0dXJuIHNlbGYuYmFsYW5jZXMuZ2V0KGNyZWF0b3IubmF0aXZlLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjIDYgLy8gMHg2MjYxNmM1ZgogICAgZnJhbWVfZGlnIC0xCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGJ0b2kKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHNlbGVjdAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbnRleHRfcmVnaXN0cnkuY29udHJhY3QuQ29udGV4dFJlZ2lzdHJ5LmdldF91c2VyX2NvbnRleHRzKHVzZXI6IGJ5dGVzLCBraW5kOiB1aW50NjQsIHBhZ2U6IHVpbnQ2NCkgLT4gYnl0ZXM6CmdldF91c2VyX2NvbnRleHRzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzExLTMxNAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF91c2VyX2NvbnRleHRzKAogICAgLy8gICAgIHNlbGYsIHVzZXI6IGFyYzQuQWRkcmVzcywga2luZDogVUludDY0LCBwYWdlOiBVSW50NjQKICAgIC8vICkgLT4gVXNlckNvbnRleHRQYWdlOgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNjAKICAgIC8vIHJldHVybiB1c2VyLmJ5dGVzICsgb3AuZXh0cmFjdChvcC5pdG9iKGtpbmQpLCA3LCAxKSArIG9wLml0b2IocGFnZSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZXh0cmFjdCA3IDEKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzE3CiAgICAvLyBpZiBrZXkgaW4gc2VsZi51c2VyX3BhZ2VzOgogICAgYnl0ZWMgOSAvLyAweDc1NzM3MjVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBieiBnZXRfdXNlcl9jb250ZXh0c19hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMxOAogICAgLy8gcmV0dXJuIHNlbGYudXNlcl9wYWdlc1trZXldCiAgICBmcmFtZV9kaWcgMAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYudXNlcl9wYWdlcyBlbnRyeSBleGlzdHMKICAgIHN3YXAKICAgIHJldHN1YgoKZ2V0X3VzZXJfY29udGV4dHNfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzE5CiAgICAvLyByZXR1cm4gVXNlckNvbnRleHRQYWdlLmZyb21fYnl0ZXMob3AuYnplcm8oOCArIFVTRVJfSU5ERVhfUEFHRV9TSVpFICogOCkpCiAgICBwdXNoaW50IDUyMCAvLyA1MjAKICAgIGJ6ZXJvCiAgICBzd2FwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKCkgLT4gdWludDY0OgpnZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMjQKICAgIC8vIHJldHVybiBzZWxmLnBsYXRmb3JtX2ZlZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDQgLy8gInBsYXRmb3JtX2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0Zm9ybV9mZWUgZXhpc3RzCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuc2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKGZlZV9icHM6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzI2LTMyNwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgc2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKHNlbGYsIGZlZV9icHM6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzI5CiAgICAvLyBhc3NlcnQgVHhuLnNlbmRlciA9PSBzZWxmLmFkbWluLCAiTm90IGFkbWluIgogICAgdHhuIFNlbmRlcgogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gImFkbWluIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmFkbWluIGV4aXN0cwogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgYWRtaW4KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMAogICAgLy8gYXNzZXJ0IGZlZV9icHMgPD0gTUFYX1BMQVRGT1JNX0ZFRV9QRVJDRU5UQUdFLCAiRmVlIHRvbyBoaWdoIgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEwMDAgLy8gMTAwMAogICAgPD0KICAgIGFzc2VydCAvLyBGZWUgdG9vIGhpZ2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMQogICAgLy8gYXJjNC5lbWl0KFBsYXRmb3JtRmVlVXBkYXRlZChhcmM0LlVJbnQ2NChzZWxmLnBsYXRmb3JtX2ZlZSksIGFyYzQuVUludDY0KGZlZV9icHMpKSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJwbGF0Zm9ybV9mZWUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxhdGZvcm1fZmVlIGV4aXN0cwogICAgaXRvYgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBjb25jYXQKICAgIHB1c2hieXRlcyAweDI0YWJjOWMwIC8vIG1ldGhvZCAiUGxhdGZvcm1GZWVVcGRhdGVkKHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjMzMgogICAgLy8gc2VsZi5wbGF0Zm9ybV9mZWUgPSBmZWVfYnBzCiAgICBieXRlYyA0IC8vICJwbGF0Zm9ybV9mZWUiCiAgICBmcmFtZV9kaWcgLTEKICAgIGFwcF9nbG9iYWxfcHV0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMuY29udGV4dF9yZWdpc3RyeS5jb250cmFjdC5Db250ZXh0UmVnaXN0cnkuX2Fzc2VydF9wYWlkKHBheW1lbnQ6IHVpbnQ2NCwgcHJpY2U6IHVpbnQ2NCwgbWluX2JhbGFuY2U6IHVpbnQ2NCkgLT4gdWludDY0OgpfYXNzZXJ0X3BhaWQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozMzgtMzQxCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9hc3NlcnRfcGFpZCgKICAgIC8vICAgICBzZWxmLCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbiwgcHJpY2U6IFVJbnQ2NCwgbWluX2JhbGFuY2U6IFVJbnQ2NAogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NgogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIHJlY2VpdmVyIgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0NwogICAgLy8gYWRkZWQgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlIC0gbWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgZnJhbWVfZGlnIC0xCiAgICAtCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNDgKICAgIC8vIGFzc2VydCBwYXltZW50LmFtb3VudCA+PSBwcmljZSArIGFkZGVkLCAiSW5zdWZmaWNpZW50IHBheW1lbnQiCiAgICBmcmFtZV9kaWcgLTMKICAgIGd0eG5zIEFtb3VudAogICAgZnJhbWVfZGlnIC0yCiAgICBkaWcgMgogICAgKwogICAgZGlnIDEKICAgIDw9CiAgICBhc3NlcnQgLy8gSW5zdWZmaWNpZW50IHBheW1lbnQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM0OQogICAgLy8gcmV0dXJuIHBheW1lbnQuYW1vdW50IC0gYWRkZWQKICAgIHN3YXAKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5jb250ZXh0X3JlZ2lzdHJ5LmNvbnRyYWN0LkNvbnRleHRSZWdpc3RyeS5fcXVvdGUoY29udGV4dF9pZDogdWludDY0LCBxdWFudGl0eTogdWludDY0LCBsaWNlbnNlX3R5cGU6IHVpbnQ2NCkgLT4gdWludDY0OgpfcXVvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNTEtMzUyCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9xdW90ZShzZWxmLCBjb250ZXh0X2lkOiBVSW50NjQsIHF1YW50aXR5OiBVSW50NjQsIGxpY2Vuc2VfdHlwZTogVUludDY0KSAtPiBVSW50NjQ6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM1My0zNTQKICAgIC8vICMgT25lIGJveF9leHRyYWN0IGNvdmVycyB0aGUgdW5pdCBwcmljZSBhbmQgaXRzIHdob2xlIHNjaGVkdWxlLgogICAgLy8ga2V5ID0gc2VsZi5jb250ZXh0cy5rZXlfcHJlZml4ICsgb3AuaXRvYihjb250ZXh0X2lkKQogICAgZnJhbWVfZGlnIC0zCiAgICBpdG9iCiAgICBieXRlY18xIC8vIDB4NjM3NDc4NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzU1CiAgICAvLyBwcmljaW5nID0gb3AuQm94LmV4dHJhY3Qoa2V5LCBQUklDRV9PRkZTRVQsIDggKyAxMiAqIDgpCiAgICBwdXNoaW50cyAzMiAxMDQgLy8gMzIsIDEwNAogICAgYm94X2V4dHJhY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojk5CiAgICAvLyBhc3NlcnQgbGljZW5zZV90eXBlIDwgTElDRU5TRV9UWVBFUywgIlVua25vd24gbGljZW5zZSB0eXBlIgogICAgZnJhbWVfZGlnIC0xCiAgICBpbnRjXzMgLy8gNAogICAgPAogICAgYXNzZXJ0IC8vIFVua25vd24gbGljZW5zZSB0eXBlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weToxMDAKICAgIC8vIGRpc2NvdW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAxLTEwMgogICAgLy8gcHJldmlvdXMgPSBVSW50NjQoMCkKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBkdXBuIDIKCl9xdW90ZV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weToxMDIKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGJ6IF9xdW90ZV9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAzCiAgICAvLyByZWFjaGVkID0gb3AuZXh0cmFjdF91aW50NjQocHJpY2luZywgOCArIChQUklDRV9USUVSUyArIHRpZXIpICogOCkKICAgIGludGNfMyAvLyA0CiAgICBmcmFtZV9kaWcgMwogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNAogICAgLy8gYnJlYWtwb2ludCA9IG9wLmV4dHJhY3RfdWludDY0KHByaWNpbmcsIDggKyB0aWVyICogOCkKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNQogICAgLy8gZGlzY291bnQgKz0gb3Auc2VsZWN0X3VpbnQ2NCgwLCByZWFjaGVkIC0gcHJldmlvdXMsIHF1YW50aXR5ID49IGJyZWFrcG9pbnQpCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIDIKICAgIC0KICAgIGZyYW1lX2RpZyAtMgogICAgdW5jb3ZlciAyCiAgICA+PQogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAyCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMwogICAgZnJhbWVfYnVyeSAyCiAgICBiIF9xdW90ZV9mb3JfaGVhZGVyQDIKCl9xdW90ZV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNwogICAgLy8gbXVsdGlwbGllciA9IG9wLmV4dHJhY3RfdWludDY0KHByaWNpbmcsIDggKyAoUFJJQ0VfVElFUlMgKiAyICsgbGljZW5zZV90eXBlKSAqIDgpCiAgICBpbnRjXzIgLy8gOAogICAgZnJhbWVfZGlnIC0xCiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwOAogICAgLy8gdG90YWwgPSBvcC5leHRyYWN0X3VpbnQ2NChwcmljaW5nLCAwKSAqIHF1YW50aXR5ICogbXVsdGlwbGllciAvLyAxMDAwMAogICAgc3dhcAogICAgaW50Y18wIC8vIDAKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTIKICAgICoKICAgICoKICAgIGludGMgNCAvLyAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTA5CiAgICAvLyByZXR1cm4gdG90YWwgKiAoMTAwMDAgLSBkaXNjb3VudCkgLy8gMTAwMDAKICAgIGludGMgNCAvLyAxMDAwMAogICAgZnJhbWVfZGlnIDEKICAgIC0KICAgICoKICAgIGludGMgNCAvLyAxMDAwMAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzU2CiAgICAvLyByZXR1cm4gcXVvdGVfcHJpY2UocHJpY2luZywgcXVhbnRpdHksIGxpY2Vuc2VfdHlwZSkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmNvbnRleHRfcmVnaXN0cnkuY29udHJhY3QuQ29udGV4dFJlZ2lzdHJ5Ll9pbmRleF91c2VyX2NvbnRleHQodXNlcjogYnl0ZXMsIGtpbmQ6IHVpbnQ2NCwgY29udGV4dF9pZDogdWludDY0KSAtPiB2b2lkOgpfaW5kZXhfdXNlcl9jb250ZXh0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzYyLTM2NQogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfaW5kZXhfdXNlcl9jb250ZXh0KAogICAgLy8gICAgIHNlbGYsIHVzZXI6IEFjY291bnQsIGtpbmQ6IFVJbnQ2NCwgY29udGV4dF9pZDogVUludDY0CiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byAzIDAKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNjAKICAgIC8vIHJldHVybiB1c2VyLmJ5dGVzICsgb3AuZXh0cmFjdChvcC5pdG9iKGtpbmQpLCA3LCAxKSArIG9wLml0b2IocGFnZSkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgZXh0cmFjdCA3IDEKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2OQogICAgLy8gZmlyc3Rfa2V5ID0gcHJlZml4ICsgc2VsZi5fdXNlcl9wYWdlX2tleSh1c2VyLCBraW5kLCBVSW50NjQoMCkpCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzYwCiAgICAvLyByZXR1cm4gdXNlci5ieXRlcyArIG9wLmV4dHJhY3Qob3AuaXRvYihraW5kKSwgNywgMSkgKyBvcC5pdG9iKHBhZ2UpCiAgICBpdG9iCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2Ny0zNjgKICAgIC8vICMgUmF3IGJveCBvcHMgcGF0Y2ggOCBieXRlcyBpbiBwbGFjZSBpbnN0ZWFkIG9mIHJld3JpdGluZyA1MjAtYnl0ZSBwYWdlcy4KICAgIC8vIHByZWZpeCA9IHNlbGYudXNlcl9wYWdlcy5rZXlfcHJlZml4CiAgICBieXRlYyA5IC8vIDB4NzU3MzcyNWYKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM2OQogICAgLy8gZmlyc3Rfa2V5ID0gcHJlZml4ICsgc2VsZi5fdXNlcl9wYWdlX2tleSh1c2VyLCBraW5kLCBVSW50NjQoMCkpCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzcwCiAgICAvLyB0b3RhbCA9IFVJbnQ2NCgwKQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3MQogICAgLy8gX3NpemUsIGV4aXN0cyA9IG9wLkJveC5sZW5ndGgoZmlyc3Rfa2V5KQogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNzIKICAgIC8vIGlmIGV4aXN0czoKICAgIGJ6IF9pbmRleF91c2VyX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNzMKICAgIC8vIHRvdGFsID0gb3AuYnRvaShvcC5Cb3guZXh0cmFjdChmaXJzdF9rZXksIDAsIDgpKQogICAgZnJhbWVfZGlnIDMKICAgIGludGNfMCAvLyAwCiAgICBpbnRjXzIgLy8gOAogICAgYm94X2V4dHJhY3QKICAgIGJ0b2kKICAgIGZyYW1lX2J1cnkgNAoKX2luZGV4X3VzZXJfY29udGV4dF9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNzUKICAgIC8vIHNsb3QgPSB0b3RhbCAlIFVTRVJfSU5ERVhfUEFHRV9TSVpFCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBwdXNoaW50IDY0IC8vIDY0CiAgICAlCiAgICBkdXAKICAgIGNvdmVyIDIKICAgIGZyYW1lX2J1cnkgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc2CiAgICAvLyBrZXkgPSBwcmVmaXggKyBzZWxmLl91c2VyX3BhZ2Vfa2V5KHVzZXIsIGtpbmQsIHRvdGFsIC8vIFVTRVJfSU5ERVhfUEFHRV9TSVpFKQogICAgcHVzaGludCA2NCAvLyA2NAogICAgLwogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6MzYwCiAgICAvLyByZXR1cm4gdXNlci5ieXRlcyArIG9wLmV4dHJhY3Qob3AuaXRvYihraW5kKSwgNywgMSkgKyBvcC5pdG9iKHBhZ2UpCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNjctMzY4CiAgICAvLyAjIFJhdyBib3ggb3BzIHBhdGNoIDggYnl0ZXMgaW4gcGxhY2UgaW5zdGVhZCBvZiByZXdyaXRpbmcgNTIwLWJ5dGUgcGFnZXMuCiAgICAvLyBwcmVmaXggPSBzZWxmLnVzZXJfcGFnZXMua2V5X3ByZWZpeAogICAgYnl0ZWMgOSAvLyAweDc1NzM3MjVmCiAgICAvLyBzbWFydF9jb250cmFjdHMvY29udGV4dF9yZWdpc3RyeS9jb250cmFjdC5weTozNzYKICAgIC8vIGtleSA9IHByZWZpeCArIHNlbGYuX3VzZXJfcGFnZV9rZXkodXNlciwga2luZCwgdG90YWwgLy8gVVNFUl9JTkRFWF9QQUdFX1NJWkUpCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2J1cnkgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc3CiAgICAvLyBpZiBzbG90ID09IDA6CiAgICBibnogX2luZGV4X3VzZXJfY29udGV4dF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM3OAogICAgLy8gb3AuQm94LmNyZWF0ZShrZXksIDggKyBVU0VSX0lOREVYX1BBR0VfU0laRSAqIDgpCiAgICBmcmFtZV9kaWcgMAogICAgcHVzaGludCA1MjAgLy8gNTIwCiAgICBib3hfY3JlYXRlCiAgICBwb3AKCl9pbmRleF91c2VyX2NvbnRleHRfYWZ0ZXJfaWZfZWxzZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2NvbnRleHRfcmVnaXN0cnkvY29udHJhY3QucHk6Mzc5CiAgICAvLyBvcC5Cb3gucmVwbGFjZShrZXksIDggKyBzbG90ICogOCwgb3AuaXRvYihjb250ZXh0X2lkKSkKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAtMQogICAgaXRvYgogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgY292ZXIgMwogICAgY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4MAogICAgLy8gb3AuQm94LnJlcGxhY2Uoa2V5LCAwLCBvcC5pdG9iKHRvdGFsICsgMSkpCiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGl0b2IKICAgIHN3YXAKICAgIGludGNfMCAvLyAwCiAgICBkaWcgMgogICAgYm94X3JlcGxhY2UKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9jb250ZXh0X3JlZ2lzdHJ5L2NvbnRyYWN0LnB5OjM4MQogICAgLy8gb3AuQm94LnJlcGxhY2UoZmlyc3Rfa2V5LCAwLCBvcC5pdG9iKHRvdGFsICsgMSkpCiAgICBmcmFtZV9kaWcgMwogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgYm94X3JlcGxhY2UKICAgIHJldHN1Ygo=", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [1334], "errorMessage": "Already purchased"}, {"pc": [1166], "errorMessage": "Breakpoints must ascend"}, {"pc": [1534], "errorMessage": "Context not purchased"}, {"pc": [1181], "errorMessage": "Discount above 100%"}, {"pc": [1176], "errorMessage": "Discounts must not drop"}, {"pc": [1889], "errorMessage": "Fee too high"}, {"pc": [1159], "errorMessage": "Gap in price tiers"}, {"pc": [579, 627, 1116, 1197, 1216, 1257, 1272, 1385, 1572, 1589, 1610, 1627, 1700, 1705, 1710], "errorMessage": "Index access is out of bounds"}, {"pc": [1946], "errorMessage": "Insufficient payment"}, {"pc": [1508], "errorMessage": "Invalid rating"}, {"pc": [1263], "errorMessage": "Multiplier must be positive"}, {"pc": [1778, 1882], "errorMessage": "Not admin"}, {"pc": [1122], "errorMessage": "Not creator"}, {"pc": [1733, 1784], "errorMessage": "Nothing to withdraw"}, {"pc": [244, 260, 277, 304, 324, 341, 358, 378, 398, 424, 449, 468, 488, 517], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [667], "errorMessage": "Price too low"}, {"pc": [677], "errorMessage": "Title too long"}, {"pc": [1968], "errorMessage": "Unknown license type"}, {"pc": [1925], "errorMessage": "Wrong receiver"}, {"pc": [682, 1354, 1738, 1750, 1930], "errorMessage": "account funded"}, {"pc": [247, 263, 280, 307, 327, 344, 361, 381, 401, 427, 452, 471, 491, 520], "errorMessage": "can only call when not creating"}, {"pc": [1776, 1793, 1880], "errorMessage": "check self.admin exists"}, {"pc": [687], "errorMessage": "check self.context_count exists"}, {"pc": [893, 936, 1115, 1318, 1546, 1698], "errorMessage": "check self.contexts entry exists"}, {"pc": [820, 1462, 1782], "errorMessage": "check self.platform_balance exists"}, {"pc": [1392, 1869, 1894], "errorMessage": "check self.platform_fee exists"}, {"pc": [1856], "errorMessage": "check self.user_pages entry exists"}, {"pc": [415, 540], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,34 +64,144 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class ContextRating:
+    """Struct for ContextRating"""
+    rating_sum: int
+    rating_count: int
+    rating_histogram: tuple[int, int, int, int, int]
+
+@dataclasses.dataclass(frozen=True)
+class ContextRecord:
+    """Struct for ContextRecord"""
+    creator: str
+    price: int
+    pricing: tuple[int, int, int, int, int, int, int, int, int, int, int, int]
+    created_at: int
+    purchases: int
+    rating_sum: int
+    rating_count: int
+    rating_histogram: tuple[int, int, int, int, int]
+    ipfs_hash: str
+    title: str
+
+@dataclasses.dataclass(frozen=True)
+class UserContextPage:
+    """Struct for UserContextPage"""
+    total: int
+    context_ids: tuple[int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int, int]
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateContextArgs:
     """Dataclass for create_context arguments"""
     ipfs_hash: str
     title: str
     price: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_context(string,string,uint64)string"
+        return "create_context(string,string,uint64,pay)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetContextPriceArgs:
     """Dataclass for get_context_price arguments"""
-    context_id: str
+    context_id: int
+    quantity: int
+    license_type: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_context_price(uint64,uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetContextArgs:
+    """Dataclass for get_context arguments"""
+    context_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetContextsArgs:
+    """Dataclass for get_contexts arguments"""
+    context_ids: list[int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPriceTiersArgs:
+    """Dataclass for set_price_tiers arguments"""
+    context_id: int
+    breakpoints: tuple[int, int, int, int]
+    discounts: tuple[int, int, int, int]
+    multipliers: tuple[int, int, int, int]
 
     @property
     def abi_method_signature(self) -> str:
-        return "get_context_price(string)uint64"
+        return "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PurchaseContextArgs:
     """Dataclass for purchase_context arguments"""
-    context_id: str
+    context_id: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "purchase_context(uint64,pay)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RateContextArgs:
+    """Dataclass for rate_context arguments"""
+    context_id: int
+    rating: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "rate_context(uint64,uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetContextRatingArgs:
+    """Dataclass for get_context_rating arguments"""
+    context_id: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "purchase_context(string)string"
+        return "get_context_rating(uint64)(uint64,uint64,uint64[5])"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBalanceArgs:
+    """Dataclass for get_balance arguments"""
+    creator: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_balance(address)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetUserContextsArgs:
+    """Dataclass for get_user_contexts arguments"""
+    user: str
+    kind: int
+    page: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPlatformFeePercentageArgs:
+    """Dataclass for set_platform_fee_percentage arguments"""
+    fee_bps: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_platform_fee_percentage(uint64)void"
 
 
 class ContextRegistryParams:
@@ -100,40 +210,153 @@ class ContextRegistryParams:
 
     def create_context(
         self,
-        args: tuple[str, str, int] | CreateContextArgs,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | CreateContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_context(string,string,uint64)string",
+            "method": "create_context(string,string,uint64,pay)uint64",
             "args": method_args,
         }))
 
     def get_context_price(
         self,
-        args: tuple[str] | GetContextPriceArgs,
+        args: tuple[int, int, int] | GetContextPriceArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_context_price(string)uint64",
+            "method": "get_context_price(uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_context(
+        self,
+        args: tuple[int] | GetContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)",
+            "args": method_args,
+        }))
+
+    def get_contexts(
+        self,
+        args: tuple[list[int]] | GetContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]",
+            "args": method_args,
+        }))
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
             "args": method_args,
         }))
 
     def purchase_context(
         self,
-        args: tuple[str] | PurchaseContextArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "purchase_context(uint64,pay)void",
+            "args": method_args,
+        }))
+
+    def rate_context(
+        self,
+        args: tuple[int, int] | RateContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "rate_context(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_context_rating(
+        self,
+        args: tuple[int] | GetContextRatingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context_rating(uint64)(uint64,uint64,uint64[5])",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw()uint64",
+        }))
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_platform_fees()uint64",
+        }))
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_context(string)string",
+            "method": "get_balance(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_user_contexts(
+        self,
+        args: tuple[str, int, int] | GetUserContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])",
             "args": method_args,
         }))
 
@@ -148,6 +371,19 @@ class ContextRegistryParams:
             "method": "get_platform_fee_percentage()uint64",
         }))
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -165,40 +401,153 @@ class ContextRegistryCreateTransactionParams:
 
     def create_context(
         self,
-        args: tuple[str, str, int] | CreateContextArgs,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | CreateContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_context(string,string,uint64)string",
+            "method": "create_context(string,string,uint64,pay)uint64",
             "args": method_args,
         }))
 
     def get_context_price(
         self,
-        args: tuple[str] | GetContextPriceArgs,
+        args: tuple[int, int, int] | GetContextPriceArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_context_price(string)uint64",
+            "method": "get_context_price(uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def get_context(
+        self,
+        args: tuple[int] | GetContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)",
+            "args": method_args,
+        }))
+
+    def get_contexts(
+        self,
+        args: tuple[list[int]] | GetContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]",
+            "args": method_args,
+        }))
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
             "args": method_args,
         }))
 
     def purchase_context(
         self,
-        args: tuple[str] | PurchaseContextArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_context(string)string",
+            "method": "purchase_context(uint64,pay)void",
+            "args": method_args,
+        }))
+
+    def rate_context(
+        self,
+        args: tuple[int, int] | RateContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "rate_context(uint64,uint64)void",
+            "args": method_args,
+        }))
+
+    def get_context_rating(
+        self,
+        args: tuple[int] | GetContextRatingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context_rating(uint64)(uint64,uint64,uint64[5])",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw()uint64",
+        }))
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_platform_fees()uint64",
+        }))
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balance(address)uint64",
+            "args": method_args,
+        }))
+
+    def get_user_contexts(
+        self,
+        args: tuple[str, int, int] | GetUserContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])",
             "args": method_args,
         }))
 
@@ -208,45 +557,198 @@ class ContextRegistryCreateTransactionParams:
     ) -> algokit_utils.BuiltTransactions:
     
         params = params or algokit_utils.CommonAppCallParams()
-        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_platform_fee_percentage()uint64",
+        }))
+
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class ContextRegistrySend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_context(
+        self,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | CreateContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_context(string,string,uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_context_price(
+        self,
+        args: tuple[int, int, int] | GetContextPriceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context_price(uint64,uint64,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_context(
+        self,
+        args: tuple[int] | GetContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ContextRecord]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ContextRecord, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ContextRecord], parsed_response)
+
+    def get_contexts(
+        self,
+        args: tuple[list[int]] | GetContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[list[tuple[str, int, tuple[int, int, int, int, int, int, int, int, int, int, int, int], int, int, int, int, tuple[int, int, int, int, int], str, str]]]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[list[tuple[str, int, tuple[int, int, int, int, int, int, int, int, int, int, int, int], int, int, int, int, tuple[int, int, int, int, int], str, str]]], parsed_response)
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def purchase_context(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "purchase_context(uint64,pay)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def rate_context(
+        self,
+        args: tuple[int, int] | RateContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "rate_context(uint64,uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def get_context_rating(
+        self,
+        args: tuple[int] | GetContextRatingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[ContextRating]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_context_rating(uint64)(uint64,uint64,uint64[5])",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(ContextRating, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[ContextRating], parsed_response)
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_platform_fee_percentage()uint64",
-        }))
-
-    def clear_state(
-        self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
-
-
-class ContextRegistrySend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+            "method": "withdraw()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def create_context(
+    def withdraw_platform_fees(
         self,
-        args: tuple[str, str, int] | CreateContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
-        method_args = _parse_abi_args(args)
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_context(string,string,uint64)string",
-            "args": method_args,
+            "method": "withdraw_platform_fees()uint64",
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def get_context_price(
+    def get_balance(
         self,
-        args: tuple[str] | GetContextPriceArgs,
+        args: tuple[str] | GetBalanceArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
     ) -> algokit_utils.SendAppTransactionResult[int]:
@@ -254,27 +756,27 @@ class ContextRegistrySend:
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_context_price(string)uint64",
+            "method": "get_balance(address)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def purchase_context(
+    def get_user_contexts(
         self,
-        args: tuple[str] | PurchaseContextArgs,
+        args: tuple[str, int, int] | GetUserContextsArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[UserContextPage]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_context(string)string",
+            "method": "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])",
             "args": method_args,
         }), send_params=send_params)
-        parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(UserContextPage, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[UserContextPage], parsed_response)
 
     def get_platform_fee_percentage(
         self,
@@ -290,6 +792,22 @@ class ContextRegistrySend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -301,12 +819,185 @@ class ContextRegistrySend:
         )
 
 
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    admin: str
+    platform_fee: int
+    context_count: int
+    platform_balance: int
+
 class ContextRegistryState:
     """Methods to access state for the current ContextRegistry app"""
 
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def admin(self) -> str:
+        """Get the current value of the admin key in global_state state"""
+        value = self.app_client.state.global_state.get_value("admin")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def platform_fee(self) -> int:
+        """Get the current value of the platform_fee key in global_state state"""
+        value = self.app_client.state.global_state.get_value("platform_fee")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def context_count(self) -> int:
+        """Get the current value of the context_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("context_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def platform_balance(self) -> int:
+        """Get the current value of the platform_balance key in global_state state"""
+        value = self.app_client.state.global_state.get_value("platform_balance")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "ContextRecord": ContextRecord,
+            "UserContextPage": UserContextPage
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def contexts(self) -> "_MapState[int, ContextRecord]":
+        """Get values from the contexts map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "contexts",
+            self._struct_classes.get("ContextRecord")
+        )
+
+    @property
+    def purchases(self) -> "_MapState[bytes, int]":
+        """Get values from the purchases map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "purchases",
+            None
+        )
+
+    @property
+    def user_pages(self) -> "_MapState[bytes, UserContextPage]":
+        """Get values from the user_pages map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "user_pages",
+            self._struct_classes.get("UserContextPage")
+        )
+
+    @property
+    def balances(self) -> "_MapState[str, int]":
+        """Get values from the balances map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "balances",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class ContextRegistryClient:
     """Client for interacting with ContextRegistry smart contract"""
 
@@ -453,21 +1144,75 @@ class ContextRegistryClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_context(string,string,uint64)string"],
+        method: typing.Literal["create_context(string,string,uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_context_price(uint64,uint64,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ContextRecord | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> list[tuple[str, int, tuple[int, int, int, int, int, int, int, int, int, int, int, int], int, int, int, int, tuple[int, int, int, int, int], str, str]] | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["purchase_context(uint64,pay)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["rate_context(uint64,uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["get_context_rating(uint64)(uint64,uint64,uint64[5])"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> ContextRating | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_platform_fees()uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_context_price(string)uint64"],
+        method: typing.Literal["get_balance(address)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["purchase_context(string)string"],
+        method: typing.Literal["get_user_contexts(address,uint64,uint64)(uint64,uint64[64])"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> UserContextPage | None: ...
     @typing.overload
     def decode_return_value(
         self,
@@ -475,6 +1220,12 @@ class ContextRegistryClient:
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_platform_fee_percentage(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -485,7 +1236,7 @@ class ContextRegistryClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | str:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | ContextRating | ContextRecord | None | UserContextPage | int | list[tuple[str, int, tuple[int, int, int, int, int, int, int, int, int, int, int, int], int, int, int, int, tuple[int, int, int, int, int], str, str]]:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -607,109 +1358,287 @@ class ContextRegistryFactory(algokit_utils.TypedAppFactoryProtocol[ContextRegist
             )
         )
 
-    def get_app_client_by_id(
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> ContextRegistryClient:
+        """Get an app client by app ID"""
+        return ContextRegistryClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class ContextRegistryFactoryParams:
+    """Parameters for creating transactions for ContextRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = ContextRegistryFactoryCreateParams(app_factory)
+        self.update = ContextRegistryFactoryUpdateParams(app_factory)
+        self.delete = ContextRegistryFactoryDeleteParams(app_factory)
+
+class ContextRegistryFactoryCreateParams:
+    """Parameters for 'create' operations of ContextRegistry contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_context(
+        self,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | CreateContextArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_context(string,string,uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_context(string,string,uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_context_price(
+        self,
+        args: tuple[int, int, int] | GetContextPriceArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_context_price(uint64,uint64,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_context_price(uint64,uint64,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_context(
+        self,
+        args: tuple[int] | GetContextArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def get_contexts(
+        self,
+        args: tuple[list[int]] | GetContextsArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[] ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def purchase_context(
         self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> ContextRegistryClient:
-        """Get an app client by app ID"""
-        return ContextRegistryClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseContextArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the purchase_context(uint64,pay)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "purchase_context(uint64,pay)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
 
+    def rate_context(
+        self,
+        args: tuple[int, int] | RateContextArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the rate_context(uint64,uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "rate_context(uint64,uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-class ContextRegistryFactoryParams:
-    """Parameters for creating transactions for ContextRegistry contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-        self.create = ContextRegistryFactoryCreateParams(app_factory)
-        self.update = ContextRegistryFactoryUpdateParams(app_factory)
-        self.delete = ContextRegistryFactoryDeleteParams(app_factory)
-
-class ContextRegistryFactoryCreateParams:
-    """Parameters for 'create' operations of ContextRegistry contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    def get_context_rating(
+        self,
+        args: tuple[int] | GetContextRatingArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_context_rating(uint64)(uint64,uint64,uint64[5]) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_context_rating(uint64)(uint64,uint64,uint64[5])",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def bare(
+    def withdraw(
         self,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def create_context(
+    def withdraw_platform_fees(
         self,
-        args: tuple[str, str, int] | CreateContextArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_context(string,string,uint64)string ABI method"""
+        """Creates a new instance using the withdraw_platform_fees()uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_context(string,string,uint64)string",
-                "args": _parse_abi_args(args),
+                "method": "withdraw_platform_fees()uint64",
+                "args": None,
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_context_price(
+    def get_balance(
         self,
-        args: tuple[str] | GetContextPriceArgs,
+        args: tuple[str] | GetBalanceArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_context_price(string)uint64 ABI method"""
+        """Creates a new instance using the get_balance(address)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_context_price(string)uint64",
+                "method": "get_balance(address)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def purchase_context(
+    def get_user_contexts(
         self,
-        args: tuple[str] | PurchaseContextArgs,
+        args: tuple[str, int, int] | GetUserContextsArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the purchase_context(string)string ABI method"""
+        """Creates a new instance using the get_user_contexts(address,uint64,uint64)(uint64,uint64[64]) ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "purchase_context(string)string",
+                "method": "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -735,6 +1664,26 @@ class ContextRegistryFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_platform_fee_percentage(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_platform_fee_percentage(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class ContextRegistryFactoryUpdateParams:
     """Parameters for 'update' operations of ContextRegistry contract"""
 
@@ -838,7 +1787,7 @@ class ContextRegistryComposer:
 
     def create_context(
         self,
-        args: tuple[str, str, int] | CreateContextArgs,
+        args: tuple[str, str, int, algokit_utils.AppMethodCallTransactionArgument] | CreateContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ContextRegistryComposer":
         self._composer.add_app_call_method_call(
@@ -849,14 +1798,14 @@ class ContextRegistryComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_context(string,string,uint64)string", v
+                "create_context(string,string,uint64,pay)uint64", v
             )
         )
         return self
 
     def get_context_price(
         self,
-        args: tuple[str] | GetContextPriceArgs,
+        args: tuple[int, int, int] | GetContextPriceArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ContextRegistryComposer":
         self._composer.add_app_call_method_call(
@@ -867,14 +1816,68 @@ class ContextRegistryComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_context_price(string)uint64", v
+                "get_context_price(uint64,uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def get_context(
+        self,
+        args: tuple[int] | GetContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_context(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_context(uint64)(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)", v
+            )
+        )
+        return self
+
+    def get_contexts(
+        self,
+        args: tuple[list[int]] | GetContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_contexts(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_contexts(uint64[])(address,uint64,uint64[12],uint64,uint64,uint64,uint64,uint64[5],string,string)[]", v
+            )
+        )
+        return self
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_price_tiers(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void", v
             )
         )
         return self
 
     def purchase_context(
         self,
-        args: tuple[str] | PurchaseContextArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseContextArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "ContextRegistryComposer":
         self._composer.add_app_call_method_call(
@@ -885,7 +1888,113 @@ class ContextRegistryComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "purchase_context(string)string", v
+                "purchase_context(uint64,pay)void", v
+            )
+        )
+        return self
+
+    def rate_context(
+        self,
+        args: tuple[int, int] | RateContextArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.rate_context(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "rate_context(uint64,uint64)void", v
+            )
+        )
+        return self
+
+    def get_context_rating(
+        self,
+        args: tuple[int] | GetContextRatingArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_context_rating(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_context_rating(uint64)(uint64,uint64,uint64[5])", v
+            )
+        )
+        return self
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw()uint64", v
+            )
+        )
+        return self
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw_platform_fees(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw_platform_fees()uint64", v
+            )
+        )
+        return self
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_balance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_balance(address)uint64", v
+            )
+        )
+        return self
+
+    def get_user_contexts(
+        self,
+        args: tuple[str, int, int] | GetUserContextsArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_user_contexts(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_user_contexts(address,uint64,uint64)(uint64,uint64[64])", v
             )
         )
         return self
@@ -907,6 +2016,24 @@ class ContextRegistryComposer:
         )
         return self
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "ContextRegistryComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_platform_fee_percentage(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_platform_fee_percentage(uint64)void", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
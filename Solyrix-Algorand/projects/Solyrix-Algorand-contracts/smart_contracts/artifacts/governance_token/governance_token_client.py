@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "string", "name": "description"}], "name": "create_proposal", "returns": {"type": "string"}, "desc": "Create a new governance proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "proposal_id"}, {"type": "uint64", "name": "vote_for"}], "name": "vote_on_proposal", "returns": {"type": "string"}, "desc": "Vote on a governance proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "proposal_id"}], "name": "get_proposal_votes", "returns": {"type": "uint64"}, "desc": "Get total votes for a proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_supply", "returns": {"type": "uint64"}, "desc": "Get total token supply", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_min_proposal_tokens", "returns": {"type": "uint64"}, "desc": "Get minimum tokens required to create proposal", "events": [], "readonly": false, "recommendations": {}}], "name": "GovernanceToken", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABATEbQQCyggUEvfvetQSLa87cBNjcWm8ERpCTVQRF4RyMNhoAjgUAagBLADMAGwADgQBDMRkURDEYRIAMFR98dQAAAAAAACcQsCJDMRkURDEYRIAMFR98dQAAAAA7msoAsCJDMRkURDEYRIAMFR98dQAAAAAAAAPosCJDMRkURDEYRIATFR98dQANdm90ZV9yZWNvcmRlZLAiQzEZFEQxGESAEhUffHUADHByb3BfY3JlYXRlZLAiQzEZQP9zMRgURCJD", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for governance token and voting", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBHb3Zlcm5hbmNlVG9rZW4oQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMAogICAgcHVzaGJ5dGVzcyAweGJkZmJkZWI1IDB4OGI2YmNlZGMgMHhkOGRjNWE2ZiAweDQ2OTA5MzU1IDB4NDVlMTFjOGMgLy8gbWV0aG9kICJjcmVhdGVfcHJvcG9zYWwoc3RyaW5nLHN0cmluZylzdHJpbmciLCBtZXRob2QgInZvdGVfb25fcHJvcG9zYWwoc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF9wcm9wb3NhbF92b3RlcyhzdHJpbmcpdWludDY0IiwgbWV0aG9kICJnZXRfdG90YWxfc3VwcGx5KCl1aW50NjQiLCBtZXRob2QgImdldF9taW5fcHJvcG9zYWxfdG9rZW5zKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUAzIG1haW5fdm90ZV9vbl9wcm9wb3NhbF9yb3V0ZUA0IG1haW5fZ2V0X3Byb3Bvc2FsX3ZvdGVzX3JvdXRlQDUgbWFpbl9nZXRfdG90YWxfc3VwcGx5X3JvdXRlQDYgbWFpbl9nZXRfbWluX3Byb3Bvc2FsX3Rva2Vuc19yb3V0ZUA3CgptYWluX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBHb3Zlcm5hbmNlVG9rZW4oQVJDNENvbnRyYWN0KToKICAgIHB1c2hpbnQgMCAvLyAwCiAgICByZXR1cm4KCm1haW5fZ2V0X21pbl9wcm9wb3NhbF90b2tlbnNfcm91dGVANzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjM5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAyNzEwCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3RvdGFsX3N1cHBseV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMDAwMDAwM2I5YWNhMDAKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9nZXRfcHJvcG9zYWxfdm90ZXNfcm91dGVANToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjI5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwM2U4CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fdm90ZV9vbl9wcm9wb3NhbF9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MTkKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBwdXNoYnl0ZXMgMHgxNTFmN2M3NTAwMGQ3NjZmNzQ2NTVmNzI2NTYzNmY3MjY0NjU2NAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwYzcwNzI2ZjcwNWY2MzcyNjU2MTc0NjU2NAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2JhcmVfcm91dGluZ0AxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIEdvdmVybmFuY2VUb2tlbihBUkM0Q29udHJhY3QpOgogICAgdHhuIE9uQ29tcGxldGlvbgogICAgYm56IG1haW5fYWZ0ZXJfaWZfZWxzZUAxNAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgICEKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gY3JlYXRpbmcKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4K", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [57, 81, 105, 129, 160], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [195], "errorMessage": "can only call when creating"}, {"pc": [60, 84, 108, 132, 163], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "title"}, {"type": "string", "name": "description"}], "name": "create_proposal", "returns": {"type": "string"}, "desc": "Create a new governance proposal", "events": [{"args": [{"type": "address", "name": "proposer"}, {"type": "string", "name": "title"}], "name": "ProposalCreated", "desc": "ARC-28 event emitted when a proposal is created"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "proposal_id"}, {"type": "uint64", "name": "vote_for"}], "name": "vote_on_proposal", "returns": {"type": "string"}, "desc": "Vote on a governance proposal", "events": [{"args": [{"type": "string", "name": "proposal_id"}, {"type": "address", "name": "voter"}, {"type": "uint64", "name": "vote_for"}], "name": "VoteCast", "desc": "ARC-28 event emitted when a vote is recorded"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "proposal_id"}], "name": "get_proposal_votes", "returns": {"type": "uint64"}, "desc": "Get total votes for a proposal", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_total_supply", "returns": {"type": "uint64"}, "desc": "Get total token supply", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_min_proposal_tokens", "returns": {"type": "uint64"}, "desc": "Get minimum tokens required to create proposal", "events": [], "readonly": false, "recommendations": {}}], "name": "GovernanceToken", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABASYBBBUffHUxG0EAooIFBL373rUEi2vO3ATY3FpvBEaQk1UEReEcjDYaAI4FAGIASwAzABsAA4EAQzEZFEQxGESADBUffHUAAAAAAAAnELAiQzEZFEQxGESADBUffHUAAAAAO5rKALAiQzEZFEQxGESADBUffHUAAAAAAAAD6LAiQzEZFEQxGEQ2GgE2GgIXiABOKExQsCJDMRkURDEYRDYaATYaAogAEShMULAiQzEZQP+DMRgURCJDigIBMQCAAgAiUIv+UIAEcYt/tExQsIAOAAxwcm9wX2NyZWF0ZWSJigIBMQCL/xaAAgAqTwJQTFCL/lCABGUasdVMULCADwANdm90ZV9yZWNvcmRlZIk=", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for governance token and voting", "events": [{"args": [{"type": "address", "name": "proposer"}, {"type": "string", "name": "title"}], "name": "ProposalCreated", "desc": "ARC-28 event emitted when a proposal is created"}, {"args": [{"type": "string", "name": "proposal_id"}, {"type": "address", "name": "voter"}, {"type": "uint64", "name": "vote_for"}], "name": "VoteCast", "desc": "ARC-28 event emitted when a vote is recorded"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjE4CiAgICAvLyBjbGFzcyBHb3Zlcm5hbmNlVG9rZW4oQVJDNENvbnRyYWN0KToKICAgIHR4biBOdW1BcHBBcmdzCiAgICBieiBtYWluX2JhcmVfcm91dGluZ0AxMAogICAgcHVzaGJ5dGVzcyAweGJkZmJkZWI1IDB4OGI2YmNlZGMgMHhkOGRjNWE2ZiAweDQ2OTA5MzU1IDB4NDVlMTFjOGMgLy8gbWV0aG9kICJjcmVhdGVfcHJvcG9zYWwoc3RyaW5nLHN0cmluZylzdHJpbmciLCBtZXRob2QgInZvdGVfb25fcHJvcG9zYWwoc3RyaW5nLHVpbnQ2NClzdHJpbmciLCBtZXRob2QgImdldF9wcm9wb3NhbF92b3RlcyhzdHJpbmcpdWludDY0IiwgbWV0aG9kICJnZXRfdG90YWxfc3VwcGx5KCl1aW50NjQiLCBtZXRob2QgImdldF9taW5fcHJvcG9zYWxfdG9rZW5zKCl1aW50NjQiCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAwCiAgICBtYXRjaCBtYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUAzIG1haW5fdm90ZV9vbl9wcm9wb3NhbF9yb3V0ZUA0IG1haW5fZ2V0X3Byb3Bvc2FsX3ZvdGVzX3JvdXRlQDUgbWFpbl9nZXRfdG90YWxfc3VwcGx5X3JvdXRlQDYgbWFpbl9nZXRfbWluX3Byb3Bvc2FsX3Rva2Vuc19yb3V0ZUA3CgptYWluX2FmdGVyX2lmX2Vsc2VAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgR292ZXJuYW5jZVRva2VuKEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9taW5fcHJvcG9zYWxfdG9rZW5zX3JvdXRlQDc6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weTo1NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMjcxMAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF90b3RhbF9zdXBwbHlfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjUxCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDNiOWFjYTAwCiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3Byb3Bvc2FsX3ZvdGVzX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weTo0NgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDNlOAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX3ZvdGVfb25fcHJvcG9zYWxfcm91dGVANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjM0CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MTgKICAgIC8vIGNsYXNzIEdvdmVybmFuY2VUb2tlbihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MzQKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiB2b3RlX29uX3Byb3Bvc2FsCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2NyZWF0ZV9wcm9wb3NhbF9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MjEKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgR292ZXJuYW5jZVRva2VuKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weToyMQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICBjYWxsc3ViIGNyZWF0ZV9wcm9wb3NhbAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTA6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weToxOAogICAgLy8gY2xhc3MgR292ZXJuYW5jZVRva2VuKEFSQzRDb250cmFjdCk6CiAgICB0eG4gT25Db21wbGV0aW9uCiAgICBibnogbWFpbl9hZnRlcl9pZl9lbHNlQDE0CiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgIQogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBjcmVhdGluZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5nb3Zlcm5hbmNlX3Rva2VuLmNvbnRyYWN0LkdvdmVybmFuY2VUb2tlbi5jcmVhdGVfcHJvcG9zYWwodGl0bGU6IGJ5dGVzLCBkZXNjcmlwdGlvbjogYnl0ZXMpIC0+IGJ5dGVzOgpjcmVhdGVfcHJvcG9zYWw6CiAgICAvLyBzbWFydF9jb250cmFjdHMvZ292ZXJuYW5jZV90b2tlbi9jb250cmFjdC5weToyMS0yNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX3Byb3Bvc2FsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgdGl0bGU6IFN0cmluZywKICAgIC8vICAgICBkZXNjcmlwdGlvbjogU3RyaW5nCiAgICAvLyApIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MjkKICAgIC8vIGFyYzQuZW1pdChQcm9wb3NhbENyZWF0ZWQoYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCB0aXRsZSkpCiAgICB0eG4gU2VuZGVyCiAgICBwdXNoYnl0ZXMgMHgwMDIyCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMgogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg3MThiN2ZiNCAvLyBtZXRob2QgIlByb3Bvc2FsQ3JlYXRlZChhZGRyZXNzLHN0cmluZykiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6MzEtMzIKICAgIC8vICMgUmV0dXJuIGEgc2ltcGxlIHByb3Bvc2FsIElECiAgICAvLyByZXR1cm4gU3RyaW5nKCJwcm9wX2NyZWF0ZWQiKQogICAgcHVzaGJ5dGVzIDB4MDAwYzcwNzI2ZjcwNWY2MzcyNjU2MTc0NjU2NAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmdvdmVybmFuY2VfdG9rZW4uY29udHJhY3QuR292ZXJuYW5jZVRva2VuLnZvdGVfb25fcHJvcG9zYWwocHJvcG9zYWxfaWQ6IGJ5dGVzLCB2b3RlX2ZvcjogdWludDY0KSAtPiBieXRlczoKdm90ZV9vbl9wcm9wb3NhbDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjM0LTM5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiB2b3RlX29uX3Byb3Bvc2FsKAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgcHJvcG9zYWxfaWQ6IFN0cmluZywKICAgIC8vICAgICB2b3RlX2ZvcjogVUludDY0CiAgICAvLyApIC0+IFN0cmluZzoKICAgIHByb3RvIDIgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2dvdmVybmFuY2VfdG9rZW4vY29udHJhY3QucHk6NDIKICAgIC8vIGFyYzQuZW1pdChWb3RlQ2FzdChwcm9wb3NhbF9pZCwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NCh2b3RlX2ZvcikpKQogICAgdHhuIFNlbmRlcgogICAgZnJhbWVfZGlnIC0xCiAgICBpdG9iCiAgICBwdXNoYnl0ZXMgMHgwMDJhCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgLTIKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4NjUxYWIxZDUgLy8gbWV0aG9kICJWb3RlQ2FzdChzdHJpbmcsYWRkcmVzcyx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9nb3Zlcm5hbmNlX3Rva2VuL2NvbnRyYWN0LnB5OjQ0CiAgICAvLyByZXR1cm4gU3RyaW5nKCJ2b3RlX3JlY29yZGVkIikKICAgIHB1c2hieXRlcyAweDAwMGQ3NjZmNzQ2NTVmNzI2NTYzNmY3MjY0NjU2NAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [64, 88, 112, 136, 159], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [186], "errorMessage": "can only call when creating"}, {"pc": [67, 91, 115, 139, 162], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
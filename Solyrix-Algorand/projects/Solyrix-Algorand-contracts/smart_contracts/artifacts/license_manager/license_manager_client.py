@@ -19,7 +19,7 @@ from algosdk.v2client.models import SimulateTraceConfig
 import algokit_utils
 from algokit_utils import AlgorandClient as _AlgoKitAlgorandClient
 
-_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": [], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "context_id"}, {"type": "uint64", "name": "license_type"}, {"type": "uint64", "name": "price"}], "name": "create_license", "returns": {"type": "string"}, "desc": "Create a new license for a context", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "license_id"}], "name": "purchase_license", "returns": {"type": "string"}, "desc": "Purchase a license", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "string", "name": "license_id"}], "name": "get_license_price", "returns": {"type": "uint64"}, "desc": "Get license price - simplified implementation", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_platform_fee_percentage", "returns": {"type": "uint64"}, "desc": "Get platform fee percentage", "events": [], "readonly": false, "recommendations": {}}], "name": "LicenseManager", "state": {"keys": {"box": {}, "global": {}, "local": {}}, "maps": {"box": {}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 0, "ints": 0}, "local": {"bytes": 0, "ints": 0}}}, "structs": {}, "byteCode": {"approval": "CiABATEbQQCZggQEhGa4LgSirjakBIEKsiwE4pdJ+DYaAI4EAFYAMwAbAAOBAEMxGRREMRhEgAwVH3x1AAAAAAAAAPqwIkMxGRREMRhEgAwVH3x1AAAAAAAAC7iwIkMxGRREMRhEgBcVH3x1ABFsaWNlbnNlX3B1cmNoYXNlZLAiQzEZFEQxGEQ2GgE2GgIXNhoDF4gAFoAEFR98dUxQsCJDMRlA/4UxGBREIkOKAwGL/4HoBw9EgA0AC2xpY19jcmVhdGVkiQ==", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for license management", "events": [], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuYXBwcm92YWxfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIGludGNibG9jayAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIExpY2Vuc2VNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG4gTnVtQXBwQXJncwogICAgYnogbWFpbl9iYXJlX3JvdXRpbmdAOQogICAgcHVzaGJ5dGVzcyAweDg0NjZiODJlIDB4YTJhZTM2YTQgMHg4MTBhYjIyYyAweGUyOTc0OWY4IC8vIG1ldGhvZCAiY3JlYXRlX2xpY2Vuc2Uoc3RyaW5nLHVpbnQ2NCx1aW50NjQpc3RyaW5nIiwgbWV0aG9kICJwdXJjaGFzZV9saWNlbnNlKHN0cmluZylzdHJpbmciLCBtZXRob2QgImdldF9saWNlbnNlX3ByaWNlKHN0cmluZyl1aW50NjQiLCBtZXRob2QgImdldF9wbGF0Zm9ybV9mZWVfcGVyY2VudGFnZSgpdWludDY0IgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMAogICAgbWF0Y2ggbWFpbl9jcmVhdGVfbGljZW5zZV9yb3V0ZUAzIG1haW5fcHVyY2hhc2VfbGljZW5zZV9yb3V0ZUA0IG1haW5fZ2V0X2xpY2Vuc2VfcHJpY2Vfcm91dGVANSBtYWluX2dldF9wbGF0Zm9ybV9mZWVfcGVyY2VudGFnZV9yb3V0ZUA2CgptYWluX2FmdGVyX2lmX2Vsc2VAMTM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjUKICAgIC8vIGNsYXNzIExpY2Vuc2VNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICBwdXNoaW50IDAgLy8gMAogICAgcmV0dXJuCgptYWluX2dldF9wbGF0Zm9ybV9mZWVfcGVyY2VudGFnZV9yb3V0ZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAwMDAwMDAwMDAwMDBmYQogICAgbG9nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9saWNlbnNlX3ByaWNlX3JvdXRlQDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgcHVzaGJ5dGVzIDB4MTUxZjdjNzUwMDAwMDAwMDAwMDAwYmI4CiAgICBsb2cKICAgIGludGNfMCAvLyAxCiAgICByZXR1cm4KCm1haW5fcHVyY2hhc2VfbGljZW5zZV9yb3V0ZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1MDAxMTZjNjk2MzY1NmU3MzY1NWY3MDc1NzI2MzY4NjE3MzY1NjQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbGljZW5zZV9yb3V0ZUAzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo1CiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgY3JlYXRlX2xpY2Vuc2UKICAgIHB1c2hieXRlcyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18wIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAOToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6NQogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMTMKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICAhCiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIGNyZWF0aW5nCiAgICBpbnRjXzAgLy8gMQogICAgcmV0dXJuCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci5jcmVhdGVfbGljZW5zZShjb250ZXh0X2lkOiBieXRlcywgbGljZW5zZV90eXBlOiB1aW50NjQsIHByaWNlOiB1aW50NjQpIC0+IGJ5dGVzOgpjcmVhdGVfbGljZW5zZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6OC0xNAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2xpY2Vuc2UoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBjb250ZXh0X2lkOiBTdHJpbmcsCiAgICAvLyAgICAgbGljZW5zZV90eXBlOiBVSW50NjQsCiAgICAvLyAgICAgcHJpY2U6IFVJbnQ2NAogICAgLy8gKSAtPiBTdHJpbmc6CiAgICBwcm90byAzIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTctMTgKICAgIC8vICMgQmFzaWMgdmFsaWRhdGlvbgogICAgLy8gYXNzZXJ0IHByaWNlID49IFVJbnQ2NCgxMDAwKSwgIlByaWNlIHRvbyBsb3ciCiAgICBmcmFtZV9kaWcgLTEKICAgIHB1c2hpbnQgMTAwMCAvLyAxMDAwCiAgICA+PQogICAgYXNzZXJ0IC8vIFByaWNlIHRvbyBsb3cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjAtMjEKICAgIC8vICMgUmV0dXJuIGEgc2ltcGxlIGxpY2Vuc2UgSUQKICAgIC8vIHJldHVybiBTdHJpbmcoImxpY19jcmVhdGVkIikKICAgIHB1c2hieXRlcyAweDAwMGI2YzY5NjM1ZjYzNzI2NTYxNzQ2NTY0CiAgICByZXRzdWIK", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [50, 74, 98, 133], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [182], "errorMessage": "Price too low"}, {"pc": [170], "errorMessage": "can only call when creating"}, {"pc": [53, 77, 101, 136], "errorMessage": "can only call when not creating"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
+_APP_SPEC_JSON = r"""{"arcs": [22, 28], "bareActions": {"call": ["NoOp"], "create": ["NoOp"]}, "methods": [{"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "context_id"}, {"type": "uint64", "name": "license_type"}, {"type": "uint64", "name": "price"}, {"type": "uint64", "name": "duration"}, {"type": "uint64", "name": "usage_limit"}, {"type": "pay", "name": "payment"}], "name": "create_license", "returns": {"type": "uint64"}, "desc": "Create a new license for a context the caller created in the context\nregistry; `payment` covers the MBR of the offer box, and the ownership check is an inner call the caller pays for", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "uint64", "name": "context_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "license_type"}, {"type": "uint64", "name": "price"}], "name": "LicenseCreated", "desc": "ARC-28 event emitted when a license offer is created"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "pay", "name": "payment"}], "name": "purchase_license", "returns": {"type": "uint64"}, "desc": "Purchase a license; `payment` covers its price and the boxes it creates.\nReturns the expiry (0 = never)", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "buyer"}, {"type": "uint64", "name": "expiry"}], "name": "LicensePurchased", "desc": "ARC-28 event emitted when a license is purchased"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "pay", "name": "payment"}], "name": "renew_license", "returns": {"type": "uint64"}, "desc": "Extend a subscription by one period; usage counters are left untouched", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}, {"type": "uint64", "name": "expiry"}], "name": "LicenseRenewed", "desc": "ARC-28 event emitted when a subscription license is extended"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}, {"type": "uint64", "name": "uses"}], "name": "record_usage", "returns": {"type": "uint64"}, "desc": "Meter uses of a usage-based license; only the license creator may call this", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}, {"type": "uint64", "name": "usage_count"}], "name": "LicenseUsed", "desc": "ARC-28 event emitted when usage is metered against a license"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}], "name": "revoke_license", "returns": {"type": "void"}, "desc": "Remove a holder's grant once it has expired or used up its usage limit;\nonly the license creator may call this. Paid grants that are still valid cannot be revoked, so a buyer always gets what they paid for. The grant box's MBR goes back to the holder, who paid it; the caller covers the inner fee.", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}], "name": "LicenseRevoked", "desc": "ARC-28 event emitted when a creator revokes a holder's license"}], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}], "name": "check_license", "returns": {"type": "(bool,uint64,uint64,uint64)", "struct": "LicenseStatus"}, "desc": "Check whether holder may use a license; a single box read, meant for simulate", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw", "returns": {"type": "uint64"}, "desc": "Pay out the caller's accumulated earnings plus the MBR freed by deleting\ntheir balance box; the caller covers the inner fee. That MBR was paid by the buyer whose purchase opened the box and counts as part of the sale, so it goes to the creator; the next sale pays for a new box.", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "withdraw_platform_fees", "returns": {"type": "uint64"}, "desc": "Pay the platform's accumulated fees to the admin; admin only, covers the inner fee", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "address", "name": "creator"}], "name": "get_balance", "returns": {"type": "uint64"}, "desc": "Get a creator's earnings awaiting withdrawal", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "uint64", "name": "quantity"}], "name": "get_license_price", "returns": {"type": "uint64"}, "desc": "Get the price of `quantity` licenses after volume discounts", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "license_id"}, {"type": "uint64[4]", "name": "breakpoints"}, {"type": "uint64[4]", "name": "discounts"}, {"type": "uint64[4]", "name": "multipliers"}], "name": "set_price_tiers", "returns": {"type": "void"}, "desc": "Set quantity breakpoints, discounts (bps) and license-type multipliers (bps)", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "app_id"}], "name": "set_context_registry", "returns": {"type": "void"}, "desc": "Set the ContextRegistry app that create_license checks ownership against; admin only", "events": [], "readonly": false, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [], "name": "get_platform_fee_percentage", "returns": {"type": "uint64"}, "desc": "Get platform fee in basis points", "events": [], "readonly": true, "recommendations": {}}, {"actions": {"call": ["NoOp"], "create": []}, "args": [{"type": "uint64", "name": "fee_bps"}], "name": "set_platform_fee_percentage", "returns": {"type": "void"}, "desc": "Change the platform fee (basis points); admin only, applies to later sales", "events": [{"args": [{"type": "uint64", "name": "previous_fee_bps"}, {"type": "uint64", "name": "fee_bps"}], "name": "PlatformFeeUpdated", "desc": "ARC-28 event emitted when the admin changes the platform fee"}], "readonly": false, "recommendations": {}}], "name": "LicenseManager", "state": {"keys": {"box": {}, "global": {"admin": {"key": "YWRtaW4=", "keyType": "AVMString", "valueType": "address"}, "platform_fee": {"key": "cGxhdGZvcm1fZmVl", "keyType": "AVMString", "valueType": "AVMUint64"}, "license_count": {"key": "bGljZW5zZV9jb3VudA==", "keyType": "AVMString", "valueType": "AVMUint64"}, "platform_balance": {"key": "cGxhdGZvcm1fYmFsYW5jZQ==", "keyType": "AVMString", "valueType": "AVMUint64"}, "context_registry": {"key": "Y29udGV4dF9yZWdpc3RyeQ==", "keyType": "AVMString", "valueType": "AVMUint64"}}, "local": {}}, "maps": {"box": {"licenses": {"keyType": "uint64", "valueType": "LicenseOffer", "prefix": "bGljXw=="}, "grants": {"keyType": "AVMBytes", "valueType": "LicenseGrant", "prefix": "aGxkXw=="}, "balances": {"keyType": "address", "valueType": "uint64", "prefix": "YmFsXw=="}}, "global": {}, "local": {}}, "schema": {"global": {"bytes": 1, "ints": 4}, "local": {"bytes": 0, "ints": 0}}}, "structs": {"LicenseGrant": [{"name": "expiry", "type": "uint64"}, {"name": "usage_count", "type": "uint64"}, {"name": "usage_limit", "type": "uint64"}], "LicenseOffer": [{"name": "context_id", "type": "uint64"}, {"name": "creator", "type": "address"}, {"name": "license_type", "type": "uint64"}, {"name": "price", "type": "uint64"}, {"name": "pricing", "type": "uint64[12]"}, {"name": "duration", "type": "uint64"}, {"name": "usage_limit", "type": "uint64"}], "LicenseStatus": [{"name": "valid", "type": "bool"}, {"name": "expiry", "type": "uint64"}, {"name": "usage_count", "type": "uint64"}, {"name": "usage_limit", "type": "uint64"}]}, "byteCode": {"approval": "CiAHAAEIBJBOmAH///////////8BJgoEFR98dRBwbGF0Zm9ybV9iYWxhbmNlBGxpY18ABWFkbWluDHBsYXRmb3JtX2ZlZQRobGRfBGJhbF8NbGljZW5zZV9jb3VudBBjb250ZXh0X3JlZ2lzdHJ5MRhAABYnBDIJZycFgfoBZycIImcpImcnCSJnMRtBAbeCDgQqHyMnBF7dkxME/eIYyAQZ20gZBEoPfyEEnMCdbwQ6OV8rBDqz5MwE5dCvHwRGfJJQBM+uKJkEj9QnwwTil0n4BCGRNIU2GgCODgEfAQAA4QDFALIAmwCKAHkAZQBMADMAIwASAAIiQzEZFEQxGEQ2GgEXiAYEI0MxGRREMRhEiAXyFihMULAjQzEZFEQxGEQ2GgEXiAXLI0MxGRREMRhENhoBFzYaAjYaAzYaBIgE5iNDMRkURDEYRDYaARc2GgIXiATHFihMULAjQzEZFEQxGEQ2GgGIBKIWKExQsCNDMRkURDEYRIgEaxYoTFCwI0MxGRREMRhEiAQnFihMULAjQzEZFEQxGEQ2GgEXNhoCiAN/KExQsCNDMRkURDEYRDYaARc2GgKIAvEjQzEZFEQxGEQ2GgEXNhoCNhoDF4gCgxYoTFCwI0MxGRREMRhENhoBFzEWIwlJOBAjEkSIAfQWKExQsCNDMRkURDEYRDYaARcxFiMJSTgQIxJEiAFdFihMULAjQzEZFEQxGEQ2GgEXNhoCFzYaAxc2GgQXNhoFFzEWIwlJOBAjEkSIAHIWKExQsCNDMRlA/q0jQ4oAASuBYK8iiwIlDEEAIYsCSYEMDERJJAuLAUyACP//////////XYwBIwiMAkL/2CKMAIsAJQxBACUkiwBJTgIISYEMDEQkC4sBTIAIAAAAAAAAJxBdjAEjCIwAQv/UiwGMAImKBgGL/IHoBw9Ei/uBAw5Ei/sjEkEAA4v9RIv7gQISQQADi/5EIicJZURJRLGL+hZMshiABK+ZvaWyGkmyGoEGshAisgGztD5JVwAEKBJEVwQgMQASRDIKcwFEIicIZUQjCCcISwFnMQCL+xaL/BaI/yqL/RaL/hZLCE8GUEsFUEsEUE8DUE8CUExQSwMWKksBUE8CvyIpZUSL/yJPB4gD5ggpTGcxAExPBVBMUE8CUExQgATaMSL8TFCwiYoCAYv+FkkqSwFQvkxJTgNOA0QxAFAnBkxQSU4CvUUBFEQyCnMBTE4CRCJMIQVbSUEABzIHiwUIjASLBEkWiwFJTgJXoAhLAYAIAAAAAAAAAABQTFCLAky/i/5PAov/iwOIBAlIiwAxAFBMUIAE/fHc00xQsIwAiYoCAYv+FkkqSwFQvkRJIQVbRDEATwJMUDIKcwFEi/5PA4v/TwOIA81MJwZMUEm+TElPAkQiW0kyBwxBAAQyB4wEiwEhBVuLBAgWiwNMXACLAksBvzEASwFXAAiLAE8CUExQgAQuaTBdTFCwIluMAImKAwGL/RYqSwFQvkRXCCAxABJEi/5QSScGTFBJvkxJTwJESSRbi/8ITIEQW0lBAAaLA4sEDkSLA0kWiwJMXAiLAUsBv1cICIsATFCABIsJMsBMULCMAImKAgCL/hZJKkxQvkRXCCAxABJEi/6L/4gAXUlXAQgrqUAACosBVxEIK6lBAEYjRIsBIlOAAQAiTwJUIlMURIsAi/9QJwZLAVBJvUUBRDIKcwFETLxIsTIKcwFECbIIi/+yByOyECKyAbOABM1xgStMULCJIkL/t4oCASIrSYv+FicGTFCL/1C+SU8CTEAABYEYr4wEiwNJjAJBAEWLBCJbSYwBiwOMAkEAD4sBMgcOiwOMAkEAAyKMAosCSYwDiwRJVxAIjACBEFtMjAJBABKLBFcICIsAp4sDjAJBAAMijAKLAoABACJPAlSLBElXAAhLAVcICE8CVxAITwNPA1BPAlBMUIwAiScHMQBQvkwXIkxPAk1JRDIKcwFEJwcxAFC8SDIKcwFECQixMQBLAbIIsgcjshAisgGziTEAIicEZUQSRCIpZURJRCkiZ7EiJwRlREsBsgiyByOyECKyAbOJigEBJweL/1C+TBciTE8CTYmKAgGL/ov/iAE0iYoEACtHAov8FipMUEm+TElPAkRXCCAxABJEiPwIIkcCiwglDEEAZYsIJAtJjAGL/UxbSYwAQQBNiwZJIQYTRIsASU8CDUSL/osBW0mLBw9ESSEEDkSMB4wGiwYWiwhJTgKBDAxEiwWLAU8CXYsHFiVLAwhJgQwMRCQLTF2MBSMIjAhC/5shBowGQv/NIowCiwIlDEEAK4sCSSQLi/9LASRYi/9PAltEJEsCCEmBDAxEJAuLBUxPAl2MBSMIjAJC/86LBIsFXDiLA0y/iYoBADEAIicEZUQSRCcJi/9niSInBWVEiYoBADEAIicEZUQSRIv/gegHDkQiJwVlRBaL/xZQgAQkq8nATFCwJwWL/2eJigMBi/04BzIKEkQyCnMBRIv/CYv9OAiL/ksCCEsBDkRMCYmKAgGL/hYqTFCDAihwuklXCABMIltJJQxEIkcCiwQlDEEAOCWLBElOAggkCyQIiwBJTwJbSwIkCyQITwJMW0sBiwMJi/9PAg8iTgJNiwIIjAJMIwiMBIwDQv/BJIsBCCQLJAiLAElPAltMIluL/wsLIQQKIQSLAgkLIQQKjACJigQBK4v8I4j/d0mL/VcIICInBWVESwILIQQKTwJMCUlOAicHTwJQSU4CvkwXIkxPAk1MQQAHiwQWiwNMv4v+iwGL/4j/GIwAiwJBAAqLBIsCCBaLA0y/IillRIsAiwIJCClMZ4v9jACJ", "clear": "CoEBQw=="}, "desc": "Minimal production-ready smart contract for license management", "events": [{"args": [{"type": "uint64", "name": "license_id"}, {"type": "uint64", "name": "context_id"}, {"type": "address", "name": "creator"}, {"type": "uint64", "name": "license_type"}, {"type": "uint64", "name": "price"}], "name": "LicenseCreated", "desc": "ARC-28 event emitted when a license offer is created"}, {"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "buyer"}, {"type": "uint64", "name": "expiry"}], "name": "LicensePurchased", "desc": "ARC-28 event emitted when a license is purchased"}, {"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}, {"type": "uint64", "name": "expiry"}], "name": "LicenseRenewed", "desc": "ARC-28 event emitted when a subscription license is extended"}, {"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}, {"type": "uint64", "name": "usage_count"}], "name": "LicenseUsed", "desc": "ARC-28 event emitted when usage is metered against a license"}, {"args": [{"type": "uint64", "name": "license_id"}, {"type": "address", "name": "holder"}], "name": "LicenseRevoked", "desc": "ARC-28 event emitted when a creator revokes a holder's license"}, {"args": [{"type": "uint64", "name": "previous_fee_bps"}, {"type": "uint64", "name": "fee_bps"}], "name": "PlatformFeeUpdated", "desc": "ARC-28 event emitted when the admin changes the platform fee"}], "networks": {}, "source": {"approval": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLl9fYWxnb3B5X2VudHJ5cG9pbnRfd2l0aF9pbml0KCkgLT4gdWludDY0OgptYWluOgogICAgaW50Y2Jsb2NrIDAgMSA4IDQgMTAwMDAgMTUyIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBieXRlY2Jsb2NrIDB4MTUxZjdjNzUgInBsYXRmb3JtX2JhbGFuY2UiIDB4NmM2OTYzNWYgMHggImFkbWluIiAicGxhdGZvcm1fZmVlIiAweDY4NmM2NDVmIDB4NjI2MTZjNWYgImxpY2Vuc2VfY291bnQiICJjb250ZXh0X3JlZ2lzdHJ5IgogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTQKICAgIC8vIHNlbGYuYWRtaW4gPSBHbG9iYWwuY3JlYXRvcl9hZGRyZXNzCiAgICBieXRlYyA0IC8vICJhZG1pbiIKICAgIGdsb2JhbCBDcmVhdG9yQWRkcmVzcwogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTE1CiAgICAvLyBzZWxmLnBsYXRmb3JtX2ZlZSA9IFVJbnQ2NChERUZBVUxUX1BMQVRGT1JNX0ZFRV9QRVJDRU5UQUdFKQogICAgYnl0ZWMgNSAvLyAicGxhdGZvcm1fZmVlIgogICAgcHVzaGludCAyNTAgLy8gMjUwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTYKICAgIC8vIHNlbGYubGljZW5zZV9jb3VudCA9IFVJbnQ2NCgwKQogICAgYnl0ZWMgOCAvLyAibGljZW5zZV9jb3VudCIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTctMTE4CiAgICAvLyAjIFBsYXRmb3JtIGZlZXMgKGFuZCBvdmVycGF5bWVudHMpIGF3YWl0aW5nIHdpdGhkcmF3X3BsYXRmb3JtX2ZlZXMKICAgIC8vIHNlbGYucGxhdGZvcm1fYmFsYW5jZSA9IFVJbnQ2NCgwKQogICAgYnl0ZWNfMSAvLyAicGxhdGZvcm1fYmFsYW5jZSIKICAgIGludGNfMCAvLyAwCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTktMTIwCiAgICAvLyAjIENvbnRleHRSZWdpc3RyeSBhcHAgd2hvc2UgY29udGV4dHMgbGljZW5zZXMgYXJlIG9mZmVyZWQgZm9yOyAwIHVudGlsIHNldAogICAgLy8gc2VsZi5jb250ZXh0X3JlZ2lzdHJ5ID0gVUludDY0KDApCiAgICBieXRlYyA5IC8vICJjb250ZXh0X3JlZ2lzdHJ5IgogICAgaW50Y18wIC8vIDAKICAgIGFwcF9nbG9iYWxfcHV0CgptYWluX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuIE51bUFwcEFyZ3MKICAgIGJ6IG1haW5fYmFyZV9yb3V0aW5nQDE5CiAgICBwdXNoYnl0ZXNzIDB4MmExZjIzMjcgMHg1ZWRkOTMxMyAweGZkZTIxOGM4IDB4MTlkYjQ4MTkgMHg0YTBmN2YyMSAweDljYzA5ZDZmIDB4M2EzOTVmMmIgMHgzYWIzZTRjYyAweGU1ZDBhZjFmIDB4NDY3YzkyNTAgMHhjZmFlMjg5OSAweDhmZDQyN2MzIDB4ZTI5NzQ5ZjggMHgyMTkxMzQ4NSAvLyBtZXRob2QgImNyZWF0ZV9saWNlbnNlKHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAicHVyY2hhc2VfbGljZW5zZSh1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAicmVuZXdfbGljZW5zZSh1aW50NjQscGF5KXVpbnQ2NCIsIG1ldGhvZCAicmVjb3JkX3VzYWdlKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCl1aW50NjQiLCBtZXRob2QgInJldm9rZV9saWNlbnNlKHVpbnQ2NCxhZGRyZXNzKXZvaWQiLCBtZXRob2QgImNoZWNrX2xpY2Vuc2UodWludDY0LGFkZHJlc3MpKGJvb2wsdWludDY0LHVpbnQ2NCx1aW50NjQpIiwgbWV0aG9kICJ3aXRoZHJhdygpdWludDY0IiwgbWV0aG9kICJ3aXRoZHJhd19wbGF0Zm9ybV9mZWVzKCl1aW50NjQiLCBtZXRob2QgImdldF9iYWxhbmNlKGFkZHJlc3MpdWludDY0IiwgbWV0aG9kICJnZXRfbGljZW5zZV9wcmljZSh1aW50NjQsdWludDY0KXVpbnQ2NCIsIG1ldGhvZCAic2V0X3ByaWNlX3RpZXJzKHVpbnQ2NCx1aW50NjRbNF0sdWludDY0WzRdLHVpbnQ2NFs0XSl2b2lkIiwgbWV0aG9kICJzZXRfY29udGV4dF9yZWdpc3RyeSh1aW50NjQpdm9pZCIsIG1ldGhvZCAiZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKCl1aW50NjQiLCBtZXRob2QgInNldF9wbGF0Zm9ybV9mZWVfcGVyY2VudGFnZSh1aW50NjQpdm9pZCIKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDAKICAgIG1hdGNoIG1haW5fY3JlYXRlX2xpY2Vuc2Vfcm91dGVANSBtYWluX3B1cmNoYXNlX2xpY2Vuc2Vfcm91dGVANiBtYWluX3JlbmV3X2xpY2Vuc2Vfcm91dGVANyBtYWluX3JlY29yZF91c2FnZV9yb3V0ZUA4IG1haW5fcmV2b2tlX2xpY2Vuc2Vfcm91dGVAOSBtYWluX2NoZWNrX2xpY2Vuc2Vfcm91dGVAMTAgbWFpbl93aXRoZHJhd19yb3V0ZUAxMSBtYWluX3dpdGhkcmF3X3BsYXRmb3JtX2ZlZXNfcm91dGVAMTIgbWFpbl9nZXRfYmFsYW5jZV9yb3V0ZUAxMyBtYWluX2dldF9saWNlbnNlX3ByaWNlX3JvdXRlQDE0IG1haW5fc2V0X3ByaWNlX3RpZXJzX3JvdXRlQDE1IG1haW5fc2V0X2NvbnRleHRfcmVnaXN0cnlfcm91dGVAMTYgbWFpbl9nZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVAMTcgbWFpbl9zZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVAMTgKCm1haW5fYWZ0ZXJfaWZfZWxzZUAyMToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgaW50Y18wIC8vIDAKICAgIHJldHVybgoKbWFpbl9zZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Vfcm91dGVAMTg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM1OAogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNTgKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2UKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlX3JvdXRlQDE3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNTMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgY2FsbHN1YiBnZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2UKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fc2V0X2NvbnRleHRfcmVnaXN0cnlfcm91dGVAMTY6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM0NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNDcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfY29udGV4dF9yZWdpc3RyeQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9zZXRfcHJpY2VfdGllcnNfcm91dGVAMTU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMzMwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgNAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMzMKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBzZXRfcHJpY2VfdGllcnMKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fZ2V0X2xpY2Vuc2VfcHJpY2Vfcm91dGVAMTQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMyOAogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjExMAogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzI4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICBjYWxsc3ViIGdldF9saWNlbnNlX3ByaWNlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX2dldF9iYWxhbmNlX3JvdXRlQDEzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMjMKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTAKICAgIC8vIGNsYXNzIExpY2Vuc2VNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMyMwogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgY2FsbHN1YiBnZXRfYmFsYW5jZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl93aXRoZHJhd19wbGF0Zm9ybV9mZWVzX3JvdXRlQDEyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMTMKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICBjYWxsc3ViIHdpdGhkcmF3X3BsYXRmb3JtX2ZlZXMKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fd2l0aGRyYXdfcm91dGVAMTE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI5NwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIGNhbGxzdWIgd2l0aGRyYXcKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fY2hlY2tfbGljZW5zZV9yb3V0ZUAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mjc3CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNzcKICAgIC8vIEBhYmltZXRob2QocmVhZG9ubHk9VHJ1ZSkKICAgIGNhbGxzdWIgY2hlY2tfbGljZW5zZQogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9yZXZva2VfbGljZW5zZV9yb3V0ZUA5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjExMAogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjUyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcmV2b2tlX2xpY2Vuc2UKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVjb3JkX3VzYWdlX3JvdXRlQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIzNQogICAgLy8gQGFiaW1ldGhvZCgpCiAgICB0eG4gT25Db21wbGV0aW9uCiAgICAhCiAgICBhc3NlcnQgLy8gT25Db21wbGV0aW9uIGlzIG5vdCBOb09wCiAgICB0eG4gQXBwbGljYXRpb25JRAogICAgYXNzZXJ0IC8vIGNhbiBvbmx5IGNhbGwgd2hlbiBub3QgY3JlYXRpbmcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTEwCiAgICAvLyBjbGFzcyBMaWNlbnNlTWFuYWdlcihBUkM0Q29udHJhY3QpOgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMQogICAgYnRvaQogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMgogICAgdHhuYSBBcHBsaWNhdGlvbkFyZ3MgMwogICAgYnRvaQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMzUKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZWNvcmRfdXNhZ2UKICAgIGl0b2IKICAgIGJ5dGVjXzAgLy8gMHgxNTFmN2M3NQogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIGludGNfMSAvLyAxCiAgICByZXR1cm4KCm1haW5fcmVuZXdfbGljZW5zZV9yb3V0ZUA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjExMAogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMTIKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiByZW5ld19saWNlbnNlCiAgICBpdG9iCiAgICBieXRlY18wIC8vIDB4MTUxZjdjNzUKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICBpbnRjXzEgLy8gMQogICAgcmV0dXJuCgptYWluX3B1cmNoYXNlX2xpY2Vuc2Vfcm91dGVANjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTgyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIHR4biBPbkNvbXBsZXRpb24KICAgICEKICAgIGFzc2VydCAvLyBPbkNvbXBsZXRpb24gaXMgbm90IE5vT3AKICAgIHR4biBBcHBsaWNhdGlvbklECiAgICBhc3NlcnQgLy8gY2FuIG9ubHkgY2FsbCB3aGVuIG5vdCBjcmVhdGluZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMTAKICAgIC8vIGNsYXNzIExpY2Vuc2VNYW5hZ2VyKEFSQzRDb250cmFjdCk6CiAgICB0eG5hIEFwcGxpY2F0aW9uQXJncyAxCiAgICBidG9pCiAgICB0eG4gR3JvdXBJbmRleAogICAgaW50Y18xIC8vIDEKICAgIC0KICAgIGR1cAogICAgZ3R4bnMgVHlwZUVudW0KICAgIGludGNfMSAvLyBwYXkKICAgID09CiAgICBhc3NlcnQgLy8gdHJhbnNhY3Rpb24gdHlwZSBpcyBwYXkKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTgyCiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIGNhbGxzdWIgcHVyY2hhc2VfbGljZW5zZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9jcmVhdGVfbGljZW5zZV9yb3V0ZUA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMjcKICAgIC8vIEBhYmltZXRob2QoKQogICAgdHhuIE9uQ29tcGxldGlvbgogICAgIQogICAgYXNzZXJ0IC8vIE9uQ29tcGxldGlvbiBpcyBub3QgTm9PcAogICAgdHhuIEFwcGxpY2F0aW9uSUQKICAgIGFzc2VydCAvLyBjYW4gb25seSBjYWxsIHdoZW4gbm90IGNyZWF0aW5nCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjExMAogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDEKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDIKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDMKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDQKICAgIGJ0b2kKICAgIHR4bmEgQXBwbGljYXRpb25BcmdzIDUKICAgIGJ0b2kKICAgIHR4biBHcm91cEluZGV4CiAgICBpbnRjXzEgLy8gMQogICAgLQogICAgZHVwCiAgICBndHhucyBUeXBlRW51bQogICAgaW50Y18xIC8vIHBheQogICAgPT0KICAgIGFzc2VydCAvLyB0cmFuc2FjdGlvbiB0eXBlIGlzIHBheQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxMjcKICAgIC8vIEBhYmltZXRob2QoKQogICAgY2FsbHN1YiBjcmVhdGVfbGljZW5zZQogICAgaXRvYgogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKbWFpbl9iYXJlX3JvdXRpbmdAMTk6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjExMAogICAgLy8gY2xhc3MgTGljZW5zZU1hbmFnZXIoQVJDNENvbnRyYWN0KToKICAgIHR4biBPbkNvbXBsZXRpb24KICAgIGJueiBtYWluX2FmdGVyX2lmX2Vsc2VAMjEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzY2CiAgICAvLyBAYXJjNC5iYXJlbWV0aG9kKGFsbG93X2FjdGlvbnM9WyJOb09wIl0sIGNyZWF0ZT0iYWxsb3ciKQogICAgaW50Y18xIC8vIDEKICAgIHJldHVybgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy51dGlscy5oZWxwZXJzLmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKSAtPiBieXRlczoKZGVmYXVsdF9wcmljZV9zY2hlZHVsZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjQ5LTUwCiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKSAtPiBQcmljZVNjaGVkdWxlOgogICAgcHJvdG8gMCAxCiAgICBieXRlY18zIC8vICIiCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1MgogICAgLy8gc2NoZWR1bGUgPSBQcmljZVNjaGVkdWxlLmZyb21fYnl0ZXMob3AuYnplcm8oKFBSSUNFX1RJRVJTICogMiArIExJQ0VOU0VfVFlQRVMpICogOCkpCiAgICBwdXNoaW50IDk2IC8vIDk2CiAgICBiemVybwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTMKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBpbnRjXzAgLy8gMAoKZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9mb3JfaGVhZGVyQDE6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1MwogICAgLy8gZm9yIHRpZXIgaW4gdXJhbmdlKFBSSUNFX1RJRVJTKToKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzMgLy8gNAogICAgPAogICAgYnogZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTQKICAgIC8vIHNjaGVkdWxlW3RpZXJdID0gYXJjNC5VSW50NjQoTk9fQlJFQUtQT0lOVCkKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZHVwCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHB1c2hieXRlcyAweGZmZmZmZmZmZmZmZmZmZmYKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjUzCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgYiBkZWZhdWx0X3ByaWNlX3NjaGVkdWxlX2Zvcl9oZWFkZXJAMQoKZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjU1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDAKCmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfZm9yX2hlYWRlckA1OgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NTUKICAgIC8vIGZvciBsaWNlbnNlX3R5cGUgaW4gdXJhbmdlKExJQ0VOU0VfVFlQRVMpOgogICAgZnJhbWVfZGlnIDAKICAgIGludGNfMyAvLyA0CiAgICA8CiAgICBieiBkZWZhdWx0X3ByaWNlX3NjaGVkdWxlX2FmdGVyX2ZvckA4CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1NgogICAgLy8gc2NoZWR1bGVbUFJJQ0VfVElFUlMgKiAyICsgbGljZW5zZV90eXBlXSA9IGFyYzQuVUludDY0KDEwMDAwKQogICAgaW50Y18yIC8vIDgKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIGNvdmVyIDIKICAgICsKICAgIGR1cAogICAgcHVzaGludCAxMiAvLyAxMgogICAgPAogICAgYXNzZXJ0IC8vIEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZnJhbWVfZGlnIDEKICAgIHN3YXAKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDI3MTAKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjU1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDAKICAgIGIgZGVmYXVsdF9wcmljZV9zY2hlZHVsZV9mb3JfaGVhZGVyQDUKCmRlZmF1bHRfcHJpY2Vfc2NoZWR1bGVfYWZ0ZXJfZm9yQDg6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo1NwogICAgLy8gcmV0dXJuIHNjaGVkdWxlCiAgICBmcmFtZV9kaWcgMQogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLmNyZWF0ZV9saWNlbnNlKGNvbnRleHRfaWQ6IHVpbnQ2NCwgbGljZW5zZV90eXBlOiB1aW50NjQsIHByaWNlOiB1aW50NjQsIGR1cmF0aW9uOiB1aW50NjQsIHVzYWdlX2xpbWl0OiB1aW50NjQsIHBheW1lbnQ6IHVpbnQ2NCkgLT4gdWludDY0OgpjcmVhdGVfbGljZW5zZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTI3LTEzNgogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgY3JlYXRlX2xpY2Vuc2UoCiAgICAvLyAgICAgc2VsZiwKICAgIC8vICAgICBjb250ZXh0X2lkOiBVSW50NjQsCiAgICAvLyAgICAgbGljZW5zZV90eXBlOiBVSW50NjQsCiAgICAvLyAgICAgcHJpY2U6IFVJbnQ2NCwKICAgIC8vICAgICBkdXJhdGlvbjogVUludDY0LAogICAgLy8gICAgIHVzYWdlX2xpbWl0OiBVSW50NjQsCiAgICAvLyAgICAgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDYgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNDMtMTQ0CiAgICAvLyAjIEJhc2ljIHZhbGlkYXRpb24KICAgIC8vIGFzc2VydCBwcmljZSA+PSBNSU5fUFJJQ0UsICJQcmljZSB0b28gbG93IgogICAgZnJhbWVfZGlnIC00CiAgICBwdXNoaW50IDEwMDAgLy8gMTAwMAogICAgPj0KICAgIGFzc2VydCAvLyBQcmljZSB0b28gbG93CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0NQogICAgLy8gYXNzZXJ0IGxpY2Vuc2VfdHlwZSA8PSBMSUNFTlNFX0NPTU1FUkNJQUwsICJVbmtub3duIGxpY2Vuc2UgdHlwZSIKICAgIGZyYW1lX2RpZyAtNQogICAgcHVzaGludCAzIC8vIDMKICAgIDw9CiAgICBhc3NlcnQgLy8gVW5rbm93biBsaWNlbnNlIHR5cGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTQ2CiAgICAvLyBpZiBsaWNlbnNlX3R5cGUgPT0gTElDRU5TRV9TVUJTQ1JJUFRJT046CiAgICBmcmFtZV9kaWcgLTUKICAgIGludGNfMSAvLyAxCiAgICA9PQogICAgYnogY3JlYXRlX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE0NwogICAgLy8gYXNzZXJ0IGR1cmF0aW9uID4gMCwgIlN1YnNjcmlwdGlvbiBuZWVkcyBhIGR1cmF0aW9uIgogICAgZnJhbWVfZGlnIC0zCiAgICBhc3NlcnQgLy8gU3Vic2NyaXB0aW9uIG5lZWRzIGEgZHVyYXRpb24KCmNyZWF0ZV9saWNlbnNlX2FmdGVyX2lmX2Vsc2VAMjoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTQ4CiAgICAvLyBpZiBsaWNlbnNlX3R5cGUgPT0gTElDRU5TRV9VU0FHRV9CQVNFRDoKICAgIGZyYW1lX2RpZyAtNQogICAgcHVzaGludCAyIC8vIDIKICAgID09CiAgICBieiBjcmVhdGVfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTQ5CiAgICAvLyBhc3NlcnQgdXNhZ2VfbGltaXQgPiAwLCAiVXNhZ2UtYmFzZWQgbGljZW5zZSBuZWVkcyBhIGxpbWl0IgogICAgZnJhbWVfZGlnIC0yCiAgICBhc3NlcnQgLy8gVXNhZ2UtYmFzZWQgbGljZW5zZSBuZWVkcyBhIGxpbWl0CgpjcmVhdGVfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDQ6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1MAogICAgLy8gYXNzZXJ0IHNlbGYuY29udGV4dF9yZWdpc3RyeSwgIkNvbnRleHQgcmVnaXN0cnkgbm90IHNldCIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA5IC8vICJjb250ZXh0X3JlZ2lzdHJ5IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmNvbnRleHRfcmVnaXN0cnkgZXhpc3RzCiAgICBkdXAKICAgIGFzc2VydCAvLyBDb250ZXh0IHJlZ2lzdHJ5IG5vdCBzZXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTUxLTE1MwogICAgLy8gcmVjb3JkLCBfY2FsbCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgQ29udGV4dFJlZ2lzdHJ5LmdldF9jb250ZXh0LCBjb250ZXh0X2lkLCBhcHBfaWQ9c2VsZi5jb250ZXh0X3JlZ2lzdHJ5LCBmZWU9MAogICAgLy8gKQogICAgaXR4bl9iZWdpbgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNTIKICAgIC8vIENvbnRleHRSZWdpc3RyeS5nZXRfY29udGV4dCwgY29udGV4dF9pZCwgYXBwX2lkPXNlbGYuY29udGV4dF9yZWdpc3RyeSwgZmVlPTAKICAgIGZyYW1lX2RpZyAtNgogICAgaXRvYgogICAgc3dhcAogICAgaXR4bl9maWVsZCBBcHBsaWNhdGlvbklECiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1MS0xNTMKICAgIC8vIHJlY29yZCwgX2NhbGwgPSBhcmM0LmFiaV9jYWxsKAogICAgLy8gICAgIENvbnRleHRSZWdpc3RyeS5nZXRfY29udGV4dCwgY29udGV4dF9pZCwgYXBwX2lkPXNlbGYuY29udGV4dF9yZWdpc3RyeSwgZmVlPTAKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGFmOTliZGE1IC8vIG1ldGhvZCAiZ2V0X2NvbnRleHQodWludDY0KShhZGRyZXNzLHVpbnQ2NCx1aW50NjRbMTJdLHVpbnQ2NCx1aW50NjQsdWludDY0LHVpbnQ2NCx1aW50NjRbNV0sc3RyaW5nLHN0cmluZykiCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgZHVwCiAgICBpdHhuX2ZpZWxkIEFwcGxpY2F0aW9uQXJncwogICAgcHVzaGludCA2IC8vIGFwcGwKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTUyCiAgICAvLyBDb250ZXh0UmVnaXN0cnkuZ2V0X2NvbnRleHQsIGNvbnRleHRfaWQsIGFwcF9pZD1zZWxmLmNvbnRleHRfcmVnaXN0cnksIGZlZT0wCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTUxLTE1MwogICAgLy8gcmVjb3JkLCBfY2FsbCA9IGFyYzQuYWJpX2NhbGwoCiAgICAvLyAgICAgQ29udGV4dFJlZ2lzdHJ5LmdldF9jb250ZXh0LCBjb250ZXh0X2lkLCBhcHBfaWQ9c2VsZi5jb250ZXh0X3JlZ2lzdHJ5LCBmZWU9MAogICAgLy8gKQogICAgaXR4bl9zdWJtaXQKICAgIGl0eG4gTGFzdExvZwogICAgZHVwCiAgICBleHRyYWN0IDAgNAogICAgYnl0ZWNfMCAvLyAweDE1MWY3Yzc1CiAgICA9PQogICAgYXNzZXJ0IC8vIGFwcGxpY2F0aW9uIGxvZyB2YWx1ZSBpcyBub3QgdGhlIHJlc3VsdCBvZiBhbiBBQkkgcmV0dXJuCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1NAogICAgLy8gYXNzZXJ0IHJlY29yZC5jcmVhdG9yID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBjb250ZXh0IGNyZWF0b3IiCiAgICBleHRyYWN0IDQgMzIKICAgIHR4biBTZW5kZXIKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGNvbnRleHQgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNTUKICAgIC8vIG1pbl9iYWxhbmNlID0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1NwogICAgLy8gc2VsZi5saWNlbnNlX2NvdW50ICs9IDEKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA4IC8vICJsaWNlbnNlX2NvdW50IgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpY2Vuc2VfY291bnQgZXhpc3RzCiAgICBpbnRjXzEgLy8gMQogICAgKwogICAgYnl0ZWMgOCAvLyAibGljZW5zZV9jb3VudCIKICAgIGRpZyAxCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNjEKICAgIC8vIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNjIKICAgIC8vIGxpY2Vuc2VfdHlwZT1hcmM0LlVJbnQ2NChsaWNlbnNlX3R5cGUpLAogICAgZnJhbWVfZGlnIC01CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE2MwogICAgLy8gcHJpY2U9YXJjNC5VSW50NjQocHJpY2UpLAogICAgZnJhbWVfZGlnIC00CiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE2NAogICAgLy8gcHJpY2luZz1kZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCksCiAgICBjYWxsc3ViIGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTY1CiAgICAvLyBkdXJhdGlvbj1hcmM0LlVJbnQ2NChkdXJhdGlvbiksCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTY2CiAgICAvLyB1c2FnZV9saW1pdD1hcmM0LlVJbnQ2NCh1c2FnZV9saW1pdCksCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTU5LTE2NwogICAgLy8gc2VsZi5saWNlbnNlc1tsaWNlbnNlX2lkXSA9IExpY2Vuc2VPZmZlcigKICAgIC8vICAgICBjb250ZXh0X2lkPWFyYzQuVUludDY0KGNvbnRleHRfaWQpLAogICAgLy8gICAgIGNyZWF0b3I9YXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLAogICAgLy8gICAgIGxpY2Vuc2VfdHlwZT1hcmM0LlVJbnQ2NChsaWNlbnNlX3R5cGUpLAogICAgLy8gICAgIHByaWNlPWFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICAgICBwcmljaW5nPWRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUoKSwKICAgIC8vICAgICBkdXJhdGlvbj1hcmM0LlVJbnQ2NChkdXJhdGlvbiksCiAgICAvLyAgICAgdXNhZ2VfbGltaXQ9YXJjNC5VSW50NjQodXNhZ2VfbGltaXQpLAogICAgLy8gKQogICAgZGlnIDgKICAgIHVuY292ZXIgNgogICAgY29uY2F0CiAgICBkaWcgNQogICAgY29uY2F0CiAgICBkaWcgNAogICAgY29uY2F0CiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNTkKICAgIC8vIHNlbGYubGljZW5zZXNbbGljZW5zZV9pZF0gPSBMaWNlbnNlT2ZmZXIoCiAgICBkaWcgMwogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE1OS0xNjcKICAgIC8vIHNlbGYubGljZW5zZXNbbGljZW5zZV9pZF0gPSBMaWNlbnNlT2ZmZXIoCiAgICAvLyAgICAgY29udGV4dF9pZD1hcmM0LlVJbnQ2NChjb250ZXh0X2lkKSwKICAgIC8vICAgICBjcmVhdG9yPWFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBsaWNlbnNlX3R5cGU9YXJjNC5VSW50NjQobGljZW5zZV90eXBlKSwKICAgIC8vICAgICBwcmljZT1hcmM0LlVJbnQ2NChwcmljZSksCiAgICAvLyAgICAgcHJpY2luZz1kZWZhdWx0X3ByaWNlX3NjaGVkdWxlKCksCiAgICAvLyAgICAgZHVyYXRpb249YXJjNC5VSW50NjQoZHVyYXRpb24pLAogICAgLy8gICAgIHVzYWdlX2xpbWl0PWFyYzQuVUludDY0KHVzYWdlX2xpbWl0KSwKICAgIC8vICkKICAgIHVuY292ZXIgMgogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxNjgtMTY5CiAgICAvLyAjIEFueXRoaW5nIHBhaWQgYmV5b25kIHRoZSBNQlIgZ29lcyB0byB0aGUgcGxhdGZvcm0uCiAgICAvLyBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgKz0gc2VsZi5fYXNzZXJ0X3BhaWQocGF5bWVudCwgVUludDY0KDApLCBtaW5fYmFsYW5jZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlY18xIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgZXhpc3RzCiAgICBmcmFtZV9kaWcgLTEKICAgIGludGNfMCAvLyAwCiAgICB1bmNvdmVyIDcKICAgIGNhbGxzdWIgX2Fzc2VydF9wYWlkCiAgICArCiAgICBieXRlY18xIC8vICJwbGF0Zm9ybV9iYWxhbmNlIgogICAgc3dhcAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTc1CiAgICAvLyBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksCiAgICB0eG4gU2VuZGVyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE3Mi0xNzgKICAgIC8vIExpY2Vuc2VDcmVhdGVkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGxpY2Vuc2VfaWQpLAogICAgLy8gICAgIGFyYzQuVUludDY0KGNvbnRleHRfaWQpLAogICAgLy8gICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICBhcmM0LlVJbnQ2NChsaWNlbnNlX3R5cGUpLAogICAgLy8gICAgIGFyYzQuVUludDY0KHByaWNlKSwKICAgIC8vICkKICAgIHN3YXAKICAgIHVuY292ZXIgNQogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIHVuY292ZXIgMgogICAgY29uY2F0CiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTcxLTE3OQogICAgLy8gYXJjNC5lbWl0KAogICAgLy8gICAgIExpY2Vuc2VDcmVhdGVkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChsaWNlbnNlX2lkKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQoY29udGV4dF9pZCksCiAgICAvLyAgICAgICAgIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQobGljZW5zZV90eXBlKSwKICAgIC8vICAgICAgICAgYXJjNC5VSW50NjQocHJpY2UpLAogICAgLy8gICAgICkKICAgIC8vICkKICAgIHB1c2hieXRlcyAweGRhMzEyMmZjIC8vIG1ldGhvZCAiTGljZW5zZUNyZWF0ZWQodWludDY0LHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCx1aW50NjQpIgogICAgc3dhcAogICAgY29uY2F0CiAgICBsb2cKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTgwCiAgICAvLyByZXR1cm4gbGljZW5zZV9pZAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci5wdXJjaGFzZV9saWNlbnNlKGxpY2Vuc2VfaWQ6IHVpbnQ2NCwgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CnB1cmNoYXNlX2xpY2Vuc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE4Mi0xODUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHB1cmNoYXNlX2xpY2Vuc2UoCiAgICAvLyAgICAgc2VsZiwgbGljZW5zZV9pZDogVUludDY0LCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTkwCiAgICAvLyBvZmZlciA9IHNlbGYubGljZW5zZXNbbGljZW5zZV9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBkdXAKICAgIGNvdmVyIDMKICAgIGNvdmVyIDMKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpY2Vuc2VzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxOTEKICAgIC8vIGtleSA9IG9wLml0b2IobGljZW5zZV9pZCkgKyBUeG4uc2VuZGVyLmJ5dGVzCiAgICB0eG4gU2VuZGVyCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTkyCiAgICAvLyBhc3NlcnQga2V5IG5vdCBpbiBzZWxmLmdyYW50cywgIkFscmVhZHkgbGljZW5zZWQiCiAgICBieXRlYyA2IC8vIDB4Njg2YzY0NWYKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfbGVuCiAgICBidXJ5IDEKICAgICEKICAgIGFzc2VydCAvLyBBbHJlYWR5IGxpY2Vuc2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE5MwogICAgLy8gbWluX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBzd2FwCiAgICBjb3ZlciAyCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTk1CiAgICAvLyBleHBpcnkgPSBVSW50NjQoMCkKICAgIGludGNfMCAvLyAwCiAgICBzd2FwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE5NgogICAgLy8gaWYgb2ZmZXIuZHVyYXRpb24ubmF0aXZlOgogICAgaW50YyA1IC8vIDE1MgogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgYnogcHVyY2hhc2VfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTk3CiAgICAvLyBleHBpcnkgPSBHbG9iYWwubGF0ZXN0X3RpbWVzdGFtcCArIG9mZmVyLmR1cmF0aW9uLm5hdGl2ZQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgZnJhbWVfZGlnIDUKICAgICsKICAgIGZyYW1lX2J1cnkgNAoKcHVyY2hhc2VfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjE5OQogICAgLy8gZXhwaXJ5PWFyYzQuVUludDY0KGV4cGlyeSksCiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBpdG9iCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIwMQogICAgLy8gdXNhZ2VfbGltaXQ9b2ZmZXIudXNhZ2VfbGltaXQsCiAgICBmcmFtZV9kaWcgMQogICAgZHVwCiAgICBjb3ZlciAyCiAgICBleHRyYWN0IDE2MCA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToxOTgtMjAyCiAgICAvLyBzZWxmLmdyYW50c1trZXldID0gTGljZW5zZUdyYW50KAogICAgLy8gICAgIGV4cGlyeT1hcmM0LlVJbnQ2NChleHBpcnkpLAogICAgLy8gICAgIHVzYWdlX2NvdW50PWFyYzQuVUludDY0KDApLAogICAgLy8gICAgIHVzYWdlX2xpbWl0PW9mZmVyLnVzYWdlX2xpbWl0LAogICAgLy8gKQogICAgZGlnIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjAwCiAgICAvLyB1c2FnZV9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIHB1c2hieXRlcyAweDAwMDAwMDAwMDAwMDAwMDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MTk4LTIwMgogICAgLy8gc2VsZi5ncmFudHNba2V5XSA9IExpY2Vuc2VHcmFudCgKICAgIC8vICAgICBleHBpcnk9YXJjNC5VSW50NjQoZXhwaXJ5KSwKICAgIC8vICAgICB1c2FnZV9jb3VudD1hcmM0LlVJbnQ2NCgwKSwKICAgIC8vICAgICB1c2FnZV9saW1pdD1vZmZlci51c2FnZV9saW1pdCwKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICBmcmFtZV9kaWcgMgogICAgc3dhcAogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMDMKICAgIC8vIHNlbGYuX2NvbGxlY3QobGljZW5zZV9pZCwgb2ZmZXIsIHBheW1lbnQsIG1pbl9iYWxhbmNlKQogICAgZnJhbWVfZGlnIC0yCiAgICB1bmNvdmVyIDIKICAgIGZyYW1lX2RpZyAtMQogICAgZnJhbWVfZGlnIDMKICAgIGNhbGxzdWIgX2NvbGxlY3QKICAgIHBvcAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMDYtMjA4CiAgICAvLyBMaWNlbnNlUHVyY2hhc2VkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGxpY2Vuc2VfaWQpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuVUludDY0KGV4cGlyeSkKICAgIC8vICkKICAgIGZyYW1lX2RpZyAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIwNwogICAgLy8gYXJjNC5VSW50NjQobGljZW5zZV9pZCksIGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgYXJjNC5VSW50NjQoZXhwaXJ5KQogICAgdHhuIFNlbmRlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMDYtMjA4CiAgICAvLyBMaWNlbnNlUHVyY2hhc2VkKAogICAgLy8gICAgIGFyYzQuVUludDY0KGxpY2Vuc2VfaWQpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGFyYzQuVUludDY0KGV4cGlyeSkKICAgIC8vICkKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIwNS0yMDkKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBMaWNlbnNlUHVyY2hhc2VkKAogICAgLy8gICAgICAgICBhcmM0LlVJbnQ2NChsaWNlbnNlX2lkKSwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBhcmM0LlVJbnQ2NChleHBpcnkpCiAgICAvLyAgICAgKQogICAgLy8gKQogICAgcHVzaGJ5dGVzIDB4ZmRmMWRjZDMgLy8gbWV0aG9kICJMaWNlbnNlUHVyY2hhc2VkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMTAKICAgIC8vIHJldHVybiBleHBpcnkKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci5yZW5ld19saWNlbnNlKGxpY2Vuc2VfaWQ6IHVpbnQ2NCwgcGF5bWVudDogdWludDY0KSAtPiB1aW50NjQ6CnJlbmV3X2xpY2Vuc2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIxMi0yMTUKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHJlbmV3X2xpY2Vuc2UoCiAgICAvLyAgICAgc2VsZiwgbGljZW5zZV9pZDogVUludDY0LCBwYXltZW50OiBndHhuLlBheW1lbnRUcmFuc2FjdGlvbgogICAgLy8gKSAtPiBVSW50NjQ6CiAgICBwcm90byAyIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjE3CiAgICAvLyBvZmZlciA9IHNlbGYubGljZW5zZXNbbGljZW5zZV9pZF0uY29weSgpCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBkaWcgMQogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5saWNlbnNlcyBlbnRyeSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjE4CiAgICAvLyBhc3NlcnQgb2ZmZXIuZHVyYXRpb24ubmF0aXZlLCAiTGljZW5zZSBkb2VzIG5vdCBleHBpcmUiCiAgICBkdXAKICAgIGludGMgNSAvLyAxNTIKICAgIGV4dHJhY3RfdWludDY0CiAgICBhc3NlcnQgLy8gTGljZW5zZSBkb2VzIG5vdCBleHBpcmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjE5CiAgICAvLyBrZXkgPSBvcC5pdG9iKGxpY2Vuc2VfaWQpICsgVHhuLnNlbmRlci5ieXRlcwogICAgdHhuIFNlbmRlcgogICAgdW5jb3ZlciAyCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjIwCiAgICAvLyBzZWxmLl9jb2xsZWN0KGxpY2Vuc2VfaWQsIG9mZmVyLCBwYXltZW50LCBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlKQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBmcmFtZV9kaWcgLTIKICAgIHVuY292ZXIgMwogICAgZnJhbWVfZGlnIC0xCiAgICB1bmNvdmVyIDMKICAgIGNhbGxzdWIgX2NvbGxlY3QKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjIyLTIyMwogICAgLy8gIyBSZW5ld2luZyBlYXJseSBzdGFja3Mgb24gdGhlIGN1cnJlbnQgZXhwaXJ5LCByZW5ld2luZyBsYXRlIHN0YXJ0cyBmcm9tIG5vdy4KICAgIC8vIGdyYW50ID0gc2VsZi5ncmFudHNba2V5XS5jb3B5KCkKICAgIGJ5dGVjIDYgLy8gMHg2ODZjNjQ1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ncmFudHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIyNAogICAgLy8gc3RhcnQgPSBncmFudC5leHBpcnkubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMjUKICAgIC8vIGlmIHN0YXJ0IDwgR2xvYmFsLmxhdGVzdF90aW1lc3RhbXA6CiAgICBnbG9iYWwgTGF0ZXN0VGltZXN0YW1wCiAgICA8CiAgICBieiByZW5ld19saWNlbnNlX2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMjYKICAgIC8vIHN0YXJ0ID0gR2xvYmFsLmxhdGVzdF90aW1lc3RhbXAKICAgIGdsb2JhbCBMYXRlc3RUaW1lc3RhbXAKICAgIGZyYW1lX2J1cnkgNAoKcmVuZXdfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIyNwogICAgLy8gZ3JhbnQuZXhwaXJ5ID0gYXJjNC5VSW50NjQoc3RhcnQgKyBvZmZlci5kdXJhdGlvbi5uYXRpdmUpCiAgICBmcmFtZV9kaWcgMQogICAgaW50YyA1IC8vIDE1MgogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyA0CiAgICArCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMwogICAgc3dhcAogICAgcmVwbGFjZTIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMjgKICAgIC8vIHNlbGYuZ3JhbnRzW2tleV0gPSBncmFudC5jb3B5KCkKICAgIGZyYW1lX2RpZyAyCiAgICBkaWcgMQogICAgYm94X3B1dAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMzEKICAgIC8vIExpY2Vuc2VSZW5ld2VkKGFyYzQuVUludDY0KGxpY2Vuc2VfaWQpLCBhcmM0LkFkZHJlc3MoVHhuLnNlbmRlciksIGdyYW50LmV4cGlyeSkKICAgIHR4biBTZW5kZXIKICAgIGRpZyAxCiAgICBleHRyYWN0IDAgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAwCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgc3dhcAogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjIzMC0yMzIKICAgIC8vIGFyYzQuZW1pdCgKICAgIC8vICAgICBMaWNlbnNlUmVuZXdlZChhcmM0LlVJbnQ2NChsaWNlbnNlX2lkKSwgYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCBncmFudC5leHBpcnkpCiAgICAvLyApCiAgICBwdXNoYnl0ZXMgMHgyZTY5MzA1ZCAvLyBtZXRob2QgIkxpY2Vuc2VSZW5ld2VkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMzMKICAgIC8vIHJldHVybiBncmFudC5leHBpcnkubmF0aXZlCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci5yZWNvcmRfdXNhZ2UobGljZW5zZV9pZDogdWludDY0LCBob2xkZXI6IGJ5dGVzLCB1c2VzOiB1aW50NjQpIC0+IHVpbnQ2NDoKcmVjb3JkX3VzYWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyMzUtMjM4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiByZWNvcmRfdXNhZ2UoCiAgICAvLyAgICAgc2VsZiwgbGljZW5zZV9pZDogVUludDY0LCBob2xkZXI6IGFyYzQuQWRkcmVzcywgdXNlczogVUludDY0CiAgICAvLyApIC0+IFVJbnQ2NDoKICAgIHByb3RvIDMgMQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNDAKICAgIC8vIGFzc2VydCBzZWxmLmxpY2Vuc2VzW2xpY2Vuc2VfaWRdLmNyZWF0b3IgPT0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCAiTm90IGNyZWF0b3IiCiAgICBmcmFtZV9kaWcgLTMKICAgIGl0b2IKICAgIGJ5dGVjXzIgLy8gMHg2YzY5NjM1ZgogICAgZGlnIDEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYubGljZW5zZXMgZW50cnkgZXhpc3RzCiAgICBleHRyYWN0IDggMzIgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICB0eG4gU2VuZGVyCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBjcmVhdG9yCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0MQogICAgLy8ga2V5ID0gb3AuaXRvYihsaWNlbnNlX2lkKSArIGhvbGRlci5ieXRlcwogICAgZnJhbWVfZGlnIC0yCiAgICBjb25jYXQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNDIKICAgIC8vIGdyYW50ID0gc2VsZi5ncmFudHNba2V5XS5jb3B5KCkKICAgIGJ5dGVjIDYgLy8gMHg2ODZjNjQ1ZgogICAgc3dhcAogICAgY29uY2F0CiAgICBkdXAKICAgIGJveF9nZXQKICAgIHN3YXAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5ncmFudHMgZW50cnkgZXhpc3RzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0MwogICAgLy8gdXNlZCA9IGdyYW50LnVzYWdlX2NvdW50Lm5hdGl2ZSArIHVzZXMKICAgIGR1cAogICAgaW50Y18yIC8vIDgKICAgIGV4dHJhY3RfdWludDY0CiAgICBmcmFtZV9kaWcgLTEKICAgICsKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjQ0CiAgICAvLyBpZiBncmFudC51c2FnZV9saW1pdC5uYXRpdmU6CiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBieiByZWNvcmRfdXNhZ2VfYWZ0ZXJfaWZfZWxzZUAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0NQogICAgLy8gYXNzZXJ0IHVzZWQgPD0gZ3JhbnQudXNhZ2VfbGltaXQubmF0aXZlLCAiVXNhZ2UgbGltaXQgZXhjZWVkZWQiCiAgICBmcmFtZV9kaWcgMwogICAgZnJhbWVfZGlnIDQKICAgIDw9CiAgICBhc3NlcnQgLy8gVXNhZ2UgbGltaXQgZXhjZWVkZWQKCnJlY29yZF91c2FnZV9hZnRlcl9pZl9lbHNlQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI0NgogICAgLy8gZ3JhbnQudXNhZ2VfY291bnQgPSBhcmM0LlVJbnQ2NCh1c2VkKQogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgaXRvYgogICAgZnJhbWVfZGlnIDIKICAgIHN3YXAKICAgIHJlcGxhY2UyIDgKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjQ3CiAgICAvLyBzZWxmLmdyYW50c1trZXldID0gZ3JhbnQuY29weSgpCiAgICBmcmFtZV9kaWcgMQogICAgZGlnIDEKICAgIGJveF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjQ5CiAgICAvLyBhcmM0LmVtaXQoTGljZW5zZVVzZWQoYXJjNC5VSW50NjQobGljZW5zZV9pZCksIGhvbGRlciwgZ3JhbnQudXNhZ2VfY291bnQpKQogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgMAogICAgc3dhcAogICAgY29uY2F0CiAgICBwdXNoYnl0ZXMgMHg4YjA5MzJjMCAvLyBtZXRob2QgIkxpY2Vuc2VVc2VkKHVpbnQ2NCxhZGRyZXNzLHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNTAKICAgIC8vIHJldHVybiB1c2VkCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIucmV2b2tlX2xpY2Vuc2UobGljZW5zZV9pZDogdWludDY0LCBob2xkZXI6IGJ5dGVzKSAtPiB2b2lkOgpyZXZva2VfbGljZW5zZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjUyLTI1MwogICAgLy8gQGFiaW1ldGhvZCgpCiAgICAvLyBkZWYgcmV2b2tlX2xpY2Vuc2Uoc2VsZiwgbGljZW5zZV9pZDogVUludDY0LCBob2xkZXI6IGFyYzQuQWRkcmVzcykgLT4gTm9uZToKICAgIHByb3RvIDIgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjEKICAgIC8vIGFzc2VydCBzZWxmLmxpY2Vuc2VzW2xpY2Vuc2VfaWRdLmNyZWF0b3IgPT0gYXJjNC5BZGRyZXNzKFR4bi5zZW5kZXIpLCAiTm90IGNyZWF0b3IiCiAgICBmcmFtZV9kaWcgLTIKICAgIGl0b2IKICAgIGR1cAogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGJveF9nZXQKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpY2Vuc2VzIGVudHJ5IGV4aXN0cwogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjIKICAgIC8vIHN0YXR1cyA9IHNlbGYuY2hlY2tfbGljZW5zZShsaWNlbnNlX2lkLCBob2xkZXIpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAtMQogICAgY2FsbHN1YiBjaGVja19saWNlbnNlCiAgICBkdXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjYzCiAgICAvLyBhc3NlcnQgc3RhdHVzLmV4cGlyeSBvciBzdGF0dXMudXNhZ2VfbGltaXQsICJMaWNlbnNlIG5ldmVyIGxhcHNlcyIKICAgIGV4dHJhY3QgMSA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgYnl0ZWNfMyAvLyAweAogICAgYiE9CiAgICBibnogcmV2b2tlX2xpY2Vuc2VfYm9vbF90cnVlQDIKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0IDE3IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBieXRlY18zIC8vIDB4CiAgICBiIT0KICAgIGJ6IHJldm9rZV9saWNlbnNlX2Jvb2xfZmFsc2VAMwoKcmV2b2tlX2xpY2Vuc2VfYm9vbF90cnVlQDI6CiAgICBpbnRjXzEgLy8gMQoKcmV2b2tlX2xpY2Vuc2VfYm9vbF9tZXJnZUA0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjMKICAgIC8vIGFzc2VydCBzdGF0dXMuZXhwaXJ5IG9yIHN0YXR1cy51c2FnZV9saW1pdCwgIkxpY2Vuc2UgbmV2ZXIgbGFwc2VzIgogICAgYXNzZXJ0IC8vIExpY2Vuc2UgbmV2ZXIgbGFwc2VzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI2NAogICAgLy8gYXNzZXJ0IG5vdCBzdGF0dXMudmFsaWQubmF0aXZlLCAiTGljZW5zZSBzdGlsbCB2YWxpZCIKICAgIGZyYW1lX2RpZyAxCiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICBwdXNoYnl0ZXMgMHgwMAogICAgaW50Y18wIC8vIDAKICAgIHVuY292ZXIgMgogICAgc2V0Yml0CiAgICBpbnRjXzAgLy8gMAogICAgZ2V0Yml0CiAgICAhCiAgICBhc3NlcnQgLy8gTGljZW5zZSBzdGlsbCB2YWxpZAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjUKICAgIC8vIGtleSA9IG9wLml0b2IobGljZW5zZV9pZCkgKyBob2xkZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjYKICAgIC8vIGFzc2VydCBrZXkgaW4gc2VsZi5ncmFudHMsICJOb3QgbGljZW5zZWQiCiAgICBieXRlYyA2IC8vIDB4Njg2YzY0NWYKICAgIGRpZyAxCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2xlbgogICAgYnVyeSAxCiAgICBhc3NlcnQgLy8gTm90IGxpY2Vuc2VkCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI2NwogICAgLy8gbWluX2JhbGFuY2UgPSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlCiAgICBnbG9iYWwgQ3VycmVudEFwcGxpY2F0aW9uQWRkcmVzcwogICAgYWNjdF9wYXJhbXNfZ2V0IEFjY3RNaW5CYWxhbmNlCiAgICBhc3NlcnQgLy8gYWNjb3VudCBmdW5kZWQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjY4CiAgICAvLyBkZWwgc2VsZi5ncmFudHNba2V5XQogICAgc3dhcAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI2OS0yNzMKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIC8vICAgICByZWNlaXZlcj1ob2xkZXIubmF0aXZlLAogICAgLy8gICAgIGFtb3VudD1taW5fYmFsYW5jZSAtIEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UsCiAgICAvLyAgICAgZmVlPTAsCiAgICAvLyApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI3MQogICAgLy8gYW1vdW50PW1pbl9iYWxhbmNlIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZSwKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGZyYW1lX2RpZyAtMQogICAgaXR4bl9maWVsZCBSZWNlaXZlcgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjkKICAgIC8vIGl0eG4uUGF5bWVudCgKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjcyCiAgICAvLyBmZWU9MCwKICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNjktMjczCiAgICAvLyBpdHhuLlBheW1lbnQoCiAgICAvLyAgICAgcmVjZWl2ZXI9aG9sZGVyLm5hdGl2ZSwKICAgIC8vICAgICBhbW91bnQ9bWluX2JhbGFuY2UgLSBHbG9iYWwuY3VycmVudF9hcHBsaWNhdGlvbl9hZGRyZXNzLm1pbl9iYWxhbmNlLAogICAgLy8gICAgIGZlZT0wLAogICAgLy8gKS5zdWJtaXQoKQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mjc1CiAgICAvLyBhcmM0LmVtaXQoTGljZW5zZVJldm9rZWQoYXJjNC5VSW50NjQobGljZW5zZV9pZCksIGhvbGRlcikpCiAgICBwdXNoYnl0ZXMgMHhjZDcxODEyYiAvLyBtZXRob2QgIkxpY2Vuc2VSZXZva2VkKHVpbnQ2NCxhZGRyZXNzKSIKICAgIHN3YXAKICAgIGNvbmNhdAogICAgbG9nCiAgICByZXRzdWIKCnJldm9rZV9saWNlbnNlX2Jvb2xfZmFsc2VAMzoKICAgIGludGNfMCAvLyAwCiAgICBiIHJldm9rZV9saWNlbnNlX2Jvb2xfbWVyZ2VANAoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuY2hlY2tfbGljZW5zZShsaWNlbnNlX2lkOiB1aW50NjQsIGhvbGRlcjogYnl0ZXMpIC0+IGJ5dGVzOgpjaGVja19saWNlbnNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyNzctMjc4CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgY2hlY2tfbGljZW5zZShzZWxmLCBsaWNlbnNlX2lkOiBVSW50NjQsIGhvbGRlcjogYXJjNC5BZGRyZXNzKSAtPiBMaWNlbnNlU3RhdHVzOgogICAgcHJvdG8gMiAxCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWNfMyAvLyAiIgogICAgZHVwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4MAogICAgLy8ga2V5ID0gc2VsZi5ncmFudHMua2V5X3ByZWZpeCArIG9wLml0b2IobGljZW5zZV9pZCkgKyBob2xkZXIuYnl0ZXMKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWMgNiAvLyAweDY4NmM2NDVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGZyYW1lX2RpZyAtMQogICAgY29uY2F0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4MQogICAgLy8gcmF3LCB2YWxpZCA9IG9wLkJveC5nZXQoa2V5KQogICAgYm94X2dldAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjgyCiAgICAvLyBpZiBub3QgdmFsaWQ6CiAgICBibnogY2hlY2tfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjgzCiAgICAvLyByYXcgPSBvcC5iemVybygyNCkKICAgIHB1c2hpbnQgMjQgLy8gMjQKICAgIGJ6ZXJvCiAgICBmcmFtZV9idXJ5IDQKCmNoZWNrX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUAyOgogICAgZnJhbWVfZGlnIDMKICAgIGR1cAogICAgZnJhbWVfYnVyeSAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4NQogICAgLy8gaWYgdmFsaWQ6CiAgICBieiBjaGVja19saWNlbnNlX2FmdGVyX2lmX2Vsc2VAMTAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mjg2CiAgICAvLyBpZiBncmFudC5leHBpcnkubmF0aXZlIGFuZCBncmFudC5leHBpcnkubmF0aXZlIDw9IEdsb2JhbC5sYXRlc3RfdGltZXN0YW1wOgogICAgZnJhbWVfZGlnIDQKICAgIGludGNfMCAvLyAwCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDIKICAgIGJ6IGNoZWNrX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUA2CiAgICBmcmFtZV9kaWcgMQogICAgZ2xvYmFsIExhdGVzdFRpbWVzdGFtcAogICAgPD0KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDIKICAgIGJ6IGNoZWNrX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUA2CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI4NwogICAgLy8gdmFsaWQgPSBGYWxzZQogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMgoKY2hlY2tfbGljZW5zZV9hZnRlcl9pZl9lbHNlQDY6CiAgICBmcmFtZV9kaWcgMgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mjg4CiAgICAvLyBpZiBncmFudC51c2FnZV9saW1pdC5uYXRpdmUgYW5kIGdyYW50LnVzYWdlX2NvdW50ID49IGdyYW50LnVzYWdlX2xpbWl0OgogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgZXh0cmFjdCAxNiA4IC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgZnJhbWVfYnVyeSAwCiAgICBwdXNoaW50IDE2IC8vIDE2CiAgICBleHRyYWN0X3VpbnQ2NAogICAgc3dhcAogICAgZnJhbWVfYnVyeSAyCiAgICBieiBjaGVja19saWNlbnNlX2FmdGVyX2lmX2Vsc2VAMTAKICAgIGZyYW1lX2RpZyA0CiAgICBleHRyYWN0IDggOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyAwCiAgICBiPj0KICAgIGZyYW1lX2RpZyAzCiAgICBmcmFtZV9idXJ5IDIKICAgIGJ6IGNoZWNrX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weToyODkKICAgIC8vIHZhbGlkID0gRmFsc2UKICAgIGludGNfMCAvLyAwCiAgICBmcmFtZV9idXJ5IDIKCmNoZWNrX2xpY2Vuc2VfYWZ0ZXJfaWZfZWxzZUAxMDoKICAgIGZyYW1lX2RpZyAyCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI5MQogICAgLy8gdmFsaWQ9YXJjNC5Cb29sKHZhbGlkKSwKICAgIHB1c2hieXRlcyAweDAwCiAgICBpbnRjXzAgLy8gMAogICAgdW5jb3ZlciAyCiAgICBzZXRiaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjkyCiAgICAvLyBleHBpcnk9Z3JhbnQuZXhwaXJ5LAogICAgZnJhbWVfZGlnIDQKICAgIGR1cAogICAgZXh0cmFjdCAwIDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI5MwogICAgLy8gdXNhZ2VfY291bnQ9Z3JhbnQudXNhZ2VfY291bnQsCiAgICBkaWcgMQogICAgZXh0cmFjdCA4IDggLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjI5NAogICAgLy8gdXNhZ2VfbGltaXQ9Z3JhbnQudXNhZ2VfbGltaXQsCiAgICB1bmNvdmVyIDIKICAgIGV4dHJhY3QgMTYgOCAvLyBvbiBlcnJvcjogSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MjkwLTI5NQogICAgLy8gcmV0dXJuIExpY2Vuc2VTdGF0dXMoCiAgICAvLyAgICAgdmFsaWQ9YXJjNC5Cb29sKHZhbGlkKSwKICAgIC8vICAgICBleHBpcnk9Z3JhbnQuZXhwaXJ5LAogICAgLy8gICAgIHVzYWdlX2NvdW50PWdyYW50LnVzYWdlX2NvdW50LAogICAgLy8gICAgIHVzYWdlX2xpbWl0PWdyYW50LnVzYWdlX2xpbWl0LAogICAgLy8gKQogICAgdW5jb3ZlciAzCiAgICB1bmNvdmVyIDMKICAgIGNvbmNhdAogICAgdW5jb3ZlciAyCiAgICBjb25jYXQKICAgIHN3YXAKICAgIGNvbmNhdAogICAgZnJhbWVfYnVyeSAwCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLndpdGhkcmF3KCkgLT4gdWludDY0Ogp3aXRoZHJhdzoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzA1CiAgICAvLyBhbW91bnQgPSBzZWxmLmJhbGFuY2VzLmdldChUeG4uc2VuZGVyLCBkZWZhdWx0PVVJbnQ2NCgwKSkKICAgIGJ5dGVjIDcgLy8gMHg2MjYxNmM1ZgogICAgdHhuIFNlbmRlcgogICAgY29uY2F0CiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzA2CiAgICAvLyBhc3NlcnQgYW1vdW50LCAiTm90aGluZyB0byB3aXRoZHJhdyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vdGhpbmcgdG8gd2l0aGRyYXcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzA3CiAgICAvLyBtaW5fYmFsYW5jZSA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UKICAgIGdsb2JhbCBDdXJyZW50QXBwbGljYXRpb25BZGRyZXNzCiAgICBhY2N0X3BhcmFtc19nZXQgQWNjdE1pbkJhbGFuY2UKICAgIGFzc2VydCAvLyBhY2NvdW50IGZ1bmRlZAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMDgKICAgIC8vIGRlbCBzZWxmLmJhbGFuY2VzW1R4bi5zZW5kZXJdCiAgICBieXRlYyA3IC8vIDB4NjI2MTZjNWYKICAgIHR4biBTZW5kZXIKICAgIGNvbmNhdAogICAgYm94X2RlbAogICAgcG9wCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMwOQogICAgLy8gYW1vdW50ICs9IG1pbl9iYWxhbmNlIC0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcy5taW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICAtCiAgICArCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMxMAogICAgLy8gaXR4bi5QYXltZW50KHJlY2VpdmVyPVR4bi5zZW5kZXIsIGFtb3VudD1hbW91bnQsIGZlZT0wKS5zdWJtaXQoKQogICAgaXR4bl9iZWdpbgogICAgdHhuIFNlbmRlcgogICAgZGlnIDEKICAgIGl0eG5fZmllbGQgQW1vdW50CiAgICBpdHhuX2ZpZWxkIFJlY2VpdmVyCiAgICBpbnRjXzEgLy8gcGF5CiAgICBpdHhuX2ZpZWxkIFR5cGVFbnVtCiAgICBpbnRjXzAgLy8gMAogICAgaXR4bl9maWVsZCBGZWUKICAgIGl0eG5fc3VibWl0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMxMQogICAgLy8gcmV0dXJuIGFtb3VudAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci53aXRoZHJhd19wbGF0Zm9ybV9mZWVzKCkgLT4gdWludDY0Ogp3aXRoZHJhd19wbGF0Zm9ybV9mZWVzOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMTYKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4sICJOb3QgYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMTcKICAgIC8vIGFtb3VudCA9IHNlbGYucGxhdGZvcm1fYmFsYW5jZQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXRmb3JtX2JhbGFuY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxhdGZvcm1fYmFsYW5jZSBleGlzdHMKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzE4CiAgICAvLyBhc3NlcnQgYW1vdW50LCAiTm90aGluZyB0byB3aXRoZHJhdyIKICAgIGR1cAogICAgYXNzZXJ0IC8vIE5vdGhpbmcgdG8gd2l0aGRyYXcKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzE5CiAgICAvLyBzZWxmLnBsYXRmb3JtX2JhbGFuY2UgPSBVSW50NjQoMCkKICAgIGJ5dGVjXzEgLy8gInBsYXRmb3JtX2JhbGFuY2UiCiAgICBpbnRjXzAgLy8gMAogICAgYXBwX2dsb2JhbF9wdXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzIwCiAgICAvLyBpdHhuLlBheW1lbnQocmVjZWl2ZXI9c2VsZi5hZG1pbiwgYW1vdW50PWFtb3VudCwgZmVlPTApLnN1Ym1pdCgpCiAgICBpdHhuX2JlZ2luCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICBkaWcgMQogICAgaXR4bl9maWVsZCBBbW91bnQKICAgIGl0eG5fZmllbGQgUmVjZWl2ZXIKICAgIGludGNfMSAvLyBwYXkKICAgIGl0eG5fZmllbGQgVHlwZUVudW0KICAgIGludGNfMCAvLyAwCiAgICBpdHhuX2ZpZWxkIEZlZQogICAgaXR4bl9zdWJtaXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzIxCiAgICAvLyByZXR1cm4gYW1vdW50CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLmdldF9iYWxhbmNlKGNyZWF0b3I6IGJ5dGVzKSAtPiB1aW50NjQ6CmdldF9iYWxhbmNlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozMjMtMzI0CiAgICAvLyBAYWJpbWV0aG9kKHJlYWRvbmx5PVRydWUpCiAgICAvLyBkZWYgZ2V0X2JhbGFuY2Uoc2VsZiwgY3JlYXRvcjogYXJjNC5BZGRyZXNzKSAtPiBVSW50NjQ6CiAgICBwcm90byAxIDEKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzI2CiAgICAvLyByZXR1cm4gc2VsZi5iYWxhbmNlcy5nZXQoY3JlYXRvci5uYXRpdmUsIGRlZmF1bHQ9VUludDY0KDApKQogICAgYnl0ZWMgNyAvLyAweDYyNjE2YzVmCiAgICBmcmFtZV9kaWcgLTEKICAgIGNvbmNhdAogICAgYm94X2dldAogICAgc3dhcAogICAgYnRvaQogICAgaW50Y18wIC8vIDAKICAgIHN3YXAKICAgIHVuY292ZXIgMgogICAgc2VsZWN0CiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLmdldF9saWNlbnNlX3ByaWNlKGxpY2Vuc2VfaWQ6IHVpbnQ2NCwgcXVhbnRpdHk6IHVpbnQ2NCkgLT4gdWludDY0OgpnZXRfbGljZW5zZV9wcmljZToKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzI4LTMyOQogICAgLy8gQGFiaW1ldGhvZChyZWFkb25seT1UcnVlKQogICAgLy8gZGVmIGdldF9saWNlbnNlX3ByaWNlKHNlbGYsIGxpY2Vuc2VfaWQ6IFVJbnQ2NCwgcXVhbnRpdHk6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMzMQogICAgLy8gcmV0dXJuIHNlbGYuX3F1b3RlKGxpY2Vuc2VfaWQsIHF1YW50aXR5KQogICAgZnJhbWVfZGlnIC0yCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX3F1b3RlCiAgICByZXRzdWIKCgovLyBzbWFydF9jb250cmFjdHMubGljZW5zZV9tYW5hZ2VyLmNvbnRyYWN0LkxpY2Vuc2VNYW5hZ2VyLnNldF9wcmljZV90aWVycyhsaWNlbnNlX2lkOiB1aW50NjQsIGJyZWFrcG9pbnRzOiBieXRlcywgZGlzY291bnRzOiBieXRlcywgbXVsdGlwbGllcnM6IGJ5dGVzKSAtPiB2b2lkOgpzZXRfcHJpY2VfdGllcnM6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjMzMy0zNDAKICAgIC8vIEBhYmltZXRob2QoKQogICAgLy8gZGVmIHNldF9wcmljZV90aWVycygKICAgIC8vICAgICBzZWxmLAogICAgLy8gICAgIGxpY2Vuc2VfaWQ6IFVJbnQ2NCwKICAgIC8vICAgICBicmVha3BvaW50czogVGllclZhbHVlcywKICAgIC8vICAgICBkaXNjb3VudHM6IFRpZXJWYWx1ZXMsCiAgICAvLyAgICAgbXVsdGlwbGllcnM6IFRpZXJWYWx1ZXMsCiAgICAvLyApIC0+IE5vbmU6CiAgICBwcm90byA0IDAKICAgIGJ5dGVjXzMgLy8gIiIKICAgIGR1cG4gMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNDIKICAgIC8vIG9mZmVyID0gc2VsZi5saWNlbnNlc1tsaWNlbnNlX2lkXS5jb3B5KCkKICAgIGZyYW1lX2RpZyAtNAogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGR1cAogICAgYm94X2dldAogICAgc3dhcAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLmxpY2Vuc2VzIGVudHJ5IGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNDMKICAgIC8vIGFzc2VydCBvZmZlci5jcmVhdG9yID09IGFyYzQuQWRkcmVzcyhUeG4uc2VuZGVyKSwgIk5vdCBjcmVhdG9yIgogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgdHhuIFNlbmRlcgogICAgPT0KICAgIGFzc2VydCAvLyBOb3QgY3JlYXRvcgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NjgKICAgIC8vIHNjaGVkdWxlID0gZGVmYXVsdF9wcmljZV9zY2hlZHVsZSgpCiAgICBjYWxsc3ViIGRlZmF1bHRfcHJpY2Vfc2NoZWR1bGUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjY5CiAgICAvLyBwcmV2aW91c19icmVha3BvaW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzAtNzEKICAgIC8vIHByZXZpb3VzX2Rpc2NvdW50ID0gVUludDY0KDApCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgZHVwbiAyCgpzZXRfcHJpY2VfdGllcnNfZm9yX2hlYWRlckAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzEKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBmcmFtZV9kaWcgOAogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGJ6IHNldF9wcmljZV90aWVyc19hZnRlcl9mb3JANwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzIKICAgIC8vIGJyZWFrcG9pbnQgPSBicmVha3BvaW50c1t0aWVyXS5uYXRpdmUKICAgIGZyYW1lX2RpZyA4CiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgZHVwCiAgICBmcmFtZV9idXJ5IDEKICAgIGZyYW1lX2RpZyAtMwogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgZnJhbWVfYnVyeSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo3MwogICAgLy8gaWYgYnJlYWtwb2ludDoKICAgIGJ6IHNldF9wcmljZV90aWVyc19lbHNlX2JvZHlANQogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzQKICAgIC8vIGFzc2VydCBwcmV2aW91c19icmVha3BvaW50ICE9IE5PX0JSRUFLUE9JTlQsICJHYXAgaW4gcHJpY2UgdGllcnMiCiAgICBmcmFtZV9kaWcgNgogICAgZHVwCiAgICBpbnRjIDYgLy8gMTg0NDY3NDQwNzM3MDk1NTE2MTUKICAgICE9CiAgICBhc3NlcnQgLy8gR2FwIGluIHByaWNlIHRpZXJzCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo3NQogICAgLy8gYXNzZXJ0IGJyZWFrcG9pbnQgPiBwcmV2aW91c19icmVha3BvaW50LCAiQnJlYWtwb2ludHMgbXVzdCBhc2NlbmQiCiAgICBmcmFtZV9kaWcgMAogICAgZHVwCiAgICB1bmNvdmVyIDIKICAgID4KICAgIGFzc2VydCAvLyBCcmVha3BvaW50cyBtdXN0IGFzY2VuZAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzYKICAgIC8vIGFzc2VydCBkaXNjb3VudHNbdGllcl0ubmF0aXZlID49IHByZXZpb3VzX2Rpc2NvdW50LCAiRGlzY291bnRzIG11c3Qgbm90IGRyb3AiCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAxCiAgICBleHRyYWN0X3VpbnQ2NAogICAgZHVwCiAgICBmcmFtZV9kaWcgNwogICAgPj0KICAgIGFzc2VydCAvLyBEaXNjb3VudHMgbXVzdCBub3QgZHJvcAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6NzcKICAgIC8vIGFzc2VydCBkaXNjb3VudHNbdGllcl0ubmF0aXZlIDw9IDEwMDAwLCAiRGlzY291bnQgYWJvdmUgMTAwJSIKICAgIGR1cAogICAgaW50YyA0IC8vIDEwMDAwCiAgICA8PQogICAgYXNzZXJ0IC8vIERpc2NvdW50IGFib3ZlIDEwMCUKICAgIGZyYW1lX2J1cnkgNwogICAgZnJhbWVfYnVyeSA2CgpzZXRfcHJpY2VfdGllcnNfYWZ0ZXJfaWZfZWxzZUA2OgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6ODIKICAgIC8vIHNjaGVkdWxlW3RpZXJdID0gYXJjNC5VSW50NjQocHJldmlvdXNfYnJlYWtwb2ludCkKICAgIGZyYW1lX2RpZyA2CiAgICBpdG9iCiAgICBmcmFtZV9kaWcgOAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBwdXNoaW50IDEyIC8vIDEyCiAgICA8CiAgICBhc3NlcnQgLy8gSW5kZXggYWNjZXNzIGlzIG91dCBvZiBib3VuZHMKICAgIGZyYW1lX2RpZyA1CiAgICBmcmFtZV9kaWcgMQogICAgdW5jb3ZlciAyCiAgICByZXBsYWNlMwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6ODMtODQKICAgIC8vICMgVW51c2VkIHRpZXJzIHJlcGVhdCB0aGUgbGFzdCBkaXNjb3VudCBzbyB0aGVpciBzdGVwIGlzIHplcm8uCiAgICAvLyBzY2hlZHVsZVtQUklDRV9USUVSUyArIHRpZXJdID0gYXJjNC5VSW50NjQocHJldmlvdXNfZGlzY291bnQpCiAgICBmcmFtZV9kaWcgNwogICAgaXRvYgogICAgaW50Y18zIC8vIDQKICAgIGRpZyAzCiAgICArCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIHN3YXAKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjcxCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgOAogICAgYiBzZXRfcHJpY2VfdGllcnNfZm9yX2hlYWRlckAyCgpzZXRfcHJpY2VfdGllcnNfZWxzZV9ib2R5QDU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weTo4MQogICAgLy8gcHJldmlvdXNfYnJlYWtwb2ludCA9IFVJbnQ2NChOT19CUkVBS1BPSU5UKQogICAgaW50YyA2IC8vIDE4NDQ2NzQ0MDczNzA5NTUxNjE1CiAgICBmcmFtZV9idXJ5IDYKICAgIGIgc2V0X3ByaWNlX3RpZXJzX2FmdGVyX2lmX2Vsc2VANgoKc2V0X3ByaWNlX3RpZXJzX2FmdGVyX2ZvckA3OgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6ODUKICAgIC8vIGZvciBsaWNlbnNlX3R5cGUgaW4gdXJhbmdlKExJQ0VOU0VfVFlQRVMpOgogICAgaW50Y18wIC8vIDAKICAgIGZyYW1lX2J1cnkgMgoKc2V0X3ByaWNlX3RpZXJzX2Zvcl9oZWFkZXJAODoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojg1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGZyYW1lX2RpZyAyCiAgICBpbnRjXzMgLy8gNAogICAgPAogICAgYnogc2V0X3ByaWNlX3RpZXJzX2FmdGVyX2ZvckAxMAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6ODYKICAgIC8vIGFzc2VydCBtdWx0aXBsaWVyc1tsaWNlbnNlX3R5cGVdLm5hdGl2ZSwgIk11bHRpcGxpZXIgbXVzdCBiZSBwb3NpdGl2ZSIKICAgIGZyYW1lX2RpZyAyCiAgICBkdXAKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBmcmFtZV9kaWcgLTEKICAgIGRpZyAxCiAgICBpbnRjXzIgLy8gOAogICAgZXh0cmFjdDMgLy8gb24gZXJyb3I6IEluZGV4IGFjY2VzcyBpcyBvdXQgb2YgYm91bmRzCiAgICBmcmFtZV9kaWcgLTEKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50NjQKICAgIGFzc2VydCAvLyBNdWx0aXBsaWVyIG11c3QgYmUgcG9zaXRpdmUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojg3CiAgICAvLyBzY2hlZHVsZVtQUklDRV9USUVSUyAqIDIgKyBsaWNlbnNlX3R5cGVdID0gbXVsdGlwbGllcnNbbGljZW5zZV90eXBlXQogICAgaW50Y18yIC8vIDgKICAgIGRpZyAyCiAgICArCiAgICBkdXAKICAgIHB1c2hpbnQgMTIgLy8gMTIKICAgIDwKICAgIGFzc2VydCAvLyBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgaW50Y18yIC8vIDgKICAgICoKICAgIGZyYW1lX2RpZyA1CiAgICBzd2FwCiAgICB1bmNvdmVyIDIKICAgIHJlcGxhY2UzCiAgICBmcmFtZV9idXJ5IDUKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5Ojg1CiAgICAvLyBmb3IgbGljZW5zZV90eXBlIGluIHVyYW5nZShMSUNFTlNFX1RZUEVTKToKICAgIGludGNfMSAvLyAxCiAgICArCiAgICBmcmFtZV9idXJ5IDIKICAgIGIgc2V0X3ByaWNlX3RpZXJzX2Zvcl9oZWFkZXJAOAoKc2V0X3ByaWNlX3RpZXJzX2FmdGVyX2ZvckAxMDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzQ0CiAgICAvLyBvZmZlci5wcmljaW5nID0gYnVpbGRfcHJpY2Vfc2NoZWR1bGUoYnJlYWtwb2ludHMsIGRpc2NvdW50cywgbXVsdGlwbGllcnMpCiAgICBmcmFtZV9kaWcgNAogICAgZnJhbWVfZGlnIDUKICAgIHJlcGxhY2UyIDU2CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM0NQogICAgLy8gc2VsZi5saWNlbnNlc1tsaWNlbnNlX2lkXSA9IG9mZmVyLmNvcHkoKQogICAgZnJhbWVfZGlnIDMKICAgIHN3YXAKICAgIGJveF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuc2V0X2NvbnRleHRfcmVnaXN0cnkoYXBwX2lkOiB1aW50NjQpIC0+IHZvaWQ6CnNldF9jb250ZXh0X3JlZ2lzdHJ5OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNDctMzQ4CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfY29udGV4dF9yZWdpc3RyeShzZWxmLCBhcHBfaWQ6IFVJbnQ2NCkgLT4gTm9uZToKICAgIHByb3RvIDEgMAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNTAKICAgIC8vIGFzc2VydCBUeG4uc2VuZGVyID09IHNlbGYuYWRtaW4sICJOb3QgYWRtaW4iCiAgICB0eG4gU2VuZGVyCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNCAvLyAiYWRtaW4iCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYuYWRtaW4gZXhpc3RzCiAgICA9PQogICAgYXNzZXJ0IC8vIE5vdCBhZG1pbgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNTEKICAgIC8vIHNlbGYuY29udGV4dF9yZWdpc3RyeSA9IGFwcF9pZAogICAgYnl0ZWMgOSAvLyAiY29udGV4dF9yZWdpc3RyeSIKICAgIGZyYW1lX2RpZyAtMQogICAgYXBwX2dsb2JhbF9wdXQKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuZ2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKCkgLT4gdWludDY0OgpnZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2U6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM1NgogICAgLy8gcmV0dXJuIHNlbGYucGxhdGZvcm1fZmVlCiAgICBpbnRjXzAgLy8gMAogICAgYnl0ZWMgNSAvLyAicGxhdGZvcm1fZmVlIgogICAgYXBwX2dsb2JhbF9nZXRfZXgKICAgIGFzc2VydCAvLyBjaGVjayBzZWxmLnBsYXRmb3JtX2ZlZSBleGlzdHMKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuc2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlKGZlZV9icHM6IHVpbnQ2NCkgLT4gdm9pZDoKc2V0X3BsYXRmb3JtX2ZlZV9wZXJjZW50YWdlOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNTgtMzU5CiAgICAvLyBAYWJpbWV0aG9kKCkKICAgIC8vIGRlZiBzZXRfcGxhdGZvcm1fZmVlX3BlcmNlbnRhZ2Uoc2VsZiwgZmVlX2JwczogVUludDY0KSAtPiBOb25lOgogICAgcHJvdG8gMSAwCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM2MQogICAgLy8gYXNzZXJ0IFR4bi5zZW5kZXIgPT0gc2VsZi5hZG1pbiwgIk5vdCBhZG1pbiIKICAgIHR4biBTZW5kZXIKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA0IC8vICJhZG1pbiIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5hZG1pbiBleGlzdHMKICAgID09CiAgICBhc3NlcnQgLy8gTm90IGFkbWluCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM2MgogICAgLy8gYXNzZXJ0IGZlZV9icHMgPD0gTUFYX1BMQVRGT1JNX0ZFRV9QRVJDRU5UQUdFLCAiRmVlIHRvbyBoaWdoIgogICAgZnJhbWVfZGlnIC0xCiAgICBwdXNoaW50IDEwMDAgLy8gMTAwMAogICAgPD0KICAgIGFzc2VydCAvLyBGZWUgdG9vIGhpZ2gKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzYzCiAgICAvLyBhcmM0LmVtaXQoUGxhdGZvcm1GZWVVcGRhdGVkKGFyYzQuVUludDY0KHNlbGYucGxhdGZvcm1fZmVlKSwgYXJjNC5VSW50NjQoZmVlX2JwcykpKQogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjIDUgLy8gInBsYXRmb3JtX2ZlZSIKICAgIGFwcF9nbG9iYWxfZ2V0X2V4CiAgICBhc3NlcnQgLy8gY2hlY2sgc2VsZi5wbGF0Zm9ybV9mZWUgZXhpc3RzCiAgICBpdG9iCiAgICBmcmFtZV9kaWcgLTEKICAgIGl0b2IKICAgIGNvbmNhdAogICAgcHVzaGJ5dGVzIDB4MjRhYmM5YzAgLy8gbWV0aG9kICJQbGF0Zm9ybUZlZVVwZGF0ZWQodWludDY0LHVpbnQ2NCkiCiAgICBzd2FwCiAgICBjb25jYXQKICAgIGxvZwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozNjQKICAgIC8vIHNlbGYucGxhdGZvcm1fZmVlID0gZmVlX2JwcwogICAgYnl0ZWMgNSAvLyAicGxhdGZvcm1fZmVlIgogICAgZnJhbWVfZGlnIC0xCiAgICBhcHBfZ2xvYmFsX3B1dAogICAgcmV0c3ViCgoKLy8gc21hcnRfY29udHJhY3RzLmxpY2Vuc2VfbWFuYWdlci5jb250cmFjdC5MaWNlbnNlTWFuYWdlci5fYXNzZXJ0X3BhaWQocGF5bWVudDogdWludDY0LCBwcmljZTogdWludDY0LCBtaW5fYmFsYW5jZTogdWludDY0KSAtPiB1aW50NjQ6Cl9hc3NlcnRfcGFpZDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzcwLTM3MwogICAgLy8gQHN1YnJvdXRpbmUKICAgIC8vIGRlZiBfYXNzZXJ0X3BhaWQoCiAgICAvLyAgICAgc2VsZiwgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sIHByaWNlOiBVSW50NjQsIG1pbl9iYWxhbmNlOiBVSW50NjQKICAgIC8vICkgLT4gVUludDY0OgogICAgcHJvdG8gMyAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM3OAogICAgLy8gYXNzZXJ0IHBheW1lbnQucmVjZWl2ZXIgPT0gR2xvYmFsLmN1cnJlbnRfYXBwbGljYXRpb25fYWRkcmVzcywgIldyb25nIHJlY2VpdmVyIgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBSZWNlaXZlcgogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgID09CiAgICBhc3NlcnQgLy8gV3JvbmcgcmVjZWl2ZXIKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mzc5CiAgICAvLyBhZGRlZCA9IEdsb2JhbC5jdXJyZW50X2FwcGxpY2F0aW9uX2FkZHJlc3MubWluX2JhbGFuY2UgLSBtaW5fYmFsYW5jZQogICAgZ2xvYmFsIEN1cnJlbnRBcHBsaWNhdGlvbkFkZHJlc3MKICAgIGFjY3RfcGFyYW1zX2dldCBBY2N0TWluQmFsYW5jZQogICAgYXNzZXJ0IC8vIGFjY291bnQgZnVuZGVkCiAgICBmcmFtZV9kaWcgLTEKICAgIC0KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6MzgwCiAgICAvLyBhc3NlcnQgcGF5bWVudC5hbW91bnQgPj0gcHJpY2UgKyBhZGRlZCwgIkluc3VmZmljaWVudCBwYXltZW50IgogICAgZnJhbWVfZGlnIC0zCiAgICBndHhucyBBbW91bnQKICAgIGZyYW1lX2RpZyAtMgogICAgZGlnIDIKICAgICsKICAgIGRpZyAxCiAgICA8PQogICAgYXNzZXJ0IC8vIEluc3VmZmljaWVudCBwYXltZW50CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM4MQogICAgLy8gcmV0dXJuIHBheW1lbnQuYW1vdW50IC0gYWRkZWQKICAgIHN3YXAKICAgIC0KICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuX3F1b3RlKGxpY2Vuc2VfaWQ6IHVpbnQ2NCwgcXVhbnRpdHk6IHVpbnQ2NCkgLT4gdWludDY0OgpfcXVvdGU6CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM4My0zODQKICAgIC8vIEBzdWJyb3V0aW5lCiAgICAvLyBkZWYgX3F1b3RlKHNlbGYsIGxpY2Vuc2VfaWQ6IFVJbnQ2NCwgcXVhbnRpdHk6IFVJbnQ2NCkgLT4gVUludDY0OgogICAgcHJvdG8gMiAxCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM4NS0zODYKICAgIC8vICMgT25lIGJveF9leHRyYWN0IGNvdmVycyB0aGUgbGljZW5zZSB0eXBlLCB1bml0IHByaWNlIGFuZCBzY2hlZHVsZS4KICAgIC8vIGtleSA9IHNlbGYubGljZW5zZXMua2V5X3ByZWZpeCArIG9wLml0b2IobGljZW5zZV9pZCkKICAgIGZyYW1lX2RpZyAtMgogICAgaXRvYgogICAgYnl0ZWNfMiAvLyAweDZjNjk2MzVmCiAgICBzd2FwCiAgICBjb25jYXQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6Mzg3CiAgICAvLyByYXcgPSBvcC5Cb3guZXh0cmFjdChrZXksIExJQ0VOU0VfVFlQRV9PRkZTRVQsIDE2ICsgMTIgKiA4KQogICAgcHVzaGludHMgNDAgMTEyIC8vIDQwLCAxMTIKICAgIGJveF9leHRyYWN0CiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gcmV0dXJuIHF1b3RlX3ByaWNlKG9wLmV4dHJhY3QocmF3LCA4LCAwKSwgcXVhbnRpdHksIG9wLmV4dHJhY3RfdWludDY0KHJhdywgMCkpCiAgICBkdXAKICAgIGV4dHJhY3QgOCAwCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6OTkKICAgIC8vIGFzc2VydCBsaWNlbnNlX3R5cGUgPCBMSUNFTlNFX1RZUEVTLCAiVW5rbm93biBsaWNlbnNlIHR5cGUiCiAgICBpbnRjXzMgLy8gNAogICAgPAogICAgYXNzZXJ0IC8vIFVua25vd24gbGljZW5zZSB0eXBlCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weToxMDAKICAgIC8vIGRpc2NvdW50ID0gVUludDY0KDApCiAgICBpbnRjXzAgLy8gMAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAxLTEwMgogICAgLy8gcHJldmlvdXMgPSBVSW50NjQoMCkKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBkdXBuIDIKCl9xdW90ZV9mb3JfaGVhZGVyQDI6CiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weToxMDIKICAgIC8vIGZvciB0aWVyIGluIHVyYW5nZShQUklDRV9USUVSUyk6CiAgICBmcmFtZV9kaWcgNAogICAgaW50Y18zIC8vIDQKICAgIDwKICAgIGJ6IF9xdW90ZV9hZnRlcl9mb3JANAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAzCiAgICAvLyByZWFjaGVkID0gb3AuZXh0cmFjdF91aW50NjQocHJpY2luZywgOCArIChQUklDRV9USUVSUyArIHRpZXIpICogOCkKICAgIGludGNfMyAvLyA0CiAgICBmcmFtZV9kaWcgNAogICAgZHVwCiAgICBjb3ZlciAyCiAgICArCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIGZyYW1lX2RpZyAwCiAgICBkdXAKICAgIHVuY292ZXIgMgogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNAogICAgLy8gYnJlYWtwb2ludCA9IG9wLmV4dHJhY3RfdWludDY0KHByaWNpbmcsIDggKyB0aWVyICogOCkKICAgIGRpZyAyCiAgICBpbnRjXzIgLy8gOAogICAgKgogICAgaW50Y18yIC8vIDgKICAgICsKICAgIHVuY292ZXIgMgogICAgc3dhcAogICAgZXh0cmFjdF91aW50NjQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNQogICAgLy8gZGlzY291bnQgKz0gb3Auc2VsZWN0X3VpbnQ2NCgwLCByZWFjaGVkIC0gcHJldmlvdXMsIHF1YW50aXR5ID49IGJyZWFrcG9pbnQpCiAgICBkaWcgMQogICAgZnJhbWVfZGlnIDMKICAgIC0KICAgIGZyYW1lX2RpZyAtMQogICAgdW5jb3ZlciAyCiAgICA+PQogICAgaW50Y18wIC8vIDAKICAgIGNvdmVyIDIKICAgIHNlbGVjdAogICAgZnJhbWVfZGlnIDIKICAgICsKICAgIGZyYW1lX2J1cnkgMgogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTAyCiAgICAvLyBmb3IgdGllciBpbiB1cmFuZ2UoUFJJQ0VfVElFUlMpOgogICAgc3dhcAogICAgaW50Y18xIC8vIDEKICAgICsKICAgIGZyYW1lX2J1cnkgNAogICAgZnJhbWVfYnVyeSAzCiAgICBiIF9xdW90ZV9mb3JfaGVhZGVyQDIKCl9xdW90ZV9hZnRlcl9mb3JANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjEwNwogICAgLy8gbXVsdGlwbGllciA9IG9wLmV4dHJhY3RfdWludDY0KHByaWNpbmcsIDggKyAoUFJJQ0VfVElFUlMgKiAyICsgbGljZW5zZV90eXBlKSAqIDgpCiAgICBpbnRjXzIgLy8gOAogICAgZnJhbWVfZGlnIDEKICAgICsKICAgIGludGNfMiAvLyA4CiAgICAqCiAgICBpbnRjXzIgLy8gOAogICAgKwogICAgZnJhbWVfZGlnIDAKICAgIGR1cAogICAgdW5jb3ZlciAyCiAgICBleHRyYWN0X3VpbnQ2NAogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTA4CiAgICAvLyB0b3RhbCA9IG9wLmV4dHJhY3RfdWludDY0KHByaWNpbmcsIDApICogcXVhbnRpdHkgKiBtdWx0aXBsaWVyIC8vIDEwMDAwCiAgICBzd2FwCiAgICBpbnRjXzAgLy8gMAogICAgZXh0cmFjdF91aW50NjQKICAgIGZyYW1lX2RpZyAtMQogICAgKgogICAgKgogICAgaW50YyA0IC8vIDEwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvdXRpbHMvaGVscGVycy5weToxMDkKICAgIC8vIHJldHVybiB0b3RhbCAqICgxMDAwMCAtIGRpc2NvdW50KSAvLyAxMDAwMAogICAgaW50YyA0IC8vIDEwMDAwCiAgICBmcmFtZV9kaWcgMgogICAgLQogICAgKgogICAgaW50YyA0IC8vIDEwMDAwCiAgICAvCiAgICAvLyBzbWFydF9jb250cmFjdHMvbGljZW5zZV9tYW5hZ2VyL2NvbnRyYWN0LnB5OjM4OAogICAgLy8gcmV0dXJuIHF1b3RlX3ByaWNlKG9wLmV4dHJhY3QocmF3LCA4LCAwKSwgcXVhbnRpdHksIG9wLmV4dHJhY3RfdWludDY0KHJhdywgMCkpCiAgICBmcmFtZV9idXJ5IDAKICAgIHJldHN1YgoKCi8vIHNtYXJ0X2NvbnRyYWN0cy5saWNlbnNlX21hbmFnZXIuY29udHJhY3QuTGljZW5zZU1hbmFnZXIuX2NvbGxlY3QobGljZW5zZV9pZDogdWludDY0LCBvZmZlcjogYnl0ZXMsIHBheW1lbnQ6IHVpbnQ2NCwgbWluX2JhbGFuY2U6IHVpbnQ2NCkgLT4gYnl0ZXM6Cl9jb2xsZWN0OgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTozOTAtMzk3CiAgICAvLyBAc3Vicm91dGluZQogICAgLy8gZGVmIF9jb2xsZWN0KAogICAgLy8gICAgIHNlbGYsCiAgICAvLyAgICAgbGljZW5zZV9pZDogVUludDY0LAogICAgLy8gICAgIG9mZmVyOiBMaWNlbnNlT2ZmZXIsCiAgICAvLyAgICAgcGF5bWVudDogZ3R4bi5QYXltZW50VHJhbnNhY3Rpb24sCiAgICAvLyAgICAgbWluX2JhbGFuY2U6IFVJbnQ2NCwKICAgIC8vICkgLT4gTm9uZToKICAgIHByb3RvIDQgMQogICAgYnl0ZWNfMyAvLyAiIgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MDMKICAgIC8vIHByaWNlID0gc2VsZi5fcXVvdGUobGljZW5zZV9pZCwgVUludDY0KDEpKQogICAgZnJhbWVfZGlnIC00CiAgICBpbnRjXzEgLy8gMQogICAgY2FsbHN1YiBfcXVvdGUKICAgIGR1cAogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MDQtNDA2CiAgICAvLyAjIFdyaXR0ZW4gbm93IHNvIGEgZmlyc3Qgc2FsZSdzIGJhbGFuY2UgYm94IGlzIHBhcnQgb2YgdGhlIE1CUiBjaGVja2VkCiAgICAvLyAjIGJlbG93OyBhIGZyZWUgc2FsZSBlYXJucyBub3RoaW5nIGFuZCBvcGVucyBubyBib3guCiAgICAvLyBjcmVhdG9yID0gb2ZmZXIuY3JlYXRvci5uYXRpdmUKICAgIGZyYW1lX2RpZyAtMwogICAgZXh0cmFjdCA4IDMyIC8vIG9uIGVycm9yOiBJbmRleCBhY2Nlc3MgaXMgb3V0IG9mIGJvdW5kcwogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MDcKICAgIC8vIGNyZWF0b3JfYW1vdW50ID0gY2FsY3VsYXRlX2NyZWF0b3JfYW1vdW50KHByaWNlLCBzZWxmLnBsYXRmb3JtX2ZlZSkKICAgIGludGNfMCAvLyAwCiAgICBieXRlYyA1IC8vICJwbGF0Zm9ybV9mZWUiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxhdGZvcm1fZmVlIGV4aXN0cwogICAgLy8gc21hcnRfY29udHJhY3RzL3V0aWxzL2hlbHBlcnMucHk6MTYKICAgIC8vIHJldHVybiAoYW1vdW50ICogZmVlX2JwcykgLy8gMTAwMDAKICAgIGRpZyAyCiAgICAqCiAgICBpbnRjIDQgLy8gMTAwMDAKICAgIC8KICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy91dGlscy9oZWxwZXJzLnB5OjIyCiAgICAvLyByZXR1cm4gYW1vdW50IC0gY2FsY3VsYXRlX3BsYXRmb3JtX2ZlZShhbW91bnQsIGZlZV9icHMpCiAgICB1bmNvdmVyIDIKICAgIHN3YXAKICAgIC0KICAgIGR1cAogICAgY292ZXIgMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MDgKICAgIC8vIGVhcm5lZCA9IHNlbGYuYmFsYW5jZXMuZ2V0KGNyZWF0b3IsIGRlZmF1bHQ9VUludDY0KDApKQogICAgYnl0ZWMgNyAvLyAweDYyNjE2YzVmCiAgICB1bmNvdmVyIDIKICAgIGNvbmNhdAogICAgZHVwCiAgICBjb3ZlciAyCiAgICBib3hfZ2V0CiAgICBzd2FwCiAgICBidG9pCiAgICBpbnRjXzAgLy8gMAogICAgc3dhcAogICAgdW5jb3ZlciAyCiAgICBzZWxlY3QKICAgIHN3YXAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6NDA5CiAgICAvLyBpZiBjcmVhdG9yX2Ftb3VudDoKICAgIGJ6IF9jb2xsZWN0X2FmdGVyX2lmX2Vsc2VAMgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MTAKICAgIC8vIHNlbGYuYmFsYW5jZXNbY3JlYXRvcl0gPSBlYXJuZWQKICAgIGZyYW1lX2RpZyA0CiAgICBpdG9iCiAgICBmcmFtZV9kaWcgMwogICAgc3dhcAogICAgYm94X3B1dAoKX2NvbGxlY3RfYWZ0ZXJfaWZfZWxzZUAyOgogICAgLy8gc21hcnRfY29udHJhY3RzL2xpY2Vuc2VfbWFuYWdlci9jb250cmFjdC5weTo0MTIKICAgIC8vIHBhaWQgPSBzZWxmLl9hc3NlcnRfcGFpZChwYXltZW50LCBwcmljZSwgbWluX2JhbGFuY2UpCiAgICBmcmFtZV9kaWcgLTIKICAgIGZyYW1lX2RpZyAxCiAgICBmcmFtZV9kaWcgLTEKICAgIGNhbGxzdWIgX2Fzc2VydF9wYWlkCiAgICBmcmFtZV9idXJ5IDAKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6NDEzCiAgICAvLyBpZiBjcmVhdG9yX2Ftb3VudDoKICAgIGZyYW1lX2RpZyAyCiAgICBieiBfY29sbGVjdF9hZnRlcl9pZl9lbHNlQDQKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6NDE0CiAgICAvLyBzZWxmLmJhbGFuY2VzW2NyZWF0b3JdID0gZWFybmVkICsgY3JlYXRvcl9hbW91bnQKICAgIGZyYW1lX2RpZyA0CiAgICBmcmFtZV9kaWcgMgogICAgKwogICAgaXRvYgogICAgZnJhbWVfZGlnIDMKICAgIHN3YXAKICAgIGJveF9wdXQKCl9jb2xsZWN0X2FmdGVyX2lmX2Vsc2VANDoKICAgIC8vIHNtYXJ0X2NvbnRyYWN0cy9saWNlbnNlX21hbmFnZXIvY29udHJhY3QucHk6NDE1LTQxNgogICAgLy8gIyBUaGUgZmVlIGFuZCBhbnl0aGluZyBwYWlkIGJleW9uZCB0aGUgcHJpY2UgZ28gdG8gdGhlIHBsYXRmb3JtLgogICAgLy8gc2VsZi5wbGF0Zm9ybV9iYWxhbmNlICs9IHBhaWQgLSBjcmVhdG9yX2Ftb3VudAogICAgaW50Y18wIC8vIDAKICAgIGJ5dGVjXzEgLy8gInBsYXRmb3JtX2JhbGFuY2UiCiAgICBhcHBfZ2xvYmFsX2dldF9leAogICAgYXNzZXJ0IC8vIGNoZWNrIHNlbGYucGxhdGZvcm1fYmFsYW5jZSBleGlzdHMKICAgIGZyYW1lX2RpZyAwCiAgICBmcmFtZV9kaWcgMgogICAgLQogICAgKwogICAgYnl0ZWNfMSAvLyAicGxhdGZvcm1fYmFsYW5jZSIKICAgIHN3YXAKICAgIGFwcF9nbG9iYWxfcHV0CiAgICBmcmFtZV9kaWcgLTMKICAgIGZyYW1lX2J1cnkgMAogICAgcmV0c3ViCg==", "clear": "I3ByYWdtYSB2ZXJzaW9uIDEwCiNwcmFnbWEgdHlwZXRyYWNrIGZhbHNlCgovLyBhbGdvcHkuYXJjNC5BUkM0Q29udHJhY3QuY2xlYXJfc3RhdGVfcHJvZ3JhbSgpIC0+IHVpbnQ2NDoKbWFpbjoKICAgIHB1c2hpbnQgMSAvLyAxCiAgICByZXR1cm4K"}, "sourceInfo": {"approval": {"pcOffsetMethod": "none", "sourceInfo": [{"pc": [910], "errorMessage": "Already licensed"}, {"pc": [1645], "errorMessage": "Breakpoints must ascend"}, {"pc": [732], "errorMessage": "Context registry not set"}, {"pc": [1660], "errorMessage": "Discount above 100%"}, {"pc": [1655], "errorMessage": "Discounts must not drop"}, {"pc": [1822], "errorMessage": "Fee too high"}, {"pc": [1638], "errorMessage": "Gap in price tiers"}, {"pc": [610, 658, 944, 1085, 1121, 1177, 1208, 1223, 1233, 1389, 1405, 1433, 1438, 1443, 1595, 1676, 1695, 1736, 1751, 2023], "errorMessage": "Index access is out of bounds"}, {"pc": [1879], "errorMessage": "Insufficient payment"}, {"pc": [1014], "errorMessage": "License does not expire"}, {"pc": [1242], "errorMessage": "License never lapses"}, {"pc": [1257], "errorMessage": "License still valid"}, {"pc": [1742], "errorMessage": "Multiplier must be positive"}, {"pc": [1518, 1791, 1815], "errorMessage": "Not admin"}, {"pc": [774], "errorMessage": "Not context creator"}, {"pc": [1127, 1214, 1601], "errorMessage": "Not creator"}, {"pc": [1272], "errorMessage": "Not licensed"}, {"pc": [1473, 1524], "errorMessage": "Nothing to withdraw"}, {"pc": [253, 269, 286, 302, 327, 352, 372, 389, 406, 429, 448, 476, 507, 538], "errorMessage": "OnCompletion is not NoOp"}, {"pc": [698], "errorMessage": "Price too low"}, {"pc": [714], "errorMessage": "Subscription needs a duration"}, {"pc": [704, 1907], "errorMessage": "Unknown license type"}, {"pc": [1162], "errorMessage": "Usage limit exceeded"}, {"pc": [725], "errorMessage": "Usage-based license needs a limit"}, {"pc": [1858], "errorMessage": "Wrong receiver"}, {"pc": [779, 918, 1025, 1277, 1286, 1478, 1490, 1863], "errorMessage": "account funded"}, {"pc": [767], "errorMessage": "application log value is not the result of an ABI return"}, {"pc": [256, 272, 289, 305, 330, 355, 375, 392, 409, 432, 451, 479, 510, 541], "errorMessage": "can only call when not creating"}, {"pc": [1516, 1533, 1789, 1813], "errorMessage": "check self.admin exists"}, {"pc": [730], "errorMessage": "check self.context_registry exists"}, {"pc": [1048, 1142], "errorMessage": "check self.grants entry exists"}, {"pc": [784], "errorMessage": "check self.license_count exists"}, {"pc": [895, 1009, 1120, 1207, 1594], "errorMessage": "check self.licenses entry exists"}, {"pc": [841, 1522, 2100], "errorMessage": "check self.platform_balance exists"}, {"pc": [1802, 1827, 2030], "errorMessage": "check self.platform_fee exists"}, {"pc": [493, 524, 571], "errorMessage": "transaction type is pay"}]}, "clear": {"pcOffsetMethod": "none", "sourceInfo": []}}, "templateVariables": {}}"""
 APP_SPEC = algokit_utils.Arc56Contract.from_json(_APP_SPEC_JSON)
 
 def _parse_abi_args(args: object | None = None) -> list[object] | None:
@@ -64,34 +64,146 @@ def _init_dataclass(cls: type, data: dict) -> object:
             field_values[field.name] = field_value
     return cls(**field_values)
 
+@dataclasses.dataclass(frozen=True)
+class LicenseGrant:
+    """Struct for LicenseGrant"""
+    expiry: int
+    usage_count: int
+    usage_limit: int
+
+@dataclasses.dataclass(frozen=True)
+class LicenseOffer:
+    """Struct for LicenseOffer"""
+    context_id: int
+    creator: str
+    license_type: int
+    price: int
+    pricing: tuple[int, int, int, int, int, int, int, int, int, int, int, int]
+    duration: int
+    usage_limit: int
+
+@dataclasses.dataclass(frozen=True)
+class LicenseStatus:
+    """Struct for LicenseStatus"""
+    valid: bool
+    expiry: int
+    usage_count: int
+    usage_limit: int
+
+
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class CreateLicenseArgs:
     """Dataclass for create_license arguments"""
-    context_id: str
+    context_id: int
     license_type: int
     price: int
+    duration: int
+    usage_limit: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "create_license(string,uint64,uint64)string"
+        return "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class PurchaseLicenseArgs:
     """Dataclass for purchase_license arguments"""
-    license_id: str
+    license_id: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
 
     @property
     def abi_method_signature(self) -> str:
-        return "purchase_license(string)string"
+        return "purchase_license(uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RenewLicenseArgs:
+    """Dataclass for renew_license arguments"""
+    license_id: int
+    payment: algokit_utils.AppMethodCallTransactionArgument
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "renew_license(uint64,pay)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RecordUsageArgs:
+    """Dataclass for record_usage arguments"""
+    license_id: int
+    holder: str
+    uses: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "record_usage(uint64,address,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class RevokeLicenseArgs:
+    """Dataclass for revoke_license arguments"""
+    license_id: int
+    holder: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "revoke_license(uint64,address)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class CheckLicenseArgs:
+    """Dataclass for check_license arguments"""
+    license_id: int
+    holder: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "check_license(uint64,address)(bool,uint64,uint64,uint64)"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class GetBalanceArgs:
+    """Dataclass for get_balance arguments"""
+    creator: str
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_balance(address)uint64"
 
 @dataclasses.dataclass(frozen=True, kw_only=True)
 class GetLicensePriceArgs:
     """Dataclass for get_license_price arguments"""
-    license_id: str
+    license_id: int
+    quantity: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "get_license_price(uint64,uint64)uint64"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPriceTiersArgs:
+    """Dataclass for set_price_tiers arguments"""
+    license_id: int
+    breakpoints: tuple[int, int, int, int]
+    discounts: tuple[int, int, int, int]
+    multipliers: tuple[int, int, int, int]
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetContextRegistryArgs:
+    """Dataclass for set_context_registry arguments"""
+    app_id: int
+
+    @property
+    def abi_method_signature(self) -> str:
+        return "set_context_registry(uint64)void"
+
+@dataclasses.dataclass(frozen=True, kw_only=True)
+class SetPlatformFeePercentageArgs:
+    """Dataclass for set_platform_fee_percentage arguments"""
+    fee_bps: int
 
     @property
     def abi_method_signature(self) -> str:
-        return "get_license_price(string)uint64"
+        return "set_platform_fee_percentage(uint64)void"
 
 
 class LicenseManagerParams:
@@ -100,40 +212,153 @@ class LicenseManagerParams:
 
     def create_license(
         self,
-        args: tuple[str, int, int] | CreateLicenseArgs,
+        args: tuple[int, int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | CreateLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_license(string,uint64,uint64)string",
+            "method": "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64",
             "args": method_args,
         }))
 
     def purchase_license(
         self,
-        args: tuple[str] | PurchaseLicenseArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_license(string)string",
+            "method": "purchase_license(uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def renew_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | RenewLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "renew_license(uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def record_usage(
+        self,
+        args: tuple[int, str, int] | RecordUsageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "record_usage(uint64,address,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def revoke_license(
+        self,
+        args: tuple[int, str] | RevokeLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_license(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def check_license(
+        self,
+        args: tuple[int, str] | CheckLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "check_license(uint64,address)(bool,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw()uint64",
+        }))
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_platform_fees()uint64",
+        }))
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balance(address)uint64",
             "args": method_args,
         }))
 
     def get_license_price(
         self,
-        args: tuple[str] | GetLicensePriceArgs,
+        args: tuple[int, int] | GetLicensePriceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_license_price(uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.AppCallMethodCallParams:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_license_price(string)uint64",
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
+            "args": method_args,
+        }))
+
+    def set_context_registry(
+        self,
+        args: tuple[int] | SetContextRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_context_registry(uint64)void",
             "args": method_args,
         }))
 
@@ -148,6 +373,19 @@ class LicenseManagerParams:
             "method": "get_platform_fee_percentage()uint64",
         }))
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.AppCallMethodCallParams:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.params.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }))
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -165,40 +403,153 @@ class LicenseManagerCreateTransactionParams:
 
     def create_license(
         self,
-        args: tuple[str, int, int] | CreateLicenseArgs,
+        args: tuple[int, int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | CreateLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_license(string,uint64,uint64)string",
+            "method": "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64",
             "args": method_args,
         }))
 
     def purchase_license(
         self,
-        args: tuple[str] | PurchaseLicenseArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "purchase_license(uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def renew_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | RenewLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "renew_license(uint64,pay)uint64",
+            "args": method_args,
+        }))
+
+    def record_usage(
+        self,
+        args: tuple[int, str, int] | RecordUsageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "record_usage(uint64,address,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def revoke_license(
+        self,
+        args: tuple[int, str] | RevokeLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_license(uint64,address)void",
+            "args": method_args,
+        }))
+
+    def check_license(
+        self,
+        args: tuple[int, str] | CheckLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_license(string)string",
+            "method": "check_license(uint64,address)(bool,uint64,uint64,uint64)",
+            "args": method_args,
+        }))
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw()uint64",
+        }))
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_platform_fees()uint64",
+        }))
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balance(address)uint64",
             "args": method_args,
         }))
 
     def get_license_price(
         self,
-        args: tuple[str] | GetLicensePriceArgs,
+        args: tuple[int, int] | GetLicensePriceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_license_price(uint64,uint64)uint64",
+            "args": method_args,
+        }))
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
+            "args": method_args,
+        }))
+
+    def set_context_registry(
+        self,
+        args: tuple[int] | SetContextRegistryArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> algokit_utils.BuiltTransactions:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_license_price(string)uint64",
+            "method": "set_context_registry(uint64)void",
             "args": method_args,
         }))
 
@@ -213,68 +564,221 @@ class LicenseManagerCreateTransactionParams:
             "method": "get_platform_fee_percentage()uint64",
         }))
 
-    def clear_state(
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> algokit_utils.BuiltTransactions:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        return self.app_client.create_transaction.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }))
+
+    def clear_state(
+        self,
+        params: algokit_utils.AppClientBareCallParams | None = None,
+        
+    ) -> Transaction:
+        return self.app_client.create_transaction.bare.clear_state(
+            params,
+            
+        )
+
+
+class LicenseManagerSend:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+
+    def create_license(
+        self,
+        args: tuple[int, int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | CreateLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def purchase_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "purchase_license(uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def renew_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | RenewLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "renew_license(uint64,pay)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def record_usage(
+        self,
+        args: tuple[int, str, int] | RecordUsageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "record_usage(uint64,address,uint64)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def revoke_license(
+        self,
+        args: tuple[int, str] | RevokeLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "revoke_license(uint64,address)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
+    def check_license(
+        self,
+        args: tuple[int, str] | CheckLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[LicenseStatus]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "check_license(uint64,address)(bool,uint64,uint64,uint64)",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = dataclasses.replace(response, abi_return=_init_dataclass(LicenseStatus, typing.cast(dict, response.abi_return))) # type: ignore
+        return typing.cast(algokit_utils.SendAppTransactionResult[LicenseStatus], parsed_response)
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+    
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "withdraw_platform_fees()uint64",
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+
+    def get_balance(
         self,
-        params: algokit_utils.AppClientBareCallParams | None = None,
-        
-    ) -> Transaction:
-        return self.app_client.create_transaction.bare.clear_state(
-            params,
-            
-        )
-
-
-class LicenseManagerSend:
-    def __init__(self, app_client: algokit_utils.AppClient):
-        self.app_client = app_client
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[int]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "get_balance(address)uint64",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def create_license(
+    def get_license_price(
         self,
-        args: tuple[str, int, int] | CreateLicenseArgs,
+        args: tuple[int, int] | GetLicensePriceArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[int]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "create_license(string,uint64,uint64)string",
+            "method": "get_license_price(uint64,uint64)uint64",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
-    def purchase_license(
+    def set_price_tiers(
         self,
-        args: tuple[str] | PurchaseLicenseArgs,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[str]:
+    ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "purchase_license(string)string",
+            "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[str], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
-    def get_license_price(
+    def set_context_registry(
         self,
-        args: tuple[str] | GetLicensePriceArgs,
+        args: tuple[int] | SetContextRegistryArgs,
         params: algokit_utils.CommonAppCallParams | None = None,
         send_params: algokit_utils.SendParams | None = None
-    ) -> algokit_utils.SendAppTransactionResult[int]:
+    ) -> algokit_utils.SendAppTransactionResult[None]:
         method_args = _parse_abi_args(args)
         params = params or algokit_utils.CommonAppCallParams()
         response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
             **dataclasses.asdict(params),
-            "method": "get_license_price(string)uint64",
+            "method": "set_context_registry(uint64)void",
             "args": method_args,
         }), send_params=send_params)
         parsed_response = response
-        return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
 
     def get_platform_fee_percentage(
         self,
@@ -290,6 +794,22 @@ class LicenseManagerSend:
         parsed_response = response
         return typing.cast(algokit_utils.SendAppTransactionResult[int], parsed_response)
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None,
+        send_params: algokit_utils.SendParams | None = None
+    ) -> algokit_utils.SendAppTransactionResult[None]:
+        method_args = _parse_abi_args(args)
+        params = params or algokit_utils.CommonAppCallParams()
+        response = self.app_client.send.call(algokit_utils.AppClientMethodCallParams(**{
+            **dataclasses.asdict(params),
+            "method": "set_platform_fee_percentage(uint64)void",
+            "args": method_args,
+        }), send_params=send_params)
+        parsed_response = response
+        return typing.cast(algokit_utils.SendAppTransactionResult[None], parsed_response)
+
     def clear_state(
         self,
         params: algokit_utils.AppClientBareCallParams | None = None,
@@ -301,12 +821,185 @@ class LicenseManagerSend:
         )
 
 
+class GlobalStateValue(typing.TypedDict):
+    """Shape of global_state state key values"""
+    admin: str
+    platform_fee: int
+    license_count: int
+    platform_balance: int
+    context_registry: int
+
 class LicenseManagerState:
     """Methods to access state for the current LicenseManager app"""
 
     def __init__(self, app_client: algokit_utils.AppClient):
         self.app_client = app_client
 
+    @property
+    def global_state(
+        self
+    ) -> "_GlobalState":
+            """Methods to access global_state for the current app"""
+            return _GlobalState(self.app_client)
+
+    @property
+    def box(
+        self
+    ) -> "_BoxState":
+            """Methods to access box for the current app"""
+            return _BoxState(self.app_client)
+
+class _GlobalState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {}
+
+    def get_all(self) -> GlobalStateValue:
+        """Get all current keyed values from global_state state"""
+        result = self.app_client.state.global_state.get_all()
+        if not result:
+            return typing.cast(GlobalStateValue, {})
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.global_state.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return typing.cast(GlobalStateValue, converted)
+
+    @property
+    def admin(self) -> str:
+        """Get the current value of the admin key in global_state state"""
+        value = self.app_client.state.global_state.get_value("admin")
+        if isinstance(value, dict) and "address" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["address"], value)  # type: ignore
+        return typing.cast(str, value)
+
+    @property
+    def platform_fee(self) -> int:
+        """Get the current value of the platform_fee key in global_state state"""
+        value = self.app_client.state.global_state.get_value("platform_fee")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def license_count(self) -> int:
+        """Get the current value of the license_count key in global_state state"""
+        value = self.app_client.state.global_state.get_value("license_count")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def platform_balance(self) -> int:
+        """Get the current value of the platform_balance key in global_state state"""
+        value = self.app_client.state.global_state.get_value("platform_balance")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+    @property
+    def context_registry(self) -> int:
+        """Get the current value of the context_registry key in global_state state"""
+        value = self.app_client.state.global_state.get_value("context_registry")
+        if isinstance(value, dict) and "AVMUint64" in self._struct_classes:
+            return _init_dataclass(self._struct_classes["AVMUint64"], value)  # type: ignore
+        return typing.cast(int, value)
+
+class _BoxState:
+    def __init__(self, app_client: algokit_utils.AppClient):
+        self.app_client = app_client
+        
+        # Pre-generated mapping of value types to their struct classes
+        self._struct_classes: dict[str, typing.Type[typing.Any]] = {
+            "LicenseOffer": LicenseOffer,
+            "LicenseGrant": LicenseGrant
+        }
+
+    def get_all(self) -> dict[str, typing.Any]:
+        """Get all current keyed values from box state"""
+        result = self.app_client.state.box.get_all()
+        if not result:
+            return {}
+
+        converted = {}
+        for key, value in result.items():
+            key_info = self.app_client.app_spec.state.keys.box.get(key)
+            struct_class = self._struct_classes.get(key_info.value_type) if key_info else None
+            converted[key] = (
+                _init_dataclass(struct_class, value) if struct_class and isinstance(value, dict)
+                else value
+            )
+        return converted
+
+    @property
+    def licenses(self) -> "_MapState[int, LicenseOffer]":
+        """Get values from the licenses map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "licenses",
+            self._struct_classes.get("LicenseOffer")
+        )
+
+    @property
+    def grants(self) -> "_MapState[bytes, LicenseGrant]":
+        """Get values from the grants map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "grants",
+            self._struct_classes.get("LicenseGrant")
+        )
+
+    @property
+    def balances(self) -> "_MapState[str, int]":
+        """Get values from the balances map in box state"""
+        return _MapState(
+            self.app_client.state.box,
+            "balances",
+            None
+        )
+
+_KeyType = typing.TypeVar("_KeyType")
+_ValueType = typing.TypeVar("_ValueType")
+
+class _AppClientStateMethodsProtocol(typing.Protocol):
+    def get_map(self, map_name: str) -> dict[typing.Any, typing.Any]:
+        ...
+    def get_map_value(self, map_name: str, key: typing.Any) -> typing.Any | None:
+        ...
+
+class _MapState(typing.Generic[_KeyType, _ValueType]):
+    """Generic class for accessing state maps with strongly typed keys and values"""
+
+    def __init__(self, state_accessor: _AppClientStateMethodsProtocol, map_name: str,
+                struct_class: typing.Type[_ValueType] | None = None):
+        self._state_accessor = state_accessor
+        self._map_name = map_name
+        self._struct_class = struct_class
+
+    def get_map(self) -> dict[_KeyType, _ValueType]:
+        """Get all current values in the map"""
+        result = self._state_accessor.get_map(self._map_name)
+        if self._struct_class and result:
+            return {k: _init_dataclass(self._struct_class, v) if isinstance(v, dict) else v
+                    for k, v in result.items()}  # type: ignore
+        return typing.cast(dict[_KeyType, _ValueType], result or {})
+
+    def get_value(self, key: _KeyType) -> _ValueType | None:
+        """Get a value from the map by key"""
+        key_value = dataclasses.asdict(key) if dataclasses.is_dataclass(key) else key  # type: ignore
+        value = self._state_accessor.get_map_value(self._map_name, key_value)
+        if value is not None and self._struct_class and isinstance(value, dict):
+            return _init_dataclass(self._struct_class, value)  # type: ignore
+        return typing.cast(_ValueType | None, value)
+
+
 class LicenseManagerClient:
     """Client for interacting with LicenseManager smart contract"""
 
@@ -453,28 +1146,88 @@ class LicenseManagerClient:
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["create_license(string,uint64,uint64)string"],
+        method: typing.Literal["create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["purchase_license(uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["renew_license(uint64,pay)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["record_usage(uint64,address,uint64)uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["revoke_license(uint64,address)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["check_license(uint64,address)(bool,uint64,uint64,uint64)"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> LicenseStatus | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw()uint64"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> int | None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["withdraw_platform_fees()uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["purchase_license(string)string"],
+        method: typing.Literal["get_balance(address)uint64"],
         return_value: algokit_utils.ABIReturn | None
-    ) -> str | None: ...
+    ) -> int | None: ...
     @typing.overload
     def decode_return_value(
         self,
-        method: typing.Literal["get_license_price(string)uint64"],
+        method: typing.Literal["get_license_price(uint64,uint64)uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_context_registry(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: typing.Literal["get_platform_fee_percentage()uint64"],
         return_value: algokit_utils.ABIReturn | None
     ) -> int | None: ...
     @typing.overload
+    def decode_return_value(
+        self,
+        method: typing.Literal["set_platform_fee_percentage(uint64)void"],
+        return_value: algokit_utils.ABIReturn | None
+    ) -> None: ...
+    @typing.overload
     def decode_return_value(
         self,
         method: str,
@@ -485,7 +1238,7 @@ class LicenseManagerClient:
         self,
         method: str,
         return_value: algokit_utils.ABIReturn | None
-    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | None | int | str:
+    ) -> algokit_utils.ABIValue | algokit_utils.ABIStruct | LicenseStatus | None | int:
         """Decode ABI return value for the given method."""
         if return_value is None:
             return None
@@ -607,109 +1360,287 @@ class LicenseManagerFactory(algokit_utils.TypedAppFactoryProtocol[LicenseManager
             )
         )
 
-    def get_app_client_by_id(
+    def get_app_client_by_id(
+        self,
+        app_id: int,
+        app_name: str | None = None,
+        default_sender: str | None = None,
+        default_signer: TransactionSigner | None = None,
+        approval_source_map: SourceMap | None = None,
+        clear_source_map: SourceMap | None = None,
+    ) -> LicenseManagerClient:
+        """Get an app client by app ID"""
+        return LicenseManagerClient(
+            self.app_factory.get_app_client_by_id(
+                app_id,
+                app_name,
+                default_sender,
+                default_signer,
+                approval_source_map,
+                clear_source_map,
+            )
+        )
+
+
+class LicenseManagerFactoryParams:
+    """Parameters for creating transactions for LicenseManager contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+        self.create = LicenseManagerFactoryCreateParams(app_factory)
+        self.update = LicenseManagerFactoryUpdateParams(app_factory)
+        self.delete = LicenseManagerFactoryDeleteParams(app_factory)
+
+class LicenseManagerFactoryCreateParams:
+    """Parameters for 'create' operations of LicenseManager contract"""
+
+    def __init__(self, app_factory: algokit_utils.AppFactory):
+        self.app_factory = app_factory
+
+    def bare(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateParams:
+        """Creates an instance using a bare call"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.bare.create(
+            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
+            compilation_params=compilation_params)
+
+    def create_license(
+        self,
+        args: tuple[int, int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | CreateLicenseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def purchase_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseLicenseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the purchase_license(uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "purchase_license(uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def renew_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | RenewLicenseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the renew_license(uint64,pay)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "renew_license(uint64,pay)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def record_usage(
+        self,
+        args: tuple[int, str, int] | RecordUsageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the record_usage(uint64,address,uint64)uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "record_usage(uint64,address,uint64)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def revoke_license(
+        self,
+        args: tuple[int, str] | RevokeLicenseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the revoke_license(uint64,address)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "revoke_license(uint64,address)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
+    def check_license(
         self,
-        app_id: int,
-        app_name: str | None = None,
-        default_sender: str | None = None,
-        default_signer: TransactionSigner | None = None,
-        approval_source_map: SourceMap | None = None,
-        clear_source_map: SourceMap | None = None,
-    ) -> LicenseManagerClient:
-        """Get an app client by app ID"""
-        return LicenseManagerClient(
-            self.app_factory.get_app_client_by_id(
-                app_id,
-                app_name,
-                default_sender,
-                default_signer,
-                approval_source_map,
-                clear_source_map,
-            )
+        args: tuple[int, str] | CheckLicenseArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the check_license(uint64,address)(bool,uint64,uint64,uint64) ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "check_license(uint64,address)(bool,uint64,uint64,uint64)",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
         )
 
+    def withdraw(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-class LicenseManagerFactoryParams:
-    """Parameters for creating transactions for LicenseManager contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
-        self.create = LicenseManagerFactoryCreateParams(app_factory)
-        self.update = LicenseManagerFactoryUpdateParams(app_factory)
-        self.delete = LicenseManagerFactoryDeleteParams(app_factory)
-
-class LicenseManagerFactoryCreateParams:
-    """Parameters for 'create' operations of LicenseManager contract"""
-
-    def __init__(self, app_factory: algokit_utils.AppFactory):
-        self.app_factory = app_factory
+    def withdraw_platform_fees(
+        self,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the withdraw_platform_fees()uint64 ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "withdraw_platform_fees()uint64",
+                "args": None,
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def bare(
+    def get_balance(
         self,
+        args: tuple[str] | GetBalanceArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
-    ) -> algokit_utils.AppCreateParams:
-        """Creates an instance using a bare call"""
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the get_balance(address)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
-        return self.app_factory.params.bare.create(
-            algokit_utils.AppFactoryCreateParams(**dataclasses.asdict(params)),
-            compilation_params=compilation_params)
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "get_balance(address)uint64",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
 
-    def create_license(
+    def get_license_price(
         self,
-        args: tuple[str, int, int] | CreateLicenseArgs,
+        args: tuple[int, int] | GetLicensePriceArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the create_license(string,uint64,uint64)string ABI method"""
+        """Creates a new instance using the get_license_price(uint64,uint64)uint64 ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "create_license(string,uint64,uint64)string",
+                "method": "get_license_price(uint64,uint64)uint64",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def purchase_license(
+    def set_price_tiers(
         self,
-        args: tuple[str] | PurchaseLicenseArgs,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the purchase_license(string)string ABI method"""
+        """Creates a new instance using the set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "purchase_license(string)string",
+                "method": "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void",
                 "args": _parse_abi_args(args),
                 }
             ),
             compilation_params=compilation_params
         )
 
-    def get_license_price(
+    def set_context_registry(
         self,
-        args: tuple[str] | GetLicensePriceArgs,
+        args: tuple[int] | SetContextRegistryArgs,
         *,
         params: algokit_utils.CommonAppCallCreateParams | None = None,
         compilation_params: algokit_utils.AppClientCompilationParams | None = None
     ) -> algokit_utils.AppCreateMethodCallParams:
-        """Creates a new instance using the get_license_price(string)uint64 ABI method"""
+        """Creates a new instance using the set_context_registry(uint64)void ABI method"""
         params = params or algokit_utils.CommonAppCallCreateParams()
         return self.app_factory.params.create(
             algokit_utils.AppFactoryCreateMethodCallParams(
                 **{
                 **dataclasses.asdict(params),
-                "method": "get_license_price(string)uint64",
+                "method": "set_context_registry(uint64)void",
                 "args": _parse_abi_args(args),
                 }
             ),
@@ -735,6 +1666,26 @@ class LicenseManagerFactoryCreateParams:
             compilation_params=compilation_params
         )
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        *,
+        params: algokit_utils.CommonAppCallCreateParams | None = None,
+        compilation_params: algokit_utils.AppClientCompilationParams | None = None
+    ) -> algokit_utils.AppCreateMethodCallParams:
+        """Creates a new instance using the set_platform_fee_percentage(uint64)void ABI method"""
+        params = params or algokit_utils.CommonAppCallCreateParams()
+        return self.app_factory.params.create(
+            algokit_utils.AppFactoryCreateMethodCallParams(
+                **{
+                **dataclasses.asdict(params),
+                "method": "set_platform_fee_percentage(uint64)void",
+                "args": _parse_abi_args(args),
+                }
+            ),
+            compilation_params=compilation_params
+        )
+
 class LicenseManagerFactoryUpdateParams:
     """Parameters for 'update' operations of LicenseManager contract"""
 
@@ -838,7 +1789,7 @@ class LicenseManagerComposer:
 
     def create_license(
         self,
-        args: tuple[str, int, int] | CreateLicenseArgs,
+        args: tuple[int, int, int, int, int, algokit_utils.AppMethodCallTransactionArgument] | CreateLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LicenseManagerComposer":
         self._composer.add_app_call_method_call(
@@ -849,14 +1800,14 @@ class LicenseManagerComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "create_license(string,uint64,uint64)string", v
+                "create_license(uint64,uint64,uint64,uint64,uint64,pay)uint64", v
             )
         )
         return self
 
     def purchase_license(
         self,
-        args: tuple[str] | PurchaseLicenseArgs,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | PurchaseLicenseArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LicenseManagerComposer":
         self._composer.add_app_call_method_call(
@@ -867,14 +1818,138 @@ class LicenseManagerComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "purchase_license(string)string", v
+                "purchase_license(uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def renew_license(
+        self,
+        args: tuple[int, algokit_utils.AppMethodCallTransactionArgument] | RenewLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.renew_license(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "renew_license(uint64,pay)uint64", v
+            )
+        )
+        return self
+
+    def record_usage(
+        self,
+        args: tuple[int, str, int] | RecordUsageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.record_usage(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "record_usage(uint64,address,uint64)uint64", v
+            )
+        )
+        return self
+
+    def revoke_license(
+        self,
+        args: tuple[int, str] | RevokeLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.revoke_license(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "revoke_license(uint64,address)void", v
+            )
+        )
+        return self
+
+    def check_license(
+        self,
+        args: tuple[int, str] | CheckLicenseArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.check_license(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "check_license(uint64,address)(bool,uint64,uint64,uint64)", v
+            )
+        )
+        return self
+
+    def withdraw(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw()uint64", v
+            )
+        )
+        return self
+
+    def withdraw_platform_fees(
+        self,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.withdraw_platform_fees(
+                
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "withdraw_platform_fees()uint64", v
+            )
+        )
+        return self
+
+    def get_balance(
+        self,
+        args: tuple[str] | GetBalanceArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.get_balance(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "get_balance(address)uint64", v
             )
         )
         return self
 
     def get_license_price(
         self,
-        args: tuple[str] | GetLicensePriceArgs,
+        args: tuple[int, int] | GetLicensePriceArgs,
         params: algokit_utils.CommonAppCallParams | None = None
     ) -> "LicenseManagerComposer":
         self._composer.add_app_call_method_call(
@@ -885,7 +1960,43 @@ class LicenseManagerComposer:
         )
         self._result_mappers.append(
             lambda v: self.client.decode_return_value(
-                "get_license_price(string)uint64", v
+                "get_license_price(uint64,uint64)uint64", v
+            )
+        )
+        return self
+
+    def set_price_tiers(
+        self,
+        args: tuple[int, tuple[int, int, int, int], tuple[int, int, int, int], tuple[int, int, int, int]] | SetPriceTiersArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_price_tiers(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_price_tiers(uint64,uint64[4],uint64[4],uint64[4])void", v
+            )
+        )
+        return self
+
+    def set_context_registry(
+        self,
+        args: tuple[int] | SetContextRegistryArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_context_registry(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_context_registry(uint64)void", v
             )
         )
         return self
@@ -907,6 +2018,24 @@ class LicenseManagerComposer:
         )
         return self
 
+    def set_platform_fee_percentage(
+        self,
+        args: tuple[int] | SetPlatformFeePercentageArgs,
+        params: algokit_utils.CommonAppCallParams | None = None
+    ) -> "LicenseManagerComposer":
+        self._composer.add_app_call_method_call(
+            self.client.params.set_platform_fee_percentage(
+                args=args,
+                params=params,
+            )
+        )
+        self._result_mappers.append(
+            lambda v: self.client.decode_return_value(
+                "set_platform_fee_percentage(uint64)void", v
+            )
+        )
+        return self
+
     def clear_state(
         self,
         *,
@@ -1,36 +1,381 @@
-from algopy import ARC4Contract, UInt64
+import typing
+
+from algopy import (
+    Account,
+    ARC4Contract,
+    BoxMap,
+    Bytes,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
 from algopy.arc4 import abimethod, String
 
+from smart_contracts.utils.constants import (
+    BALANCE_BOX_PREFIX,
+    CONTEXT_BOX_PREFIX,
+    DEFAULT_PLATFORM_FEE_PERCENTAGE,
+    LICENSE_ONE_TIME,
+    MAX_PLATFORM_FEE_PERCENTAGE,
+    MAX_TITLE_LENGTH,
+    MIN_PRICE,
+    PURCHASE_BOX_PREFIX,
+    USER_BOX_PREFIX,
+    USER_INDEX_CREATED,
+    USER_INDEX_PAGE_SIZE,
+    USER_INDEX_PURCHASED,
+)
+from smart_contracts.utils.helpers import (
+    PriceSchedule,
+    TierValues,
+    build_price_schedule,
+    calculate_creator_amount,
+    default_price_schedule,
+    quote_price,
+    validate_rating,
+)
+
+# One counter per star value; the length must match MAX_RATING.
+RatingHistogram = arc4.StaticArray[arc4.UInt64, typing.Literal[5]]
+
+# Byte offset of `price` in ContextRecord; the price schedule follows it.
+PRICE_OFFSET = 32
+
+# The length must match USER_INDEX_PAGE_SIZE.
+ContextIdPage = arc4.StaticArray[arc4.UInt64, typing.Literal[64]]
+
+
+class ContextRecord(arc4.Struct):
+    """Box record stored under ctx_ + context id"""
+    creator: arc4.Address
+    price: arc4.UInt64
+    pricing: PriceSchedule
+    created_at: arc4.UInt64
+    purchases: arc4.UInt64
+    rating_sum: arc4.UInt64
+    rating_count: arc4.UInt64
+    rating_histogram: RatingHistogram
+    ipfs_hash: String
+    title: String
+
+
+class UserContextPage(arc4.Struct):
+    """Box record stored under usr_ + address + list kind + page number"""
+    total: arc4.UInt64  # entries in the list up to this page; page 0 holds the list total
+    context_ids: ContextIdPage
+
+
+class ContextRating(arc4.Struct):
+    """Aggregated ratings for a context"""
+    rating_sum: arc4.UInt64
+    rating_count: arc4.UInt64
+    rating_histogram: RatingHistogram
+
+
+class ContextCreated(arc4.Struct):
+    """ARC-28 event emitted when a context is registered"""
+    context_id: arc4.UInt64
+    creator: arc4.Address
+    price: arc4.UInt64
+    ipfs_hash: String
+    title: String
+
+
+class ContextPurchased(arc4.Struct):
+    """ARC-28 event emitted when a context is purchased"""
+    context_id: arc4.UInt64
+    buyer: arc4.Address
+
+
+class ContextRated(arc4.Struct):
+    """ARC-28 event emitted when a buyer rates a context (previous_rating is 0 on first rating)"""
+    context_id: arc4.UInt64
+    rater: arc4.Address
+    rating: arc4.UInt64
+    previous_rating: arc4.UInt64
+
+
+class PlatformFeeUpdated(arc4.Struct):
+    """ARC-28 event emitted when the admin changes the platform fee"""
+    previous_fee_bps: arc4.UInt64
+    fee_bps: arc4.UInt64
+
 
 class ContextRegistry(ARC4Contract):
     """Minimal production-ready smart contract for AI context registry"""
     
+    def __init__(self) -> None:
+        self.admin = Global.creator_address
+        self.platform_fee = UInt64(DEFAULT_PLATFORM_FEE_PERCENTAGE)
+        self.context_count = UInt64(0)
+        # Platform fees (and overpayments) awaiting withdraw_platform_fees
+        self.platform_balance = UInt64(0)
+        self.contexts = BoxMap(UInt64, ContextRecord, key_prefix=CONTEXT_BOX_PREFIX)
+        # Keyed by itob(context_id) + buyer; the value is the buyer's rating (0 = not rated yet)
+        self.purchases = BoxMap(Bytes, UInt64, key_prefix=PURCHASE_BOX_PREFIX)
+        # Append-only per-user lists of created and purchased context ids
+        self.user_pages = BoxMap(Bytes, UserContextPage, key_prefix=USER_BOX_PREFIX)
+        # Creator earnings awaiting withdrawal
+        self.balances = BoxMap(Account, UInt64, key_prefix=BALANCE_BOX_PREFIX)
+    
     @abimethod()
     def create_context(
         self,
         ipfs_hash: String,
         title: String,
-        price: UInt64
-    ) -> String:
-        """Create a new AI context"""
+        price: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> UInt64:
+        """Create a new AI context; `payment` covers the MBR of the boxes it creates"""
         
         # Basic validation
-        assert price >= UInt64(1000), "Price too low"
+        assert price >= MIN_PRICE, "Price too low"
+        assert title.native.bytes.length <= MAX_TITLE_LENGTH, "Title too long"
+        min_balance = Global.current_application_address.min_balance
+        
+        self.context_count += 1
+        context_id = self.context_count
+        zero = arc4.UInt64(0)
+        self.contexts[context_id] = ContextRecord(
+            creator=arc4.Address(Txn.sender),
+            price=arc4.UInt64(price),
+            pricing=default_price_schedule(),
+            created_at=arc4.UInt64(Global.latest_timestamp),
+            purchases=zero,
+            rating_sum=zero,
+            rating_count=zero,
+            rating_histogram=RatingHistogram(zero, zero, zero, zero, zero),
+            ipfs_hash=ipfs_hash,
+            title=title,
+        )
+        self._index_user_context(Txn.sender, UInt64(USER_INDEX_CREATED), context_id)
+        # Anything paid beyond the MBR goes to the platform.
+        self.platform_balance += self._assert_paid(payment, UInt64(0), min_balance)
+        
+        arc4.emit(
+            ContextCreated(
+                arc4.UInt64(context_id),
+                arc4.Address(Txn.sender),
+                arc4.UInt64(price),
+                ipfs_hash,
+                title,
+            )
+        )
+        return context_id
+    
+    @abimethod(readonly=True)
+    def get_context_price(
+        self, context_id: UInt64, quantity: UInt64, license_type: UInt64
+    ) -> UInt64:
+        """Get the price of `quantity` units under a license type, after volume discounts"""
+        return self._quote(context_id, quantity, license_type)
+    
+    @abimethod(readonly=True)
+    def get_context(self, context_id: UInt64) -> ContextRecord:
+        """Get the full record of a context"""
+        return self.contexts[context_id]
+    
+    @abimethod(readonly=True)
+    def get_contexts(
+        self, context_ids: arc4.DynamicArray[arc4.UInt64]
+    ) -> arc4.DynamicArray[ContextRecord]:
+        """Get the full records of several contexts, in the order requested"""
+        records = arc4.DynamicArray[ContextRecord]()
+        for context_id in context_ids:
+            records.append(self.contexts[context_id.native].copy())
+        return records
+    
+    @abimethod()
+    def set_price_tiers(
+        self,
+        context_id: UInt64,
+        breakpoints: TierValues,
+        discounts: TierValues,
+        multipliers: TierValues,
+    ) -> None:
+        """Set quantity breakpoints, discounts (bps) and license-type multipliers (bps)"""
+        record = self.contexts[context_id].copy()
+        assert record.creator == arc4.Address(Txn.sender), "Not creator"
+        record.pricing = build_price_schedule(breakpoints, discounts, multipliers)
+        self.contexts[context_id] = record.copy()
+    
+    @abimethod()
+    def purchase_context(
+        self, context_id: UInt64, payment: gtxn.PaymentTransaction
+    ) -> None:
+        """Purchase access to a context; `payment` covers its price and the boxes it creates"""
+        record = self.contexts[context_id].copy()
+        key = op.itob(context_id) + Txn.sender.bytes
+        assert key not in self.purchases, "Already purchased"
+        price = self._quote(context_id, UInt64(1), UInt64(LICENSE_ONE_TIME))
+        min_balance = Global.current_application_address.min_balance
+        
+        self.purchases[key] = UInt64(0)
+        record.purchases = arc4.UInt64(record.purchases.native + 1)
+        self.contexts[context_id] = record.copy()
+        self._index_user_context(Txn.sender, UInt64(USER_INDEX_PURCHASED), context_id)
+        # Written now so a first sale's balance box is part of the MBR checked
+        # below; a free sale earns nothing and opens no box.
+        creator = record.creator.native
+        creator_amount = calculate_creator_amount(price, self.platform_fee)
+        earned = self.balances.get(creator, default=UInt64(0))
+        if creator_amount:
+            self.balances[creator] = earned
+        
+        paid = self._assert_paid(payment, price, min_balance)
+        if creator_amount:
+            self.balances[creator] = earned + creator_amount
+        # The fee and anything paid beyond the price go to the platform.
+        self.platform_balance += paid - creator_amount
         
-        # Return a simple context ID
-        return String("ctx_created")
+        arc4.emit(ContextPurchased(arc4.UInt64(context_id), arc4.Address(Txn.sender)))
     
     @abimethod()
-    def get_context_price(self, context_id: String) -> UInt64:
-        """Get context price - simplified implementation"""
-        return UInt64(5000)  # Fixed price for demo
+    def rate_context(self, context_id: UInt64, rating: UInt64) -> None:
+        """Rate a purchased context from 1 to 5; rating again replaces the previous rating"""
+        assert validate_rating(rating), "Invalid rating"
+        key = op.itob(context_id) + Txn.sender.bytes
+        previous, purchased = self.purchases.maybe(key)
+        assert purchased, "Context not purchased"
+        
+        record = self.contexts[context_id].copy()
+        if previous:
+            record.rating_sum = arc4.UInt64(record.rating_sum.native - previous)
+            record.rating_histogram[previous - 1] = arc4.UInt64(
+                record.rating_histogram[previous - 1].native - 1
+            )
+        else:
+            record.rating_count = arc4.UInt64(record.rating_count.native + 1)
+        record.rating_sum = arc4.UInt64(record.rating_sum.native + rating)
+        record.rating_histogram[rating - 1] = arc4.UInt64(
+            record.rating_histogram[rating - 1].native + 1
+        )
+        self.contexts[context_id] = record.copy()
+        self.purchases[key] = rating
+        
+        arc4.emit(
+            ContextRated(
+                arc4.UInt64(context_id),
+                arc4.Address(Txn.sender),
+                arc4.UInt64(rating),
+                arc4.UInt64(previous),
+            )
+        )
+    
+    @abimethod(readonly=True)
+    def get_context_rating(self, context_id: UInt64) -> ContextRating:
+        """Get rating sum, count and per-star histogram for a context"""
+        record = self.contexts[context_id].copy()
+        return ContextRating(
+            rating_sum=record.rating_sum,
+            rating_count=record.rating_count,
+            rating_histogram=record.rating_histogram.copy(),
+        )
     
     @abimethod()
-    def purchase_context(self, context_id: String) -> String:
-        """Purchase access to a context"""
-        return String("purchase_success")
+    def withdraw(self) -> UInt64:
+        """
+        Pay out the caller's accumulated earnings plus the MBR freed by deleting
+        their balance box; the caller covers the inner fee. That MBR was paid by
+        the buyer whose purchase opened the box and counts as part of the sale,
+        so it goes to the creator; the next sale pays for a new box.
+        """
+        amount = self.balances.get(Txn.sender, default=UInt64(0))
+        assert amount, "Nothing to withdraw"
+        min_balance = Global.current_application_address.min_balance
+        del self.balances[Txn.sender]
+        amount += min_balance - Global.current_application_address.min_balance
+        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
+        return amount
     
     @abimethod()
+    def withdraw_platform_fees(self) -> UInt64:
+        """Pay the platform's accumulated fees to the admin; admin only, covers the inner fee"""
+        assert Txn.sender == self.admin, "Not admin"
+        amount = self.platform_balance
+        assert amount, "Nothing to withdraw"
+        self.platform_balance = UInt64(0)
+        itxn.Payment(receiver=self.admin, amount=amount, fee=0).submit()
+        return amount
+    
+    @abimethod(readonly=True)
+    def get_balance(self, creator: arc4.Address) -> UInt64:
+        """Get a creator's earnings awaiting withdrawal"""
+        return self.balances.get(creator.native, default=UInt64(0))
+    
+    @abimethod(readonly=True)
+    def get_user_contexts(
+        self, user: arc4.Address, kind: UInt64, page: UInt64
+    ) -> UserContextPage:
+        """Get one page of a user's created (kind 0) or purchased (kind 1) context ids"""
+        key = self._user_page_key(user.native, kind, page)
+        if key in self.user_pages:
+            return self.user_pages[key]
+        return UserContextPage.from_bytes(op.bzero(8 + USER_INDEX_PAGE_SIZE * 8))
+    
+    @abimethod(readonly=True)
     def get_platform_fee_percentage(self) -> UInt64:
-        """Get platform fee percentage"""
-        return UInt64(250)  # 2.5%
+        """Get platform fee in basis points"""
+        return self.platform_fee
+    
+    @abimethod()
+    def set_platform_fee_percentage(self, fee_bps: UInt64) -> None:
+        """Change the platform fee (basis points); admin only, applies to later sales"""
+        assert Txn.sender == self.admin, "Not admin"
+        assert fee_bps <= MAX_PLATFORM_FEE_PERCENTAGE, "Fee too high"
+        arc4.emit(PlatformFeeUpdated(arc4.UInt64(self.platform_fee), arc4.UInt64(fee_bps)))
+        self.platform_fee = fee_bps
+    
+    @arc4.baremethod(allow_actions=["NoOp"], create="allow")
+    def op_up(self) -> None:
+        """Do nothing; extra calls in a group add to its pooled opcode budget"""
+    
+    @subroutine
+    def _assert_paid(
+        self, payment: gtxn.PaymentTransaction, price: UInt64, min_balance: UInt64
+    ) -> UInt64:
+        """
+        Check `payment` covers `price` plus what boxes created since `min_balance`
+        lock up, returning the part of it left after that MBR
+        """
+        assert payment.receiver == Global.current_application_address, "Wrong receiver"
+        added = Global.current_application_address.min_balance - min_balance
+        assert payment.amount >= price + added, "Insufficient payment"
+        return payment.amount - added
+    
+    @subroutine
+    def _quote(self, context_id: UInt64, quantity: UInt64, license_type: UInt64) -> UInt64:
+        # One box_extract covers the unit price and its whole schedule.
+        key = self.contexts.key_prefix + op.itob(context_id)
+        pricing = op.Box.extract(key, PRICE_OFFSET, 8 + 12 * 8)
+        return quote_price(pricing, quantity, license_type)
+    
+    @subroutine
+    def _user_page_key(self, user: Account, kind: UInt64, page: UInt64) -> Bytes:
+        return user.bytes + op.extract(op.itob(kind), 7, 1) + op.itob(page)
+    
+    @subroutine
+    def _index_user_context(
+        self, user: Account, kind: UInt64, context_id: UInt64
+    ) -> None:
+        """Append a context id to one of a user's lists, opening a new page when full"""
+        # Raw box ops patch 8 bytes in place instead of rewriting 520-byte pages.
+        prefix = self.user_pages.key_prefix
+        first_key = prefix + self._user_page_key(user, kind, UInt64(0))
+        total = UInt64(0)
+        _size, exists = op.Box.length(first_key)
+        if exists:
+            total = op.btoi(op.Box.extract(first_key, 0, 8))
+        
+        slot = total % USER_INDEX_PAGE_SIZE
+        key = prefix + self._user_page_key(user, kind, total // USER_INDEX_PAGE_SIZE)
+        if slot == 0:
+            op.Box.create(key, 8 + USER_INDEX_PAGE_SIZE * 8)
+        op.Box.replace(key, 8 + slot * 8, op.itob(context_id))
+        op.Box.replace(key, 0, op.itob(total + 1))
+        op.Box.replace(first_key, 0, op.itob(total + 1))
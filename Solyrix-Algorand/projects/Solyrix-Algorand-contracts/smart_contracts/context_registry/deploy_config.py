@@ -4,11 +4,12 @@ from algopy import Account, Txn
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from backend.costs import CostModel
+from backend.telemetry import span
 from smart_contracts.context_registry.contract import ContextRegistry
 
 logger = logging.getLogger(__name__)
 
-
 def deploy(
     algod_client: AlgodClient,
     indexer_client: IndexerClient,
@@ -24,13 +25,16 @@ def deploy(
         ensure_funded,
     )
     
+    costs = CostModel.for_contract("ContextRegistry")
+    
     # Ensure the creator account is funded
-    ensure_funded(
-        algod_client,
-        app_creator.address,
-        min_spending_balance_micro_algos=2_000_000,  # 2 ALGO for deployment
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="ContextRegistry", account="creator"):
+        ensure_funded(
+            algod_client,
+            app_creator.address,
+            min_spending_balance_micro_algos=costs.deploy_cost(),  # app creation MBR and fees
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     # Load the application specification
     app_spec = ApplicationSpecification.from_json(f"{app_spec_dir}/context_registry.json")
@@ -62,11 +66,12 @@ def deploy(
     logger.info(f"App Address: {app_result.app.app_address}")
     
     # Fund the application account for box storage
-    ensure_funded(
-        algod_client,
-        app_result.app.app_address,
-        min_spending_balance_micro_algos=10_000_000,  # 10 ALGO for box storage
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="ContextRegistry", account="app"):
+        ensure_funded(
+            algod_client,
+            app_result.app.app_address,
+            min_spending_balance_micro_algos=costs.app_funding({}),  # callers pay for the boxes they create
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     return app_result
@@ -1,7 +1,20 @@
-from algopy import ARC4Contract, UInt64
+from algopy import ARC4Contract, Txn, UInt64, arc4
 from algopy.arc4 import abimethod, String
 
 
+class ProposalCreated(arc4.Struct):
+    """ARC-28 event emitted when a proposal is created"""
+    proposer: arc4.Address
+    title: String
+
+
+class VoteCast(arc4.Struct):
+    """ARC-28 event emitted when a vote is recorded"""
+    proposal_id: String
+    voter: arc4.Address
+    vote_for: arc4.UInt64
+
+
 class GovernanceToken(ARC4Contract):
     """Minimal production-ready smart contract for governance token and voting"""
     
@@ -13,6 +26,8 @@ class GovernanceToken(ARC4Contract):
     ) -> String:
         """Create a new governance proposal"""
         
+        arc4.emit(ProposalCreated(arc4.Address(Txn.sender), title))
+        
         # Return a simple proposal ID
         return String("prop_created")
     
@@ -24,6 +39,8 @@ class GovernanceToken(ARC4Contract):
     ) -> String:
         """Vote on a governance proposal"""
         
+        arc4.emit(VoteCast(proposal_id, arc4.Address(Txn.sender), arc4.UInt64(vote_for)))
+        
         return String("vote_recorded")
     
     @abimethod()
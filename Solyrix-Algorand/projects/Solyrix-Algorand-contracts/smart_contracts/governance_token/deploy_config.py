@@ -4,6 +4,8 @@ from algopy import Account, Txn
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from backend.costs import CostModel
+from backend.telemetry import span
 from smart_contracts.governance_token.contract import GovernanceToken
 
 logger = logging.getLogger(__name__)
@@ -28,13 +30,16 @@ def deploy(
         ensure_funded,
     )
     
+    costs = CostModel.for_contract("GovernanceToken")
+    
     # Ensure the creator account is funded
-    ensure_funded(
-        algod_client,
-        app_creator.address,
-        min_spending_balance_micro_algos=5_000_000,  # 5 ALGO for deployment
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="GovernanceToken", account="creator"):
+        ensure_funded(
+            algod_client,
+            app_creator.address,
+            min_spending_balance_micro_algos=costs.deploy_cost(),  # app creation MBR and fees
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     # Load the application specification
     app_spec = ApplicationSpecification.from_json(f"{app_spec_dir}/governance_token.json")
@@ -66,12 +71,13 @@ def deploy(
     logger.info(f"App Address: {app_result.app.app_address}")
     
     # Fund the application account for ASA creation and operations
-    ensure_funded(
-        algod_client,
-        app_result.app.app_address,
-        min_spending_balance_micro_algos=20_000_000,  # 20 ALGO for operations
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="GovernanceToken", account="app"):
+        ensure_funded(
+            algod_client,
+            app_result.app.app_address,
+            min_spending_balance_micro_algos=costs.app_funding({}),  # no boxes, only the account minimum
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     # Create the governance token
     try:
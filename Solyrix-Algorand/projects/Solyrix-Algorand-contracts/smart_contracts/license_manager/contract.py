@@ -1,36 +1,416 @@
-from algopy import ARC4Contract, UInt64
-from algopy.arc4 import abimethod, String
+from algopy import (
+    Account,
+    ARC4Contract,
+    BoxMap,
+    Bytes,
+    Global,
+    Txn,
+    UInt64,
+    arc4,
+    gtxn,
+    itxn,
+    op,
+    subroutine,
+)
+from algopy.arc4 import abimethod
+
+from smart_contracts.context_registry.contract import ContextRegistry
+from smart_contracts.utils.constants import (
+    BALANCE_BOX_PREFIX,
+    DEFAULT_PLATFORM_FEE_PERCENTAGE,
+    HOLDER_BOX_PREFIX,
+    LICENSE_BOX_PREFIX,
+    LICENSE_COMMERCIAL,
+    LICENSE_SUBSCRIPTION,
+    LICENSE_USAGE_BASED,
+    MAX_PLATFORM_FEE_PERCENTAGE,
+    MIN_PRICE,
+)
+from smart_contracts.utils.helpers import (
+    PriceSchedule,
+    TierValues,
+    build_price_schedule,
+    calculate_creator_amount,
+    default_price_schedule,
+    quote_price,
+)
+
+# Byte offset of `license_type` in LicenseOffer; `price` and the price schedule follow it.
+LICENSE_TYPE_OFFSET = 40
+
+
+class LicenseOffer(arc4.Struct):
+    """Box record stored under lic_ + license id"""
+    context_id: arc4.UInt64
+    creator: arc4.Address
+    license_type: arc4.UInt64
+    price: arc4.UInt64
+    pricing: PriceSchedule
+    duration: arc4.UInt64  # seconds per subscription period, 0 = perpetual
+    usage_limit: arc4.UInt64  # 0 = unlimited
+
+
+class LicenseGrant(arc4.Struct):
+    """Packed 24-byte box record stored under hld_ + license id + holder"""
+    expiry: arc4.UInt64  # unix timestamp, 0 = never expires
+    usage_count: arc4.UInt64
+    usage_limit: arc4.UInt64  # 0 = unlimited
+
+
+class LicenseStatus(arc4.Struct):
+    """Result of check_license"""
+    valid: arc4.Bool
+    expiry: arc4.UInt64
+    usage_count: arc4.UInt64
+    usage_limit: arc4.UInt64
+
+
+class LicenseCreated(arc4.Struct):
+    """ARC-28 event emitted when a license offer is created"""
+    license_id: arc4.UInt64
+    context_id: arc4.UInt64
+    creator: arc4.Address
+    license_type: arc4.UInt64
+    price: arc4.UInt64
+
+
+class LicensePurchased(arc4.Struct):
+    """ARC-28 event emitted when a license is purchased"""
+    license_id: arc4.UInt64
+    buyer: arc4.Address
+    expiry: arc4.UInt64
+
+
+class LicenseRenewed(arc4.Struct):
+    """ARC-28 event emitted when a subscription license is extended"""
+    license_id: arc4.UInt64
+    holder: arc4.Address
+    expiry: arc4.UInt64
+
+
+class LicenseRevoked(arc4.Struct):
+    """ARC-28 event emitted when a creator revokes a holder's license"""
+    license_id: arc4.UInt64
+    holder: arc4.Address
+
+
+class LicenseUsed(arc4.Struct):
+    """ARC-28 event emitted when usage is metered against a license"""
+    license_id: arc4.UInt64
+    holder: arc4.Address
+    usage_count: arc4.UInt64
+
+
+class PlatformFeeUpdated(arc4.Struct):
+    """ARC-28 event emitted when the admin changes the platform fee"""
+    previous_fee_bps: arc4.UInt64
+    fee_bps: arc4.UInt64
 
 
 class LicenseManager(ARC4Contract):
     """Minimal production-ready smart contract for license management"""
     
+    def __init__(self) -> None:
+        self.admin = Global.creator_address
+        self.platform_fee = UInt64(DEFAULT_PLATFORM_FEE_PERCENTAGE)
+        self.license_count = UInt64(0)
+        # Platform fees (and overpayments) awaiting withdraw_platform_fees
+        self.platform_balance = UInt64(0)
+        # ContextRegistry app whose contexts licenses are offered for; 0 until set
+        self.context_registry = UInt64(0)
+        self.licenses = BoxMap(UInt64, LicenseOffer, key_prefix=LICENSE_BOX_PREFIX)
+        # Keyed by itob(license_id) + holder
+        self.grants = BoxMap(Bytes, LicenseGrant, key_prefix=HOLDER_BOX_PREFIX)
+        # Creator earnings awaiting withdrawal
+        self.balances = BoxMap(Account, UInt64, key_prefix=BALANCE_BOX_PREFIX)
+    
     @abimethod()
     def create_license(
         self,
-        context_id: String,
+        context_id: UInt64,
         license_type: UInt64,
-        price: UInt64
-    ) -> String:
-        """Create a new license for a context"""
+        price: UInt64,
+        duration: UInt64,
+        usage_limit: UInt64,
+        payment: gtxn.PaymentTransaction,
+    ) -> UInt64:
+        """
+        Create a new license for a context the caller created in the context
+        registry; `payment` covers the MBR of the offer box, and the ownership
+        check is an inner call the caller pays for
+        """
         
         # Basic validation
-        assert price >= UInt64(1000), "Price too low"
+        assert price >= MIN_PRICE, "Price too low"
+        assert license_type <= LICENSE_COMMERCIAL, "Unknown license type"
+        if license_type == LICENSE_SUBSCRIPTION:
+            assert duration > 0, "Subscription needs a duration"
+        if license_type == LICENSE_USAGE_BASED:
+            assert usage_limit > 0, "Usage-based license needs a limit"
+        assert self.context_registry, "Context registry not set"
+        record, _call = arc4.abi_call(
+            ContextRegistry.get_context, context_id, app_id=self.context_registry, fee=0
+        )
+        assert record.creator == arc4.Address(Txn.sender), "Not context creator"
+        min_balance = Global.current_application_address.min_balance
+        
+        self.license_count += 1
+        license_id = self.license_count
+        self.licenses[license_id] = LicenseOffer(
+            context_id=arc4.UInt64(context_id),
+            creator=arc4.Address(Txn.sender),
+            license_type=arc4.UInt64(license_type),
+            price=arc4.UInt64(price),
+            pricing=default_price_schedule(),
+            duration=arc4.UInt64(duration),
+            usage_limit=arc4.UInt64(usage_limit),
+        )
+        # Anything paid beyond the MBR goes to the platform.
+        self.platform_balance += self._assert_paid(payment, UInt64(0), min_balance)
         
-        # Return a simple license ID
-        return String("lic_created")
+        arc4.emit(
+            LicenseCreated(
+                arc4.UInt64(license_id),
+                arc4.UInt64(context_id),
+                arc4.Address(Txn.sender),
+                arc4.UInt64(license_type),
+                arc4.UInt64(price),
+            )
+        )
+        return license_id
     
     @abimethod()
-    def purchase_license(self, license_id: String) -> String:
-        """Purchase a license"""
-        return String("license_purchased")
+    def purchase_license(
+        self, license_id: UInt64, payment: gtxn.PaymentTransaction
+    ) -> UInt64:
+        """
+        Purchase a license; `payment` covers its price and the boxes it creates.
+        Returns the expiry (0 = never)
+        """
+        offer = self.licenses[license_id].copy()
+        key = op.itob(license_id) + Txn.sender.bytes
+        assert key not in self.grants, "Already licensed"
+        min_balance = Global.current_application_address.min_balance
+        
+        expiry = UInt64(0)
+        if offer.duration.native:
+            expiry = Global.latest_timestamp + offer.duration.native
+        self.grants[key] = LicenseGrant(
+            expiry=arc4.UInt64(expiry),
+            usage_count=arc4.UInt64(0),
+            usage_limit=offer.usage_limit,
+        )
+        self._collect(license_id, offer, payment, min_balance)
+        
+        arc4.emit(
+            LicensePurchased(
+                arc4.UInt64(license_id), arc4.Address(Txn.sender), arc4.UInt64(expiry)
+            )
+        )
+        return expiry
     
     @abimethod()
-    def get_license_price(self, license_id: String) -> UInt64:
-        """Get license price - simplified implementation"""
-        return UInt64(3000)  # Fixed price for demo
+    def renew_license(
+        self, license_id: UInt64, payment: gtxn.PaymentTransaction
+    ) -> UInt64:
+        """Extend a subscription by one period; usage counters are left untouched"""
+        offer = self.licenses[license_id].copy()
+        assert offer.duration.native, "License does not expire"
+        key = op.itob(license_id) + Txn.sender.bytes
+        self._collect(license_id, offer, payment, Global.current_application_address.min_balance)
+        
+        # Renewing early stacks on the current expiry, renewing late starts from now.
+        grant = self.grants[key].copy()
+        start = grant.expiry.native
+        if start < Global.latest_timestamp:
+            start = Global.latest_timestamp
+        grant.expiry = arc4.UInt64(start + offer.duration.native)
+        self.grants[key] = grant.copy()
+        
+        arc4.emit(
+            LicenseRenewed(arc4.UInt64(license_id), arc4.Address(Txn.sender), grant.expiry)
+        )
+        return grant.expiry.native
     
     @abimethod()
+    def record_usage(
+        self, license_id: UInt64, holder: arc4.Address, uses: UInt64
+    ) -> UInt64:
+        """Meter uses of a usage-based license; only the license creator may call this"""
+        assert self.licenses[license_id].creator == arc4.Address(Txn.sender), "Not creator"
+        key = op.itob(license_id) + holder.bytes
+        grant = self.grants[key].copy()
+        used = grant.usage_count.native + uses
+        if grant.usage_limit.native:
+            assert used <= grant.usage_limit.native, "Usage limit exceeded"
+        grant.usage_count = arc4.UInt64(used)
+        self.grants[key] = grant.copy()
+        
+        arc4.emit(LicenseUsed(arc4.UInt64(license_id), holder, grant.usage_count))
+        return used
+    
+    @abimethod()
+    def revoke_license(self, license_id: UInt64, holder: arc4.Address) -> None:
+        """
+        Remove a holder's grant once it has expired or used up its usage limit;
+        only the license creator may call this. Paid grants that are still valid
+        cannot be revoked, so a buyer always gets what they paid for. The grant
+        box's MBR goes back to the holder, who paid it; the caller covers the
+        inner fee.
+        """
+        assert self.licenses[license_id].creator == arc4.Address(Txn.sender), "Not creator"
+        status = self.check_license(license_id, holder)
+        assert status.expiry or status.usage_limit, "License never lapses"
+        assert not status.valid.native, "License still valid"
+        key = op.itob(license_id) + holder.bytes
+        assert key in self.grants, "Not licensed"
+        min_balance = Global.current_application_address.min_balance
+        del self.grants[key]
+        itxn.Payment(
+            receiver=holder.native,
+            amount=min_balance - Global.current_application_address.min_balance,
+            fee=0,
+        ).submit()
+        
+        arc4.emit(LicenseRevoked(arc4.UInt64(license_id), holder))
+    
+    @abimethod(readonly=True)
+    def check_license(self, license_id: UInt64, holder: arc4.Address) -> LicenseStatus:
+        """Check whether holder may use a license; a single box read, meant for simulate"""
+        key = self.grants.key_prefix + op.itob(license_id) + holder.bytes
+        raw, valid = op.Box.get(key)
+        if not valid:
+            raw = op.bzero(24)
+        grant = LicenseGrant.from_bytes(raw)
+        if valid:
+            if grant.expiry.native and grant.expiry.native <= Global.latest_timestamp:
+                valid = False
+            if grant.usage_limit.native and grant.usage_count >= grant.usage_limit:
+                valid = False
+        return LicenseStatus(
+            valid=arc4.Bool(valid),
+            expiry=grant.expiry,
+            usage_count=grant.usage_count,
+            usage_limit=grant.usage_limit,
+        )
+    
+    @abimethod()
+    def withdraw(self) -> UInt64:
+        """
+        Pay out the caller's accumulated earnings plus the MBR freed by deleting
+        their balance box; the caller covers the inner fee. That MBR was paid by
+        the buyer whose purchase opened the box and counts as part of the sale,
+        so it goes to the creator; the next sale pays for a new box.
+        """
+        amount = self.balances.get(Txn.sender, default=UInt64(0))
+        assert amount, "Nothing to withdraw"
+        min_balance = Global.current_application_address.min_balance
+        del self.balances[Txn.sender]
+        amount += min_balance - Global.current_application_address.min_balance
+        itxn.Payment(receiver=Txn.sender, amount=amount, fee=0).submit()
+        return amount
+    
+    @abimethod()
+    def withdraw_platform_fees(self) -> UInt64:
+        """Pay the platform's accumulated fees to the admin; admin only, covers the inner fee"""
+        assert Txn.sender == self.admin, "Not admin"
+        amount = self.platform_balance
+        assert amount, "Nothing to withdraw"
+        self.platform_balance = UInt64(0)
+        itxn.Payment(receiver=self.admin, amount=amount, fee=0).submit()
+        return amount
+    
+    @abimethod(readonly=True)
+    def get_balance(self, creator: arc4.Address) -> UInt64:
+        """Get a creator's earnings awaiting withdrawal"""
+        return self.balances.get(creator.native, default=UInt64(0))
+    
+    @abimethod(readonly=True)
+    def get_license_price(self, license_id: UInt64, quantity: UInt64) -> UInt64:
+        """Get the price of `quantity` licenses after volume discounts"""
+        return self._quote(license_id, quantity)
+    
+    @abimethod()
+    def set_price_tiers(
+        self,
+        license_id: UInt64,
+        breakpoints: TierValues,
+        discounts: TierValues,
+        multipliers: TierValues,
+    ) -> None:
+        """Set quantity breakpoints, discounts (bps) and license-type multipliers (bps)"""
+        offer = self.licenses[license_id].copy()
+        assert offer.creator == arc4.Address(Txn.sender), "Not creator"
+        offer.pricing = build_price_schedule(breakpoints, discounts, multipliers)
+        self.licenses[license_id] = offer.copy()
+    
+    @abimethod()
+    def set_context_registry(self, app_id: UInt64) -> None:
+        """Set the ContextRegistry app that create_license checks ownership against; admin only"""
+        assert Txn.sender == self.admin, "Not admin"
+        self.context_registry = app_id
+    
+    @abimethod(readonly=True)
     def get_platform_fee_percentage(self) -> UInt64:
-        """Get platform fee percentage"""
-        return UInt64(250)  # 2.5%
+        """Get platform fee in basis points"""
+        return self.platform_fee
+    
+    @abimethod()
+    def set_platform_fee_percentage(self, fee_bps: UInt64) -> None:
+        """Change the platform fee (basis points); admin only, applies to later sales"""
+        assert Txn.sender == self.admin, "Not admin"
+        assert fee_bps <= MAX_PLATFORM_FEE_PERCENTAGE, "Fee too high"
+        arc4.emit(PlatformFeeUpdated(arc4.UInt64(self.platform_fee), arc4.UInt64(fee_bps)))
+        self.platform_fee = fee_bps
+    
+    @arc4.baremethod(allow_actions=["NoOp"], create="allow")
+    def op_up(self) -> None:
+        """Do nothing; extra calls in a group add to its pooled opcode budget"""
+    
+    @subroutine
+    def _assert_paid(
+        self, payment: gtxn.PaymentTransaction, price: UInt64, min_balance: UInt64
+    ) -> UInt64:
+        """
+        Check `payment` covers `price` plus what boxes created since `min_balance`
+        lock up, returning the part of it left after that MBR
+        """
+        assert payment.receiver == Global.current_application_address, "Wrong receiver"
+        added = Global.current_application_address.min_balance - min_balance
+        assert payment.amount >= price + added, "Insufficient payment"
+        return payment.amount - added
+    
+    @subroutine
+    def _quote(self, license_id: UInt64, quantity: UInt64) -> UInt64:
+        # One box_extract covers the license type, unit price and schedule.
+        key = self.licenses.key_prefix + op.itob(license_id)
+        raw = op.Box.extract(key, LICENSE_TYPE_OFFSET, 16 + 12 * 8)
+        return quote_price(op.extract(raw, 8, 0), quantity, op.extract_uint64(raw, 0))
+    
+    @subroutine
+    def _collect(
+        self,
+        license_id: UInt64,
+        offer: LicenseOffer,
+        payment: gtxn.PaymentTransaction,
+        min_balance: UInt64,
+    ) -> None:
+        """
+        Check `payment` covers the price plus what boxes created since
+        `min_balance` lock up, and credit the creator with the price less
+        the platform fee
+        """
+        price = self._quote(license_id, UInt64(1))
+        # Written now so a first sale's balance box is part of the MBR checked
+        # below; a free sale earns nothing and opens no box.
+        creator = offer.creator.native
+        creator_amount = calculate_creator_amount(price, self.platform_fee)
+        earned = self.balances.get(creator, default=UInt64(0))
+        if creator_amount:
+            self.balances[creator] = earned
+        
+        paid = self._assert_paid(payment, price, min_balance)
+        if creator_amount:
+            self.balances[creator] = earned + creator_amount
+        # The fee and anything paid beyond the price go to the platform.
+        self.platform_balance += paid - creator_amount
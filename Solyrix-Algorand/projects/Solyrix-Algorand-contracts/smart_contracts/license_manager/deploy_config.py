@@ -4,11 +4,12 @@ from algopy import Account, Txn
 from algosdk.v2client.algod import AlgodClient
 from algosdk.v2client.indexer import IndexerClient
 
+from backend.costs import CostModel
+from backend.telemetry import span
 from smart_contracts.license_manager.contract import LicenseManager
 
 logger = logging.getLogger(__name__)
 
-
 def deploy(
     algod_client: AlgodClient,
     indexer_client: IndexerClient,
@@ -25,13 +26,16 @@ def deploy(
         ensure_funded,
     )
     
+    costs = CostModel.for_contract("LicenseManager")
+    
     # Ensure the creator account is funded
-    ensure_funded(
-        algod_client,
-        app_creator.address,
-        min_spending_balance_micro_algos=3_000_000,  # 3 ALGO for deployment
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="LicenseManager", account="creator"):
+        ensure_funded(
+            algod_client,
+            app_creator.address,
+            min_spending_balance_micro_algos=costs.deploy_cost(),  # app creation MBR and fees
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     # Load the application specification
     app_spec = ApplicationSpecification.from_json(f"{app_spec_dir}/license_manager.json")
@@ -63,12 +67,13 @@ def deploy(
     logger.info(f"App Address: {app_result.app.app_address}")
     
     # Fund the application account for box storage and inner transactions
-    ensure_funded(
-        algod_client,
-        app_result.app.app_address,
-        min_spending_balance_micro_algos=15_000_000,  # 15 ALGO for operations
-        min_funding_increment_micro_algos=1_000_000,
-    )
+    with span("fund", contract="LicenseManager", account="app"):
+        ensure_funded(
+            algod_client,
+            app_result.app.app_address,
+            min_spending_balance_micro_algos=costs.app_funding({}),  # callers pay for the boxes they create
+            min_funding_increment_micro_algos=1_000_000,
+        )
     
     # Set context registry app ID if provided
     if context_registry_app_id:
@@ -2,6 +2,8 @@ import logging
 
 import algokit_utils
 
+from backend.telemetry import span
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,13 +30,14 @@ def deploy() -> None:
         algokit_utils.OperationPerformed.Create,
         algokit_utils.OperationPerformed.Replace,
     ]:
-        algorand.send.payment(
-            algokit_utils.PaymentParams(
-                amount=algokit_utils.AlgoAmount(algo=1),
-                sender=deployer_.address,
-                receiver=app_client.app_address,
+        with span("fund", contract="SolyrixAlgorand", account="app"):
+            algorand.send.payment(
+                algokit_utils.PaymentParams(
+                    amount=algokit_utils.AlgoAmount(algo=1),
+                    sender=deployer_.address,
+                    receiver=app_client.app_address,
+                )
             )
-        )
 
     name = "world"
     response = app_client.send.hello(args=HelloArgs(name=name))
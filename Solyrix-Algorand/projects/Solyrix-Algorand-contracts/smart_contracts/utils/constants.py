@@ -19,16 +19,31 @@ LICENSE_USAGE_BASED = 2
 LICENSE_COMMERCIAL = 3
 
 # Platform settings
-PLATFORM_FEE_PERCENTAGE = 250  # 2.5% (in basis points)
+DEFAULT_PLATFORM_FEE_PERCENTAGE = 250  # 2.5% (in basis points), set at app creation
+MAX_PLATFORM_FEE_PERCENTAGE = 1000  # 10%, upper bound for admin updates
 MAX_TITLE_LENGTH = 64
 MAX_DESCRIPTION_LENGTH = 256
 MIN_PRICE = 1000  # Minimum price in microAlgos
 MAX_RATING = 5
 
+# Price schedules: quantity breakpoints, discount reached at each, and a
+# price multiplier per license type, all in basis points where applicable
+PRICE_TIERS = 4
+LICENSE_TYPES = 4
+NO_BREAKPOINT = 2**64 - 1  # stored for unused tiers so they never apply
+
 # Box storage keys
 CONTEXT_BOX_PREFIX = b"ctx_"
 LICENSE_BOX_PREFIX = b"lic_"
 USER_BOX_PREFIX = b"usr_"
+PURCHASE_BOX_PREFIX = b"pur_"
+HOLDER_BOX_PREFIX = b"hld_"
+BALANCE_BOX_PREFIX = b"bal_"
+
+# Per-user context index pages (usr_ + address + list kind + page number)
+USER_INDEX_PAGE_SIZE = 64
+USER_INDEX_CREATED = 0
+USER_INDEX_PURCHASED = 1
 
 # Governance settings
 MIN_PROPOSAL_TOKENS = 1000000  # Minimum tokens to create proposal
@@ -1,17 +1,25 @@
-from algopy import Bytes, UInt64, op, subroutine
-from .constants import PLATFORM_FEE_PERCENTAGE, MAX_RATING
+import typing
+
+from algopy import Bytes, UInt64, arc4, op, subroutine, urange
+from .constants import LICENSE_TYPES, MAX_RATING, NO_BREAKPOINT, PRICE_TIERS
+
+# One value per tier (PRICE_TIERS) or per license type (LICENSE_TYPES)
+TierValues = arc4.StaticArray[arc4.UInt64, typing.Literal[4]]
+
+# Packed uint64[12]: breakpoints, cumulative discounts (bps), multipliers (bps)
+PriceSchedule = arc4.StaticArray[arc4.UInt64, typing.Literal[12]]
 
 
 @subroutine
-def calculate_platform_fee(amount: UInt64) -> UInt64:
-    """Calculate platform fee (2.5% of amount)"""
-    return (amount * PLATFORM_FEE_PERCENTAGE) // 10000
+def calculate_platform_fee(amount: UInt64, fee_bps: UInt64) -> UInt64:
+    """Calculate platform fee (fee_bps basis points of amount)"""
+    return (amount * fee_bps) // 10000
 
 
 @subroutine
-def calculate_creator_amount(amount: UInt64) -> UInt64:
-    """Calculate amount going to creator (97.5% of amount)"""
-    return amount - calculate_platform_fee(amount)
+def calculate_creator_amount(amount: UInt64, fee_bps: UInt64) -> UInt64:
+    """Calculate amount going to creator (amount minus the platform fee)"""
+    return amount - calculate_platform_fee(amount, fee_bps)
 
 
 @subroutine
@@ -29,10 +37,73 @@ def generate_context_id(creator: Bytes, timestamp: UInt64) -> Bytes:
 @subroutine
 def validate_ipfs_hash(ipfs_hash: Bytes) -> bool:
     """Basic validation for IPFS hash format (should be 46 characters for v0)"""
-    return op.len(ipfs_hash) == 46
+    return ipfs_hash.length == 46
 
 
 @subroutine
 def is_valid_address(address: Bytes) -> bool:
     """Validate Algorand address format"""
-    return op.len(address) == 32
+    return address.length == 32
+
+
+@subroutine
+def default_price_schedule() -> PriceSchedule:
+    """No volume discounts and every license type at the base price"""
+    schedule = PriceSchedule.from_bytes(op.bzero((PRICE_TIERS * 2 + LICENSE_TYPES) * 8))
+    for tier in urange(PRICE_TIERS):
+        schedule[tier] = arc4.UInt64(NO_BREAKPOINT)
+    for license_type in urange(LICENSE_TYPES):
+        schedule[PRICE_TIERS * 2 + license_type] = arc4.UInt64(10000)
+    return schedule
+
+
+@subroutine
+def build_price_schedule(
+    breakpoints: TierValues, discounts: TierValues, multipliers: TierValues
+) -> PriceSchedule:
+    """
+    Validate and pack a price schedule. Used tiers need ascending quantity
+    breakpoints and non-decreasing discounts; a 0 breakpoint ends the list.
+    """
+    schedule = default_price_schedule()
+    previous_breakpoint = UInt64(0)
+    previous_discount = UInt64(0)
+    for tier in urange(PRICE_TIERS):
+        breakpoint = breakpoints[tier].native
+        if breakpoint:
+            assert previous_breakpoint != NO_BREAKPOINT, "Gap in price tiers"
+            assert breakpoint > previous_breakpoint, "Breakpoints must ascend"
+            assert discounts[tier].native >= previous_discount, "Discounts must not drop"
+            assert discounts[tier].native <= 10000, "Discount above 100%"
+            previous_breakpoint = breakpoint
+            previous_discount = discounts[tier].native
+        else:
+            previous_breakpoint = UInt64(NO_BREAKPOINT)
+        schedule[tier] = arc4.UInt64(previous_breakpoint)
+        # Unused tiers repeat the last discount so their step is zero.
+        schedule[PRICE_TIERS + tier] = arc4.UInt64(previous_discount)
+    for license_type in urange(LICENSE_TYPES):
+        assert multipliers[license_type].native, "Multiplier must be positive"
+        schedule[PRICE_TIERS * 2 + license_type] = multipliers[license_type]
+    return schedule
+
+
+@subroutine
+def quote_price(pricing: Bytes, quantity: UInt64, license_type: UInt64) -> UInt64:
+    """
+    Price `quantity` units from a box slice holding the unit price followed
+    by a PriceSchedule. Breakpoints ascend and discounts never drop, so the
+    discount is the sum of the steps whose breakpoint was reached, chosen
+    with `select` instead of a branch per tier.
+    """
+    assert license_type < LICENSE_TYPES, "Unknown license type"
+    discount = UInt64(0)
+    previous = UInt64(0)
+    for tier in urange(PRICE_TIERS):
+        reached = op.extract_uint64(pricing, 8 + (PRICE_TIERS + tier) * 8)
+        breakpoint = op.extract_uint64(pricing, 8 + tier * 8)
+        discount += op.select_uint64(0, reached - previous, quantity >= breakpoint)
+        previous = reached
+    multiplier = op.extract_uint64(pricing, 8 + (PRICE_TIERS * 2 + license_type) * 8)
+    total = op.extract_uint64(pricing, 0) * quantity * multiplier // 10000
+    return total * (10000 - discount) // 10000
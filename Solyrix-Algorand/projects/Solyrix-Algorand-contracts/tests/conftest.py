@@ -0,0 +1,138 @@
+import base64
+from collections.abc import Callable, Iterator
+from typing import TypeVar
+
+import algokit_utils
+import pytest
+from _algopy_testing.context_helpers import lazy_context
+from algopy import Account, Application, ARC4Contract, UInt64, gtxn
+from algopy_testing import AlgopyTestContext, algopy_testing_context
+from algosdk import account
+from algosdk.transaction import SignedTransaction, SuggestedParams
+from algosdk.v2client.models import SimulateRequest
+
+from backend.costs import BOX_BYTE_MIN_BALANCE, BOX_FLAT_MIN_BALANCE
+
+ContractT = TypeVar("ContractT", bound=ARC4Contract)
+
+
+@pytest.fixture
+def algorand() -> algokit_utils.AlgorandClient:
+    """An AlgorandClient that builds transactions without reaching a node"""
+    client = algokit_utils.AlgorandClient.from_config(
+        algokit_utils.AlgoClientNetworkConfig("http://127.0.0.1:1", "")
+    )
+    params = SuggestedParams(
+        fee=1_000,
+        first=1,
+        last=1_000,
+        gh=base64.b64encode(bytes(32)).decode(),
+        gen="test",
+        flat_fee=True,
+        min_fee=1_000,
+    )
+    client.get_suggested_params = lambda: params  # type: ignore[method-assign]
+    return client
+
+
+@pytest.fixture
+def sender() -> str:
+    return account.generate_account()[1]
+
+
+SimulateHandler = Callable[[list[SignedTransaction]], dict]
+
+
+class SimulateStub:
+    """
+    Stands in for algod's simulate endpoint. Like algod, it rejects
+    requests with more than one transaction group; `handler` turns the
+    group's transactions into that group's result.
+    """
+
+    def __init__(self, handler: SimulateHandler) -> None:
+        self.handler = handler
+        self.group_sizes: list[int] = []
+
+    def __call__(self, request: SimulateRequest) -> dict:
+        if len(request.txn_groups) != 1:
+            raise AssertionError(f"simulate got {len(request.txn_groups)} groups, algod takes one")
+        txns = request.txn_groups[0].txns
+        assert len({stxn.transaction.group for stxn in txns}) == 1
+        self.group_sizes.append(len(txns))
+        return {"txn-groups": [self.handler(txns)]}
+
+
+@pytest.fixture
+def simulate(algorand: algokit_utils.AlgorandClient) -> Callable[[SimulateHandler], SimulateStub]:
+    def install(handler: SimulateHandler) -> SimulateStub:
+        stub = SimulateStub(handler)
+        algorand.client.algod.simulate_transactions = stub  # type: ignore[method-assign]
+        return stub
+
+    return install
+
+
+class MinBalanceBoxes(dict[bytes, bytes]):
+    """
+    An app's boxes in the testing context. The context keeps every
+    account's min_balance fixed; this charges each box's MBR to the app
+    account the way algod does, so contracts' payment checks see it.
+    """
+
+    def __init__(self, fields: dict) -> None:
+        super().__init__()
+        self._fields = fields
+
+    def __setitem__(self, key: bytes, value: bytes) -> None:
+        if key in self:
+            self._charge(-self._cost(key, self[key]))
+        self._charge(self._cost(key, value))
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: bytes) -> None:
+        self._charge(-self._cost(key, self[key]))
+        super().__delitem__(key)
+
+    @staticmethod
+    def _cost(key: bytes, value: bytes) -> int:
+        return BOX_FLAT_MIN_BALANCE + BOX_BYTE_MIN_BALANCE * (len(key) + len(value))
+
+    def _charge(self, amount: int) -> None:
+        self._fields["min_balance"] = UInt64(self._fields["min_balance"].value + amount)
+
+
+@pytest.fixture
+def context() -> Iterator[AlgopyTestContext]:
+    with algopy_testing_context() as ctx:
+        yield ctx
+
+
+@pytest.fixture
+def deploy(context: AlgopyTestContext) -> Callable[[type[ContractT]], ContractT]:
+    """Create a contract whose app account is charged for its boxes"""
+
+    def install(contract_type: type[ContractT]) -> ContractT:
+        contract = contract_type()
+        app = context.ledger.get_app(contract)
+        data = lazy_context.get_app_data(app.id)
+        data.is_creating = False  # later calls go to the created app
+        data.boxes = MinBalanceBoxes(app.address.data.fields)
+        return contract
+
+    return install
+
+
+Pay = Callable[[Account, Application, int], gtxn.PaymentTransaction]
+
+
+@pytest.fixture
+def pay(context: AlgopyTestContext) -> Pay:
+    """Build a payment from an account to an app, for a method's payment argument"""
+
+    def build(sender: Account, app: Application, amount: int) -> gtxn.PaymentTransaction:
+        return context.any.txn.payment(
+            sender=sender, receiver=app.address, amount=UInt64(amount)
+        )
+
+    return build
@@ -0,0 +1,36 @@
+import msgpack
+from algosdk import encoding
+
+from backend.indexer.blocks import decode_block
+
+SENDER = bytes(range(32))
+
+
+def _block_response(txns: list[dict]) -> bytes:
+    # algod packs byte strings with the str type, as use_bin_type=False does.
+    return msgpack.packb(
+        {"block": {"rnd": 7, "ts": 1_700_000_000, "txns": txns}}, use_bin_type=False
+    )
+
+
+def test_binary_logs_and_args_are_kept_as_bytes():
+    log = b"\xff\xfe\x00\x80not utf-8"
+    inner = {"txn": {"type": "appl", "apid": 9, "snd": SENDER}, "dt": {"lg": [b"\xc3\x28"]}}
+    raw = _block_response(
+        [
+            {"txn": {"type": "pay", "snd": SENDER}},
+            {
+                "txn": {"type": "appl", "apid": 5, "snd": SENDER, "apaa": [b"\x80\x81"]},
+                "dt": {"lg": [log], "itx": [inner]},
+            },
+        ]
+    )
+    block = decode_block(raw)
+    assert (block.round, block.timestamp) == (7, 1_700_000_000)
+    outer, nested = block.app_calls
+    assert outer.app_id == 5
+    assert outer.sender == encoding.encode_address(SENDER)
+    assert outer.args == [b"\x80\x81"]
+    assert outer.logs == [log]
+    assert outer.intra == 1
+    assert (nested.app_id, nested.logs, nested.intra) == (9, [b"\xc3\x28"], 1)
@@ -0,0 +1,106 @@
+import base64
+import itertools
+
+import pytest
+
+from backend.boxes import BoxRecord, BoxScanner, Checkpoint
+
+APP_ID = 1234
+PAGE_SIZE = 3
+
+
+def _token(name: bytes) -> str:
+    return f"b64:{base64.b64encode(name).decode()}"
+
+
+class _Indexer:
+    """Pages box names in name order, after a `b64:` token, like the indexer"""
+
+    def __init__(self, names: list[bytes]) -> None:
+        self.names = sorted(names)
+        self.tokens: list[str | None] = []
+
+    def application_boxes(self, application_id: int, limit: int = 0, next_page=None) -> dict:
+        assert application_id == APP_ID
+        self.tokens.append(next_page)
+        after = base64.b64decode(next_page.removeprefix("b64:")) if next_page else None
+        page = [name for name in self.names if after is None or name > after][:limit]
+        response: dict = {"boxes": [{"name": base64.b64encode(name).decode()} for name in page]}
+        if len(page) == limit:
+            response["next-token"] = _token(page[-1])
+        return response
+
+
+class _Algod:
+    def __init__(self, boxes: dict[bytes, bytes]) -> None:
+        self.boxes = boxes
+
+    def application_box_by_name(self, application_id: int, box_name: bytes) -> dict:
+        if box_name not in self.boxes:
+            raise Exception("box not found")
+        return {"value": base64.b64encode(self.boxes[box_name]).decode()}
+
+
+PREFIXED = {b"p" + bytes([i]): b"value %d" % i for i in range(8)}
+BOXES = {b"a": b"before", **PREFIXED, b"q": b"after", b"z": b"last"}
+
+
+@pytest.fixture
+def indexer() -> _Indexer:
+    return _Indexer(list(BOXES))
+
+
+@pytest.fixture
+def scanner(indexer: _Indexer) -> BoxScanner:
+    algod = _Algod(dict(BOXES))
+    return BoxScanner(algod, indexer, APP_ID, page_size=PAGE_SIZE)  # type: ignore[arg-type]
+
+
+def _expected(names) -> list[BoxRecord]:
+    return [BoxRecord(name, BOXES[name]) for name in sorted(names)]
+
+
+def test_prefix_scan_starts_at_the_prefix_and_stops_past_it(scanner, indexer):
+    assert list(scanner.scan(b"p")) == _expected(PREFIXED)
+    assert indexer.tokens[0] == _token(b"p")
+    # 8 names in pages of 3; the third page holds "q", which ends the range.
+    assert len(indexer.tokens) == 3
+    assert indexer.tokens[1:] == [_token(b"p\x02"), _token(b"p\x05")]
+
+
+def test_unprefixed_scan_reads_every_page(scanner, indexer):
+    assert list(scanner.names()) == sorted(BOXES)
+    assert indexer.tokens[0] is None
+    assert list(scanner.scan()) == _expected(BOXES)
+
+
+def test_boxes_deleted_after_listing_are_skipped(indexer):
+    algod = _Algod({name: value for name, value in BOXES.items() if name != b"p\x04"})
+    scanner = BoxScanner(algod, indexer, APP_ID, page_size=PAGE_SIZE)  # type: ignore[arg-type]
+    assert [record.name for record in scanner.scan(b"p")] == [
+        name for name in sorted(PREFIXED) if name != b"p\x04"
+    ]
+
+
+def test_scan_resumes_after_the_last_consumed_page(scanner, indexer, tmp_path):
+    checkpoint = tmp_path / "scan.json"
+    # Stop one record into the second page: only the first page is checkpointed.
+    partial = list(itertools.islice(scanner.scan(b"p", checkpoint), PAGE_SIZE + 1))
+    state = Checkpoint.load(checkpoint)
+    assert state is not None
+    assert (state.scanned, state.done) == (PAGE_SIZE, False)
+    assert state.next_token == _token(b"p\x02")
+
+    indexer.tokens.clear()
+    resumed = list(scanner.scan(b"p", checkpoint))
+    assert indexer.tokens[0] == state.next_token
+    assert partial[:PAGE_SIZE] + resumed == _expected(PREFIXED)
+    assert Checkpoint.load(checkpoint).done
+    assert list(scanner.scan(b"p", checkpoint)) == []
+
+
+def test_checkpoint_of_another_scan_is_refused(scanner, tmp_path):
+    checkpoint = tmp_path / "scan.json"
+    list(scanner.scan(b"p", checkpoint))
+    with pytest.raises(ValueError):
+        list(scanner.scan(b"q", checkpoint))
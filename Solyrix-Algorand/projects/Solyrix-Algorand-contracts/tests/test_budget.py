@@ -0,0 +1,51 @@
+import pytest
+from algosdk import transaction
+
+from backend.budget import APP_CALL_BUDGET, GROUP_SIZE, BudgetError, BudgetPadder
+from smart_contracts.artifacts.context_registry.context_registry_client import (
+    ContextRegistryClient,
+)
+
+OP_UP_COST = 20  # opcodes the bare-call routing of one op_up uses
+
+
+def _consumed(base: int):
+    """Simulate handler: `base` for the caller's calls plus each op_up's own cost"""
+
+    def handler(txns: list) -> dict:
+        op_ups = sum(
+            isinstance(stxn.transaction, transaction.ApplicationCallTxn)
+            and not stxn.transaction.app_args
+            for stxn in txns
+        )
+        return {"txn-results": [{}] * len(txns), "app-budget-consumed": base + op_ups * OP_UP_COST}
+
+    return handler
+
+
+@pytest.fixture
+def padder(algorand, sender):
+    client = ContextRegistryClient(algorand=algorand, app_id=1, default_sender=sender)
+    calls = [client.params.get_platform_fee_percentage()]
+    return BudgetPadder(client), calls
+
+
+def test_group_within_budget_is_not_padded(padder, simulate):
+    budget, calls = padder
+    simulate(_consumed(APP_CALL_BUDGET))
+    assert budget.pad(calls) == calls
+
+
+def test_padding_covers_the_op_up_calls_own_cost(padder, simulate):
+    budget, calls = padder
+    # 10 short of two calls' budget: one op_up would cover it if it were free.
+    stub = simulate(_consumed(2 * APP_CALL_BUDGET - 10))
+    assert budget.padding_needed(calls) == 2
+    assert stub.group_sizes == [1, 2, 3]
+
+
+def test_padding_that_does_not_fit_the_group_raises(padder, simulate):
+    budget, calls = padder
+    simulate(_consumed(GROUP_SIZE * APP_CALL_BUDGET + 1))
+    with pytest.raises(BudgetError, match="split the batch"):
+        budget.pad(calls)
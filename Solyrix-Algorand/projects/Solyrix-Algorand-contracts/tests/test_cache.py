@@ -0,0 +1,78 @@
+import os
+
+import pytest
+
+from backend.ipfs.cache import BlobCache
+from backend.ipfs.cid import CIDError, compute_cid
+
+A, B, C = (bytes([byte]) * 100 for byte in b"abc")
+CID_A, CID_B, CID_C = (str(compute_cid(payload)) for payload in (A, B, C))
+
+
+def _age(cache_root, cid: str, mtime: float) -> None:
+    (path,) = cache_root.glob(f"*/{cid}")
+    os.utime(path, (mtime, mtime))
+
+
+def test_least_recently_read_blob_is_evicted_over_budget(tmp_path):
+    cache = BlobCache(tmp_path, max_bytes=250)
+    cache.put(CID_A, A)
+    cache.put(CID_B, B)
+    assert bytes(cache.get(CID_A)) == A
+    cache.put(CID_C, C)
+
+    assert CID_B not in cache
+    assert (CID_A in cache, CID_C in cache) == (True, True)
+    assert cache.total_bytes == 200
+    assert not list(tmp_path.glob(f"*/{CID_B}"))
+
+
+def test_blob_larger_than_the_budget_is_not_cached(tmp_path):
+    cache = BlobCache(tmp_path, max_bytes=50)
+    cache.put(CID_A, A)
+    assert cache.get(CID_A) is None
+    assert cache.total_bytes == 0
+
+
+def test_recency_is_restored_from_mtimes_after_a_restart(tmp_path):
+    cache = BlobCache(tmp_path)
+    for cid, payload in ((CID_A, A), (CID_B, B), (CID_C, C)):
+        cache.put(cid, payload)
+    _age(tmp_path, CID_A, 1_000)
+    _age(tmp_path, CID_B, 3_000)
+    _age(tmp_path, CID_C, 2_000)
+
+    restarted = BlobCache(tmp_path, max_bytes=250)
+    assert len(restarted) == 2
+    assert CID_A not in restarted
+    restarted.put(str(compute_cid(b"d" * 100)), b"d" * 100)
+    assert CID_C not in restarted  # the older of the two survivors goes next
+    assert bytes(restarted.get(CID_B)) == B
+
+
+def test_reads_refresh_recency_on_disk(tmp_path):
+    cache = BlobCache(tmp_path)
+    cache.put(CID_A, A)
+    cache.put(CID_B, B)
+    _age(tmp_path, CID_A, 1_000)
+    _age(tmp_path, CID_B, 2_000)
+    cache.get(CID_A)
+
+    restarted = BlobCache(tmp_path, max_bytes=150)
+    assert CID_A in restarted
+    assert CID_B not in restarted
+
+
+def test_put_rejects_a_payload_that_does_not_match_the_cid(tmp_path):
+    cache = BlobCache(tmp_path)
+    with pytest.raises(CIDError):
+        cache.put(CID_A, B)
+    assert CID_A not in cache
+    assert not [path for path in tmp_path.rglob("*") if path.is_file()]
+
+
+def test_empty_blob_is_served_without_mapping(tmp_path):
+    cache = BlobCache(tmp_path)
+    cid = str(compute_cid(b""))
+    cache.put(cid, b"")
+    assert cache.get(cid) == b""
@@ -0,0 +1,53 @@
+import hashlib
+import io
+
+import pytest
+
+from backend.ipfs.car import write_car
+from backend.ipfs.cid import CHUNK_SIZE, DAG_PB, RAW, _read_varint, compute_cid
+
+
+def _read_car(data: bytes) -> tuple[bytes, list[tuple[bytes, bytes]]]:
+    """The header and the (CID bytes, block) sections of a CARv1"""
+    length, offset = _read_varint(data, 0)
+    header = data[offset : offset + length]
+    offset += length
+    sections = []
+    while offset < len(data):
+        length, offset = _read_varint(data, offset)
+        section = data[offset : offset + length]
+        offset += length
+        cid_length = 34 if section[:2] == b"\x12\x20" else 36  # CIDv0 is a bare multihash
+        sections.append((section[:cid_length], section[cid_length:]))
+    return header, sections
+
+
+@pytest.mark.parametrize("cid_version", [0, 1])
+def test_car_holds_every_block_once_under_the_root(cid_version):
+    data = bytes(3 * CHUNK_SIZE) + b"tail"
+    out = io.BytesIO(b"prefix")
+    out.seek(0, io.SEEK_END)
+    root = write_car(io.BytesIO(data), out, cid_version)
+    assert root == compute_cid(data, cid_version)
+
+    car = out.getvalue()
+    assert car.startswith(b"prefix")
+    header, sections = _read_car(car[len(b"prefix") :])
+    link = b"\x58" + bytes([len(root.to_bytes()) + 1]) + b"\0" + root.to_bytes()
+    assert header == b"\xa2\x65roots\x81\xd8\x2a" + link + b"\x67version\x01"
+    # Three identical zero leaves collapse to one, plus the tail and the root.
+    assert len(sections) == 3
+    for cid, block in sections:
+        assert cid.endswith(hashlib.sha256(block).digest())
+    assert sections[-1][0] == root.to_bytes()
+    assert root.codec == DAG_PB
+    if cid_version:
+        assert sections[0][0][:2] == bytes([1, RAW])  # leaves are raw blocks
+
+
+def test_single_chunk_root_is_a_raw_block_in_cidv1():
+    out = io.BytesIO()
+    root = write_car(io.BytesIO(b"hello world\n"), out, cid_version=1)
+    assert str(root) == "bafkreifjjcie6lypi6ny7amxnfftagclbuxndqonfipmb64f2km2devei4"
+    _, sections = _read_car(out.getvalue())
+    assert sections == [(root.to_bytes(), b"hello world\n")]
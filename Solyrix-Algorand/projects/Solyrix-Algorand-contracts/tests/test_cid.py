@@ -0,0 +1,99 @@
+import hashlib
+
+import pytest
+
+from backend.ipfs.cid import (
+    CHUNK_SIZE,
+    CID,
+    DAG_PB,
+    MAX_LINKS,
+    RAW,
+    CIDError,
+    DagBuilder,
+    compute_cid,
+    verify,
+)
+
+
+def _chunks(count: int, tail: int = 0) -> bytes:
+    """`count` full chunks that all differ, then `tail` more bytes"""
+    return b"".join(i.to_bytes(4, "big") * (CHUNK_SIZE // 4) for i in range(count)) + (
+        b"\xab" * tail
+    )
+
+
+@pytest.fixture(scope="module")
+def deep_file() -> bytes:
+    # One chunk more than a single node can link, so the DAG is two levels deep.
+    return _chunks(MAX_LINKS, tail=1000)
+
+
+# Roots printed by `ipfs add --only-hash` (Kubo, default importer) for the same bytes.
+@pytest.mark.parametrize(
+    "data, cid",
+    [
+        (b"", "QmbFMke1KXqnYyBBWxB74N4c5SBnJMVAiMNRcGu6x1AwQH"),
+        (b"hello world\n", "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o"),
+        (_chunks(1), "QmRk1rduJvo5DfEYAaLobS2za9tDszk35hzaNSDCJ74DA7"),
+        (_chunks(3, tail=1000), "QmafoYC4GYbRjDQrXUHoP3NFAoXckZKofrPAJZpUjiTuhg"),
+        (_chunks(MAX_LINKS), "QmXtV1XJg1bzLo5Ei6WkGSkrRxcQozQvwcBbYJJHvkaMGX"),
+    ],
+    ids=["empty", "hello", "one-chunk", "three-chunks", "full-node"],
+)
+def test_cidv0_matches_ipfs_add(data, cid):
+    assert str(compute_cid(data)) == cid
+
+
+def test_cidv0_of_a_two_level_dag_matches_ipfs_add(deep_file):
+    assert str(compute_cid(deep_file)) == "QmevVzURi24XD3Ci3jktM2C4bCuqbqGXu84Q9k9pRTMufy"
+
+
+@pytest.mark.parametrize(
+    "data, cid",
+    [
+        (b"", "bafkreihdwdcefgh4dqkjv67uzcmw7ojee6xedzdetojuzjevtenxquvyku"),
+        (b"hello world\n", "bafkreifjjcie6lypi6ny7amxnfftagclbuxndqonfipmb64f2km2devei4"),
+        (_chunks(1), "bafkreiekhhjkxu4ztk3tyng3er3ijhg56mb44oe3gwbgquhzu4afrg2ksa"),
+    ],
+    ids=["empty", "hello", "one-chunk"],
+)
+def test_single_chunk_cidv1_is_a_raw_block(data, cid):
+    # What `ipfs add --cid-version=1` prints: a file of one chunk is stored as-is.
+    assert str(compute_cid(data, cid_version=1)) == cid
+
+
+def test_cidv1_dag_has_the_cidv0_shape_with_raw_leaves(deep_file):
+    def build(version: int) -> list:
+        builder = DagBuilder(version)
+        blocks = []
+        for start in range(0, len(deep_file), 100_000):
+            blocks += builder.update(deep_file[start : start + 100_000])
+        return blocks + builder.finish()
+
+    v0, v1 = build(0), build(1)
+    # MAX_LINKS + 1 leaves, the two nodes linking them, and the root.
+    assert len(v0) == len(v1) == MAX_LINKS + 4
+    assert str(v0[-1].cid) == "QmevVzURi24XD3Ci3jktM2C4bCuqbqGXu84Q9k9pRTMufy"
+    leaves = [block for block in v1 if block.cid.codec == RAW]
+    assert [leaf.cid.digest for leaf in leaves] == [
+        hashlib.sha256(deep_file[start : start + CHUNK_SIZE]).digest()
+        for start in range(0, len(deep_file), CHUNK_SIZE)
+    ]
+    assert all(block.cid.codec == DAG_PB for block in v1 if block not in leaves)
+    assert (v1[-1].cid.version, v1[-1].cid.codec) == (1, DAG_PB)
+
+
+def test_cid_round_trips_and_rejects_unsupported_bases():
+    for text in (
+        "QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o",
+        "bafkreifjjcie6lypi6ny7amxnfftagclbuxndqonfipmb64f2km2devei4",
+    ):
+        assert str(CID.parse(text)) == text
+    with pytest.raises(CIDError):
+        CID.parse("zQmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o")
+
+
+def test_verify_rejects_content_that_does_not_match():
+    verify("QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o", b"hello world\n")
+    with pytest.raises(CIDError):
+        verify("QmT78zSuBmuS4z925WZfrqQ1qHaJ56DQaTfyMUF7F8ff5o", b"hello world")
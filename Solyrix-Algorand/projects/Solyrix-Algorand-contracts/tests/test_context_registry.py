@@ -0,0 +1,205 @@
+import pytest
+from algopy import Account, UInt64, arc4
+
+from backend.costs import CostModel
+from smart_contracts.context_registry.contract import ContextRated, ContextRegistry
+from smart_contracts.utils.constants import USER_INDEX_CREATED, USER_INDEX_PAGE_SIZE
+from smart_contracts.utils.helpers import TierValues
+
+COSTS = CostModel.for_contract("ContextRegistry")
+PRICE = 10_000
+
+
+def _tiers(*values: int) -> TierValues:
+    return TierValues(*(arc4.UInt64(value) for value in values))
+
+
+@pytest.fixture
+def registry(deploy):
+    return deploy(ContextRegistry)
+
+
+@pytest.fixture
+def create(context, registry, pay):
+    """Register a context for `creator`, paying well over the MBR"""
+
+    def create(creator: Account, price: int = PRICE) -> UInt64:
+        app = context.ledger.get_app(registry)
+        with context.txn.create_group(active_txn_overrides={"sender": creator}):
+            return registry.create_context(
+                arc4.String("Qm" + "a" * 44),
+                arc4.String("Support bot"),
+                UInt64(price),
+                pay(creator, app, 1_000_000),
+            )
+
+    return create
+
+
+@pytest.fixture
+def purchase(context, registry, pay):
+    def purchase(buyer: Account, context_id: UInt64, amount: int) -> None:
+        app = context.ledger.get_app(registry)
+        with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+            registry.purchase_context(context_id, pay(buyer, app, amount))
+
+    return purchase
+
+
+def test_purchase_pays_the_creator_the_price_less_the_fee(context, registry, create, purchase):
+    creator = context.any.account()
+    context_id = create(creator)
+    platform = registry.platform_balance
+    first_sale_boxes = sum(
+        COSTS.box_min_balance(name) for name in ("purchases", "user_pages", "balances")
+    )
+    purchase(context.any.account(), context_id, PRICE + first_sale_boxes + 500)
+    assert registry.get_balance(arc4.Address(creator)) == PRICE - 250  # 2.5% fee
+    assert registry.platform_balance - platform == 250 + 500  # overpayment included
+
+
+def test_purchase_without_the_box_mbr_fails(context, create, purchase):
+    context_id = create(context.any.account())
+    with pytest.raises(AssertionError, match="Insufficient payment"):
+        purchase(context.any.account(), context_id, PRICE)
+
+
+def test_free_purchase_opens_no_balance_box(context, registry, create, purchase):
+    creator = context.any.account()
+    context_id = create(creator)
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        registry.set_price_tiers(
+            context_id, _tiers(1, 0, 0, 0), _tiers(10_000, 0, 0, 0), _tiers(*[10_000] * 4)
+        )
+    boxes = COSTS.box_min_balance("purchases") + COSTS.box_min_balance("user_pages")
+    purchase(context.any.account(), context_id, boxes)
+    assert creator not in registry.balances
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        with pytest.raises(AssertionError, match="Nothing to withdraw"):
+            registry.withdraw()
+
+
+def test_withdraw_pays_earnings_and_the_freed_box_mbr(context, registry, create, purchase):
+    creator = context.any.account()
+    context_id = create(creator)
+    for _ in range(2):
+        purchase(context.any.account(), context_id, 1_000_000)
+    app = context.ledger.get_app(registry)
+    min_balance = app.address.min_balance
+
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        amount = registry.withdraw()
+    payment = context.txn.last_group.last_itxn.payment
+    freed = COSTS.box_min_balance("balances")
+    assert amount == payment.amount == 2 * (PRICE - 250) + freed
+    assert payment.receiver == creator
+    assert min_balance - app.address.min_balance == freed
+    assert creator not in registry.balances
+
+
+def test_withdraw_platform_fees_is_admin_only(context, registry, create):
+    create(context.any.account())
+    with context.txn.create_group(active_txn_overrides={"sender": context.any.account()}):
+        with pytest.raises(AssertionError, match="Not admin"):
+            registry.withdraw_platform_fees()
+    balance = registry.platform_balance
+    amount = registry.withdraw_platform_fees()
+    assert amount == balance
+    assert context.txn.last_group.last_itxn.payment.receiver == context.default_sender
+    assert registry.platform_balance == 0
+
+
+@pytest.fixture
+def rate(context, registry):
+    def rate(rater: Account, context_id: UInt64, rating: int) -> None:
+        with context.txn.create_group(active_txn_overrides={"sender": rater}):
+            registry.rate_context(context_id, UInt64(rating))
+
+    return rate
+
+
+def _rating(registry, context_id: UInt64) -> tuple[int, int, list[int]]:
+    rating = registry.get_context_rating(context_id)
+    return (
+        rating.rating_sum.native,
+        rating.rating_count.native,
+        [count.native for count in rating.rating_histogram],
+    )
+
+
+def test_only_buyers_can_rate(context, create, rate):
+    context_id = create(context.any.account())
+    with pytest.raises(AssertionError, match="Context not purchased"):
+        rate(context.any.account(), context_id, 5)
+
+
+@pytest.mark.parametrize("rating", [0, 6])
+def test_out_of_range_rating_is_rejected(context, create, purchase, rate, rating):
+    context_id = create(context.any.account())
+    buyer = context.any.account()
+    purchase(buyer, context_id, 1_000_000)
+    with pytest.raises(AssertionError, match="Invalid rating"):
+        rate(buyer, context_id, rating)
+
+
+def test_ratings_update_sum_count_and_histogram(context, registry, create, purchase, rate):
+    context_id = create(context.any.account())
+    first, second = context.any.account(), context.any.account()
+    for buyer in (first, second):
+        purchase(buyer, context_id, 1_000_000)
+    rate(first, context_id, 4)
+    rate(second, context_id, 2)
+    assert _rating(registry, context_id) == (6, 2, [0, 1, 0, 1, 0])
+
+
+def test_rating_again_replaces_the_previous_rating(context, registry, create, purchase, rate):
+    context_id = create(context.any.account())
+    buyer = context.any.account()
+    purchase(buyer, context_id, 1_000_000)
+    rate(buyer, context_id, 1)
+    rate(buyer, context_id, 5)
+    event = ContextRated.from_bytes(context.txn.last_active.last_log[4:])
+    assert (event.rating.native, event.previous_rating.native) == (5, 1)
+    assert _rating(registry, context_id) == (5, 1, [0, 0, 0, 0, 1])
+
+
+def _page(registry, user: Account, page: int) -> tuple[int, list[int]]:
+    stored = registry.get_user_contexts(
+        arc4.Address(user), UInt64(USER_INDEX_CREATED), UInt64(page)
+    )
+    return stored.total.native, [context_id.native for context_id in stored.context_ids]
+
+
+@pytest.mark.parametrize("count", [63, 64, 65])
+def test_created_index_rolls_over_to_a_new_page(context, registry, create, count):
+    creator = context.any.account()
+    ids = [create(creator, PRICE + i).value for i in range(count)]
+
+    total, first = _page(registry, creator, 0)
+    assert total == count
+    assert first == (ids + [0] * USER_INDEX_PAGE_SIZE)[:USER_INDEX_PAGE_SIZE]
+    if count > USER_INDEX_PAGE_SIZE:
+        assert _page(registry, creator, 1) == (count, ids[64:] + [0] * 63)
+    else:
+        assert _page(registry, creator, 1) == (0, [0] * USER_INDEX_PAGE_SIZE)
+
+    # A return value must fit in one log entry, so read back the ids around the boundary.
+    boundary = ids[USER_INDEX_PAGE_SIZE - 2 :]
+    records = registry.get_contexts(arc4.DynamicArray[arc4.UInt64](*map(arc4.UInt64, boundary)))
+    assert [record.price.native for record in records] == [PRICE + i - 1 for i in boundary]
+
+
+def test_creator_pays_for_the_page_a_context_opens(context, registry, create):
+    app = context.ledger.get_app(registry)
+    creator = context.any.account()
+    for _ in range(USER_INDEX_PAGE_SIZE - 1):
+        create(creator)
+
+    added = []
+    for _ in range(2):  # the last slot of page 0, then the first of page 1
+        min_balance, platform = app.address.min_balance, registry.platform_balance
+        create(creator)
+        added.append(app.address.min_balance - min_balance)
+        # The creator's payment covered the MBR; only the rest went to the platform.
+        assert registry.platform_balance - platform == 1_000_000 - added[-1]
+    assert added[1] - added[0] == COSTS.box_min_balance("user_pages")
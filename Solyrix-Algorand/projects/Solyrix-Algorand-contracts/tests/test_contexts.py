@@ -0,0 +1,42 @@
+import base64
+
+from algosdk import abi, encoding
+from algosdk.atomic_transaction_composer import ABI_RETURN_HASH
+
+from backend.contexts import ContextReader
+from smart_contracts.artifacts.context_registry.context_registry_client import (
+    APP_SPEC,
+    ContextRegistryClient,
+)
+
+_IDS = abi.ABIType.from_string("uint64[]")
+_RECORDS = abi.ABIType.from_string(APP_SPEC.get_arc56_method("get_contexts").returns.type)
+_CREATOR = encoding.encode_address(bytes(32))
+
+
+def _records_result(txns: list) -> dict:
+    """Each context's price is its id"""
+    results = []
+    for stxn in txns:
+        ids = _IDS.decode(stxn.transaction.app_args[1])
+        records = [
+            [_CREATOR, i, [i] * 12, 0, 0, 0, 0, [0, 0, 0, 0, i], "Qm" + "a" * 44, f"Context {i}"]
+            for i in ids
+        ]
+        logs = [base64.b64encode(ABI_RETURN_HASH + _RECORDS.encode(records)).decode()]
+        results.append({"txn-result": {"logs": logs}})
+    return {"txn-results": results}
+
+
+def test_page_larger_than_a_group_is_split(algorand, sender, simulate):
+    stub = simulate(_records_result)
+    reader = ContextReader(ContextRegistryClient(algorand=algorand, app_id=1), sender)
+    ids = list(range(1, 301))
+    records = reader.get_many(ids)
+    assert [record.price for record in records] == ids
+    assert records[0].title == "Context 1"
+    assert (records[1].creator, records[1].ipfs_hash) == (_CREATOR, "Qm" + "a" * 44)
+    assert list(records[1].pricing) == [2] * 12
+    assert list(records[1].rating_histogram) == [0, 0, 0, 0, 2]
+    # 300 ids are 38 calls of 8: two full groups of 16 and one of 6.
+    assert sorted(stub.group_sizes) == [6, 16, 16]
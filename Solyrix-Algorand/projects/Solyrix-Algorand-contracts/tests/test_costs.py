@@ -0,0 +1,29 @@
+from backend.costs import CostModel
+
+
+def test_balance_boxes_are_counted_per_creator_not_per_buyer():
+    model = CostModel.for_contract("ContextRegistry")
+    purchase = model.box_min_balance("purchases")
+    balance = model.box_min_balance("balances")
+    page = model.box_min_balance("user_pages")
+    # 100 buyers purchase one context each from a single creator.
+    funding = model.bulk_min_balance("purchase_context", 100, accounts=100)
+    assert funding == 100 * purchase + 100 * page + balance
+    funding = model.bulk_min_balance("purchase_context", 100, accounts=100, creators=3)
+    assert funding == 100 * purchase + 100 * page + 3 * balance
+
+
+def test_app_funding_leaves_out_caller_funded_calls():
+    model = CostModel.for_contract("LicenseManager")
+    plan = {"create_license": 10, "purchase_license": 40, "renew_license": 5}
+    assert model.app_funding(plan, accounts=40) == model.app_funding({})
+    grants = 40 * model.box_min_balance("grants")
+    offers = 10 * model.box_min_balance("licenses")
+    assert model.caller_funding(plan, accounts=40) == (
+        offers + grants + model.box_min_balance("balances")
+    )
+    registry = CostModel.for_contract("ContextRegistry")
+    assert all(
+        registry.operation_cost(method).caller_funded
+        for method in ("create_context", "purchase_context")
+    )
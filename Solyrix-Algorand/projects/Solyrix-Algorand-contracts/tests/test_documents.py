@@ -0,0 +1,21 @@
+import json
+
+from backend.documents import ContextCodec, ContextView
+
+DOCUMENT = {
+    "metadata": {"title": "Support bot"},
+    "content": {
+        "systemPrompt": "Be helpful",
+        "examples": [{"input": "hi", "output": "hello"}],
+        "tools": [{"name": "search"}],
+    },
+}
+
+
+def test_content_reads_the_same_from_json_and_binary():
+    codec = ContextCodec()
+    binary = ContextView(codec.encode(DOCUMENT), codec)
+    legacy = ContextView(json.dumps(DOCUMENT).encode(), codec)
+    assert binary["content"] == legacy["content"] == DOCUMENT["content"]
+    assert binary["content.tools"] == DOCUMENT["content"]["tools"]
+    assert binary["metadata.title"] == "Support bot"
@@ -0,0 +1,100 @@
+import io
+
+import pytest
+
+from backend.encryption import (
+    DecryptionError,
+    TAG_LENGTH,
+    DerivedKeyCache,
+    decrypt_data,
+    decrypt_file,
+    decrypt_stream,
+    encrypt_data,
+    encrypt_stream,
+)
+
+CHUNK = 16
+
+
+def _sealed(plaintext: bytes) -> tuple[bytes, list[bytes]]:
+    """Encrypt `plaintext` and split the result into its header line and chunks"""
+    out = io.BytesIO()
+    encrypt_stream(io.BytesIO(plaintext), out, "right", chunk_size=CHUNK)
+    header, _, body = out.getvalue().partition(b"\n")
+    size = CHUNK + TAG_LENGTH
+    return header + b"\n", [body[i : i + size] for i in range(0, len(body), size)]
+
+
+def _decrypt(data: bytes) -> bytes:
+    out = io.BytesIO()
+    decrypt_stream(io.BytesIO(data), out, "right")
+    return out.getvalue()
+
+
+def test_cached_key_is_not_served_to_a_wrong_password():
+    cache = DerivedKeyCache()
+    encrypted = encrypt_data("secret", "right")
+    assert decrypt_data(encrypted, "right", cache, "ctx-1") == "secret"
+    with pytest.raises(DecryptionError):
+        decrypt_data(encrypted, "wrong", cache, "ctx-1")
+    assert decrypt_data(encrypted, "right", cache, "ctx-1") == "secret"
+    assert len(cache) == 1
+
+
+def test_stream_wrong_password_fails_with_and_without_cache():
+    sealed = io.BytesIO()
+    encrypt_stream(io.BytesIO(b"x" * 100), sealed, "right", chunk_size=16)
+    cache = DerivedKeyCache()
+    for key_cache, key_id in ((None, None), (cache, "ctx-1")):
+        sealed.seek(0)
+        decrypt_stream(sealed, io.BytesIO(), "right", key_cache=key_cache, key_id=key_id)
+        sealed.seek(0)
+        with pytest.raises(DecryptionError):
+            decrypt_stream(sealed, io.BytesIO(), "wrong", key_cache=key_cache, key_id=key_id)
+
+
+def test_eviction_does_not_zero_a_returned_key():
+    cache = DerivedKeyCache()
+    key = cache.derive("right", bytes(16), "ctx-1")
+    cache.clear()
+    assert key != bytes(len(key))
+
+
+@pytest.mark.parametrize("length", [0, 1, CHUNK, 3 * CHUNK, 3 * CHUNK + 5])
+def test_stream_round_trips(length):
+    plaintext = bytes(range(length))
+    header, chunks = _sealed(plaintext)
+    assert len(chunks) == max(1, -(-length // CHUNK))
+    assert _decrypt(header + b"".join(chunks)) == plaintext
+
+
+@pytest.mark.parametrize("length", [3 * CHUNK, 3 * CHUNK + 5])
+def test_truncated_stream_fails(length):
+    header, chunks = _sealed(bytes(length))
+    with pytest.raises(DecryptionError):
+        _decrypt(header + b"".join(chunks[:-1]))  # cut at a chunk boundary
+    with pytest.raises(DecryptionError):
+        _decrypt(header + b"".join(chunks)[:-1])
+    with pytest.raises(DecryptionError):
+        _decrypt(header)
+
+
+def test_reordered_chunks_fail():
+    header, chunks = _sealed(bytes(3 * CHUNK))
+    with pytest.raises(DecryptionError):
+        _decrypt(header + chunks[1] + chunks[0] + chunks[2])
+
+
+def test_failed_file_decryption_leaves_no_plaintext(tmp_path):
+    header, chunks = _sealed(b"secret" * 10)
+    src, dst = tmp_path / "context.enc", tmp_path / "context.json"
+    src.write_bytes(header + b"".join(chunks[:-1]))
+    dst.write_bytes(b"previous")
+    with pytest.raises(DecryptionError):
+        decrypt_file(src, dst, "right")
+    assert dst.read_bytes() == b"previous"
+    assert sorted(path.name for path in tmp_path.iterdir()) == [src.name, dst.name]
+
+    src.write_bytes(header + b"".join(chunks))
+    decrypt_file(src, dst, "right")
+    assert dst.read_bytes() == b"secret" * 10
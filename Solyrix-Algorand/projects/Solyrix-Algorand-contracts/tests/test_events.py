@@ -0,0 +1,102 @@
+import re
+
+import msgpack
+import pytest
+from algosdk import abi, encoding
+
+from backend.events import EventDecoder
+from backend.indexer.blocks import decode_block
+from backend.indexer.decoder import ARTIFACTS_PATH, ContextCreated, MarketplaceDecoder, load_methods
+from smart_contracts.artifacts.context_registry.context_registry_client import (
+    APP_SPEC as REGISTRY_SPEC,
+)
+from smart_contracts.artifacts.governance_token.governance_token_client import (
+    APP_SPEC as GOVERNANCE_SPEC,
+)
+from smart_contracts.artifacts.license_manager.license_manager_client import (
+    APP_SPEC as LICENSE_SPEC,
+)
+
+REGISTRY_APP_ID = 11
+LICENSE_APP_ID = 12
+
+# puya comments every selector it pushes with the signature it hashed; events are
+# CamelCase, while ABI methods called on other apps are snake_case.
+_EMIT = re.compile(r'pushbytes 0x([0-9a-f]{8}) // method "([A-Z]\w*\(.*\))"')
+
+
+def _emitted(teal_name: str) -> dict[str, bytes]:
+    teal = next(ARTIFACTS_PATH.glob(f"*/{teal_name}.approval.teal")).read_text()
+    return {signature: bytes.fromhex(selector) for selector, signature in _EMIT.findall(teal)}
+
+
+def _signature(app_spec, name: str) -> str:
+    event = next(event for event in app_spec.events if event.name == name)
+    return f"{name}({','.join(arg.type for arg in event.args)})"
+
+
+_ZERO = {"uint64": 0, "address": encoding.encode_address(bytes(32)), "string": ""}
+
+
+@pytest.mark.parametrize(
+    "app_spec", [REGISTRY_SPEC, LICENSE_SPEC, GOVERNANCE_SPEC], ids=lambda spec: spec.name
+)
+def test_spec_events_are_the_ones_the_contract_emits(app_spec):
+    emitted = _emitted(app_spec.name)
+    assert {_signature(app_spec, event.name) for event in app_spec.events} == set(emitted)
+    decoder = EventDecoder.from_app_spec(app_spec)
+    for event in app_spec.events:
+        values = [_ZERO[arg.type] for arg in event.args]
+        decoded = decoder.decode(_log(app_spec, event.name, values))
+        assert decoded is not None
+        assert (decoded.name, decoded.signature) == (event.name, _signature(app_spec, event.name))
+        assert list(decoded.fields) == [arg.name for arg in event.args]
+
+
+def _log(app_spec, name: str, values: list) -> bytes:
+    """Log bytes as the contract's arc4.emit writes them, typed from the spec"""
+    signature = _signature(app_spec, name)
+    selector = _emitted(app_spec.name)[signature]
+    types = signature[len(name) + 1 : -1].split(",")
+    codec = abi.TupleType([abi.ABIType.from_string(t) for t in types])
+    return selector + codec.encode(values)
+
+
+def _block(txn: dict, logs: list[bytes]) -> bytes:
+    return msgpack.packb(
+        {"block": {"rnd": 42, "ts": 1_700_000_000, "txns": [{"txn": txn, "dt": {"lg": logs}}]}},
+        use_bin_type=False,
+    )
+
+
+def _create_context_call(creator_key: bytes) -> dict:
+    methods = load_methods(ARTIFACTS_PATH / "context_registry" / "ContextRegistry.arc56.json")
+    selector = next(s for s, method in methods.items() if method.name == "create_context")
+    return {"type": "appl", "apid": REGISTRY_APP_ID, "snd": creator_key, "apaa": [selector]}
+
+
+def test_emitted_event_round_trips_through_a_block():
+    creator_key = bytes(range(200, 232))  # not valid UTF-8
+    creator = encoding.encode_address(creator_key)
+    log = _log(REGISTRY_SPEC, "ContextCreated", [0xFF, creator, 5_000, "QmHash", "Títle"])
+    raw = _block(_create_context_call(creator_key), [log])
+
+    events = MarketplaceDecoder(REGISTRY_APP_ID, LICENSE_APP_ID).decode_block(decode_block(raw))
+
+    assert events == [
+        ContextCreated(
+            round=42,
+            timestamp=1_700_000_000,
+            intra=0,
+            context_id=0xFF,
+            creator=creator,
+            ipfs_hash="QmHash",
+            title="Títle",
+            price=5_000,
+        )
+    ]
+
+
+def test_calls_without_event_logs_are_not_decoded_from_app_args():
+    raw = _block(_create_context_call(bytes(32)), [])
+    assert MarketplaceDecoder(REGISTRY_APP_ID, LICENSE_APP_ID).decode_block(decode_block(raw)) == []
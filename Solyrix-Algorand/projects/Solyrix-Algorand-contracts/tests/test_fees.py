@@ -0,0 +1,38 @@
+import base64
+
+from backend.fees import PLATFORM_FEE_KEY, PlatformFeeCache
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import PlatformFeeUpdated
+
+
+class FakeAlgod:
+    def __init__(self, fee_bps: int) -> None:
+        self.fee_bps = fee_bps
+        self.reads = 0
+
+    def status(self) -> dict:
+        return {"last-round": 10}
+
+    def application_info(self, app_id: int) -> dict:
+        self.reads += 1
+        key = base64.b64encode(PLATFORM_FEE_KEY).decode()
+        return {"params": {"global-state": [{"key": key, "value": {"uint": self.fee_bps}}]}}
+
+
+def test_stale_entry_is_reread_without_a_follower():
+    algod = FakeAlgod(250)
+    cache = PlatformFeeCache(algod, max_age=0)  # type: ignore[arg-type]
+    assert cache.get(1) == 250
+    algod.fee_bps = 300
+    assert cache.get(1) == 300
+    assert algod.reads == 2
+
+
+def test_follower_keeps_entries_fresh():
+    algod = FakeAlgod(250)
+    cache = PlatformFeeCache(algod)  # type: ignore[arg-type]
+    assert cache.get(1) == 250
+    event = PlatformFeeUpdated(round=11, timestamp=0, intra=0, app_id=1, fee_bps=400)
+    cache.on_block(Block(round=11, timestamp=0, app_calls=[]), [event])
+    assert cache.get(1) == 400
+    assert algod.reads == 1
@@ -0,0 +1,86 @@
+import http.server
+import threading
+import time
+from collections.abc import Iterator
+
+import pytest
+
+from backend.ipfs.cid import compute_cid
+from backend.ipfs.gateways import GatewayError, GatewayFetcher
+
+PAYLOAD = b"context document" * 64
+CID = str(compute_cid(PAYLOAD))
+
+
+class Gateway(http.server.ThreadingHTTPServer):
+    """Local gateway that answers every GET with `body` after `delay` seconds"""
+
+    daemon_threads = True
+
+    def __init__(self, body: bytes, delay: float = 0.0, status: int = 200) -> None:
+        super().__init__(("127.0.0.1", 0), _Handler)
+        self.body = body
+        self.delay = delay
+        self.status = status
+        self.requests = 0
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}/ipfs/"
+
+
+class _Handler(http.server.BaseHTTPRequestHandler):
+    server: Gateway
+
+    def do_GET(self) -> None:
+        self.server.requests += 1
+        time.sleep(self.server.delay)
+        self.send_response(self.server.status)
+        self.send_header("Content-Length", str(len(self.server.body)))
+        self.end_headers()
+        self.wfile.write(self.server.body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def gateways() -> Iterator[list[Gateway]]:
+    started: list[Gateway] = []
+    yield started
+    for gateway in started:
+        gateway.shutdown()
+        gateway.server_close()
+
+
+def _start(gateways: list[Gateway], *servers: Gateway) -> list[str]:
+    for server in servers:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        gateways.append(server)
+    return [server.url for server in servers]
+
+
+def test_stalled_gateway_is_hedged(gateways):
+    urls = _start(gateways, Gateway(PAYLOAD, delay=5), Gateway(PAYLOAD))
+    fetcher = GatewayFetcher(urls, timeout=10)
+    started = time.monotonic()
+    assert fetcher.fetch_blocking(CID) == PAYLOAD
+    assert time.monotonic() - started < 5
+    # The stalled request was cancelled, which is not held against the gateway.
+    assert list(fetcher.stats[urls[0]].outcomes) == []
+    assert list(fetcher.stats[urls[1]].outcomes) == [True]
+
+
+def test_payload_that_does_not_match_the_cid_is_rejected(gateways):
+    urls = _start(gateways, Gateway(b"tampered"), Gateway(PAYLOAD))
+    fetcher = GatewayFetcher(urls)
+    assert fetcher.fetch_blocking(CID) == PAYLOAD
+    assert list(fetcher.stats[urls[0]].outcomes) == [False]
+    assert fetcher.ranked() == [urls[1], urls[0]]
+
+
+def test_every_gateway_failing_raises(gateways):
+    urls = _start(gateways, Gateway(b"", status=404), Gateway(b"tampered"))
+    with pytest.raises(GatewayError) as raised:
+        GatewayFetcher(urls).fetch_blocking(CID)
+    assert set(raised.value.errors) == set(urls)
@@ -0,0 +1,77 @@
+import pytest
+from algopy import Bytes, UInt64, arc4
+
+from smart_contracts.utils.constants import NO_BREAKPOINT
+from smart_contracts.utils.helpers import (
+    TierValues,
+    build_price_schedule,
+    default_price_schedule,
+    quote_price,
+)
+
+UNIT_PRICE = 1_000
+BASE = (10_000,) * 4  # every license type at the base price
+
+
+def _tiers(*values: int) -> TierValues:
+    return TierValues(*(arc4.UInt64(value) for value in values))
+
+
+def _pricing(breakpoints=(0, 0, 0, 0), discounts=(0, 0, 0, 0), multipliers=BASE) -> Bytes:
+    """The unit price and schedule as quote_price reads them from a box"""
+    schedule = build_price_schedule(
+        _tiers(*breakpoints), _tiers(*discounts), _tiers(*multipliers)
+    )
+    return arc4.UInt64(UNIT_PRICE).bytes + schedule.bytes
+
+
+def _quote(pricing: Bytes, quantity: int, license_type: int = 0) -> int:
+    return quote_price(pricing, UInt64(quantity), UInt64(license_type)).value
+
+
+def test_unused_tiers_never_apply(context):
+    schedule = default_price_schedule()
+    assert [schedule[tier].native for tier in range(4)] == [NO_BREAKPOINT] * 4
+    pricing = arc4.UInt64(UNIT_PRICE).bytes + schedule.bytes
+    assert _quote(pricing, 5) == 5 * UNIT_PRICE
+    assert _quote(pricing, 2**32) == 2**32 * UNIT_PRICE
+
+
+def test_discount_starts_at_each_breakpoint(context):
+    pricing = _pricing(breakpoints=(10, 100, 0, 0), discounts=(500, 1_500, 0, 0))
+    assert _quote(pricing, 9) == 9 * UNIT_PRICE
+    assert _quote(pricing, 10) == 10 * UNIT_PRICE * 95 // 100
+    assert _quote(pricing, 99) == 99 * UNIT_PRICE * 95 // 100
+    assert _quote(pricing, 100) == 100 * UNIT_PRICE * 85 // 100
+
+
+def test_quantity_zero_costs_nothing(context):
+    assert _quote(_pricing(breakpoints=(1, 0, 0, 0), discounts=(500, 0, 0, 0)), 0) == 0
+
+
+def test_full_discount_makes_it_free(context):
+    pricing = _pricing(breakpoints=(1, 0, 0, 0), discounts=(10_000, 0, 0, 0))
+    assert _quote(pricing, 1) == 0
+    assert _quote(pricing, 50) == 0
+
+
+def test_license_type_multiplier(context):
+    pricing = _pricing(multipliers=(10_000, 20_000, 15_000, 50_000))
+    quotes = [_quote(pricing, 2, license_type) for license_type in range(4)]
+    assert quotes == [2_000, 4_000, 3_000, 10_000]
+    with pytest.raises(AssertionError, match="Unknown license type"):
+        _quote(pricing, 1, 4)
+
+
+@pytest.mark.parametrize(
+    ("breakpoints", "discounts", "message"),
+    [
+        ((10, 5, 0, 0), (0, 0, 0, 0), "Breakpoints must ascend"),
+        ((10, 0, 20, 0), (0, 0, 0, 0), "Gap in price tiers"),
+        ((10, 20, 0, 0), (900, 500, 0, 0), "Discounts must not drop"),
+        ((10, 0, 0, 0), (10_001, 0, 0, 0), "Discount above 100%"),
+    ],
+)
+def test_invalid_schedules_are_rejected(context, breakpoints, discounts, message):
+    with pytest.raises(AssertionError, match=message):
+        _pricing(breakpoints, discounts)
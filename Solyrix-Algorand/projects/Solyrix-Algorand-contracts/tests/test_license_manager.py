@@ -0,0 +1,105 @@
+import pytest
+from algopy import Account, UInt64, arc4
+
+from backend.costs import CostModel
+from smart_contracts.context_registry.contract import ContextRecord, RatingHistogram
+from smart_contracts.license_manager.contract import LicenseManager
+from smart_contracts.utils.constants import LICENSE_ONE_TIME
+from smart_contracts.utils.helpers import TierValues, default_price_schedule
+
+COSTS = CostModel.for_contract("LicenseManager")
+OFFER_BOX_MIN_BALANCE = COSTS.box_min_balance("licenses")
+PRICE = 2_000
+REGISTRY_APP_ID = 7
+
+
+def _tiers(*values: int) -> TierValues:
+    return TierValues(*(arc4.UInt64(value) for value in values))
+
+
+def _context_record(creator: Account) -> ContextRecord:
+    zero = arc4.UInt64(0)
+    return ContextRecord(
+        creator=arc4.Address(creator),
+        price=arc4.UInt64(1_000),
+        pricing=default_price_schedule(),
+        created_at=zero,
+        purchases=zero,
+        rating_sum=zero,
+        rating_count=zero,
+        rating_histogram=RatingHistogram(zero, zero, zero, zero, zero),
+        ipfs_hash=arc4.String("Qm"),
+        title=arc4.String("T"),
+    )
+
+
+@pytest.fixture
+def manager(context, deploy, monkeypatch):
+    """A LicenseManager whose registry reports every context as the default sender's"""
+    record = _context_record(context.default_sender)
+    # The testing context cannot run inner app calls; stand in for get_context.
+    monkeypatch.setattr(arc4, "abi_call", lambda *args, **kwargs: (record, None))
+    manager = deploy(LicenseManager)
+    manager.set_context_registry(UInt64(REGISTRY_APP_ID))
+    return manager
+
+
+def _create(context, manager, pay, amount: int) -> UInt64:
+    app = context.ledger.get_app(manager)
+    creator = context.default_sender
+    with context.txn.create_group(active_txn_overrides={"sender": creator}):
+        return manager.create_license(
+            UInt64(1),
+            UInt64(LICENSE_ONE_TIME),
+            UInt64(PRICE),
+            UInt64(0),
+            UInt64(0),
+            pay(creator, app, amount),
+        )
+
+
+def test_create_license_is_paid_for_by_the_caller(context, manager, pay):
+    app = context.ledger.get_app(manager)
+    min_balance = app.address.min_balance
+    _create(context, manager, pay, OFFER_BOX_MIN_BALANCE + 300)
+    assert app.address.min_balance - min_balance == OFFER_BOX_MIN_BALANCE
+    assert manager.platform_balance == 300  # overpayment goes to the platform
+
+
+def test_create_license_without_the_offer_box_mbr_fails(context, manager, pay):
+    with pytest.raises(AssertionError, match="Insufficient payment"):
+        _create(context, manager, pay, OFFER_BOX_MIN_BALANCE - 1)
+
+
+def _purchase(context, manager, pay, buyer: Account, license_id: UInt64, amount: int) -> None:
+    app = context.ledger.get_app(manager)
+    with context.txn.create_group(active_txn_overrides={"sender": buyer}):
+        manager.purchase_license(license_id, pay(buyer, app, amount))
+
+
+def test_purchase_pays_the_creator_the_price_less_the_fee(context, manager, pay):
+    license_id = _create(context, manager, pay, OFFER_BOX_MIN_BALANCE)
+    boxes = COSTS.box_min_balance("grants") + COSTS.box_min_balance("balances")
+    _purchase(context, manager, pay, context.any.account(), license_id, PRICE + boxes + 500)
+    assert manager.get_balance(arc4.Address(context.default_sender)) == PRICE - 50  # 2.5% fee
+    assert manager.platform_balance == 50 + 500  # overpayment included
+
+
+def test_free_license_opens_no_balance_box(context, manager, pay):
+    license_id = _create(context, manager, pay, OFFER_BOX_MIN_BALANCE)
+    manager.set_price_tiers(
+        license_id, _tiers(1, 0, 0, 0), _tiers(10_000, 0, 0, 0), _tiers(*[10_000] * 4)
+    )
+    buyer = context.any.account()
+    _purchase(context, manager, pay, buyer, license_id, COSTS.box_min_balance("grants"))
+    assert manager.check_license(license_id, arc4.Address(buyer)).valid
+    assert context.default_sender not in manager.balances
+
+
+def test_withdraw_pays_earnings_and_the_freed_box_mbr(context, manager, pay):
+    license_id = _create(context, manager, pay, OFFER_BOX_MIN_BALANCE)
+    _purchase(context, manager, pay, context.any.account(), license_id, 1_000_000)
+    amount = manager.withdraw()
+    payment = context.txn.last_group.last_itxn.payment
+    assert amount == payment.amount == PRICE - 50 + COSTS.box_min_balance("balances")
+    assert context.default_sender not in manager.balances
@@ -0,0 +1,38 @@
+import base64
+
+from algosdk import abi, encoding
+from algosdk.atomic_transaction_composer import ABI_RETURN_HASH
+
+from backend.licenses import LicenseCheckError, LicenseVerifier
+from smart_contracts.artifacts.license_manager.license_manager_client import LicenseManagerClient
+
+_STATUS = abi.ABIType.from_string("(bool,uint64,uint64,uint64)")
+
+
+def _status_log(valid: bool) -> str:
+    return base64.b64encode(ABI_RETURN_HASH + _STATUS.encode([valid, 0, 0, 0])).decode()
+
+
+def _check_result(txns: list) -> dict:
+    """Licenses with an even id are valid"""
+    ids = [int.from_bytes(stxn.transaction.app_args[1]) for stxn in txns]
+    return {"txn-results": [{"txn-result": {"logs": [_status_log(i % 2 == 0)]}} for i in ids]}
+
+
+def test_batch_larger_than_a_group_is_split(algorand, sender, simulate):
+    stub = simulate(_check_result)
+    holder = encoding.encode_address(bytes(32))
+    keys = [(license_id, holder) for license_id in range(1, 41)]
+    with LicenseVerifier(LicenseManagerClient(algorand=algorand, app_id=1), sender) as verifier:
+        results = verifier.check_many(keys, timeout=10)
+    assert results == {key: key[0] % 2 == 0 for key in keys}
+    assert sorted(stub.group_sizes) == [8, 16, 16]
+
+
+def test_short_failed_group_fails_every_check(algorand, sender, simulate):
+    simulate(lambda txns: {"failure-message": "logic eval error", "txn-results": []})
+    holder = encoding.encode_address(bytes(32))
+    with LicenseVerifier(LicenseManagerClient(algorand=algorand, app_id=1), sender) as verifier:
+        futures = [verifier.submit(license_id, holder) for license_id in range(20)]
+        errors = [future.exception(timeout=10) for future in futures]
+    assert all(isinstance(error, LicenseCheckError) for error in errors)
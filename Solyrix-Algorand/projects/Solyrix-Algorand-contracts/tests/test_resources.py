@@ -0,0 +1,162 @@
+import base64
+
+import algokit_utils
+from algosdk import encoding
+from algosdk.atomic_transaction_composer import EmptySigner, TransactionWithSigner
+from algosdk.error import AlgodHTTPError
+
+from backend.resources import ResourcePacker
+from smart_contracts.artifacts.context_registry.context_registry_client import (
+    ContextRegistryClient,
+    CreateContextArgs,
+    PurchaseContextArgs,
+)
+from smart_contracts.artifacts.license_manager.license_manager_client import (
+    CreateLicenseArgs,
+    LicenseManagerClient,
+)
+from smart_contracts.utils.constants import (
+    BALANCE_BOX_PREFIX,
+    CONTEXT_BOX_PREFIX,
+    LICENSE_BOX_PREFIX,
+    PURCHASE_BOX_PREFIX,
+    USER_BOX_PREFIX,
+    USER_INDEX_CREATED,
+    USER_INDEX_PURCHASED,
+)
+
+APP_ID = 1
+REGISTRY_APP_ID = 2
+
+
+def _itob(value: int) -> bytes:
+    return value.to_bytes(8, "big")
+
+
+def _page(user: str, kind: int, page: int) -> bytes:
+    return USER_BOX_PREFIX + encoding.decode_address(user) + bytes([kind]) + _itob(page)
+
+
+def _global_state(**values: int) -> dict:
+    return {
+        "params": {
+            "global-state": [
+                {"key": base64.b64encode(key.encode()).decode(), "value": {"uint": value}}
+                for key, value in values.items()
+            ]
+        }
+    }
+
+
+def test_batch_advances_counters_and_simulates_one_call_per_request(algorand, sender, simulate):
+    algod = algorand.client.algod
+    owner = encoding.encode_address(bytes(range(32)))
+    boxes = {
+        CONTEXT_BOX_PREFIX + _itob(3): encoding.decode_address(owner) + bytes(8),
+        _page(sender, USER_INDEX_CREATED, 0): _itob(63),  # next append starts page 1
+    }
+
+    def box(app_id: int, name: bytes) -> dict:
+        if name not in boxes:
+            raise AlgodHTTPError("box not found", 404)
+        return {"name": base64.b64encode(name).decode(), "value": base64.b64encode(boxes[name])}
+
+    algod.application_info = lambda app_id: _global_state(  # type: ignore[method-assign]
+        context_count=5
+    )
+    algod.application_box_by_name = box  # type: ignore[method-assign]
+    unknown = CONTEXT_BOX_PREFIX + _itob(99)
+    stub = simulate(
+        lambda txns: {
+            "txn-results": [{}] * len(txns),
+            "unnamed-resources-accessed": {
+                "boxes": [{"app": APP_ID, "name": base64.b64encode(unknown).decode()}]
+            },
+        }
+    )
+
+    client = ContextRegistryClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    def payment() -> TransactionWithSigner:
+        return TransactionWithSigner(
+            algorand.create_transaction.payment(
+                algokit_utils.PaymentParams(
+                    sender=sender,
+                    receiver=owner,
+                    amount=algokit_utils.AlgoAmount(micro_algo=1_000),
+                )
+            ),
+            EmptySigner(),
+        )
+
+    def create(title: str) -> algokit_utils.AppCallMethodCallParams:
+        args = CreateContextArgs(ipfs_hash="Qm", title=title, price=1_000, payment=payment())
+        return client.params.create_context(args)
+
+    def purchase(context_id: int) -> algokit_utils.AppCallMethodCallParams:
+        args = PurchaseContextArgs(context_id=context_id, payment=payment())
+        return client.params.purchase_context(args)
+
+    calls = [
+        create("first"),
+        create("second"),
+        purchase(7),
+        purchase(3),
+        purchase(99),
+    ]
+    resources = ResourcePacker.for_client(client).resolve(calls)
+
+    created = _page(sender, USER_INDEX_CREATED, 0)
+    purchased = _page(sender, USER_INDEX_PURCHASED, 0)
+    assert resources[0].boxes == (CONTEXT_BOX_PREFIX + _itob(6), created)
+    assert resources[1].boxes == (
+        CONTEXT_BOX_PREFIX + _itob(7),
+        created,
+        _page(sender, USER_INDEX_CREATED, 1),
+    )
+    assert resources[2].boxes == (
+        CONTEXT_BOX_PREFIX + _itob(7),
+        PURCHASE_BOX_PREFIX + _itob(7) + encoding.decode_address(sender),
+        purchased,
+        BALANCE_BOX_PREFIX + encoding.decode_address(sender),
+    )
+    assert resources[3].boxes[-1] == BALANCE_BOX_PREFIX + encoding.decode_address(owner)
+    assert resources[3].boxes[-2] == purchased
+    assert resources[4].boxes == (unknown,)
+    assert stub.group_sizes == [2]
+
+
+def test_create_license_references_the_registry_context(algorand, sender):
+    state = _global_state(license_count=3, context_registry=REGISTRY_APP_ID)
+    algorand.client.algod.application_info = lambda app_id: state  # type: ignore[method-assign]
+    client = LicenseManagerClient(algorand=algorand, app_id=APP_ID, default_sender=sender)
+
+    def create(context_id: int) -> algokit_utils.AppCallMethodCallParams:
+        payment = algorand.create_transaction.payment(
+            algokit_utils.PaymentParams(
+                sender=sender,
+                receiver=sender,
+                amount=algokit_utils.AlgoAmount(micro_algo=1_000),
+            )
+        )
+        args = CreateLicenseArgs(
+            context_id=context_id,
+            license_type=0,
+            price=1_000,
+            duration=0,
+            usage_limit=0,
+            payment=TransactionWithSigner(payment, EmptySigner()),
+        )
+        return client.params.create_license(args)
+
+    calls = [create(context_id) for context_id in (8, 9)]
+
+    groups = ResourcePacker.for_client(client).pack(calls)
+
+    assert len(groups) == 1
+    for call, license_id, context_id in zip(groups[0], (4, 5), (8, 9)):
+        assert call.app_references == [REGISTRY_APP_ID]
+        boxes = [(ref.app_index, ref.name) for ref in call.box_references or []]
+        assert (REGISTRY_APP_ID, CONTEXT_BOX_PREFIX + _itob(context_id)) in boxes
+    own = [ref.name for call in groups[0] for ref in call.box_references or [] if not ref.app_index]
+    assert sorted(own) == [LICENSE_BOX_PREFIX + _itob(4), LICENSE_BOX_PREFIX + _itob(5)]
@@ -0,0 +1,95 @@
+import pytest
+
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import ContextCreated
+from backend.indexer.search import ContextSearchIndex, build_match_query
+from backend.indexer.store import MarketplaceStore
+
+
+def _created(context_id: int, title: str) -> ContextCreated:
+    return ContextCreated(
+        round=1,
+        timestamp=0,
+        intra=context_id,
+        context_id=context_id,
+        creator="C" * 58,
+        ipfs_hash=f"Qm{context_id}",
+        title=title,
+        price=0,
+    )
+
+
+@pytest.fixture
+def store() -> MarketplaceStore:
+    return MarketplaceStore()
+
+
+@pytest.fixture
+def index(store: MarketplaceStore) -> ContextSearchIndex:
+    index = ContextSearchIndex(store.connection)
+    events = [
+        _created(7, "Rust borrow checker"),
+        _created(8, "Prompt library"),
+        _created(9, "Python testing"),
+    ]
+    store.apply_block(1, events)
+    index.on_block(Block(round=1, timestamp=0, app_calls=[]), events)
+    return index
+
+
+def _ids(hits) -> list[int]:
+    return [hit.context_id for hit in hits]
+
+
+def test_title_hits_outrank_tag_hits_outrank_description_hits(index):
+    index.index_context(7, "Rust borrow checker", "Notes on python interop")
+    index.index_context(8, "Prompt library", "", ["python"])
+    hits = index.search("python")
+    assert _ids(hits) == [9, 8, 7]
+    assert hits[0].score > hits[1].score > hits[2].score > 0
+
+
+def test_every_term_must_match(index):
+    index.index_context(8, "Prompt library for python")
+    assert sorted(_ids(index.search("python"))) == [8, 9]
+    assert _ids(index.search("python testing")) == [9]
+
+
+def test_prefix_matches_only_when_asked(index):
+    assert index.search("pyth") == []
+    assert _ids(index.search("pyth", prefix=True)) == [9]
+    assert sorted(_ids(index.suggest("p"))) == [8, 9]
+    assert _ids(index.suggest("rust bor")) == [7]
+
+
+def test_suggest_only_looks_at_titles(index):
+    index.index_context(8, "Prompt library", "", ["borrowing"])
+    assert _ids(index.suggest("bor")) == [7]
+    assert _ids(index.search("borrow", prefix=True)) == [7, 8]
+
+
+def test_reindexing_replaces_the_previous_terms(index):
+    index.index_context(7, "Go concurrency")
+    assert index.search("rust") == []
+    assert _ids(index.search("concurrency")) == [7]
+
+
+def test_metadata_adds_description_and_tags(index):
+    index.apply_metadata(
+        "Qm8", {"metadata": {"description": "Curated system prompts", "tags": ["agents"]}}
+    )
+    assert _ids(index.search("curated")) == [8]
+    assert _ids(index.search("agents")) == [8]
+    assert _ids(index.search("library")) == [8]  # the chain title is kept
+
+
+def test_removed_contexts_are_not_found(index):
+    index.remove_context(9)
+    assert index.search("python") == []
+    assert _ids(index.search("rust")) == [7]
+
+
+def test_user_input_cannot_inject_fts_syntax(index):
+    assert build_match_query('rust" OR title:*', prefix=False) == '"rust" "or" "title"'
+    assert index.search('rust" OR NEAR(') == []
+    assert index.search("***") == []
@@ -0,0 +1,40 @@
+import pytest
+from algosdk import account, encoding, transaction
+
+from backend.signing import SERIAL_THRESHOLD, SigningPool
+
+
+def _payment(sender: str, amount: int = 0) -> transaction.PaymentTxn:
+    params = transaction.SuggestedParams(1_000, 1, 1_000, "A" * 44, flat_fee=True)
+    return transaction.PaymentTxn(sender, params, sender, amount)
+
+
+@pytest.mark.filterwarnings("error::DeprecationWarning")
+def test_pools_sign_with_their_own_keys():
+    first_key, first = account.generate_account()
+    second_key, second = account.generate_account()
+    first_pool = SigningPool([first_key], max_workers=1)
+    second_pool = SigningPool([second_key], max_workers=1)
+
+    assert first_pool.sign([_payment(first)])[0].transaction.sender == first
+    assert second_pool.sign([_payment(second)])[0].transaction.sender == second
+    with pytest.raises(KeyError):
+        second_pool.sign([_payment(first)])
+
+
+def test_worker_processes_sign_in_order():
+    keys, senders = zip(*(account.generate_account() for _ in range(3)))
+    txns = [_payment(senders[i % 3], amount=i) for i in range(SERIAL_THRESHOLD + 36)]
+    # ed25519 signatures are deterministic, so the serial path is the reference.
+    expected = SigningPool(keys, max_workers=1).sign(txns)
+
+    with SigningPool(keys, max_workers=2, chunk_size=16) as pool:
+        signed = pool.sign(txns)
+        with pytest.raises(KeyError):
+            pool.sign(txns + [_payment(account.generate_account()[1])])
+
+    assert [stxn.transaction.amt for stxn in signed] == list(range(len(txns)))
+    assert [encoding.msgpack_encode(stxn) for stxn in signed] == [
+        encoding.msgpack_encode(stxn) for stxn in expected
+    ]
+    assert all(stxn.signature for stxn in signed)
@@ -0,0 +1,131 @@
+import json
+import threading
+
+import pytest
+
+from backend.indexer.blocks import Block
+from backend.indexer.decoder import ContextCreated, ContextPurchased, ContextRated
+from backend.indexer.metadata import MetadataFetcher
+from backend.indexer.store import ContextFilters, MarketplaceStore
+
+CREATOR = "C" * 58
+BUYER = "B" * 58
+
+
+def _created(context_id: int, price: int, round_: int = 1, ipfs_hash: str = "") -> ContextCreated:
+    return ContextCreated(
+        round=round_,
+        timestamp=1_700_000_000 + round_,
+        intra=0,
+        context_id=context_id,
+        creator=CREATOR,
+        ipfs_hash=ipfs_hash or f"Qm{context_id}",
+        title=f"Context {context_id}",
+        price=price,
+    )
+
+
+def _document(tags: list[str], models: list[int], category: int) -> dict:
+    return {
+        "metadata": {
+            "description": "A context",
+            "author": "Ada",
+            "category": category,
+            "tags": tags,
+            "modelCompatibility": models,
+        }
+    }
+
+
+@pytest.fixture
+def store() -> MarketplaceStore:
+    store = MarketplaceStore()
+    store.apply_block(1, [_created(1, 100, 1), _created(2, 300, 1)])
+    store.apply_block(2, [_created(3, 200, 2)])
+    return store
+
+
+def _ids(store: MarketplaceStore, **filters) -> list[int]:
+    result = store.search(ContextFilters(**filters))
+    return [context.context_id for context in result.contexts]
+
+
+def test_apply_block_advances_the_cursor_and_counts_activity(store):
+    store.apply_block(
+        3,
+        [
+            ContextPurchased(3, 0, 0, context_id=1, buyer=BUYER),
+            ContextRated(3, 0, 1, context_id=1, rater=BUYER, rating=4, previous_rating=0),
+            ContextRated(3, 0, 2, context_id=1, rater=BUYER, rating=2, previous_rating=4),
+        ],
+    )
+    assert store.next_round(default=1) == 4
+    context = store.get_context(1)
+    assert context is not None
+    assert (context.purchases, context.rating_count, context.rating_avg) == (1, 1, 2.0)
+
+
+def test_reapplied_block_keeps_the_context(store):
+    store.apply_block(1, [_created(1, 150, 1)])
+    assert store.get_context(1).price == 150
+    assert store.search(ContextFilters()).total_count == 3
+
+
+def test_search_sorts_and_pages(store):
+    assert _ids(store) == [3, 2, 1]
+    assert _ids(store, sort_by="price_low") == [1, 3, 2]
+    assert _ids(store, min_price=150, max_price=250) == [3]
+    result = store.search(ContextFilters(sort_by="oldest"), limit=2, offset=1)
+    assert [c.context_id for c in result.contexts] == [2, 3]
+    assert (result.total_count, result.has_more) == (3, False)
+
+
+def test_metadata_filters_match_once_applied(store):
+    assert _ids(store, tags=["python"]) == []
+    store.apply_metadata("Qm1", _document([" Python ", "ML"], [2], category=4))
+    store.apply_metadata("Qm3", _document(["python"], [1, 2], category=1))
+
+    assert _ids(store, tags=["PYTHON"]) == [3, 1]
+    assert _ids(store, tags=["ml"]) == [1]
+    assert _ids(store, model_type=1) == [3]
+    assert _ids(store, category=4) == [1]
+    context = store.get_context(1)
+    assert (context.description, context.author) == ("A context", "Ada")
+
+
+def test_metadata_replaces_previous_tags(store):
+    store.apply_metadata("Qm1", _document(["old"], [1], category=0))
+    store.apply_metadata("Qm1", _document(["new"], [], category=0))
+    assert _ids(store, tags=["old"]) == []
+    assert _ids(store, tags=["new"]) == [1]
+    assert _ids(store, model_type=1) == []
+
+
+class _Fetcher:
+    """Serves documents by CID; `release` holds fetches back until set"""
+
+    def __init__(self, documents: dict[str, bytes]) -> None:
+        self.documents = documents
+        self.release = threading.Event()
+
+    def fetch_blocking(self, cid: str) -> bytes:
+        self.release.wait(5)
+        return self.documents[cid]
+
+
+def test_metadata_fetcher_applies_documents_on_a_later_block(store):
+    fetcher = _Fetcher({"Qm4": json.dumps(_document(["rust"], [3], category=2)).encode()})
+    metadata = MetadataFetcher(fetcher, consumers=[store.apply_metadata])  # type: ignore[arg-type]
+    block = Block(round=3, timestamp=0, app_calls=[])
+    created = [_created(4, 10, 3, ipfs_hash="Qm4"), _created(5, 10, 3, ipfs_hash="Qm5")]
+    store.apply_block(3, created)
+
+    metadata.on_block(block, created)
+    assert metadata.apply_fetched() == 0  # still fetching; nothing is written off-thread
+    fetcher.release.set()
+    metadata.close()
+
+    metadata.on_block(Block(round=4, timestamp=0, app_calls=[]), [])
+    assert _ids(store, tags=["rust"]) == [4]
+    assert store.get_context(4).category == 2
+    assert store.get_context(5).description == ""  # Qm5 failed to fetch and was skipped
@@ -0,0 +1,62 @@
+import threading
+
+import pytest
+from algosdk import account, transaction
+from algosdk.atomic_transaction_composer import AccountTransactionSigner
+
+from backend import submitter
+from backend.submitter import PipelinedSubmitter
+
+
+class FakeAlgod:
+    """Commits each sent group in the block after the current round"""
+
+    def __init__(self, fail_blocks: bool = False) -> None:
+        self.last_round = 10
+        self.blocks: dict[int, list[str]] = {}
+        self.fail_blocks = fail_blocks
+        self._lock = threading.Lock()
+
+    def status(self) -> dict:
+        with self._lock:
+            return {"last-round": self.last_round}
+
+    def send_transactions(self, group: list) -> str:
+        with self._lock:
+            self.last_round += 1
+            self.blocks[self.last_round] = [stxn.get_txid() for stxn in group]
+        return group[0].get_txid()
+
+    def status_after_block(self, block: int) -> dict:
+        return {"last-round": block + 1}
+
+    def get_block_txids(self, block: int) -> dict:
+        if self.fail_blocks:
+            raise ConnectionError("algod unreachable")
+        with self._lock:
+            return {"blockTxids": self.blocks.get(block, [])}
+
+
+def _group() -> list[transaction.GenericSignedTransaction]:
+    key, address = account.generate_account()
+    params = transaction.SuggestedParams(1_000, 1, 1_000, "A" * 44, flat_fee=True)
+    txn = transaction.PaymentTxn(address, params, address, 0)
+    return AccountTransactionSigner(key).sign_transactions([txn], [0])
+
+
+def test_group_confirmed_in_the_next_block_is_seen():
+    with PipelinedSubmitter(FakeAlgod()) as pipeline:  # type: ignore[arg-type]
+        confirmation = pipeline.submit(_group()).result(timeout=5)
+    assert confirmation.confirmed_round == 11
+    assert confirmation.attempts == 1
+
+
+def test_pending_groups_fail_when_the_follower_gives_up(monkeypatch):
+    monkeypatch.setattr(submitter, "FOLLOWER_RETRY_DELAY", 0.0)
+    monkeypatch.setattr(submitter, "FOLLOWER_MAX_FAILURES", 3)
+    pipeline = PipelinedSubmitter(FakeAlgod(fail_blocks=True))  # type: ignore[arg-type]
+    futures = [pipeline.submit(_group()) for _ in range(3)]
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result(timeout=5)
+    assert pipeline.drain(timeout=5)
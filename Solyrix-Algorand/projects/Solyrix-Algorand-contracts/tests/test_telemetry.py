@@ -0,0 +1,22 @@
+from algosdk.error import IndexerHTTPError
+
+from backend import telemetry
+
+
+def test_indexer_error_is_recorded_without_a_status_code():
+    def failing(client, method, requrl, *args, **kwargs):
+        raise IndexerHTTPError("not found")
+
+    recorder = telemetry.Telemetry()
+    previous = telemetry.set_recorder(recorder)
+    try:
+        timed = telemetry._timed(failing, "indexer")
+        try:
+            timed(None, "GET", "/v2/accounts/ABC")
+        except IndexerHTTPError:
+            pass
+    finally:
+        telemetry.set_recorder(previous)
+    (span,) = recorder.spans
+    assert span.attributes["http.status_code"] == 0
+    assert span.error == "IndexerHTTPError: not found"
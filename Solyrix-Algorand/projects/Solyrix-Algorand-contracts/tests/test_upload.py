@@ -0,0 +1,56 @@
+import os
+
+import pytest
+
+from backend.ipfs.cid import CHUNK_SIZE, CID
+from backend.ipfs.mock_pinning import MockPinningService
+from backend.ipfs.upload import DatasetUploader, PinningClient, UploadError
+
+
+def test_interrupted_upload_resumes_from_the_checkpoint(tmp_path, monkeypatch):
+    dataset = tmp_path / "dataset.bin"
+    dataset.write_bytes(os.urandom(5 * CHUNK_SIZE))
+    checkpoint = tmp_path / "dataset.progress"
+    service = MockPinningService().start()
+    client = PinningClient(service.url)
+    try:
+        put_block = client.put_block
+
+        def interrupted(block):
+            if service.puts == 3:
+                raise UploadError("connection lost")
+            put_block(block)
+
+        monkeypatch.setattr(client, "put_block", interrupted)
+        with pytest.raises(UploadError):
+            DatasetUploader(client, concurrency=1, retries=1).upload(dataset, checkpoint)
+        assert not service.pins
+
+        monkeypatch.setattr(client, "put_block", put_block)
+        result = DatasetUploader(client, concurrency=1).upload(dataset, checkpoint)
+    finally:
+        client.close()
+        service.shutdown()
+        service.server_close()
+
+    assert result.blocks == 6  # five leaves under one root
+    assert result.uploaded == 3
+    assert service.puts == result.blocks
+    assert CID.parse(result.cid).digest in service.pins
+
+
+def test_repeated_chunks_are_sent_once(tmp_path):
+    dataset = tmp_path / "dataset.bin"
+    dataset.write_bytes(bytes(4 * CHUNK_SIZE) + b"tail")
+    service = MockPinningService().start()
+    client = PinningClient(service.url)
+    try:
+        result = DatasetUploader(client, concurrency=4).upload(dataset)
+    finally:
+        client.close()
+        service.shutdown()
+        service.server_close()
+
+    assert result.blocks == 6  # four identical leaves, the tail and the root
+    assert result.uploaded == service.puts == 3
+    assert CID.parse(result.cid).digest in service.pins